@@ -7,13 +7,12 @@ per docs/stages/STAGE_WORKER_SPECS.md.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import re
 from typing import Any, Callable, Dict, List, Optional
 
-from src.llm.router import generate_text
+from src.llm.router import agenerate_text
 
 logger = logging.getLogger(__name__)
 
@@ -98,9 +97,8 @@ async def call_llm_async(
     temperature: float = 0.2,
     max_tokens: int = 4096,
 ) -> Any:
-    """Run sync generate_text in thread pool for use from async process()."""
-    return await asyncio.to_thread(
-        generate_text,
+    """Call the LLM router from async process() without tying up a thread."""
+    return await agenerate_text(
         task_name=task_name,
         prompt=prompt,
         system_prompt=system_prompt,
@@ -7,7 +7,8 @@ and compliance with data governance requirements.
 Key Components:
 - hash_chain: Hash chain audit logging with database persistence
 - SQLAlchemy ORM models for audit entries
-- Chain integrity verification
+- Chain integrity verification with signed checkpoints
+- Group-commit appends serialized on a chain-tail row
 - Rollback support for audit entries
 
 Phase 14 Implementation - ROS-114
@@ -16,12 +17,16 @@ Track E - Monitoring & Audit
 
 from .hash_chain import (
     HashChainAuditLogger,
+    AuditChainTail,
+    AuditCheckpoint,
     AuditEntry,
     get_audit_logger,
 )
 
 __all__ = [
     "HashChainAuditLogger",
+    "AuditChainTail",
+    "AuditCheckpoint",
     "AuditEntry",
     "get_audit_logger",
 ]
@@ -11,17 +11,22 @@ Key Features:
 - Database persistence with SQLite/PostgreSQL support
 - Transaction-based rollback capability
 - Chain integrity verification
-- Batch entry support for performance
+- Streaming verification with signed checkpoints for incremental runs
+- Group-commit batched appends for bursts of events
 
 Phase 14 Implementation - ROS-114
 Track E - Monitoring & Audit
 """
 
 import hashlib
+import hmac
 import json
 import logging
+import os
+import threading
 import uuid
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
@@ -95,6 +100,60 @@ class AuditEntry(Base):
         }
 
 
+class AuditCheckpoint(Base):
+    """SQLAlchemy model for signed chain verification checkpoints."""
+
+    __tablename__ = "audit_checkpoints"
+
+    checkpoint_id = Column(Integer, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime, nullable=False)
+
+    # Last entry covered by a successful verification
+    entry_id = Column(String(36), nullable=False)
+    entry_hash = Column(String(64), nullable=False)
+    entry_timestamp = Column(DateTime, nullable=False, index=True)
+
+    # Number of entries from genesis through entry_id
+    position = Column(Integer, nullable=False)
+
+    # HMAC-SHA256 over the fields above
+    signature = Column(String(64), nullable=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert checkpoint to dictionary."""
+        return {
+            "checkpoint_id": self.checkpoint_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "entry_id": self.entry_id,
+            "entry_hash": self.entry_hash,
+            "entry_timestamp": (
+                self.entry_timestamp.isoformat() if self.entry_timestamp else None
+            ),
+            "position": self.position,
+        }
+
+
+class AuditChainTail(Base):
+    """Single-row table holding the current chain tail, locked by writers."""
+
+    __tablename__ = "audit_chain_tail"
+
+    tail_id = Column(Integer, primary_key=True)
+    entry_id = Column(String(36), nullable=True)
+    entry_hash = Column(String(64), nullable=False)
+    timestamp = Column(DateTime, nullable=True)
+
+
+@dataclass
+class _PendingAppend:
+    """Entries submitted by one caller, waiting for a group commit."""
+
+    records: List[Dict[str, Any]]
+    done: threading.Event = field(default_factory=threading.Event)
+    entry_ids: List[str] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+
 class HashChainAuditLogger:
     """
     Immutable audit logger with cryptographic hash chain.
@@ -103,6 +162,7 @@ class HashChainAuditLogger:
     All entries are persisted to database with optional rollback capability.
     """
 
+    TAIL_ROW_ID = 1
     HASH_ALGORITHM = "sha256"
     HASH_TRUNCATE = 64  # Full SHA-256 hash length (no truncation)
     GENESIS_HASH = "genesis_block_hash_chain_audit_system_v1"
@@ -114,6 +174,8 @@ class HashChainAuditLogger:
         pool_size: int = 10,
         max_overflow: int = 20,
         echo: bool = False,
+        checkpoint_key: Optional[str] = None,
+        max_batch_size: int = 500,
     ):
         """
         Initialize hash chain audit logger.
@@ -125,6 +187,10 @@ class HashChainAuditLogger:
             pool_size: Connection pool size
             max_overflow: Max overflow connections
             echo: Enable SQL echo logging
+            checkpoint_key: Secret used to sign verification checkpoints
+                (default: AUDIT_CHECKPOINT_KEY env var). Checkpoints are
+                disabled when no key is configured.
+            max_batch_size: Maximum entries written per group commit
 
         Raises:
             SQLAlchemyError: If database connection fails
@@ -132,6 +198,15 @@ class HashChainAuditLogger:
         self.database_url = database_url
         self.logger = logging.getLogger(__name__)
 
+        key = checkpoint_key or os.getenv("AUDIT_CHECKPOINT_KEY")
+        self._checkpoint_key = key.encode("utf-8") if key else None
+
+        # Group commit: callers enqueue, one leader at a time flushes
+        self.max_batch_size = max_batch_size
+        self._pending: List[_PendingAppend] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
         try:
             # Create engine with connection pooling
             if "sqlite" in database_url:
@@ -210,6 +285,75 @@ class HashChainAuditLogger:
         entry_json = json.dumps(entry_components, sort_keys=True)
         return hashlib.sha256(entry_json.encode("utf-8")).hexdigest()
 
+    def _sign_checkpoint(
+        self,
+        entry_id: str,
+        entry_hash: str,
+        entry_timestamp: datetime,
+        position: int,
+    ) -> str:
+        """
+        Compute HMAC-SHA256 signature for a verification checkpoint.
+
+        Args:
+            entry_id: Last verified entry ID
+            entry_hash: Hash of the last verified entry
+            entry_timestamp: Timestamp of the last verified entry
+            position: Number of entries from genesis through entry_id
+
+        Returns:
+            Signature hexdigest
+        """
+        payload = f"{entry_id}|{entry_hash}|{entry_timestamp.isoformat()}|{position}"
+        return hmac.new(
+            self._checkpoint_key, payload.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    def _find_checkpoint(
+        self,
+        session: Session,
+        before: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Optional[AuditCheckpoint]:
+        """
+        Find the most recent correctly signed checkpoint.
+
+        Args:
+            session: SQLAlchemy session
+            before: Only consider checkpoints strictly before this timestamp
+            until: Only consider checkpoints at or before this timestamp
+
+        Returns:
+            Checkpoint to resume verification from, or None
+        """
+        if self._checkpoint_key is None:
+            return None
+
+        query = session.query(AuditCheckpoint).order_by(
+            AuditCheckpoint.entry_timestamp.desc(),
+            AuditCheckpoint.checkpoint_id.desc(),
+        )
+        if before:
+            query = query.filter(AuditCheckpoint.entry_timestamp < before)
+        if until:
+            query = query.filter(AuditCheckpoint.entry_timestamp <= until)
+
+        for checkpoint in query:
+            expected = self._sign_checkpoint(
+                entry_id=checkpoint.entry_id,
+                entry_hash=checkpoint.entry_hash,
+                entry_timestamp=checkpoint.entry_timestamp,
+                position=checkpoint.position,
+            )
+            if hmac.compare_digest(expected, checkpoint.signature):
+                return checkpoint
+
+            self.logger.warning(
+                f"Ignoring checkpoint {checkpoint.checkpoint_id}: invalid signature"
+            )
+
+        return None
+
     def _get_last_hash(self, session: Session) -> str:
         """
         Get hash of most recent audit entry.
@@ -250,6 +394,49 @@ class HashChainAuditLogger:
         finally:
             session.close()
 
+    def _lock_tail(self, session: Session) -> AuditChainTail:
+        """
+        Lock and return the chain tail row, creating it on first use.
+
+        The row is selected FOR UPDATE so concurrent writers from other
+        processes serialize on it for the rest of the transaction.
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            Locked AuditChainTail row
+        """
+        tail = (
+            session.query(AuditChainTail)
+            .filter_by(tail_id=self.TAIL_ROW_ID)
+            .with_for_update()
+            .first()
+        )
+
+        if tail is None:
+            # Seed from existing entries written before the tail table existed
+            last_entry = (
+                session.query(AuditEntry)
+                .order_by(AuditEntry.timestamp.desc())
+                .first()
+            )
+            tail = AuditChainTail(
+                tail_id=self.TAIL_ROW_ID,
+                entry_id=last_entry.entry_id if last_entry else None,
+                entry_hash=self._get_last_hash(session),
+                timestamp=last_entry.timestamp if last_entry else None,
+            )
+            session.add(tail)
+
+        return tail
+
+    @staticmethod
+    def _validate_record(record: Dict[str, Any]) -> None:
+        """Reject entries missing the required fields."""
+        if not record.get("action") or not record.get("actor"):
+            raise ValueError("action and actor are required")
+
     def append_entry(
         self,
         action: str,
@@ -268,6 +455,10 @@ class HashChainAuditLogger:
         - SHA-256 hash of data
         - Previous entry hash (maintains chain)
 
+        Entries from concurrent callers are group-committed: they are
+        chained in memory from the locked tail and written in a single
+        transaction. The call returns once its entry is committed.
+
         Args:
             action: Type of action (e.g., "UPDATE", "DELETE", "CREATE")
             actor: User/system that performed action
@@ -283,59 +474,157 @@ class HashChainAuditLogger:
             SQLAlchemyError: If database write fails
             ValueError: If required fields are invalid
         """
-        if not action or not actor:
-            raise ValueError("action and actor are required")
+        return self.append_entries(
+            [
+                {
+                    "action": action,
+                    "actor": actor,
+                    "resource_type": resource_type,
+                    "data": data,
+                    "resource_id": resource_id,
+                    "details": details,
+                }
+            ]
+        )[0]
+
+    def append_entries(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Append several entries to the audit chain, in order.
+
+        Each dict takes the keyword arguments of append_entry(). The entries
+        are committed together, possibly in the same transaction as entries
+        from other concurrent callers.
+
+        Args:
+            entries: Entry field dictionaries
+
+        Returns:
+            Entry IDs in the order given
+
+        Raises:
+            SQLAlchemyError: If database write fails
+            ValueError: If required fields are invalid
+        """
+        for record in entries:
+            self._validate_record(record)
+
+        if not entries:
+            return []
+
+        pending = _PendingAppend(records=list(entries))
+        with self._pending_lock:
+            self._pending.append(pending)
+
+        # Whoever holds the flush lock commits everything queued so far;
+        # callers whose entries were included just return
+        while not pending.done.is_set():
+            with self._flush_lock:
+                if pending.done.is_set():
+                    break
+                self._flush_pending()
+
+        if pending.error is not None:
+            raise pending.error
+
+        return pending.entry_ids
+
+    def _flush_pending(self) -> None:
+        """Write queued entries in one transaction. Caller holds _flush_lock."""
+        with self._pending_lock:
+            batch: List[_PendingAppend] = []
+            size = 0
+            while self._pending and (not batch or size < self.max_batch_size):
+                pending = self._pending.pop(0)
+                batch.append(pending)
+                size += len(pending.records)
+
+        if not batch:
+            return
 
         try:
             with self._get_session() as session:
-                # Generate entry ID
-                entry_id = str(uuid.uuid4())
-                timestamp = datetime.utcnow()
-                timestamp_iso = timestamp.isoformat() + "Z"
-
-                # Hash the data
-                data_str = json.dumps(data, sort_keys=True, default=str) if data else ""
-                data_hash = self._hash_data(data_str)
-
-                # Get previous hash for chain
-                previous_hash = self._get_last_hash(session)
-
-                # Compute entry hash
-                entry_hash = self._compute_entry_hash(
-                    timestamp=timestamp_iso,
-                    action=action,
-                    actor=actor,
-                    data_hash=data_hash,
-                    previous_hash=previous_hash,
-                )
+                tail = self._lock_tail(session)
+                previous_hash = tail.entry_hash
+                last_timestamp = tail.timestamp
+
+                for pending in batch:
+                    for record in pending.records:
+                        # Strictly increasing timestamps keep chain order
+                        # equal to timestamp order
+                        timestamp = datetime.utcnow()
+                        if last_timestamp is not None and timestamp <= last_timestamp:
+                            timestamp = last_timestamp + timedelta(microseconds=1)
+
+                        entry = self._build_entry(record, timestamp, previous_hash)
+                        session.add(entry)
+                        pending.entry_ids.append(entry.entry_id)
+
+                        previous_hash = entry.entry_hash
+                        last_timestamp = timestamp
+
+                tail.entry_id = entry.entry_id
+                tail.entry_hash = previous_hash
+                tail.timestamp = last_timestamp
+
+            self.logger.debug(
+                f"Group-committed {size} audit entries from {len(batch)} callers"
+            )
 
-                # Create entry
-                entry = AuditEntry(
-                    entry_id=entry_id,
-                    timestamp=timestamp,
-                    action=action,
-                    actor=actor,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    data=data_str if data else None,
-                    data_hash=data_hash,
-                    entry_hash=entry_hash,
-                    previous_hash=previous_hash,
-                    details=json.dumps(details, default=str) if details else None,
-                )
+        except Exception as e:
+            self.logger.error(f"Failed to append audit entries: {e}")
+            for pending in batch:
+                pending.entry_ids.clear()
+                pending.error = e
 
-                session.add(entry)
-                session.flush()  # Get the inserted row
+        finally:
+            for pending in batch:
+                pending.done.set()
 
-                self.logger.debug(
-                    f"Appended audit entry {entry_id}: {action} by {actor}"
-                )
+    def _build_entry(
+        self,
+        record: Dict[str, Any],
+        timestamp: datetime,
+        previous_hash: str,
+    ) -> AuditEntry:
+        """
+        Build a chained AuditEntry from append_entry() fields.
 
-                return entry_id
+        Args:
+            record: Entry field dictionary
+            timestamp: Entry timestamp
+            previous_hash: Hash of the preceding entry
 
-        except SQLAlchemyError as e:
-            self.logger.error(f"Failed to append audit entry: {e}")
-            raise
+        Returns:
+            Unsaved AuditEntry
+        """
+        data = record.get("data")
+        details = record.get("details")
+
+        # Hash the data
+        data_str = json.dumps(data, sort_keys=True, default=str) if data else ""
+        data_hash = self._hash_data(data_str)
+
+        entry_hash = self._compute_entry_hash(
+            timestamp=timestamp.isoformat() + "Z",
+            action=record["action"],
+            actor=record["actor"],
+            data_hash=data_hash,
+            previous_hash=previous_hash,
+        )
+
+        return AuditEntry(
+            entry_id=str(uuid.uuid4()),
+            timestamp=timestamp,
+            action=record["action"],
+            actor=record["actor"],
+            resource_type=record.get("resource_type"),
+            resource_id=record.get("resource_id"),
+            data=data_str if data else None,
+            data_hash=data_hash,
+            entry_hash=entry_hash,
+            previous_hash=previous_hash,
+            details=json.dumps(details, default=str) if details else None,
+        )
 
     def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -361,7 +650,12 @@ class HashChainAuditLogger:
             raise
 
     def verify_chain(
-        self, start_timestamp: Optional[datetime] = None, end_timestamp: Optional[datetime] = None
+        self,
+        start_timestamp: Optional[datetime] = None,
+        end_timestamp: Optional[datetime] = None,
+        batch_size: int = 1000,
+        use_checkpoints: bool = True,
+        save_checkpoint: bool = True,
     ) -> Dict[str, Any]:
         """
         Verify integrity of audit hash chain.
@@ -372,9 +666,20 @@ class HashChainAuditLogger:
         - Inserted entries (chain breaks)
         - Out-of-order entries
 
+        Entries are streamed in batches of batch_size, so memory use does
+        not grow with the table. When a checkpoint key is configured, the
+        walk resumes from the latest signed checkpoint before
+        start_timestamp (or the latest one overall), and a new checkpoint
+        is written at the last entry whenever every walked entry verifies.
+        Entries before start_timestamp are walked only to link the chain
+        and are not included in the counts.
+
         Args:
             start_timestamp: Filter entries from this timestamp (optional)
             end_timestamp: Filter entries to this timestamp (optional)
+            batch_size: Number of entries fetched per round trip
+            use_checkpoints: Resume from the nearest signed checkpoint
+            save_checkpoint: Record a checkpoint after a clean walk
 
         Returns:
             Verification result dictionary:
@@ -384,6 +689,8 @@ class HashChainAuditLogger:
                     'verified_entries': int,
                     'invalid_entries': list[entry_id],
                     'chain_breaks': list[entry_id],
+                    'checkpoint': dict or None (checkpoint resumed from),
+                    'checkpoint_saved': bool,
                     'details': str
                 }
         """
@@ -391,25 +698,52 @@ class HashChainAuditLogger:
 
         try:
             with self._get_session() as session:
-                query = session.query(AuditEntry).order_by(AuditEntry.timestamp)
+                checkpoint = (
+                    self._find_checkpoint(
+                        session, before=start_timestamp, until=end_timestamp
+                    )
+                    if use_checkpoints
+                    else None
+                )
 
-                if start_timestamp:
-                    query = query.filter(AuditEntry.timestamp >= start_timestamp)
+                # Plain column tuples keep the identity map out of the stream
+                query = session.query(
+                    AuditEntry.entry_id,
+                    AuditEntry.timestamp,
+                    AuditEntry.action,
+                    AuditEntry.actor,
+                    AuditEntry.data_hash,
+                    AuditEntry.entry_hash,
+                    AuditEntry.previous_hash,
+                ).order_by(AuditEntry.timestamp)
+
+                if checkpoint:
+                    query = query.filter(AuditEntry.timestamp > checkpoint.entry_timestamp)
+                    previous_hash = checkpoint.entry_hash
+                    position = checkpoint.position
+                else:
+                    previous_hash = self._hash_data(self.GENESIS_HASH)
+                    position = 0
 
                 if end_timestamp:
                     query = query.filter(AuditEntry.timestamp <= end_timestamp)
 
-                entries = query.all()
-
                 invalid_entries = []
                 chain_breaks = []
+                total_entries = 0
+                walk_valid = True
+                last_entry = None
 
-                previous_hash = self._hash_data(self.GENESIS_HASH)
+                for entry in query.yield_per(batch_size):
+                    in_range = start_timestamp is None or entry.timestamp >= start_timestamp
+                    if in_range:
+                        total_entries += 1
 
-                for entry in entries:
                     # Verify hash chain continuity
                     if entry.previous_hash != previous_hash:
-                        chain_breaks.append(entry.entry_id)
+                        walk_valid = False
+                        if in_range:
+                            chain_breaks.append(entry.entry_id)
                         self.logger.warning(
                             f"Chain break detected at {entry.entry_id}: "
                             f"expected previous_hash={previous_hash[:8]}..., "
@@ -426,7 +760,9 @@ class HashChainAuditLogger:
                     )
 
                     if recomputed_hash != entry.entry_hash:
-                        invalid_entries.append(entry.entry_id)
+                        walk_valid = False
+                        if in_range:
+                            invalid_entries.append(entry.entry_id)
                         self.logger.warning(
                             f"Hash mismatch at {entry.entry_id}: "
                             f"expected {recomputed_hash[:8]}..., "
@@ -434,17 +770,46 @@ class HashChainAuditLogger:
                         )
 
                     previous_hash = entry.entry_hash
+                    position += 1
+                    last_entry = entry
 
                 is_valid = len(invalid_entries) == 0 and len(chain_breaks) == 0
 
+                checkpoint_saved = False
+                if (
+                    save_checkpoint
+                    and self._checkpoint_key is not None
+                    and walk_valid
+                    and last_entry is not None
+                ):
+                    session.add(
+                        AuditCheckpoint(
+                            created_at=datetime.utcnow(),
+                            entry_id=last_entry.entry_id,
+                            entry_hash=last_entry.entry_hash,
+                            entry_timestamp=last_entry.timestamp,
+                            position=position,
+                            signature=self._sign_checkpoint(
+                                entry_id=last_entry.entry_id,
+                                entry_hash=last_entry.entry_hash,
+                                entry_timestamp=last_entry.timestamp,
+                                position=position,
+                            ),
+                        )
+                    )
+                    checkpoint_saved = True
+
                 result = {
                     "valid": is_valid,
-                    "total_entries": len(entries),
-                    "verified_entries": len(entries) - len(invalid_entries) - len(chain_breaks),
+                    "total_entries": total_entries,
+                    "verified_entries": total_entries - len(invalid_entries) - len(chain_breaks),
                     "invalid_entries": invalid_entries,
                     "chain_breaks": chain_breaks,
-                    "details": f"Chain verification: {len(entries)} entries, "
-                    f"{len(invalid_entries)} invalid, {len(chain_breaks)} breaks",
+                    "checkpoint": checkpoint.to_dict() if checkpoint else None,
+                    "checkpoint_saved": checkpoint_saved,
+                    "details": f"Chain verification: {total_entries} entries, "
+                    f"{len(invalid_entries)} invalid, {len(chain_breaks)} breaks"
+                    + (f", resumed at position {checkpoint.position}" if checkpoint else ""),
                 }
 
                 if is_valid:
@@ -518,7 +883,9 @@ class HashChainAuditLogger:
         """
         Rollback audit log to specified hash.
 
-        Removes all entries after the target hash entry.
+        Removes all entries after the target hash entry, along with any
+        verification checkpoints past it, so resumed verification never
+        starts from a removed entry.
         Preserves referential integrity of hash chain.
 
         Args:
@@ -554,11 +921,25 @@ class HashChainAuditLogger:
                 for entry in entries_to_remove:
                     session.delete(entry)
 
+                # Checkpoints past the target cover entries that no longer exist
+                checkpoints_removed = (
+                    session.query(AuditCheckpoint)
+                    .filter(AuditCheckpoint.entry_timestamp > target_entry.timestamp)
+                    .delete(synchronize_session=False)
+                )
+
+                # Move the chain tail back to the target entry
+                tail = self._lock_tail(session)
+                tail.entry_id = target_entry.entry_id
+                tail.entry_hash = target_entry.entry_hash
+                tail.timestamp = target_entry.timestamp
+
                 entries_removed = len(entries_to_remove)
                 session.flush()
 
                 self.logger.warning(
-                    f"Rollback complete: removed {entries_removed} entries"
+                    f"Rollback complete: removed {entries_removed} entries "
+                    f"and {checkpoints_removed} checkpoints"
                 )
 
                 return True, entries_removed
@@ -12,12 +12,18 @@ Usage:
     cache.set_json("key", {"data": "value"}, ttl_s=3600)
     data = cache.get_json("key")
 
+    # In-process LRU in front of Redis with request coalescing
+    from cache.redis_cache import TieredCache
+
+    cache = TieredCache.from_env()
+    result = cache.get_or_compute(key, lambda: expensive_call())
+
 PHI Considerations:
     - Default: Do NOT cache PHI-bearing content
     - If caching PHI: Use CACHE_FERNET_KEY for encryption and short TTLs
     - Consider de-identifying data before caching
 """
 
-from .redis_cache import RedisCache, RedisCacheConfig
+from .redis_cache import CacheStats, RedisCache, RedisCacheConfig, TieredCache
 
-__all__ = ["RedisCache", "RedisCacheConfig"]
+__all__ = ["CacheStats", "RedisCache", "RedisCacheConfig", "TieredCache"]
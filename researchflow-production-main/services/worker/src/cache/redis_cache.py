@@ -11,11 +11,17 @@ Environment Variables:
     CACHE_TTL_S: Default TTL in seconds (default: 86400 = 24h)
     CACHE_PREFIX: Key prefix for namespacing (default: "worker")
     CACHE_FERNET_KEY: Optional Fernet key for encryption
+    CACHE_LOCAL_MAX_ENTRIES: In-process LRU entry limit (default: 10000)
+    CACHE_LOCAL_MAX_BYTES: In-process LRU size limit (default: 67108864 = 64MB)
+    CACHE_LOCAL_FRESH_S: Age after which local hits are revalidated (default: 60)
+    CACHE_LOCAL_STALE_S: Age after which local entries are dropped (default: 300)
 
 PHI Considerations:
     - Safest default: cache only for de-identified inputs
     - If caching PHI: enable encryption with CACHE_FERNET_KEY
     - Use short TTLs for sensitive data
+    - TieredCache keeps decrypted values in process memory for up to
+      CACHE_LOCAL_STALE_S seconds
 """
 
 from __future__ import annotations
@@ -25,8 +31,12 @@ import hashlib
 import json
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import redis
 
@@ -46,6 +56,12 @@ class RedisCacheConfig:
     prefix: str = "worker"
     fernet_key: Optional[str] = None  # Optional encryption key
 
+    # In-process tier used by TieredCache
+    local_max_entries: int = 10000
+    local_max_bytes: int = 64 * 1024 * 1024
+    local_fresh_s: float = 60.0
+    local_stale_s: float = 300.0
+
     @classmethod
     def from_env(cls) -> "RedisCacheConfig":
         """
@@ -56,12 +72,22 @@ class RedisCacheConfig:
             CACHE_TTL_S: Default TTL (default: 86400)
             CACHE_PREFIX: Key prefix (default: "worker")
             CACHE_FERNET_KEY: Encryption key (optional)
+            CACHE_LOCAL_MAX_ENTRIES: Local LRU entry limit (default: 10000)
+            CACHE_LOCAL_MAX_BYTES: Local LRU size limit (default: 64MB)
+            CACHE_LOCAL_FRESH_S: Local revalidation age (default: 60)
+            CACHE_LOCAL_STALE_S: Local max age (default: 300)
         """
         return cls(
             url=os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
             default_ttl_s=int(os.getenv("CACHE_TTL_S", "86400")),
             prefix=os.getenv("CACHE_PREFIX", "worker"),
             fernet_key=os.getenv("CACHE_FERNET_KEY"),
+            local_max_entries=int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "10000")),
+            local_max_bytes=int(
+                os.getenv("CACHE_LOCAL_MAX_BYTES", str(64 * 1024 * 1024))
+            ),
+            local_fresh_s=float(os.getenv("CACHE_LOCAL_FRESH_S", "60")),
+            local_stale_s=float(os.getenv("CACHE_LOCAL_STALE_S", "300")),
         )
 
 
@@ -123,6 +149,38 @@ class RedisCache:
             return raw
         return self._fernet.decrypt(raw)
 
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get decrypted serialized value from cache.
+
+        Unlike get_json(), errors are raised so callers can tell a miss
+        from an unavailable Redis.
+
+        Args:
+            key: Cache key (without prefix)
+
+        Returns:
+            Decrypted JSON bytes or None if not found
+        """
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return None
+        return self._decrypt(raw)
+
+    def set_raw(self, key: str, raw: bytes, *, ttl_s: Optional[int] = None) -> None:
+        """
+        Encrypt and store already serialized JSON bytes.
+
+        Args:
+            key: Cache key (without prefix)
+            raw: JSON bytes
+            ttl_s: TTL in seconds (uses default if not specified)
+        """
+        ttl = ttl_s if ttl_s is not None else self.cfg.default_ttl_s
+
+        # Redis SET with EX (seconds TTL)
+        self.client.set(self._key(key), self._encrypt(raw), ex=ttl)
+
     def get_json(self, key: str) -> Any | None:
         """
         Get JSON value from cache.
@@ -134,11 +192,10 @@ class RedisCache:
             Deserialized value or None if not found/error
         """
         try:
-            raw = self.client.get(self._key(key))
+            raw = self.get_raw(key)
             if raw is None:
                 return None
 
-            raw = self._decrypt(raw)
             return json.loads(raw.decode("utf-8"))
         except Exception as e:
             logger.warning(f"Cache get failed for {key}: {e}")
@@ -164,12 +221,7 @@ class RedisCache:
         """
         try:
             raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
-            raw = self._encrypt(raw)
-
-            ttl = ttl_s if ttl_s is not None else self.cfg.default_ttl_s
-
-            # Redis SET with EX (seconds TTL)
-            self.client.set(self._key(key), raw, ex=ttl)
+            self.set_raw(key, raw, ttl_s=ttl_s)
             return True
         except Exception as e:
             logger.warning(f"Cache set failed for {key}: {e}")
@@ -267,8 +319,420 @@ class RedisCache:
             return False
 
 
+@dataclass
+class _LocalEntry:
+    """Serialized value held by the in-process tier."""
+    raw: bytes
+    fresh_until: float
+    expires_at: float
+
+
+class LocalLRUCache:
+    """
+    Thread-safe in-process LRU cache bounded by entry count and bytes.
+
+    Values are stored as serialized JSON bytes, so the byte limit reflects
+    actual payload size and callers never share mutable objects.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of stored values in bytes."""
+        return self._bytes
+
+    def get(self, key: str, now: float) -> Optional[_LocalEntry]:
+        """Return the entry for key, dropping it if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, raw: bytes, fresh_s: float, ttl_s: float, now: float) -> None:
+        """Store raw bytes, evicting least recently used entries to fit."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(raw) > self.max_bytes or self.max_entries <= 0:
+                return
+
+            self._entries[key] = _LocalEntry(
+                raw=raw,
+                fresh_until=now + min(fresh_s, ttl_s),
+                expires_at=now + ttl_s,
+            )
+            self._bytes += len(raw)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.raw)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss and latency counters for TieredCache."""
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    remote_gets: int = 0
+    remote_get_ms: float = 0.0
+    computes: int = 0
+    compute_ms: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def incr(self, name: str, amount: float = 1) -> None:
+        """Add amount to a counter."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counters plus derived hit rate and mean latencies."""
+        with self._lock:
+            lookups = self.local_hits + self.remote_hits + self.misses
+            return {
+                "local_hits": self.local_hits,
+                "remote_hits": self.remote_hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "refreshes": self.refreshes,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "hit_rate": (
+                    (self.local_hits + self.remote_hits) / lookups if lookups else None
+                ),
+                "remote_get_avg_ms": (
+                    self.remote_get_ms / self.remote_gets if self.remote_gets else None
+                ),
+                "compute_avg_ms": (
+                    self.compute_ms / self.computes if self.computes else None
+                ),
+            }
+
+
+class _Flight:
+    """In-progress load shared by concurrent callers of the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.raw: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+class TieredCache:
+    """
+    In-process LRU in front of a RedisCache.
+
+    - Local hits skip the network round trip and decryption
+    - Concurrent misses on the same key are coalesced into one Redis
+      lookup (and one compute in get_or_compute)
+    - Local entries older than local_fresh_s are served stale while a
+      background task revalidates them against Redis; entries older than
+      local_stale_s are dropped
+
+    Example:
+        cache = TieredCache.from_env()
+        result = cache.get_or_compute(key, lambda: llm.extract(text))
+        cache.stats_snapshot()
+    """
+
+    stable_text_key = staticmethod(RedisCache.stable_text_key)
+
+    def __init__(
+        self,
+        remote: RedisCache,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        fresh_s: Optional[float] = None,
+        stale_s: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize tiered cache.
+
+        Args:
+            remote: Backing Redis cache
+            max_entries: Local entry limit (default: cfg.local_max_entries)
+            max_bytes: Local size limit (default: cfg.local_max_bytes)
+            fresh_s: Local revalidation age (default: cfg.local_fresh_s)
+            stale_s: Local max age (default: cfg.local_stale_s)
+        """
+        cfg = remote.cfg
+        self.remote = remote
+        self.local = LocalLRUCache(
+            max_entries if max_entries is not None else cfg.local_max_entries,
+            max_bytes if max_bytes is not None else cfg.local_max_bytes,
+        )
+        self.fresh_s = fresh_s if fresh_s is not None else cfg.local_fresh_s
+        self.stale_s = stale_s if stale_s is not None else cfg.local_stale_s
+        self.stats = CacheStats()
+
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "TieredCache":
+        """Create tiered cache from environment variables."""
+        return cls(RedisCache.from_env())
+
+    def get_json(self, key: str) -> Any | None:
+        """
+        Get JSON value, checking the local tier before Redis.
+
+        Args:
+            key: Cache key (without prefix)
+
+        Returns:
+            Deserialized value or None if not found/error
+        """
+        raw = self._get_local(key)
+        if raw is None:
+            raw = self._single_flight(("get", key), lambda: self._load_remote(key))[1]
+        return json.loads(raw) if raw is not None else None
+
+    def set_json(self, key: str, value: Any, *, ttl_s: Optional[int] = None) -> bool:
+        """
+        Set JSON value in both tiers.
+
+        Args:
+            key: Cache key (without prefix)
+            value: JSON-serializable value
+            ttl_s: TTL in seconds (uses default if not specified)
+
+        Returns:
+            True if Redis write succeeded, False otherwise
+        """
+        try:
+            raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+            return False
+
+        self._put_local(key, raw, ttl_s)
+        try:
+            self.remote.set_raw(key, raw, ttl_s=ttl_s)
+            return True
+        except Exception as e:
+            self.stats.incr("errors")
+            logger.warning(f"Cache set failed for {key}: {e}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        """Delete key from both tiers."""
+        self.local.delete(key)
+        return self.remote.delete(key)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], Any],
+        *,
+        ttl_s: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Concurrent callers that miss on the same key wait for a single
+        compute_fn call. Exceptions from compute_fn propagate to all of
+        them and nothing is cached.
+
+        Args:
+            key: Cache key (without prefix)
+            compute_fn: Zero-argument function producing a JSON value
+            ttl_s: TTL in seconds (uses default if not specified)
+
+        Returns:
+            Cached or freshly computed value
+        """
+        raw = self._get_local(key)
+        if raw is not None:
+            return json.loads(raw)
+
+        value, raw = self._single_flight(
+            ("compute", key), lambda: self._load_or_compute(key, compute_fn, ttl_s)
+        )
+        return json.loads(raw) if raw is not None else value
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        """Local lookup; schedules revalidation for stale entries."""
+        now = time.monotonic()
+        entry = self.local.get(key, now)
+        if entry is None:
+            return None
+
+        self.stats.incr("local_hits")
+        if entry.fresh_until <= now:
+            self.stats.incr("stale_hits")
+            self._schedule_refresh(key)
+        return entry.raw
+
+    def _put_local(self, key: str, raw: bytes, ttl_s: Optional[int]) -> None:
+        ttl = ttl_s if ttl_s is not None else self.remote.cfg.default_ttl_s
+        self.local.put(key, raw, self.fresh_s, min(self.stale_s, ttl), time.monotonic())
+
+    def _fetch_remote(self, key: str) -> Optional[bytes]:
+        """Timed Redis lookup; raises on Redis errors."""
+        start = time.perf_counter()
+        try:
+            return self.remote.get_raw(key)
+        finally:
+            self.stats.incr("remote_gets")
+            self.stats.incr("remote_get_ms", (time.perf_counter() - start) * 1000)
+
+    def _load_remote(self, key: str) -> Tuple[Any, Optional[bytes]]:
+        """Fetch from Redis into the local tier; errors count as misses."""
+        try:
+            raw = self._fetch_remote(key)
+        except Exception as e:
+            self.stats.incr("errors")
+            logger.warning(f"Cache get failed for {key}: {e}")
+            raw = None
+
+        if raw is None:
+            self.stats.incr("misses")
+            return None, None
+
+        self.stats.incr("remote_hits")
+        self._put_local(key, raw, None)
+        return None, raw
+
+    def _load_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], Any],
+        ttl_s: Optional[int],
+    ) -> Tuple[Any, Optional[bytes]]:
+        """Fetch from Redis, falling back to compute_fn and storing the result."""
+        _, raw = self._load_remote(key)
+        if raw is not None:
+            return None, raw
+
+        start = time.perf_counter()
+        try:
+            value = compute_fn()
+        finally:
+            self.stats.incr("computes")
+            self.stats.incr("compute_ms", (time.perf_counter() - start) * 1000)
+
+        try:
+            raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+            return value, None
+
+        self._put_local(key, raw, ttl_s)
+        try:
+            self.remote.set_raw(key, raw, ttl_s=ttl_s)
+        except Exception as e:
+            self.stats.incr("errors")
+            logger.warning(f"Cache set failed for {key}: {e}")
+        return value, raw
+
+    def _single_flight(
+        self,
+        flight_key: Tuple[str, str],
+        load: Callable[[], Tuple[Any, Optional[bytes]]],
+    ) -> Tuple[Any, Optional[bytes]]:
+        """Run load once per flight_key across concurrent callers."""
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+
+        if not leader:
+            self.stats.incr("coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, flight.raw
+
+        try:
+            flight.value, flight.raw = load()
+            return flight.value, flight.raw
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[flight_key]
+            flight.done.set()
+
+    def _schedule_refresh(self, key: str) -> None:
+        """Revalidate a stale local entry against Redis in the background."""
+        flight_key = ("refresh", key)
+        with self._flights_lock:
+            if flight_key in self._flights:
+                return
+            self._flights[flight_key] = _Flight()
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="cache-refresh"
+                )
+
+        self._refresher.submit(self._refresh, key)
+
+    def _refresh(self, key: str) -> None:
+        flight_key = ("refresh", key)
+        try:
+            raw = self._fetch_remote(key)
+            if raw is None:
+                self.local.delete(key)
+            else:
+                self._put_local(key, raw, None)
+            self.stats.incr("refreshes")
+        except Exception as e:
+            # Keep serving the stale entry until it expires
+            self.stats.incr("errors")
+            logger.warning(f"Cache refresh failed for {key}: {e}")
+        finally:
+            with self._flights_lock:
+                self._flights.pop(flight_key).done.set()
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Counters plus local tier occupancy."""
+        snapshot = self.stats.snapshot()
+        snapshot.update(
+            local_entries=len(self.local),
+            local_bytes=self.local.nbytes,
+            local_evictions=self.local.evictions,
+        )
+        return snapshot
+
+
 def cached_extraction(
-    cache: RedisCache,
+    cache: RedisCache | TieredCache,
     extract_fn,
     text: str,
     model: str,
@@ -287,8 +751,11 @@ def cached_extraction(
             ttl_s=604800  # 1 week
         )
 
+    With a TieredCache, concurrent calls for the same text share a single
+    extraction and repeated calls are served from process memory.
+
     Args:
-        cache: RedisCache instance
+        cache: RedisCache or TieredCache instance
         extract_fn: Extraction function to call on cache miss
         text: Input text
         model: Model identifier (for cache key)
@@ -299,6 +766,9 @@ def cached_extraction(
     """
     key = cache.stable_text_key("llm_extract", text, extra=model)
 
+    if isinstance(cache, TieredCache):
+        return cache.get_or_compute(key, lambda: extract_fn(text), ttl_s=ttl_s)
+
     # Try cache
     hit = cache.get_json(key)
     if hit is not None:
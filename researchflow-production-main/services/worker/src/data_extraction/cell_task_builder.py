@@ -308,7 +308,7 @@ class CellTaskBuilder:
                 detection.col_name
             ),
             job_id=self.job_id,
-            partition_id=partition_id or self._partition_counter,
+            partition_id=partition_id if partition_id is not None else self._partition_counter,
             row_idx=detection.row_idx,
             col_name=detection.col_name,
             content_hash=detection.content_hash,
@@ -363,6 +363,7 @@ class CellTaskBuilder:
         row_start: int,
         row_end: int,
         metadata: Optional[Dict[str, Any]] = None,
+        partition_id: Optional[int] = None,
     ) -> PartitionTasks:
         """
         Build tasks for a partition (chunk) of data.
@@ -373,11 +374,13 @@ class CellTaskBuilder:
             row_start: Starting row index
             row_end: Ending row index
             metadata: Additional metadata
+            partition_id: Explicit partition ID (None = next counter value)
             
         Returns:
             PartitionTasks object
         """
-        partition_id = self._partition_counter
+        if partition_id is None:
+            partition_id = self._partition_counter
         self._partition_counter += 1
         
         initial_dedup = self._dedup_count
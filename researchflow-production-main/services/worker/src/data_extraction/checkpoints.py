@@ -351,6 +351,19 @@ class CheckpointWriter:
         logger.debug(f"Wrote {len(results)} results to {filepath}")
         return str(filepath)
     
+    def mark_completed(self, partition_ids: List[int]) -> None:
+        """
+        Record partitions completed by an earlier run of the same job.
+        
+        Keeps them in the manifest written at the end of a resumed run.
+        
+        Args:
+            partition_ids: Partition IDs with existing result checkpoints
+        """
+        for partition_id in partition_ids:
+            if partition_id not in self._completed_partitions:
+                self._completed_partitions.append(partition_id)
+    
     def write_manifest(self) -> str:
         """
         Write job manifest with checkpoint state.
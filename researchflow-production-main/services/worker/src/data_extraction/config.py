@@ -53,7 +53,11 @@ class LargeSheetConfig:
     large_csv_mb: int = 200
     chunk_rows: int = 50_000
     llm_concurrency: int = 24
+    llm_queue_size: int = 0  # 0 = 4 x llm_concurrency
     llm_batch_size: int = 20
+    dedup_store_path: str = ""  # "" = per-job store in the output directory
+    extractor_id: str = ""  # model/extractor in dedup keys ("" = extract_fn's name)
+    prompt_version: str = ""  # bump when prompt wording changes to bypass stored results
     task_checkpoint_every_chunks: int = 1
     output_format: Literal["parquet", "jsonl"] = "parquet"
     join_back_to_sheet: bool = False
@@ -169,7 +173,11 @@ def config_to_dict(config: ExtractionConfig) -> Dict[str, Any]:
             "large_csv_mb": config.large_sheet.large_csv_mb,
             "chunk_rows": config.large_sheet.chunk_rows,
             "llm_concurrency": config.large_sheet.llm_concurrency,
+            "llm_queue_size": config.large_sheet.llm_queue_size,
             "llm_batch_size": config.large_sheet.llm_batch_size,
+            "dedup_store_path": config.large_sheet.dedup_store_path,
+            "extractor_id": config.large_sheet.extractor_id,
+            "prompt_version": config.large_sheet.prompt_version,
             "output_format": config.large_sheet.output_format,
             "join_back_to_sheet": config.large_sheet.join_back_to_sheet,
             "enable_dask": config.large_sheet.enable_dask,
@@ -14,7 +14,12 @@ Key Features:
 - Memory-safe streaming for multi-GB files
 - Bounded LLM concurrency to avoid rate limits
 - Checkpoint/resume for long-running jobs
-- Micro-batching for efficiency
+- Producer/consumer streaming: detection feeds a bounded queue drained by
+  llm_concurrency workers, and each chunk's results are checkpointed as
+  soon as its last task finishes
+- Text dedup: each distinct normalized text is extracted once per prompt
+  template and tier, with results fanned out to every matching cell and
+  reused across jobs (see text_dedup.py)
 - PHI scanning integration
 
 Architecture:
@@ -27,7 +32,7 @@ import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable, Awaitable, Tuple
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Set, Tuple
 import json
 
 from .config import LargeSheetConfig, get_config, config_to_dict
@@ -35,6 +40,12 @@ from .sheet_reader import SheetReader, ChunkResult, get_sheet_metadata, SheetMet
 from .block_text_detector import BlockTextDetector, CellDetection
 from .cell_task_builder import CellTaskBuilder, ExtractionTask, TaskBatch
 from .checkpoints import CheckpointWriter, CheckpointReader, CheckpointState
+from .text_dedup import (
+    SHARED_RESULT_FIELDS,
+    ExtractionResultStore,
+    TextDeduplicator,
+    dedup_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +127,48 @@ class PipelineResult:
 ExtractionFn = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
 
 
+@dataclass
+class _PartitionState:
+    """Results of one chunk, held until all of its tasks finish."""
+    partition_id: int
+    chunk_index: int
+    row_start: int
+    row_end: int
+    pending: int
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    sealed: bool = False  # producer has queued every task of the chunk
+
+
+# (task, cell text, owning partition)
+_QueueItem = Tuple[ExtractionTask, str, _PartitionState]
+
+
+def _fan_out(
+    result: Dict[str, Any],
+    task: ExtractionTask,
+    source: str,
+) -> Dict[str, Any]:
+    """Copy a shared extraction result onto another cell's task."""
+    fanned = {
+        "task_id": task.task_id,
+        "row_idx": task.row_idx,
+        "col_name": task.col_name,
+    }
+    fanned.update({k: result[k] for k in SHARED_RESULT_FIELDS if k in result})
+    fanned["cost_usd"] = 0
+    fanned["processing_time_ms"] = 0
+    fanned["dedup_source"] = source  # "store" or the task that called the LLM
+    return fanned
+
+
+def _extractor_identity(extract_fn: ExtractionFn) -> str:
+    """Default extractor identity for dedup keys: the function's qualified name."""
+    func = getattr(extract_fn, "func", extract_fn)  # unwrap functools.partial
+    module = getattr(func, "__module__", None) or ""
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    return f"{module}.{name}"
+
+
 class LargeSheetPipeline:
     """
     Pipeline for processing large spreadsheets with clinical extraction.
@@ -141,6 +194,7 @@ class LargeSheetPipeline:
         output_dir: Path,
         config: Optional[LargeSheetConfig] = None,
         progress_callback: Optional[Callable[[PipelineProgress], None]] = None,
+        result_store: Optional[ExtractionResultStore] = None,
     ):
         """
         Initialize pipeline.
@@ -150,6 +204,8 @@ class LargeSheetPipeline:
             output_dir: Directory for outputs and checkpoints
             config: Pipeline configuration (uses global if None)
             progress_callback: Optional callback for progress updates
+            result_store: Extraction result store for text dedup (default:
+                config.dedup_store_path, else a store in output_dir)
         """
         self.job_id = job_id
         self.output_dir = Path(output_dir)
@@ -166,7 +222,16 @@ class LargeSheetPipeline:
             dask_blocksize=self.config.dask_blocksize,
         )
         self.detector = BlockTextDetector()
-        self.task_builder = CellTaskBuilder(job_id=job_id)
+        # Duplicate texts become tasks too; TextDeduplicator fans results out
+        self.task_builder = CellTaskBuilder(job_id=job_id, enable_dedup=False)
+        if result_store is None:
+            result_store = ExtractionResultStore(
+                self.config.dedup_store_path
+                or self.output_dir / "extraction_store.sqlite"
+            )
+        self.dedup: TextDeduplicator[_QueueItem] = (
+            TextDeduplicator(result_store)
+        )
         self.checkpoint_writer = CheckpointWriter(
             job_id=job_id,
             base_dir=self.output_dir,
@@ -187,9 +252,8 @@ class LargeSheetPipeline:
             current_chunk=0,
         )
         self._start_time: Optional[float] = None
-        self._all_tasks: List[ExtractionTask] = []
-        self._task_texts: Dict[str, str] = {}  # task_id -> text
-        self._results: List[Dict[str, Any]] = []
+        self._total_task_count = 0
+        self._result_count = 0
         self._total_cost = 0.0
         self._total_tokens = {"input": 0, "output": 0}
     
@@ -203,21 +267,15 @@ class LargeSheetPipeline:
         if self.progress_callback:
             self.progress_callback(self._progress)
     
-    async def _scan_and_detect(
-        self,
-        input_path: Path,
-        sheet_name: Optional[str] = None,
-        resume_from: Optional[int] = None,
-    ) -> Tuple[SheetMetadata, int]:
+    async def _scan(self, input_path: Path) -> SheetMetadata:
         """
-        Phase 1: Scan file and detect block text cells.
+        Phase 1: Read file metadata and estimate size.
         
         Returns:
-            Tuple of (metadata, total_chunks)
+            SheetMetadata for the input file
         """
         self._update_progress("scan", current_chunk=0)
         
-        # Get metadata
         metadata = self.reader.get_metadata(input_path)
         estimated_chunks = (
             (metadata.estimated_rows or 0) // self.config.chunk_rows + 1
@@ -230,191 +288,297 @@ class LargeSheetPipeline:
             f"Scanning {metadata.file_type} file: "
             f"{metadata.file_size_mb:.1f}MB, ~{metadata.estimated_rows} rows"
         )
+        return metadata
+    
+    def _prepare_chunk(
+        self,
+        chunk: ChunkResult,
+    ) -> Tuple[_PartitionState, List[Tuple[ExtractionTask, str]]]:
+        """
+        Detect block text in one chunk, build its tasks and checkpoint them.
+        
+        Runs in a worker thread so LLM calls keep progressing meanwhile.
+        
+        Returns:
+            Tuple of (partition state, [(task, cell text), ...])
+        """
+        detections = self.detector.detect_dataframe(
+            chunk.df,
+            check_dedup=False,
+        )
+        
+        partition = self.task_builder.build_partition_tasks(
+            detections=detections,
+            chunk_index=chunk.chunk_index,
+            row_start=chunk.row_start,
+            row_end=chunk.row_end,
+            partition_id=chunk.chunk_index,
+        )
         
-        # Process chunks
+        texts = {
+            (d.row_idx, d.col_name): d.text
+            for d in detections
+            if d.should_extract
+        }
+        work = [
+            (task, texts.get((task.row_idx, task.col_name), ""))
+            for task in partition.tasks
+        ]
+        
+        self.checkpoint_writer.write_tasks(
+            partition_id=partition.partition_id,
+            chunk_index=chunk.chunk_index,
+            row_start=chunk.row_start,
+            row_end=chunk.row_end,
+            tasks=[t.to_dict() for t in partition.tasks],
+        )
+        
+        state = _PartitionState(
+            partition_id=partition.partition_id,
+            chunk_index=chunk.chunk_index,
+            row_start=chunk.row_start,
+            row_end=chunk.row_end,
+            pending=len(work),
+        )
+        return state, work
+    
+    async def _produce(
+        self,
+        input_path: Path,
+        sheet_name: Optional[str],
+        completed_partitions: Set[int],
+        queue: "asyncio.Queue[Optional[_QueueItem]]",
+    ) -> int:
+        """
+        Producer: stream chunks, detect cells and enqueue extraction tasks.
+        
+        Blocks on the bounded queue when the LLM workers fall behind, so at
+        most one chunk plus the queue's worth of cell text is held at once.
+        
+        Returns:
+            Number of chunks read (including resumed ones)
+        """
+        chunk_iter = iter(self.reader.read_chunks(input_path, sheet_name))
         chunk_count = 0
-        for chunk in self.reader.read_chunks(input_path, sheet_name):
-            # Skip already completed chunks
-            if resume_from and chunk.chunk_index < resume_from:
+        
+        while True:
+            chunk = await asyncio.to_thread(next, chunk_iter, None)
+            if chunk is None:
+                break
+            chunk_count += 1
+            
+            # Skip chunks whose results were checkpointed by a previous run
+            if chunk.chunk_index in completed_partitions:
                 continue
             
             self._update_progress(
                 "detect",
                 current_chunk=chunk.chunk_index,
-                processed_rows=chunk.row_end,
-            )
-            
-            # Detect block text cells
-            detections = self.detector.detect_dataframe(
-                chunk.df,
-                check_dedup=True,
-            )
-            
-            # Build tasks for this chunk
-            partition = self.task_builder.build_partition_tasks(
-                detections=detections,
-                chunk_index=chunk.chunk_index,
-                row_start=chunk.row_start,
-                row_end=chunk.row_end,
-            )
-            
-            # Store task texts for extraction
-            for detection in detections:
-                if detection.should_extract:
-                    task_id = f"task_{self.job_id[:8]}_{detection.row_idx}_{detection.col_name}"
-                    # Find matching task
-                    for task in partition.tasks:
-                        if task.row_idx == detection.row_idx and task.col_name == detection.col_name:
-                            self._task_texts[task.task_id] = detection.text
-                            break
-            
-            # Write task checkpoint
-            self.checkpoint_writer.write_tasks(
-                partition_id=partition.partition_id,
-                chunk_index=chunk.chunk_index,
-                row_start=chunk.row_start,
-                row_end=chunk.row_end,
-                tasks=[t.to_dict() for t in partition.tasks],
+                processed_rows=chunk.row_end + 1,
             )
             
-            self._all_tasks.extend(partition.tasks)
-            chunk_count += 1
-            
+            state, work = await asyncio.to_thread(self._prepare_chunk, chunk)
+            self._total_task_count += len(work)
             self._update_progress(
                 "detect",
                 completed_chunks=chunk_count,
-                total_tasks=len(self._all_tasks),
+                total_tasks=self._total_task_count,
             )
+            
+            for task, text in work:
+                await queue.put((task, text, state))
+            state.sealed = True
+            if state.pending == 0:
+                self._complete_partition(state)
         
         logger.info(
-            f"Detection complete: {len(self._all_tasks)} tasks from {chunk_count} chunks"
+            f"Detection complete: {self._total_task_count} tasks from {chunk_count} chunks"
         )
+        return chunk_count
+    
+    async def _process_task(
+        self,
+        task: ExtractionTask,
+        text: str,
+        extract_fn: ExtractionFn,
+    ) -> Dict[str, Any]:
+        """Process single extraction task."""
+        try:
+            if not text:
+                return {
+                    "task_id": task.task_id,
+                    "row_idx": task.row_idx,
+                    "col_name": task.col_name,
+                    "success": False,
+                    "error": "text_not_found",
+                }
+            
+            # Call extraction function
+            result = await extract_fn(text, {
+                "task_id": task.task_id,
+                "row_idx": task.row_idx,
+                "col_name": task.col_name,
+                "prompt_template": task.prompt_template,
+                "force_tier": task.force_tier,
+            })
+            
+            # Track costs
+            if "cost_usd" in result:
+                self._total_cost += result["cost_usd"]
+            if "tokens" in result:
+                self._total_tokens["input"] += result["tokens"].get("input", 0)
+                self._total_tokens["output"] += result["tokens"].get("output", 0)
+            
+            return {
+                "task_id": task.task_id,
+                "row_idx": task.row_idx,
+                "col_name": task.col_name,
+                "success": result.get("success", True),
+                "extraction": result.get("extraction"),
+                "tier_used": result.get("tier_used"),
+                "cost_usd": result.get("cost_usd", 0),
+                "processing_time_ms": result.get("processing_time_ms"),
+            }
+            
+        except Exception as e:
+            logger.error(f"Task {task.task_id} failed: {e}")
+            return {
+                "task_id": task.task_id,
+                "row_idx": task.row_idx,
+                "col_name": task.col_name,
+                "success": False,
+                "error": str(e)[:200],
+            }
+    
+    async def _consume(
+        self,
+        queue: "asyncio.Queue[Optional[_QueueItem]]",
+        extract_fn: ExtractionFn,
+    ) -> None:
+        """
+        Consumer: run extraction tasks until the producer's stop marker.
         
-        return metadata, chunk_count
+        Each of the llm_concurrency consumers keeps one call in flight, so a
+        slow call only occupies its own slot. Texts already in the result
+        store are answered without a call, and a text that is in flight
+        parks later identical tasks until its result can be fanned out. If
+        that call fails, the parked tasks retry in turn until one succeeds.
+        """
+        extractor = self.config.extractor_id or _extractor_identity(extract_fn)
+        prompt_version = self.config.prompt_version or None
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            task, text, state = item
+            
+            key = dedup_key(
+                text, task.prompt_template, task.force_tier, extractor, prompt_version,
+            ) if text else None
+            if key is not None:
+                cached = self.dedup.lookup(key)
+                if cached is not None:
+                    self._record_result(state, _fan_out(cached, task, "store"))
+                    continue
+                if not self.dedup.claim(key, item):
+                    continue
+            
+            result = await self._process_task(task, text, extract_fn)
+            self._record_result(state, result)
+            if key is None:
+                continue
+            
+            followers = self.dedup.release(key, result)
+            while followers and not result.get("success", False):
+                # Retry with the first waiting cell rather than failing them all
+                for follower in followers:
+                    self.dedup.claim(key, follower)
+                task, text, state = followers[0]
+                result = await self._process_task(task, text, extract_fn)
+                self._record_result(state, result)
+                followers = self.dedup.release(key, result)
+            
+            for follower, _, follower_state in followers:
+                self._record_result(
+                    follower_state, _fan_out(result, follower, task.task_id),
+                )
+    
+    def _record_result(self, state: _PartitionState, result: Dict[str, Any]) -> None:
+        """Count a task result and checkpoint its chunk once complete."""
+        if result.get("success", False):
+            self._progress.completed_tasks += 1
+        else:
+            self._progress.failed_tasks += 1
+        self._update_progress("llm")
+        
+        state.results.append(result)
+        state.pending -= 1
+        if state.sealed and state.pending == 0:
+            self._complete_partition(state)
     
-    async def _extract_tasks(
+    def _complete_partition(self, state: _PartitionState) -> None:
+        """Write the results checkpoint for a chunk whose tasks all finished."""
+        state.results.sort(key=lambda r: (r.get("row_idx", -1), str(r.get("col_name"))))
+        self.checkpoint_writer.write_results(
+            partition_id=state.partition_id,
+            chunk_index=state.chunk_index,
+            row_start=state.row_start,
+            row_end=state.row_end,
+            results=state.results,
+        )
+        self._result_count += len(state.results)
+        # Results now live only in the checkpoint
+        state.results = []
+    
+    async def _stream_extract(
         self,
+        input_path: Path,
         extract_fn: ExtractionFn,
-        resume_from_task: int = 0,
+        sheet_name: Optional[str] = None,
+        completed_partitions: Optional[Set[int]] = None,
     ) -> int:
         """
-        Phase 2: Execute extraction on all tasks with bounded concurrency.
+        Phases 1-2: Detect and extract as a producer/consumer pipeline.
         
         Returns:
-            Number of completed tasks
+            Number of chunks read
         """
-        self._update_progress("llm", completed_tasks=0)
+        concurrency = max(1, self.config.llm_concurrency)
+        queue_size = self.config.llm_queue_size or concurrency * 4
+        queue: "asyncio.Queue[Optional[_QueueItem]]" = asyncio.Queue(maxsize=queue_size)
         
-        # Skip already completed tasks
-        tasks_to_process = self._all_tasks[resume_from_task:]
+        async def produce() -> int:
+            chunk_count = await self._produce(
+                input_path,
+                sheet_name,
+                completed_partitions or set(),
+                queue,
+            )
+            # One stop marker per consumer, queued behind the real work
+            for _ in range(concurrency):
+                await queue.put(None)
+            return chunk_count
         
-        if not tasks_to_process:
-            logger.info("No tasks to process")
-            return 0
+        producer = asyncio.create_task(produce())
+        consumers = [
+            asyncio.create_task(self._consume(queue, extract_fn))
+            for _ in range(concurrency)
+        ]
         
-        # Create batches for micro-batching
-        batches = self.task_builder.build_batches(
-            tasks_to_process,
-            batch_size=self.config.llm_batch_size,
-        )
+        try:
+            chunk_count, *_ = await asyncio.gather(producer, *consumers)
+        except BaseException:
+            # A failed reader or checkpoint write stops the whole pipeline
+            for t in (producer, *consumers):
+                t.cancel()
+            await asyncio.gather(producer, *consumers, return_exceptions=True)
+            raise
         
-        # Semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.config.llm_concurrency)
-        
-        async def process_task(task: ExtractionTask) -> Dict[str, Any]:
-            """Process single extraction task."""
-            async with semaphore:
-                try:
-                    text = self._task_texts.get(task.task_id, "")
-                    if not text:
-                        return {
-                            "task_id": task.task_id,
-                            "success": False,
-                            "error": "text_not_found",
-                        }
-                    
-                    # Call extraction function
-                    result = await extract_fn(text, {
-                        "task_id": task.task_id,
-                        "row_idx": task.row_idx,
-                        "col_name": task.col_name,
-                        "prompt_template": task.prompt_template,
-                        "force_tier": task.force_tier,
-                    })
-                    
-                    # Track costs
-                    if "cost_usd" in result:
-                        self._total_cost += result["cost_usd"]
-                    if "tokens" in result:
-                        self._total_tokens["input"] += result["tokens"].get("input", 0)
-                        self._total_tokens["output"] += result["tokens"].get("output", 0)
-                    
-                    return {
-                        "task_id": task.task_id,
-                        "row_idx": task.row_idx,
-                        "col_name": task.col_name,
-                        "success": result.get("success", True),
-                        "extraction": result.get("extraction"),
-                        "tier_used": result.get("tier_used"),
-                        "cost_usd": result.get("cost_usd", 0),
-                        "processing_time_ms": result.get("processing_time_ms"),
-                    }
-                    
-                except Exception as e:
-                    logger.error(f"Task {task.task_id} failed: {e}")
-                    return {
-                        "task_id": task.task_id,
-                        "success": False,
-                        "error": str(e)[:200],
-                    }
-        
-        # Process all tasks concurrently (respecting semaphore)
-        completed = 0
-        failed = 0
-        
-        # Process in batches to update progress and checkpoint
-        for batch_idx, batch in enumerate(batches):
-            tasks_coros = [process_task(t) for t in batch.tasks]
-            batch_results = await asyncio.gather(*tasks_coros, return_exceptions=True)
-            
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    failed += 1
-                    self._results.append({
-                        "success": False,
-                        "error": str(result)[:200],
-                    })
-                else:
-                    if result.get("success", False):
-                        completed += 1
-                    else:
-                        failed += 1
-                    self._results.append(result)
-            
-            self._update_progress(
-                "llm",
-                completed_tasks=completed,
-                failed_tasks=failed,
-            )
-            
-            # Checkpoint every N chunks
-            if (batch_idx + 1) % self.config.task_checkpoint_every_chunks == 0:
-                # Write results checkpoint
-                batch_results_clean = [
-                    r for r in batch_results 
-                    if isinstance(r, dict)
-                ]
-                if batch_results_clean:
-                    self.checkpoint_writer.write_results(
-                        partition_id=batch_idx,
-                        chunk_index=batch_idx,
-                        row_start=0,
-                        row_end=0,
-                        results=batch_results_clean,
-                    )
-        
-        logger.info(f"Extraction complete: {completed} succeeded, {failed} failed")
-        return completed
+        logger.info(
+            f"Extraction complete: {self._progress.completed_tasks} succeeded, "
+            f"{self._progress.failed_tasks} failed"
+        )
+        return chunk_count
     
     async def _finalize(
         self,
@@ -426,16 +590,7 @@ class LargeSheetPipeline:
         """
         self._update_progress("finalize")
         
-        # Write final results
-        if self._results:
-            self.checkpoint_writer.write_results(
-                partition_id=999999,  # Final partition
-                chunk_index=total_chunks,
-                row_start=0,
-                row_end=self._progress.total_rows,
-                results=self._results,
-            )
-        
+        # Results were checkpointed per chunk as they completed
         # Write manifest
         manifest_path = self.checkpoint_writer.write_manifest()
         
@@ -451,10 +606,10 @@ class LargeSheetPipeline:
             phase_completed="finalize",
             total_rows=self._progress.total_rows,
             total_chunks=total_chunks,
-            total_tasks=len(self._all_tasks),
+            total_tasks=self._total_task_count,
             completed_tasks=self._progress.completed_tasks,
             failed_tasks=self._progress.failed_tasks,
-            deduped_tasks=self.task_builder.get_stats()["dedup_count"],
+            deduped_tasks=self.dedup.stats.saved_calls,
             total_cost_usd=self._total_cost,
             total_tokens=self._total_tokens,
             artifact_paths={
@@ -492,29 +647,28 @@ class LargeSheetPipeline:
         
         logger.info(f"Starting pipeline for job {self.job_id}: {input_path}")
         
-        # Check for resume
-        resume_from_chunk = None
-        resume_from_task = 0
+        # Check for resume: partition IDs are chunk indices, and a results
+        # checkpoint covers exactly that chunk's rows
+        completed_partitions: Set[int] = set()
         
         if resume:
             reader = CheckpointReader(self.output_dir)
             resume_info = reader.get_resume_info()
             if resume_info["completed_partitions"]:
-                resume_from_chunk = resume_info["next_partition"]
-                logger.info(f"Resuming from chunk {resume_from_chunk}")
+                completed_partitions = set(resume_info["completed_partitions"])
+                self.checkpoint_writer.mark_completed(sorted(completed_partitions))
+                logger.info(f"Resuming: {len(completed_partitions)} chunks already complete")
         
         try:
-            # Phase 1: Scan and detect
-            metadata, total_chunks = await self._scan_and_detect(
-                input_path,
-                sheet_name,
-                resume_from_chunk,
-            )
+            # Phase 1: Scan
+            metadata = await self._scan(input_path)
             
-            # Phase 2: Extract
-            await self._extract_tasks(
+            # Phase 2: Detect and extract (streaming)
+            total_chunks = await self._stream_extract(
+                input_path,
                 extract_fn,
-                resume_from_task,
+                sheet_name,
+                completed_partitions,
             )
             
             # Phase 3: Finalize
@@ -531,7 +685,7 @@ class LargeSheetPipeline:
                 phase_completed=self._progress.phase,
                 total_rows=self._progress.total_rows,
                 total_chunks=self._progress.total_chunks,
-                total_tasks=len(self._all_tasks),
+                total_tasks=self._total_task_count,
                 completed_tasks=self._progress.completed_tasks,
                 failed_tasks=self._progress.failed_tasks,
                 deduped_tasks=0,
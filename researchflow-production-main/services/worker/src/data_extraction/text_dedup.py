@@ -0,0 +1,251 @@
+"""
+Text Dedup Module - Extract each distinct cell text once.
+
+Clinical sheets repeat the same narrative many times ("No evidence of
+disease", templated pathology comments). This module sits between block
+text detection and extraction:
+
+- Cell text is normalized (Unicode NFKC, case-folded, whitespace collapsed)
+  and hashed
+- The first task for a (text hash, prompt template, tier, extractor,
+  prompt version) key calls the LLM; identical tasks that arrive while it
+  is in flight wait on it and receive a copy of its result. If that call
+  fails, the waiting tasks are handed back to be claimed and retried
+- Successful results are kept in a persistent SQLite store shared across
+  jobs, so later jobs reuse them without any LLM call
+
+Design Principles:
+- Only the hash of the normalized text is stored, never the text itself
+- Failed extractions are not stored and are retried by later tasks/jobs
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Fields of an extraction result that are shared by all cells with the same text
+SHARED_RESULT_FIELDS = ("success", "extraction", "tier_used", "error")
+
+Target = TypeVar("Target")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize cell text for duplicate detection.
+
+    Applies Unicode NFKC, case folding and whitespace collapsing, so cells
+    that differ only in spacing, line endings or case share one extraction.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
+
+
+def text_hash(text: str) -> str:
+    """Full SHA256 of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def dedup_key(
+    text: str,
+    prompt_template: Optional[str] = None,
+    tier: Optional[str] = None,
+    extractor: Optional[str] = None,
+    prompt_version: Optional[str] = None,
+) -> str:
+    """
+    Key for a text extracted with a given prompt template and tier.
+
+    extractor identifies the model/extraction function and prompt_version
+    the revision of the template's wording, so results from a different
+    model or an edited prompt are never reused from a shared store.
+    """
+    parts = (prompt_template, tier, extractor, prompt_version)
+    return ":".join([text_hash(text), *(part or "" for part in parts)])
+
+
+class ExtractionResultStore:
+    """
+    Persistent cross-job store of extraction results.
+
+    Keyed by dedup_key(); values are the shared result fields as JSON.
+
+    Example:
+        store = ExtractionResultStore(Path("/data/cache/extractions.sqlite"))
+        key = dedup_key(text, "clinical_note_extract_v2", None)
+        cached = store.get(key)
+        if cached is None:
+            store.put(key, result)
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_results (
+                dedup_key TEXT PRIMARY KEY,
+                result_json TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json FROM extraction_results WHERE dedup_key = ?",
+                (key,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store the shared fields of a successful result under key."""
+        payload = {k: result[k] for k in SHARED_RESULT_FIELDS if k in result}
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO extraction_results
+                (dedup_key, result_json, created_at)
+                VALUES (?, ?, ?)
+                """,
+                (key, json.dumps(payload), datetime.now(timezone.utc).isoformat()),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM extraction_results"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class DedupStats:
+    """Counters for a TextDeduplicator."""
+    llm_calls: int = 0
+    store_hits: int = 0
+    fanned_out: int = 0
+
+    @property
+    def saved_calls(self) -> int:
+        return self.store_hits + self.fanned_out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "llm_calls": self.llm_calls,
+            "store_hits": self.store_hits,
+            "fanned_out": self.fanned_out,
+            "saved_calls": self.saved_calls,
+        }
+
+
+class TextDeduplicator(Generic[Target]):
+    """
+    Tracks which texts are being extracted and who is waiting for them.
+
+    Targets are opaque to this class (the pipeline passes its queue items).
+    Not thread-safe; use from one event loop.
+
+    Example:
+        dedup = TextDeduplicator(store)
+        key = dedup_key(text, template, tier)
+        cached = dedup.lookup(key)
+        if cached is None and dedup.claim(key, target):
+            result = await extract(text)
+            followers = dedup.release(key, result)
+            if result["success"]:
+                for follower in followers:
+                    record(follower, result)
+            else:
+                for follower in followers:
+                    dedup.claim(key, follower)  # first one retries
+    """
+
+    def __init__(self, store: Optional[ExtractionResultStore] = None):
+        self.store = store
+        self.stats = DedupStats()
+        # key -> targets waiting on the in-flight extraction
+        self._in_flight: Dict[str, List[Target]] = {}
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a stored result for key, counting it as a store hit."""
+        if self.store is None:
+            return None
+        cached = self.store.get(key)
+        if cached is not None:
+            self.stats.store_hits += 1
+        return cached
+
+    def claim(self, key: str, target: Target) -> bool:
+        """
+        Claim key for extraction.
+
+        Returns:
+            True if the caller should extract; False if the key is already
+            in flight, in which case target is queued for release()
+        """
+        followers = self._in_flight.get(key)
+        if followers is not None:
+            followers.append(target)
+            self.stats.fanned_out += 1
+            return False
+        self._in_flight[key] = []
+        self.stats.llm_calls += 1
+        return True
+
+    def release(self, key: str, result: Dict[str, Any]) -> List[Target]:
+        """
+        Finish an extraction claimed with claim().
+
+        Returns the targets that waited on key. On success the result is
+        stored and should be fanned out to them; on failure they must be
+        claimed again so one of them retries instead of inheriting the
+        failure.
+        """
+        followers = self._in_flight.pop(key, [])
+        if not result.get("success", False):
+            # Handed back for retry; they will be counted again when claimed
+            self.stats.fanned_out -= len(followers)
+            return followers
+        if self.store is not None:
+            try:
+                self.store.put(key, result)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to store extraction result: {e}")
+        return followers
+
+
+__all__ = [
+    "normalize_text",
+    "text_hash",
+    "dedup_key",
+    "ExtractionResultStore",
+    "DedupStats",
+    "TextDeduplicator",
+]
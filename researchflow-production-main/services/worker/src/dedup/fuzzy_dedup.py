@@ -2,6 +2,11 @@
 Fuzzy Deduplication
 
 Identifies and removes duplicate records using fuzzy string matching.
+
+Records are first partitioned into blocks (exact_match_columns plus an
+optional phonetic, n-gram or sorted-neighbourhood key) and only pairs inside
+a block are scored, in tiles, with rapidfuzz.process.cdist. Sorted-
+neighbourhood windows are scored one diagonal at a time with process.cpdist.
 """
 
 from __future__ import annotations
@@ -11,12 +16,52 @@ import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
 
 from src.provenance.artifact_store import store_text, new_run_id
 
 logger = logging.getLogger(__name__)
 
+BLOCKING_STRATEGIES = ("none", "phonetic", "ngram", "sorted_neighborhood")
+
+# Upper bound on score matrix cells computed per cdist call (float64)
+_TILE_CELLS = 4_000_000
+
+_SOUNDEX_CODES = {
+    letter: digit
+    for digit, letters in (
+        ("1", "BFPV"), ("2", "CGJKQSXZ"), ("3", "DT"),
+        ("4", "L"), ("5", "MN"), ("6", "R"),
+    )
+    for letter in letters
+}
+
+
+def soundex(text: str) -> str:
+    """
+    American Soundex code of the letters in text.
+
+    Non-letters are skipped rather than treated as word breaks, so
+    "O'Brien" codes like "OBrien" and a multi-word value is coded from the
+    start of its concatenated letters.
+    """
+    letters = [c for c in text.upper() if "A" <= c <= "Z"]
+    if not letters:
+        return ""
+
+    code = [letters[0]]
+    prev = _SOUNDEX_CODES.get(letters[0], "")
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, "")
+        if digit and digit != prev:
+            code.append(digit)
+            if len(code) == 4:
+                break
+        # H and W do not separate letters with the same code; vowels do
+        if letter not in "HW":
+            prev = digit
+    return "".join(code).ljust(4, "0")
+
 
 @dataclass
 class DedupConfig:
@@ -28,6 +73,13 @@ class DedupConfig:
     case_sensitive: bool = False
     keep: str = "first"  # first, last, best_quality
     quality_column: Optional[str] = None  # Column to use for quality scoring
+    # Candidate blocking: none, phonetic, ngram, sorted_neighborhood.
+    # exact_match_columns always partition records before blocking.
+    blocking: str = "none"
+    blocking_columns: Optional[List[str]] = None  # Defaults to match columns
+    ngram_size: int = 3  # Leading characters used by ngram blocking
+    window_size: int = 10  # Neighbours compared by sorted_neighborhood
+    workers: int = 1  # rapidfuzz cdist workers (-1 = all cores)
 
 
 @dataclass
@@ -139,47 +191,45 @@ class FuzzyDeduplicator:
 
             record_strings[record_id] = " ".join(parts)
 
+        if self.config.blocking not in BLOCKING_STRATEGIES:
+            return DedupResult(
+                success=False,
+                original_count=original_count,
+                errors=[
+                    f"Unknown blocking strategy: {self.config.blocking}. "
+                    f"Use one of {', '.join(BLOCKING_STRATEGIES)}"
+                ],
+            )
+
         # Find duplicates
         duplicate_groups: List[DuplicateGroup] = []
         processed_ids: Set[str] = set()
         removed_ids: List[str] = []
 
-        # Get the similarity function
-        sim_func = self._get_similarity_function()
-
-        # Compare all pairs (optimized with early filtering)
         record_ids = list(record_strings.keys())
+        strings = [record_strings[rid] for rid in record_ids]
+
+        # Candidate pairs (i < j in record order) scoring above threshold
+        matches = self._score_blocks(
+            record_ids, strings, id_to_record, match_cols, process,
+        )
 
+        # Greedy grouping in record order: each unprocessed record absorbs
+        # every later unprocessed record that matched it
         for i, id1 in enumerate(record_ids):
             if id1 in processed_ids:
                 continue
 
-            str1 = record_strings[id1]
             group_ids = []
             scores = {}
 
-            for j, id2 in enumerate(record_ids[i + 1:], i + 1):
+            for j, score in matches.get(i, ()):
+                id2 = record_ids[j]
                 if id2 in processed_ids:
                     continue
-
-                str2 = record_strings[id2]
-
-                # Check exact match columns first
-                if self.config.exact_match_columns:
-                    exact_match = all(
-                        id_to_record[id1].get(col) == id_to_record[id2].get(col)
-                        for col in self.config.exact_match_columns
-                    )
-                    if not exact_match:
-                        continue
-
-                # Calculate similarity
-                score = sim_func(str1, str2) / 100.0  # rapidfuzz returns 0-100
-
-                if score >= self.config.threshold:
-                    group_ids.append(id2)
-                    scores[id2] = score
-                    processed_ids.add(id2)
+                group_ids.append(id2)
+                scores[id2] = score
+                processed_ids.add(id2)
 
             if group_ids:
                 # Determine which record to keep
@@ -211,8 +261,8 @@ class FuzzyDeduplicator:
         # Build deduplicated data
         removed_set = set(removed_ids)
         deduped_data = [
-            record for record in records
-            if record.get(id_column, f"record_{records.index(record)}") not in removed_set
+            record for i, record in enumerate(records)
+            if record.get(id_column, f"record_{i}") not in removed_set
         ]
 
         result = DedupResult(
@@ -249,6 +299,158 @@ class FuzzyDeduplicator:
         result = self.deduplicate(records, id_column, save_artifact=False)
         return result.duplicate_groups
 
+    def _blocks(
+        self,
+        record_ids: List[str],
+        strings: List[str],
+        id_to_record: Dict[str, Dict[str, Any]],
+        match_cols: List[str],
+    ) -> List[List[int]]:
+        """
+        Partition record positions into blocks of candidate duplicates.
+
+        Positions within a block keep record order, except for
+        sorted_neighborhood where they are sorted by blocking key.
+        """
+        exact_cols = self.config.exact_match_columns or []
+        blocking_cols = self.config.blocking_columns or match_cols
+        strategy = self.config.blocking
+
+        def column_text(record: Dict[str, Any], col: str) -> str:
+            value = record.get(col)
+            text = str(value) if value else ""
+            return text if self.config.case_sensitive else text.lower()
+
+        blocks: Dict[Hashable, List[int]] = {}
+        sort_keys: List[str] = []
+        for pos, rid in enumerate(record_ids):
+            record = id_to_record[rid]
+            key: Tuple[Any, ...] = tuple(record.get(col) for col in exact_cols)
+
+            if strategy == "phonetic":
+                key += tuple(soundex(column_text(record, c)) for c in blocking_cols)
+            elif strategy == "ngram":
+                key += tuple(
+                    column_text(record, c).strip()[:self.config.ngram_size]
+                    for c in blocking_cols
+                )
+            elif strategy == "sorted_neighborhood":
+                sort_keys.append(
+                    " ".join(column_text(record, c) for c in blocking_cols)
+                    if self.config.blocking_columns else strings[pos]
+                )
+
+            try:
+                blocks.setdefault(key, []).append(pos)
+            except TypeError:
+                # Unhashable exact-match values fall back to their repr
+                blocks.setdefault(repr(key), []).append(pos)
+
+        if strategy == "sorted_neighborhood":
+            return [
+                sorted(positions, key=lambda p: (sort_keys[p], p))
+                for positions in blocks.values()
+            ]
+        return list(blocks.values())
+
+    def _score_blocks(
+        self,
+        record_ids: List[str],
+        strings: List[str],
+        id_to_record: Dict[str, Dict[str, Any]],
+        match_cols: List[str],
+        process: Any,
+    ) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Score candidate pairs block by block with rapidfuzz.process.cdist.
+
+        Returns:
+            Map of record position i -> [(j, score 0-1), ...] for j > i whose
+            similarity meets the threshold, sorted by j
+        """
+        import numpy as np
+
+        scorer = self._get_similarity_function()
+        cutoff = self.config.threshold * 100.0
+        window = max(2, self.config.window_size)
+        banded = self.config.blocking == "sorted_neighborhood"
+
+        matches: Dict[int, List[Tuple[int, float]]] = {}
+        blocks = self._blocks(record_ids, strings, id_to_record, match_cols)
+
+        def add_pairs(first, second, values) -> None:
+            for a, b, value in zip(first.tolist(), second.tolist(), values.tolist()):
+                i, j = (a, b) if a < b else (b, a)
+                matches.setdefault(i, []).append((j, value / 100.0))
+
+        for block in blocks:
+            size = len(block)
+            if size < 2:
+                continue
+            block_strings = [strings[p] for p in block]
+            positions = np.asarray(block)
+
+            if banded:
+                # Score each diagonal of the window band pairwise: O(n * window)
+                for k in range(1, min(window, size)):
+                    diagonal = self._pairwise_scores(
+                        process, scorer, block_strings[:-k], block_strings[k:], cutoff,
+                    )
+                    idx = np.nonzero(diagonal >= cutoff)[0]
+                    add_pairs(positions[idx], positions[idx + k], diagonal[idx])
+                continue
+
+            # Row tiles keep each score matrix within _TILE_CELLS; columns
+            # before a tile's first row were already compared as rows
+            tile = max(1, _TILE_CELLS // size)
+            for r0 in range(0, size, tile):
+                r1 = min(size, r0 + tile)
+                scores = process.cdist(
+                    block_strings[r0:r1],
+                    block_strings[r0:],
+                    scorer=scorer,
+                    processor=None,
+                    score_cutoff=cutoff,
+                    dtype=np.float64,
+                    workers=self.config.workers,
+                )
+                rows, cols = np.nonzero(scores >= cutoff)
+                upper = cols > rows
+                rows, cols = rows[upper], cols[upper]
+                add_pairs(positions[rows + r0], positions[cols + r0], scores[rows, cols])
+
+        for pairs in matches.values():
+            pairs.sort()
+        return matches
+
+    def _pairwise_scores(
+        self,
+        process: Any,
+        scorer: Any,
+        left: List[str],
+        right: List[str],
+        cutoff: float,
+    ):
+        """Scores of left[k] vs right[k] for every k (0-100)."""
+        import numpy as np
+
+        if hasattr(process, "cpdist"):
+            return process.cpdist(
+                left,
+                right,
+                scorer=scorer,
+                processor=None,
+                score_cutoff=cutoff,
+                dtype=np.float64,
+                workers=self.config.workers,
+            )
+        # rapidfuzz < 3.6 has no cpdist
+        return np.fromiter(
+            (scorer(a, b, score_cutoff=cutoff) for a, b in zip(left, right)),
+            dtype=np.float64,
+            count=len(left),
+        )
+
     def _get_similarity_function(self):
         """Get the similarity function based on config."""
         from rapidfuzz import fuzz
@@ -4,21 +4,136 @@ Reference Duplicate Detection and Merging
 Identifies duplicate references using multiple matching strategies and provides
 intelligent merging recommendations.
 
+Only likely pairs get full similarity scoring: candidates come from exact
+DOI/PMID indexes and MinHash/LSH buckets over normalized title words. A
+library can be indexed once and new references deduplicated against it
+incrementally.
+
 Linear Issues: ROS-XXX
 """
 
 import re
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import zlib
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 from difflib import SequenceMatcher
 import hashlib
 
+import numpy as np
+
 from .reference_types import Reference, DuplicateGroup
 from .reference_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Mersenne prime for MinHash permutations; 32-bit token hashes times 31-bit
+# coefficients stay inside uint64
+_MINHASH_PRIME = np.uint64((1 << 31) - 1)
+
+
+class TitleLSH:
+    """
+    MinHash signatures with banded LSH buckets over title word sets.
+
+    With the default 32 bands of 3 rows, titles with a word Jaccard
+    similarity of 0.5 share a bucket with probability ~0.99, while
+    unrelated titles (Jaccard ~0.1) collide ~3% of the time.
+    """
+
+    def __init__(self, bands: int = 32, rows: int = 3, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.RandomState(seed)
+        num_perm = bands * rows
+        self._a = rng.randint(1, int(_MINHASH_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_MINHASH_PRIME), size=num_perm).astype(np.uint64)
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+
+    def band_keys(self, tokens: Set[str]) -> List[Tuple[int, bytes]]:
+        """Bucket keys for a token set (empty if there are no tokens)."""
+        if not tokens:
+            return []
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode('utf-8')) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        ) % _MINHASH_PRIME
+        signature = ((np.outer(hashes, self._a) + self._b) % _MINHASH_PRIME).min(axis=0)
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def add(self, position: int, keys: List[Tuple[int, bytes]]) -> None:
+        for key in keys:
+            self._buckets[key].append(position)
+
+    def query(self, keys: List[Tuple[int, bytes]]) -> Set[int]:
+        found: Set[int] = set()
+        for key in keys:
+            found.update(self._buckets.get(key, ()))
+        return found
+
+
+class ReferenceIndex:
+    """
+    Candidate index over a reference library.
+
+    References are addressed by insertion position. candidates() returns
+    every indexed reference sharing a normalized DOI, a PMID or a title LSH
+    bucket with the given one.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[str], str],
+        lsh_bands: int = 32,
+        lsh_rows: int = 3,
+    ):
+        self._normalize = normalize
+        self.references: List[Reference] = []
+        self._positions: Dict[str, int] = {}
+        self._doi: Dict[str, List[int]] = defaultdict(list)
+        self._pmid: Dict[str, List[int]] = defaultdict(list)
+        self._lsh = TitleLSH(lsh_bands, lsh_rows)
+        self._keys: List[Tuple[str, str, List[Tuple[int, bytes]]]] = []
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    def __contains__(self, ref_id: str) -> bool:
+        return ref_id in self._positions
+
+    def add(self, ref: Reference) -> int:
+        """Index a reference and return its position."""
+        position = len(self.references)
+        doi = self._normalize(ref.doi) if ref.doi else ""
+        pmid = ref.pmid or ""
+        band_keys = self._lsh.band_keys(set(self._normalize(ref.title).split()))
+
+        self.references.append(ref)
+        self._positions[ref.id] = position
+        if doi:
+            self._doi[doi].append(position)
+        if pmid:
+            self._pmid[pmid].append(position)
+        self._lsh.add(position, band_keys)
+        self._keys.append((doi, pmid, band_keys))
+        return position
+
+    def candidates(self, position: int) -> Set[int]:
+        """Positions of references that may duplicate the one at position."""
+        doi, pmid, band_keys = self._keys[position]
+        found = self._lsh.query(band_keys)
+        if doi:
+            found.update(self._doi[doi])
+        if pmid:
+            found.update(self._pmid[pmid])
+        found.discard(position)
+        return found
+
 
 class PaperDeduplicator:
     """Reference deduplication service with multiple matching strategies."""
@@ -44,10 +159,21 @@ class PaperDeduplicator:
         'doi': 0.05,
     }
     
-    def __init__(self):
-        """Initialize duplicate detector."""
+    def __init__(self, lsh_bands: int = 32, lsh_rows: int = 3):
+        """
+        Initialize duplicate detector.
+
+        Args:
+            lsh_bands: Number of LSH bands over title MinHash signatures
+            lsh_rows: Rows per band; more rows means fewer, stricter candidates
+        """
         self.cache = None
+        self.lsh_bands = lsh_bands
+        self.lsh_rows = lsh_rows
+        # Library indexed by index_library() for find_new_duplicates()
+        self.library_index: Optional[ReferenceIndex] = None
         self.stats = {
+            'candidate_pairs': 0,
             'comparisons_made': 0,
             'duplicates_found': 0,
             'exact_matches': 0,
@@ -327,44 +453,8 @@ class PaperDeduplicator:
             if cached_result:
                 return [DuplicateGroup.model_validate(group) for group in cached_result]
         
-        duplicate_groups = []
-        processed_refs = set()
-        
-        for i, ref1 in enumerate(references):
-            if ref1.id in processed_refs:
-                continue
-            
-            duplicates = [ref1.id]
-            
-            for j, ref2 in enumerate(references[i+1:], i+1):
-                if ref2.id in processed_refs:
-                    continue
-                
-                similarity, criteria = self._calculate_comprehensive_similarity(ref1, ref2)
-                
-                if similarity >= self.SIMILARITY_THRESHOLDS['fuzzy_comprehensive']:
-                    duplicates.append(ref2.id)
-                    processed_refs.add(ref2.id)
-            
-            if len(duplicates) > 1:
-                # Determine primary reference (prefer one with DOI, more complete metadata)
-                primary_ref_id = self._select_primary_reference(
-                    [ref for ref in references if ref.id in duplicates]
-                )
-                
-                group = DuplicateGroup(
-                    group_id=f"dup_{len(duplicate_groups)}_{int(datetime.utcnow().timestamp())}",
-                    reference_ids=duplicates,
-                    primary_reference_id=primary_ref_id,
-                    similarity_score=similarity,
-                    match_criteria=criteria,
-                    auto_resolvable=self._can_auto_resolve(criteria, similarity),
-                    resolution_strategy=self._get_resolution_strategy(criteria)
-                )
-                
-                duplicate_groups.append(group)
-                processed_refs.update(duplicates)
-                self.stats['duplicates_found'] += len(duplicates) - 1
+        index = self._build_index(references)
+        duplicate_groups = self._group_candidates(index, range(len(index)))
         
         # Cache result
         if self.cache and duplicate_groups:
@@ -373,6 +463,133 @@ class PaperDeduplicator:
         
         return duplicate_groups
     
+    def index_library(self, references: List[Reference]) -> ReferenceIndex:
+        """
+        Index an existing (already deduplicated) reference library.
+        
+        Args:
+            references: Library references
+            
+        Returns:
+            The library index used by find_new_duplicates()
+        """
+        self.library_index = self._build_index(references)
+        return self.library_index
+    
+    async def find_new_duplicates(self, new_references: List[Reference]) -> List[DuplicateGroup]:
+        """
+        Find duplicates of newly added references against the indexed library.
+        
+        Each new reference is compared with its library candidates and with
+        other new references; library references are never compared with
+        each other. The new references are added to the library index, so
+        the next import is checked against them too.
+        
+        Args:
+            new_references: References added since the library was indexed
+            
+        Returns:
+            List of duplicate groups involving at least one new reference
+        """
+        if self.library_index is None:
+            self.library_index = self._build_index([])
+        index = self.library_index
+        
+        first_new = len(index)
+        for ref in new_references:
+            if ref.id not in index:
+                index.add(ref)
+        new_positions = range(first_new, len(index))
+        
+        # Library anchors come first, in library order, as in a full pass
+        library_anchors = sorted({
+            candidate
+            for position in new_positions
+            for candidate in index.candidates(position)
+            if candidate < first_new
+        })
+        return self._group_candidates(
+            index,
+            library_anchors + list(new_positions),
+            min_partner=first_new,
+        )
+    
+    def _build_index(self, references: Iterable[Reference]) -> ReferenceIndex:
+        """Index references for candidate generation."""
+        index = ReferenceIndex(self._normalize_text, self.lsh_bands, self.lsh_rows)
+        for ref in references:
+            index.add(ref)
+        return index
+    
+    def _group_candidates(
+        self,
+        index: ReferenceIndex,
+        anchors: Iterable[int],
+        min_partner: int = 0,
+    ) -> List[DuplicateGroup]:
+        """
+        Greedily group each anchor with its unprocessed candidates.
+        
+        Anchors are visited in order and only later candidates at or after
+        min_partner are scored, so with every position as an anchor this
+        reproduces the all-pairs pass restricted to candidate pairs. A group
+        is scored by its weakest matching pair.
+        
+        Args:
+            index: Reference index
+            anchors: Positions to group around, in order
+            min_partner: Lowest position that may join an anchor's group
+            
+        Returns:
+            List of duplicate groups
+        """
+        references = index.references
+        threshold = self.SIMILARITY_THRESHOLDS['fuzzy_comprehensive']
+        duplicate_groups = []
+        processed: Set[int] = set()
+        
+        for i in anchors:
+            if i in processed:
+                continue
+            
+            candidates = sorted(
+                j for j in index.candidates(i)
+                if j > i and j >= min_partner and j not in processed
+            )
+            self.stats['candidate_pairs'] += len(candidates)
+            
+            members = [i]
+            weakest: Optional[Tuple[float, List[str]]] = None
+            for j in candidates:
+                similarity, criteria = self._calculate_comprehensive_similarity(
+                    references[i], references[j]
+                )
+                if similarity >= threshold:
+                    members.append(j)
+                    processed.add(j)
+                    if weakest is None or similarity < weakest[0]:
+                        weakest = (similarity, criteria)
+            
+            processed.add(i)
+            if weakest is None:
+                continue
+            
+            similarity, criteria = weakest
+            member_refs = [references[m] for m in members]
+            group = DuplicateGroup(
+                group_id=f"dup_{len(duplicate_groups)}_{int(datetime.utcnow().timestamp())}",
+                reference_ids=[ref.id for ref in member_refs],
+                primary_reference_id=self._select_primary_reference(member_refs),
+                similarity_score=similarity,
+                match_criteria=criteria,
+                auto_resolvable=self._can_auto_resolve(criteria, similarity),
+                resolution_strategy=self._get_resolution_strategy(criteria)
+            )
+            duplicate_groups.append(group)
+            self.stats['duplicates_found'] += len(members) - 1
+        
+        return duplicate_groups
+    
     def _select_primary_reference(self, references: List[Reference]) -> str:
         """
         Select the primary reference from a duplicate group.
@@ -6,6 +6,7 @@ Handles ingestion and merging of multiple files/sheets with:
 - Automatic ID column detection using fuzzy matching
 - Support for CSV, TSV, Excel (xlsx/xls), Parquet
 - Large file handling via Dask chunking
+- Out-of-core merges via DuckDB (spills to disk, streams Arrow batches)
 - Audit manifests for provenance tracking
 - PHI governance mode awareness
 
@@ -13,13 +14,18 @@ Part of the multi-file ingestion feature.
 """
 import os
 import json
+import shutil
 import logging
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 # Optional imports with availability flags
@@ -71,6 +77,26 @@ except ImportError:
     )
 
 
+MERGE_BACKENDS = ("pandas", "duckdb")
+
+_SQL_JOINS = {
+    "outer": "FULL OUTER JOIN",
+    "inner": "INNER JOIN",
+    "left": "LEFT JOIN",
+    "right": "RIGHT JOIN",
+}
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column or view name for DuckDB SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a string (file path, source name) as a DuckDB literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
 @dataclass
 class MergeManifest:
     """Audit manifest for merge operations."""
@@ -117,16 +143,27 @@ class MergeResult:
     needs_confirmation: bool = False
     confirmation_prompt: Optional[str] = None
     candidates: List[IDCandidate] = field(default_factory=list)
+    output_path: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        if self.dataframe is not None:
+            row_count = len(self.dataframe)
+            column_count = len(self.dataframe.columns)
+        elif self.output_path:
+            # DuckDB merges are written to Parquet instead of held in memory
+            row_count = self.manifest.rows_after_merge or 0
+            column_count = len(self.manifest.columns_merged)
+        else:
+            row_count = column_count = 0
         return {
             'success': self.success,
             'needs_confirmation': self.needs_confirmation,
             'confirmation_prompt': self.confirmation_prompt,
             'manifest': self.manifest.to_dict(),
             'candidates': [c.to_dict() for c in self.candidates],
-            'row_count': len(self.dataframe) if self.dataframe is not None else 0,
-            'column_count': len(self.dataframe.columns) if self.dataframe is not None else 0,
+            'row_count': row_count,
+            'column_count': column_count,
+            'output_path': self.output_path,
         }
 
 
@@ -142,6 +179,7 @@ class MultiFileIngestEngine:
     - Automatic ID column detection using fuzzy matching
     - Support for CSV, TSV, Excel (xlsx/xls), Parquet
     - Large file handling via Dask chunking
+    - Out-of-core DuckDB merge backend for inputs larger than memory
     - Optional DuckDB persistence for provenance
     - PHI governance mode awareness
     """
@@ -155,6 +193,8 @@ class MultiFileIngestEngine:
         use_dask: bool = True,
         use_polars: bool = False,
         use_duckdb: bool = False,
+        merge_backend: str = "pandas",
+        duckdb_memory_limit: Optional[str] = None,
     ):
         """
         Initialize the multi-file ingest engine.
@@ -167,13 +207,27 @@ class MultiFileIngestEngine:
             use_dask: Enable Dask for large file processing
             use_polars: Enable Polars for high-performance operations
             use_duckdb: Enable DuckDB for persistent storage
+            merge_backend: "pandas" (in-memory) or "duckdb" (out-of-core;
+                the merged table is written to Parquet under artifacts_dir)
+            duckdb_memory_limit: DuckDB memory_limit for merges (e.g. "4GB");
+                work beyond it spills to a temp directory under artifacts_dir
         """
+        if merge_backend not in MERGE_BACKENDS:
+            raise ValueError(
+                f"merge_backend must be one of {MERGE_BACKENDS}, got {merge_backend!r}"
+            )
+        if merge_backend == "duckdb" and not DUCKDB_AVAILABLE:
+            logger.warning("duckdb not available - falling back to pandas merge backend")
+            merge_backend = "pandas"
+
         self.governance_mode = governance_mode
         self.chunk_size = chunk_size
         self.fuzzy_threshold = fuzzy_threshold
         self.use_dask = use_dask and DASK_AVAILABLE
         self.use_polars = use_polars and POLARS_AVAILABLE
         self.use_duckdb = use_duckdb and DUCKDB_AVAILABLE
+        self.merge_backend = merge_backend
+        self.duckdb_memory_limit = duckdb_memory_limit
 
         # Setup artifacts directory: align with worker config (ARTIFACTS_PATH/ARTIFACT_PATH/RESEARCHFLOW_ARTIFACTS_DIR)
         if artifacts_dir:
@@ -191,7 +245,8 @@ class MultiFileIngestEngine:
         logger.info(
             f"MultiFileIngestEngine initialized: "
             f"governance={governance_mode}, dask={self.use_dask}, "
-            f"polars={self.use_polars}, duckdb={self.use_duckdb}"
+            f"polars={self.use_polars}, duckdb={self.use_duckdb}, "
+            f"merge_backend={self.merge_backend}"
         )
 
     def read_directory(
@@ -446,6 +501,11 @@ class MultiFileIngestEngine:
         try:
             source = Path(source)
 
+            if self.merge_backend == "duckdb":
+                return self._complete_merge_duckdb(
+                    source, id_column, manifest, file_pattern, merge_strategy
+                )
+
             # Re-read files
             if source.is_dir():
                 dataframes = self.read_directory(source, file_pattern)
@@ -568,6 +628,291 @@ class MultiFileIngestEngine:
 
         return result
 
+    def _list_merge_sources(
+        self,
+        source: Path,
+        file_pattern: str,
+    ) -> Dict[str, Tuple[Path, Optional[str]]]:
+        """
+        Resolve merge inputs without reading them.
+
+        Mirrors the naming used by read_directory / read_multi_sheet_workbook
+        so manifests from Phase 1 line up with the DuckDB backend.
+
+        Returns:
+            Dict mapping source name to (file path, Excel sheet or None)
+        """
+        if source.is_dir():
+            sources = {}
+            for pattern in (p.strip() for p in file_pattern.split(',')):
+                for file_path in source.glob(pattern):
+                    sources[file_path.name] = (file_path, None)
+            return sources
+
+        if not source.exists():
+            raise FileNotFoundError(f"File not found: {source}")
+
+        if source.suffix.lower() in ['.xlsx', '.xls']:
+            sheet_names = pd.ExcelFile(source).sheet_names
+            return {f"{source.stem}_{sheet}": (source, sheet) for sheet in sheet_names}
+
+        return {source.name: (source, None)}
+
+    def _register_duckdb_view(
+        self,
+        conn: "duckdb.DuckDBPyConnection",
+        view_name: str,
+        file_path: Path,
+        sheet: Optional[str],
+        export_dir: Path,
+    ) -> List[str]:
+        """
+        Register one source file as a DuckDB view and return its columns.
+
+        CSV/TSV and Parquet are scanned lazily by DuckDB. Excel has no
+        streaming reader, so each sheet is read once with pandas and exported
+        to Parquet in export_dir; the view then scans that file.
+        """
+        suffix = file_path.suffix.lower()
+        path_literal = _sql_literal(file_path)
+
+        if suffix == '.csv':
+            relation = f"read_csv({path_literal}, header=true, sample_size=-1)"
+        elif suffix == '.tsv':
+            relation = f"read_csv({path_literal}, header=true, delim='\t', sample_size=-1)"
+        elif suffix == '.parquet':
+            relation = f"read_parquet({path_literal})"
+        elif suffix in ['.xlsx', '.xls']:
+            sheet_df = pd.read_excel(file_path, sheet_name=sheet if sheet is not None else 0)
+            export_path = export_dir / f"{view_name}.parquet"
+            conn.register("_excel_sheet", sheet_df)
+            try:
+                conn.execute(
+                    f"COPY _excel_sheet TO {_sql_literal(export_path)} (FORMAT parquet)"
+                )
+            finally:
+                conn.unregister("_excel_sheet")
+            del sheet_df
+            relation = f"read_parquet({_sql_literal(export_path)})"
+        else:
+            raise ValueError(f"Unsupported file type: {suffix}")
+
+        conn.execute(f"CREATE VIEW {_quote_identifier(view_name)} AS SELECT * FROM {relation}")
+        columns = conn.execute(
+            f"SELECT * FROM {_quote_identifier(view_name)} LIMIT 0"
+        ).description
+        return [col[0] for col in columns]
+
+    def _build_merge_sql(
+        self,
+        views: List[Tuple[str, str, List[str]]],
+        id_column: str,
+        strategy: str = "outer",
+    ) -> Tuple[str, List[str]]:
+        """
+        Build the multi-way join as one SQL query.
+
+        Follows _merge_dataframes column for column: the ID column is
+        normalized, each source gets a _source tag, clashing columns are
+        renamed to "{col}_{filename}", and the join key is coalesced across
+        sides so outer joins keep IDs present on either side.
+
+        Args:
+            views: (source name, view name, columns) per source, in merge order
+            id_column: Column to merge on
+            strategy: Merge strategy ('outer', 'inner', 'left', 'right')
+
+        Returns:
+            (SQL query, output column names)
+        """
+        if strategy not in _SQL_JOINS:
+            raise ValueError(
+                f"Unsupported merge strategy: {strategy!r} "
+                f"(expected one of {sorted(_SQL_JOINS)})"
+            )
+        join = _SQL_JOINS[strategy]
+        q = _quote_identifier
+        key = q(id_column)
+
+        def projection(name: str, columns: List[str]) -> Tuple[List[str], List[str]]:
+            """Select list for one source with its ID column renamed."""
+            id_match = find_matching_column(columns, id_column, self.fuzzy_threshold)
+            exprs, names = [], []
+            for col in columns:
+                if col == '_source':
+                    continue
+                out = id_column if col == id_match else col
+                exprs.append(f"{q(col)} AS {q(out)}")
+                names.append(out)
+            exprs.append(f"{_sql_literal(name)} AS {q('_source')}")
+            names.append('_source')
+            return exprs, names
+
+        first_name, first_view, first_columns = views[0]
+        exprs, result_columns = projection(first_name, first_columns)
+        ctes = [f"step_0 AS (SELECT {', '.join(exprs)} FROM {q(first_view)})"]
+
+        for step, (name, view, columns) in enumerate(views[1:], start=1):
+            right_exprs, right_names = projection(name, columns)
+            select = []
+            for col in result_columns:
+                if col == id_column:
+                    select.append(f"COALESCE(l.{key}, r.{key}) AS {key}")
+                else:
+                    select.append(f"l.{q(col)}")
+
+            renamed = []
+            for col in right_names:
+                if col == id_column:
+                    continue
+                out = col
+                if col != '_source' and out in result_columns:
+                    out = f"{col}_{name}"
+                # pd.merge suffixes anything that still collides
+                if out in result_columns:
+                    out = f"{out}_{name}"
+                select.append(f"r.{q(col)} AS {q(out)}")
+                renamed.append(out)
+
+            ctes.append(
+                f"step_{step} AS (SELECT {', '.join(select)} "
+                f"FROM step_{step - 1} l {join} "
+                f"(SELECT {', '.join(right_exprs)} FROM {q(view)}) r "
+                f"ON l.{key} IS NOT DISTINCT FROM r.{key})"
+            )
+            result_columns = result_columns + renamed
+
+        sql = f"WITH {', '.join(ctes)} SELECT * FROM step_{len(views) - 1}"
+        return sql, result_columns
+
+    def _complete_merge_duckdb(
+        self,
+        source: Path,
+        id_column: str,
+        manifest: MergeManifest,
+        file_pattern: str,
+        merge_strategy: str,
+    ) -> MergeResult:
+        """
+        Phase 2 merge executed out-of-core in DuckDB.
+
+        Each input is registered as a view, the multi-way join runs as a
+        single query with memory_limit / temp_directory set so large joins
+        spill to disk, and the result is streamed straight to
+        artifacts_dir/merged_{run_id}.parquet. No merged DataFrame is built;
+        use iter_merged_batches to consume the output as Arrow batches.
+        Row order of the output is not guaranteed.
+        """
+        sources = self._list_merge_sources(source, file_pattern)
+        if not sources:
+            manifest.errors.append("No data files found")
+            return MergeResult(success=False, dataframe=None, manifest=manifest)
+
+        work_dir = Path(tempfile.mkdtemp(prefix=f"duckdb_{manifest.run_id}_", dir=self.artifacts_dir))
+        output_path = self.artifacts_dir / f"merged_{manifest.run_id}.parquet"
+        conn = duckdb.connect()
+        try:
+            conn.execute(f"SET temp_directory = {_sql_literal(work_dir)}")
+            conn.execute("SET preserve_insertion_order = false")
+            if self.duckdb_memory_limit:
+                conn.execute(f"SET memory_limit = {_sql_literal(self.duckdb_memory_limit)}")
+
+            views = []
+            for i, (name, (file_path, sheet)) in enumerate(sources.items()):
+                view_name = f"source_{i}"
+                columns = self._register_duckdb_view(conn, view_name, file_path, sheet, work_dir)
+                views.append((name, view_name, columns))
+                logger.info(f"Registered {name} as DuckDB view: {len(columns)} columns")
+
+            # Validation only needs column names, so pass empty frames
+            column_frames = {name: pd.DataFrame(columns=cols) for name, _, cols in views}
+            is_valid, error = validate_id_column(
+                column_frames, id_column, self.fuzzy_threshold
+            )
+            if not is_valid:
+                manifest.errors.append(error)
+                return MergeResult(success=False, dataframe=None, manifest=manifest)
+
+            for name, _, columns in views:
+                match = find_matching_column(columns, id_column, self.fuzzy_threshold)
+                if match:
+                    manifest.id_column_aliases[name] = match
+
+            logger.info(
+                f"Merging {len(views)} files on '{id_column}' using {merge_strategy} join (duckdb)"
+            )
+            sql, merged_columns = self._build_merge_sql(views, id_column, merge_strategy)
+            conn.execute(f"COPY ({sql}) TO {_sql_literal(output_path)} (FORMAT parquet)")
+
+            merged = f"read_parquet({_sql_literal(output_path)})"
+            key = _quote_identifier(id_column)
+            row_count, distinct_ids, null_ids = conn.execute(
+                f"SELECT count(*), count(DISTINCT {key}), count(*) - count({key}) FROM {merged}"
+            ).fetchone()
+
+            manifest.completed_at = datetime.utcnow().isoformat()
+            manifest.rows_after_merge = row_count
+            manifest.columns_merged = merged_columns
+
+            # Same checks as _validate_merged_df, computed in SQL
+            if PANDERA_AVAILABLE:
+                dup_count = row_count - distinct_ids - (1 if null_ids else 0)
+                if dup_count > 0:
+                    manifest.warnings.append(f"Found {dup_count} duplicate ID values after merge")
+                if null_ids > 0:
+                    manifest.warnings.append(f"Found {null_ids} null ID values after merge")
+
+            manifest_path = self.artifacts_dir / f"merge_manifest_{manifest.run_id}.json"
+            manifest.save(str(manifest_path))
+
+            if self.use_duckdb:
+                self._store_in_duckdb(None, manifest, parquet_path=output_path)
+
+            logger.info(
+                f"Merge complete: {row_count} rows, {len(merged_columns)} columns -> {output_path}"
+            )
+
+            return MergeResult(
+                success=True,
+                dataframe=None,
+                manifest=manifest,
+                output_path=str(output_path),
+            )
+
+        finally:
+            conn.close()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def iter_merged_batches(
+        self,
+        result: MergeResult,
+        batch_size: int = 100_000,
+    ) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Stream a DuckDB-backed merge result as Arrow record batches.
+
+        Requires pyarrow.
+
+        Args:
+            result: Successful MergeResult from the duckdb merge backend
+            batch_size: Rows per record batch
+
+        Yields:
+            pyarrow.RecordBatch chunks of the merged table
+        """
+        if not result.output_path:
+            raise ValueError("MergeResult has no output_path; use merge_backend='duckdb'")
+
+        conn = duckdb.connect()
+        try:
+            reader = conn.execute(
+                f"SELECT * FROM read_parquet({_sql_literal(result.output_path)})"
+            ).fetch_record_batch(batch_size)
+            for batch in reader:
+                yield batch
+        finally:
+            conn.close()
+
     def _validate_merged_df(
         self,
         df: pd.DataFrame,
@@ -603,15 +948,17 @@ class MultiFileIngestEngine:
 
     def _store_in_duckdb(
         self,
-        df: pd.DataFrame,
-        manifest: MergeManifest
+        df: Optional[pd.DataFrame],
+        manifest: MergeManifest,
+        parquet_path: Optional[Path] = None,
     ) -> None:
         """
         Store merged DataFrame and manifest in DuckDB.
 
         Args:
-            df: Merged DataFrame
+            df: Merged DataFrame (None when parquet_path is given)
             manifest: Merge manifest
+            parquet_path: Merged Parquet output of the duckdb merge backend
         """
         if not DUCKDB_AVAILABLE:
             return
@@ -622,7 +969,13 @@ class MultiFileIngestEngine:
 
             # Store merged data
             table_name = f"merge_{manifest.run_id}"
-            conn.execute(f"CREATE TABLE IF NOT EXISTS {table_name} AS SELECT * FROM df")
+            if parquet_path is not None:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table_name} AS "
+                    f"SELECT * FROM read_parquet({_sql_literal(parquet_path)})"
+                )
+            else:
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table_name} AS SELECT * FROM df")
 
             # Store manifest
             conn.execute("""
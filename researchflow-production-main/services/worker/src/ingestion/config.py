@@ -13,6 +13,7 @@ Environment Variables:
 - DASK_MEMORY_LIMIT: Memory limit per worker (default: 4GB)
 - DASK_SCHEDULER_ADDR: External Dask scheduler address (optional)
 - MAX_PARQUET_FILE_SIZE: Max partition file size (default: 100MB)
+- PHI_SCAN_WORKERS: Processes for chunked/partitioned PHI scans (default: 1, in-process)
 
 Last Updated: 2026-01-23
 """
@@ -69,6 +70,7 @@ class IngestionConfig:
         dask_memory_limit: Memory limit per Dask worker.
         dask_scheduler_addr: External Dask scheduler address (optional).
         max_parquet_file_size: Maximum size for individual Parquet partitions.
+        phi_scan_workers: Worker processes for chunked PHI scanning (1 = in-process).
     """
     
     large_file_bytes: int = 50 * 1024 * 1024  # 50 MB
@@ -80,6 +82,7 @@ class IngestionConfig:
     dask_memory_limit: str = "4GB"
     dask_scheduler_addr: Optional[str] = None
     max_parquet_file_size: int = 100 * 1024 * 1024  # 100 MB
+    phi_scan_workers: int = 1
     
     @classmethod
     def from_env(cls) -> "IngestionConfig":
@@ -110,6 +113,9 @@ class IngestionConfig:
             max_parquet_file_size=int(
                 os.getenv("MAX_PARQUET_FILE_SIZE", str(100 * 1024 * 1024))
             ),
+            phi_scan_workers=int(
+                os.getenv("PHI_SCAN_WORKERS", "1")
+            ),
         )
 
 
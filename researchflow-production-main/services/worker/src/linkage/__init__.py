@@ -25,6 +25,8 @@ __version__ = "1.0.0"
 from .linkage_engine import (
     LinkageConfig,
     create_linkage,
+    create_linkage_ids,
+    link_nearest_events,
     link_ct_to_pathology,
     link_fna_to_pathology,
     link_molecular_to_pathology,
@@ -50,6 +52,8 @@ __all__ = [
     # Core linkage functions
     "LinkageConfig",
     "create_linkage",
+    "create_linkage_ids",
+    "link_nearest_events",
     "link_ct_to_pathology",
     "link_fna_to_pathology",
     "link_molecular_to_pathology",
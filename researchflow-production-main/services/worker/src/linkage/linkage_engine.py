@@ -10,6 +10,10 @@ events and clinical outcomes with configurable date tolerances:
 
 All linkages are logged to an immutable audit trail for reproducibility.
 
+Each source event is joined to its nearest same-patient target with a sorted
+merge_asof (no per-patient cartesian product), optionally one partition of
+patients at a time.
+
 Author: Research Operating System
 Date: 2025-12-22
 """
@@ -82,6 +86,31 @@ def create_linkage_id(
     return f"LINK_{link_hash}"
 
 
+def create_linkage_ids(
+    source_ids: pd.Series, target_ids: pd.Series, source_type: str, target_type: str
+) -> pd.Series:
+    """
+    Vectorized create_linkage_id over aligned source and target ID columns.
+
+    Link strings are built with column-wise string concatenation and hashed
+    in a single pass; IDs are identical to create_linkage_id.
+    """
+    link_strings = (
+        f"{source_type}_"
+        + source_ids.astype(str)
+        + f"_to_{target_type}_"
+        + target_ids.astype(str).to_numpy()
+    )
+    return pd.Series(
+        [
+            "LINK_" + hashlib.sha256(link.encode()).hexdigest()[:16]
+            for link in link_strings
+        ],
+        index=source_ids.index,
+        dtype=object,
+    )
+
+
 def calculate_date_gap(
     source_date: pd.Timestamp, target_date: pd.Timestamp
 ) -> Dict[str, any]:
@@ -101,6 +130,207 @@ def calculate_date_gap(
     }
 
 
+def _patient_partitions(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    patient_id_col: str,
+    chunk_patients: int,
+):
+    """
+    Yield (source, target) frame pairs covering chunk_patients patients each.
+
+    Patients are partitioned by their position in the sorted list of source
+    patient IDs; targets for patients with no source events are skipped.
+    """
+    codes, patients = pd.factorize(source_df[patient_id_col], sort=True)
+    target_codes = patients.get_indexer(target_df[patient_id_col])
+
+    source_rows = pd.Series(np.arange(len(source_df))).groupby(codes // chunk_patients).indices
+    target_rows = pd.Series(np.arange(len(target_df))).groupby(
+        target_codes // chunk_patients
+    ).indices
+
+    for chunk, rows in source_rows.items():
+        # Code -1 marks a missing patient ID (or, for targets, an unknown patient)
+        if chunk < 0 or chunk not in target_rows:
+            continue
+        yield source_df.iloc[rows], target_df.iloc[target_rows[chunk]]
+
+
+def _nearest_within_tolerance(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    source_id_col: str,
+    target_id_col: str,
+    patient_id_col: str,
+    source_date_col: str,
+    target_date_col: str,
+    tolerance_days: int,
+) -> pd.DataFrame:
+    """Nearest same-patient target per source event, within tolerance."""
+    left = source_df[[source_id_col, patient_id_col, source_date_col]].dropna(
+        subset=[patient_id_col, source_date_col]
+    )
+    right = target_df[[target_id_col, patient_id_col, target_date_col]].dropna(
+        subset=[patient_id_col, target_date_col]
+    )
+    if left.empty or right.empty:
+        return left.iloc[:0]
+
+    if right[target_date_col].dtype != left[source_date_col].dtype:
+        right = right.astype({target_date_col: left[source_date_col].dtype})
+
+    # One extra day of slack: the gap is compared in whole (floored) days below
+    merged = pd.merge_asof(
+        left.sort_values(source_date_col, kind="mergesort"),
+        right.sort_values(target_date_col, kind="mergesort"),
+        left_on=source_date_col,
+        right_on=target_date_col,
+        by=patient_id_col,
+        direction="nearest",
+        tolerance=pd.Timedelta(days=tolerance_days + 1),
+    )
+    merged = merged[merged[target_date_col].notna()]
+
+    merged["days_gap"] = (merged[target_date_col] - merged[source_date_col]).dt.days
+    merged["abs_days_gap"] = merged["days_gap"].abs()
+    merged = merged[merged["abs_days_gap"] <= tolerance_days]
+    merged["within_tolerance"] = True
+
+    # A source ID repeated across rows still gets a single (nearest) link
+    return merged.sort_values("abs_days_gap", kind="mergesort").drop_duplicates(
+        source_id_col
+    )
+
+
+def link_nearest_events(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    source_id_col: str,
+    target_id_col: str,
+    source_type: str,
+    target_type: str,
+    patient_id_col: str = "research_id",
+    source_date_col: str = "event_date",
+    target_date_col: str = "target_date",
+    tolerance_days: int = 30,
+    chunk_patients: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Link each source event to its nearest same-patient target within tolerance.
+
+    Shared core of the link_*_to_pathology functions. Both tables are sorted
+    by date and joined with pd.merge_asof (by patient, nearest direction), so
+    memory stays linear in the input instead of growing with the per-patient
+    cartesian product. Gaps are compared in whole days; when two targets are
+    equally near, the earlier one wins.
+
+    Parameters
+    ----------
+    source_df : pd.DataFrame
+        Source events with columns: patient ID, source ID, source date
+    target_df : pd.DataFrame
+        Target events with columns: patient ID, target ID, target date
+    source_id_col : str
+        Column name for source event identifier
+    target_id_col : str
+        Column name for target event identifier
+    source_type : str
+        Source modality used in linkage IDs (e.g. 'ct_scan')
+    target_type : str
+        Target type used in linkage IDs (e.g. 'pathology')
+    patient_id_col : str
+        Column name for patient identifier
+    source_date_col : str
+        Column name for source event date
+    target_date_col : str
+        Column name for target event date
+    tolerance_days : int
+        Date tolerance window
+    chunk_patients : int, optional
+        If set, link this many patients at a time to bound peak memory
+
+    Returns
+    -------
+    pd.DataFrame
+        Linkage table (same schema as link_ct_to_pathology), sorted by source
+        ID; an empty DataFrame if nothing links
+    """
+    if chunk_patients is None:
+        linkage = _nearest_within_tolerance(
+            source_df,
+            target_df,
+            source_id_col,
+            target_id_col,
+            patient_id_col,
+            source_date_col,
+            target_date_col,
+            tolerance_days,
+        )
+    else:
+        if chunk_patients < 1:
+            raise ValueError(f"chunk_patients must be >= 1, got {chunk_patients}")
+        parts = [
+            _nearest_within_tolerance(
+                source_part,
+                target_part,
+                source_id_col,
+                target_id_col,
+                patient_id_col,
+                source_date_col,
+                target_date_col,
+                tolerance_days,
+            )
+            for source_part, target_part in _patient_partitions(
+                source_df, target_df, patient_id_col, chunk_patients
+            )
+        ]
+        parts = [part for part in parts if len(part)]
+        linkage = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if len(linkage):
+            linkage = linkage.sort_values("abs_days_gap", kind="mergesort").drop_duplicates(
+                source_id_col
+            )
+
+    label = f"{source_type} → {target_type}"
+    if len(linkage) == 0:
+        logger.warning(f"No {label} links within tolerance window!")
+        return pd.DataFrame()
+
+    linkage = linkage.sort_values(source_id_col, kind="mergesort", ignore_index=True)
+    logger.info(f"Created {len(linkage)} unique {label} links (1:1 cardinality)")
+
+    linkage["linkage_id"] = create_linkage_ids(
+        linkage[source_id_col], linkage[target_id_col], source_type, target_type
+    )
+
+    # Calculate link confidence (1.0 for same-day, decreases with date gap)
+    linkage["link_confidence"] = 1.0 - (linkage["abs_days_gap"] / tolerance_days)
+
+    result = linkage[
+        [
+            "linkage_id",
+            source_id_col,
+            target_id_col,
+            patient_id_col,
+            source_date_col,
+            target_date_col,
+            "days_gap",
+            "abs_days_gap",
+            "within_tolerance",
+            "link_confidence",
+        ]
+    ]
+
+    logger.info(f"{label} Linkage Stats:")
+    logger.info(f"  Mean date gap: {linkage['abs_days_gap'].mean():.1f} days")
+    logger.info(f"  Median date gap: {linkage['abs_days_gap'].median():.1f} days")
+    logger.info(f"  Max date gap: {linkage['abs_days_gap'].max()} days")
+    logger.info(f"  Mean confidence: {linkage['link_confidence'].mean():.3f}")
+
+    return result
+
+
 def link_ct_to_pathology(
     ct_df: pd.DataFrame,
     pathology_df: pd.DataFrame,
@@ -108,6 +338,7 @@ def link_ct_to_pathology(
     ct_date_col: str = "ct_date",
     path_date_col: str = "surgery_date",
     tolerance_days: int = 90,
+    chunk_patients: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Link CT scans to pathology reports using deterministic date tolerance.
@@ -131,6 +362,8 @@ def link_ct_to_pathology(
         Column name for pathology/surgery date
     tolerance_days : int
         Date tolerance window (default: 90 days)
+    chunk_patients : int, optional
+        If set, link this many patients at a time to bound peak memory
 
     Returns
     -------
@@ -152,70 +385,20 @@ def link_ct_to_pathology(
     )
     logger.info(f"Date tolerance: ±{tolerance_days} days")
 
-    # Merge on patient ID
-    merged = ct_df.merge(
-        pathology_df, on=patient_id_col, how="inner", suffixes=("_ct", "_path")
+    return link_nearest_events(
+        ct_df,
+        pathology_df,
+        source_id_col="ct_id",
+        target_id_col="pathology_id",
+        source_type="ct_scan",
+        target_type="pathology",
+        patient_id_col=patient_id_col,
+        source_date_col=ct_date_col,
+        target_date_col=path_date_col,
+        tolerance_days=tolerance_days,
+        chunk_patients=chunk_patients,
     )
 
-    logger.info(f"Found {len(merged)} potential CT-pathology pairs (same patient)")
-
-    # Calculate date gaps
-    merged["days_gap"] = (merged[path_date_col] - merged[ct_date_col]).dt.days
-    merged["abs_days_gap"] = merged["days_gap"].abs()
-    merged["within_tolerance"] = merged["abs_days_gap"] <= tolerance_days
-
-    # Filter to within tolerance
-    within_tolerance = merged[merged["within_tolerance"]].copy()
-    logger.info(
-        f"{len(within_tolerance)} CT-pathology pairs within ±{tolerance_days} days"
-    )
-
-    if len(within_tolerance) == 0:
-        logger.warning("No CT-pathology links within tolerance window!")
-        return pd.DataFrame()
-
-    # Enforce 1:1 cardinality: Each CT links to nearest pathology
-    within_tolerance = within_tolerance.sort_values("abs_days_gap")
-    linkage = within_tolerance.groupby("ct_id").first().reset_index()
-
-    logger.info(f"Created {len(linkage)} unique CT-pathology links (1:1 cardinality)")
-
-    # Create linkage IDs
-    linkage["linkage_id"] = linkage.apply(
-        lambda row: create_linkage_id(
-            row["ct_id"], row["pathology_id"], "ct_scan", "pathology"
-        ),
-        axis=1,
-    )
-
-    # Calculate link confidence (1.0 for same-day, decreases with date gap)
-    linkage["link_confidence"] = 1.0 - (linkage["abs_days_gap"] / tolerance_days)
-
-    # Select final columns
-    result = linkage[
-        [
-            "linkage_id",
-            "ct_id",
-            "pathology_id",
-            patient_id_col,
-            ct_date_col,
-            path_date_col,
-            "days_gap",
-            "abs_days_gap",
-            "within_tolerance",
-            "link_confidence",
-        ]
-    ]
-
-    # Log linkage statistics
-    logger.info(f"CT-Pathology Linkage Stats:")
-    logger.info(f"  Mean date gap: {linkage['abs_days_gap'].mean():.1f} days")
-    logger.info(f"  Median date gap: {linkage['abs_days_gap'].median():.1f} days")
-    logger.info(f"  Max date gap: {linkage['abs_days_gap'].max()} days")
-    logger.info(f"  Mean confidence: {linkage['link_confidence'].mean():.3f}")
-
-    return result
-
 
 def link_fna_to_pathology(
     fna_df: pd.DataFrame,
@@ -224,6 +407,7 @@ def link_fna_to_pathology(
     fna_date_col: str = "fna_date",
     path_date_col: str = "surgery_date",
     tolerance_days: int = 14,
+    chunk_patients: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Link FNA biopsies to pathology reports using strict date tolerance.
@@ -247,6 +431,8 @@ def link_fna_to_pathology(
         Column name for pathology/surgery date
     tolerance_days : int
         Date tolerance window (default: 14 days, strict)
+    chunk_patients : int, optional
+        If set, link this many patients at a time to bound peak memory
 
     Returns
     -------
@@ -258,70 +444,20 @@ def link_fna_to_pathology(
     )
     logger.info(f"Date tolerance: ±{tolerance_days} days (STRICT)")
 
-    # Merge on patient ID
-    merged = fna_df.merge(
-        pathology_df, on=patient_id_col, how="inner", suffixes=("_fna", "_path")
-    )
-
-    logger.info(f"Found {len(merged)} potential FNA-pathology pairs (same patient)")
-
-    # Calculate date gaps
-    merged["days_gap"] = (merged[path_date_col] - merged[fna_date_col]).dt.days
-    merged["abs_days_gap"] = merged["days_gap"].abs()
-    merged["within_tolerance"] = merged["abs_days_gap"] <= tolerance_days
-
-    # Filter to within tolerance
-    within_tolerance = merged[merged["within_tolerance"]].copy()
-    logger.info(
-        f"{len(within_tolerance)} FNA-pathology pairs within ±{tolerance_days} days"
-    )
-
-    if len(within_tolerance) == 0:
-        logger.warning("No FNA-pathology links within tolerance window!")
-        return pd.DataFrame()
-
-    # Enforce 1:1 cardinality: Each FNA links to nearest pathology
-    within_tolerance = within_tolerance.sort_values("abs_days_gap")
-    linkage = within_tolerance.groupby("fna_id").first().reset_index()
-
-    logger.info(f"Created {len(linkage)} unique FNA-pathology links (1:1 cardinality)")
-
-    # Create linkage IDs
-    linkage["linkage_id"] = linkage.apply(
-        lambda row: create_linkage_id(
-            row["fna_id"], row["pathology_id"], "fna_biopsy", "pathology"
-        ),
-        axis=1,
+    return link_nearest_events(
+        fna_df,
+        pathology_df,
+        source_id_col="fna_id",
+        target_id_col="pathology_id",
+        source_type="fna_biopsy",
+        target_type="pathology",
+        patient_id_col=patient_id_col,
+        source_date_col=fna_date_col,
+        target_date_col=path_date_col,
+        tolerance_days=tolerance_days,
+        chunk_patients=chunk_patients,
     )
 
-    # Calculate link confidence
-    linkage["link_confidence"] = 1.0 - (linkage["abs_days_gap"] / tolerance_days)
-
-    # Select final columns
-    result = linkage[
-        [
-            "linkage_id",
-            "fna_id",
-            "pathology_id",
-            patient_id_col,
-            fna_date_col,
-            path_date_col,
-            "days_gap",
-            "abs_days_gap",
-            "within_tolerance",
-            "link_confidence",
-        ]
-    ]
-
-    # Log linkage statistics
-    logger.info(f"FNA-Pathology Linkage Stats:")
-    logger.info(f"  Mean date gap: {linkage['abs_days_gap'].mean():.1f} days")
-    logger.info(f"  Median date gap: {linkage['abs_days_gap'].median():.1f} days")
-    logger.info(f"  Max date gap: {linkage['abs_days_gap'].max()} days")
-    logger.info(f"  Mean confidence: {linkage['link_confidence'].mean():.3f}")
-
-    return result
-
 
 def link_molecular_to_pathology(
     molecular_df: pd.DataFrame,
@@ -330,6 +466,7 @@ def link_molecular_to_pathology(
     molecular_date_col: str = "test_date",
     path_date_col: str = "surgery_date",
     tolerance_days: int = 30,
+    chunk_patients: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Link molecular tests to pathology reports using standard date tolerance.
@@ -353,6 +490,8 @@ def link_molecular_to_pathology(
         Column name for pathology/surgery date
     tolerance_days : int
         Date tolerance window (default: 30 days)
+    chunk_patients : int, optional
+        If set, link this many patients at a time to bound peak memory
 
     Returns
     -------
@@ -364,74 +503,20 @@ def link_molecular_to_pathology(
     )
     logger.info(f"Date tolerance: ±{tolerance_days} days")
 
-    # Merge on patient ID
-    merged = molecular_df.merge(
-        pathology_df, on=patient_id_col, how="inner", suffixes=("_mol", "_path")
+    return link_nearest_events(
+        molecular_df,
+        pathology_df,
+        source_id_col="test_id",
+        target_id_col="pathology_id",
+        source_type="molecular_test",
+        target_type="pathology",
+        patient_id_col=patient_id_col,
+        source_date_col=molecular_date_col,
+        target_date_col=path_date_col,
+        tolerance_days=tolerance_days,
+        chunk_patients=chunk_patients,
     )
 
-    logger.info(
-        f"Found {len(merged)} potential molecular-pathology pairs (same patient)"
-    )
-
-    # Calculate date gaps
-    merged["days_gap"] = (merged[path_date_col] - merged[molecular_date_col]).dt.days
-    merged["abs_days_gap"] = merged["days_gap"].abs()
-    merged["within_tolerance"] = merged["abs_days_gap"] <= tolerance_days
-
-    # Filter to within tolerance
-    within_tolerance = merged[merged["within_tolerance"]].copy()
-    logger.info(
-        f"{len(within_tolerance)} molecular-pathology pairs within ±{tolerance_days} days"
-    )
-
-    if len(within_tolerance) == 0:
-        logger.warning("No molecular-pathology links within tolerance window!")
-        return pd.DataFrame()
-
-    # Enforce 1:1 cardinality: Each molecular test links to nearest pathology
-    within_tolerance = within_tolerance.sort_values("abs_days_gap")
-    linkage = within_tolerance.groupby("test_id").first().reset_index()
-
-    logger.info(
-        f"Created {len(linkage)} unique molecular-pathology links (1:1 cardinality)"
-    )
-
-    # Create linkage IDs
-    linkage["linkage_id"] = linkage.apply(
-        lambda row: create_linkage_id(
-            row["test_id"], row["pathology_id"], "molecular_test", "pathology"
-        ),
-        axis=1,
-    )
-
-    # Calculate link confidence
-    linkage["link_confidence"] = 1.0 - (linkage["abs_days_gap"] / tolerance_days)
-
-    # Select final columns
-    result = linkage[
-        [
-            "linkage_id",
-            "test_id",
-            "pathology_id",
-            patient_id_col,
-            molecular_date_col,
-            path_date_col,
-            "days_gap",
-            "abs_days_gap",
-            "within_tolerance",
-            "link_confidence",
-        ]
-    ]
-
-    # Log linkage statistics
-    logger.info(f"Molecular-Pathology Linkage Stats:")
-    logger.info(f"  Mean date gap: {linkage['abs_days_gap'].mean():.1f} days")
-    logger.info(f"  Median date gap: {linkage['abs_days_gap'].median():.1f} days")
-    logger.info(f"  Max date gap: {linkage['abs_days_gap'].max()} days")
-    logger.info(f"  Mean confidence: {linkage['link_confidence'].mean():.3f}")
-
-    return result
-
 
 def create_linkage(
     source_df: pd.DataFrame,
@@ -442,6 +527,7 @@ def create_linkage(
     source_date_col: str = "event_date",
     target_date_col: str = "target_date",
     tolerance_days: Optional[int] = None,
+    chunk_patients: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Generic linkage function with configurable parameters.
@@ -469,6 +555,8 @@ def create_linkage(
         Date column in target data
     tolerance_days : int, optional
         Override default tolerance window (uses LinkageConfig defaults if None)
+    chunk_patients : int, optional
+        If set, link this many patients at a time to bound peak memory
 
     Returns
     -------
@@ -490,6 +578,7 @@ def create_linkage(
             source_date_col,
             target_date_col,
             tolerance_days,
+            chunk_patients,
         )
     elif source_type == "fna_biopsy":
         return link_fna_to_pathology(
@@ -499,6 +588,7 @@ def create_linkage(
             source_date_col,
             target_date_col,
             tolerance_days,
+            chunk_patients,
         )
     elif source_type == "molecular_test":
         return link_molecular_to_pathology(
@@ -508,6 +598,7 @@ def create_linkage(
             source_date_col,
             target_date_col,
             tolerance_days,
+            chunk_patients,
         )
     else:
         raise ValueError(f"Unsupported source_type: {source_type}")
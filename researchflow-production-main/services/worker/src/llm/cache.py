@@ -0,0 +1,402 @@
+"""
+Completion cache for the LLM router.
+
+Exact hits are keyed on provider, model, temperature, max_tokens, and a hash
+of the canonicalized system prompt and prompt. Optionally, when an embedding
+function is configured, a miss falls back to cosine similarity against cached
+prompts with the same provider/model/parameters/system prompt.
+
+Backends are pluggable (:class:`MemoryCacheBackend`, :class:`SQLiteCacheBackend`);
+both apply a TTL and evict least-recently-used entries beyond ``max_entries``.
+
+Router configuration (env):
+- ``LLM_CACHE_BACKEND``: off (default) | memory | sqlite
+- ``LLM_CACHE_PATH``: SQLite file (default /tmp/llm_cache/completions.db)
+- ``LLM_CACHE_TTL_SECONDS``: entry lifetime (default 7 days)
+- ``LLM_CACHE_MAX_ENTRIES``: size bound (default 10000)
+- ``LLM_CACHE_MAX_TEMPERATURE``: only calls at or below this temperature are
+  cached (default 0.0, i.e. deterministic calls only)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Protocol, Sequence
+
+import numpy as np
+
+from src.llm.providers.base import LLMResult, LLMUsage
+
+logger = logging.getLogger("llm.cache")
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def canonical_prompt(text: str | None) -> str:
+    """Normalize line endings and trailing whitespace so trivially different prompts share a key."""
+    if not text:
+        return ""
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def _sha256(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    scope: str
+    payload: str
+    embedding: bytes | None
+    expires_at: float
+
+
+class CacheBackend(Protocol):
+    """Storage for cache entries; implementations handle TTL and size eviction."""
+
+    def get(self, key: str, now: float) -> str | None: ...
+
+    def put(self, entry: CacheEntry, now: float) -> int: ...
+
+    def embeddings(self, scope: str, now: float) -> list[tuple[str, bytes]]: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.payload
+
+    def put(self, entry: CacheEntry, now: float) -> int:
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def embeddings(self, scope: str, now: float) -> list[tuple[str, bytes]]:
+        with self._lock:
+            return [
+                (e.key, e.embedding)
+                for e in self._entries.values()
+                if e.scope == scope and e.embedding is not None and e.expires_at > now
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """Persistent SQLite backend shared across runs and processes."""
+
+    def __init__(self, db_path: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                key TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                embedding BLOB,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_completions_scope ON completions(scope)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_completions_access ON completions(last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, now: float) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE completions SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, entry: CacheEntry, now: float) -> int:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions "
+                "(key, scope, payload, embedding, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (entry.key, entry.scope, entry.payload, entry.embedding, entry.expires_at, now),
+            )
+            self._conn.execute("DELETE FROM completions WHERE expires_at <= ?", (now,))
+            (count,) = self._conn.execute("SELECT count(*) FROM completions").fetchone()
+            evicted = max(count - self.max_entries, 0)
+            if evicted:
+                self._conn.execute(
+                    "DELETE FROM completions WHERE key IN "
+                    "(SELECT key FROM completions ORDER BY last_access ASC LIMIT ?)",
+                    (evicted,),
+                )
+            self._conn.commit()
+            return evicted
+
+    def embeddings(self, scope: str, now: float) -> list[tuple[str, bytes]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, embedding FROM completions "
+                "WHERE scope = ? AND expires_at > ? AND embedding IS NOT NULL",
+                (scope, now),
+            ).fetchall()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM completions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _result_to_payload(result: LLMResult) -> str:
+    return json.dumps(asdict(result))
+
+
+def _payload_to_result(payload: str) -> LLMResult:
+    data = json.loads(payload)
+    data["usage"] = LLMUsage(**(data.get("usage") or {}))
+    return LLMResult(**data)
+
+
+class CompletionCache:
+    """
+    Exact and (optionally) embedding-similarity cache for LLM completions.
+
+    Args:
+        backend: Storage backend (defaults to an in-memory LRU)
+        ttl_seconds: Lifetime of an entry
+        max_temperature: Calls above this temperature bypass the cache
+        embed_fn: Optional text -> vector function enabling near-duplicate lookup
+        similarity_threshold: Minimum cosine similarity for a semantic hit
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_temperature: float = 0.0,
+        embed_fn: Callable[[str], Sequence[float]] | None = None,
+        similarity_threshold: float = 0.97,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self.similarity_threshold = similarity_threshold
+        self._embed = lru_cache(maxsize=256)(self._normalized_embedding) if embed_fn else None
+        self._embed_fn = embed_fn
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "CompletionCache | None":
+        """Build the router cache from ``LLM_CACHE_*`` env vars (None when off)."""
+        kind = os.getenv("LLM_CACHE_BACKEND", "off").strip().lower()
+        if kind in ("", "off", "none", "0", "false"):
+            return None
+        max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        if kind == "sqlite":
+            backend: CacheBackend = SQLiteCacheBackend(
+                os.getenv("LLM_CACHE_PATH", "/tmp/llm_cache/completions.db"), max_entries
+            )
+        elif kind == "memory":
+            backend = MemoryCacheBackend(max_entries)
+        else:
+            raise ValueError(f"Unknown LLM_CACHE_BACKEND: {kind!r} (off | memory | sqlite)")
+        return cls(
+            backend=backend,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            max_temperature=float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", 0.0)),
+        )
+
+    def cacheable(self, temperature: float) -> bool:
+        return temperature <= self.max_temperature
+
+    @staticmethod
+    def _scope(
+        provider: str, model: str, system_prompt: str | None,
+        temperature: float, max_tokens: int,
+    ) -> str:
+        return _sha256(
+            provider, model, repr(float(temperature)), str(int(max_tokens)),
+            canonical_prompt(system_prompt),
+        )
+
+    def _normalized_embedding(self, prompt: str) -> bytes:
+        vec = np.asarray(self._embed_fn(prompt), dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return (vec / norm if norm else vec).tobytes()
+
+    def _bump(self, stat: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] += n
+
+    def get(
+        self,
+        *,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> LLMResult | None:
+        """Return a cached completion, marking ``raw_meta["cache"]`` as exact or semantic."""
+        now = time.time()
+        scope = self._scope(provider, model, system_prompt, temperature, max_tokens)
+        canon = canonical_prompt(prompt)
+
+        payload = self.backend.get(_sha256(scope, canon), now)
+        kind = "exact"
+        if payload is None and self._embed is not None:
+            payload = self._semantic_lookup(scope, canon, now)
+            kind = "semantic"
+
+        if payload is None:
+            self._bump("misses")
+            return None
+
+        self._bump("hits" if kind == "exact" else "semantic_hits")
+        result = _payload_to_result(payload)
+        return replace(result, raw_meta={**(result.raw_meta or {}), "cache": kind})
+
+    def _semantic_lookup(self, scope: str, canon: str, now: float) -> str | None:
+        candidates = self.backend.embeddings(scope, now)
+        if not candidates:
+            return None
+        query = np.frombuffer(self._embed(canon), dtype=np.float32)
+        matrix = np.stack([np.frombuffer(e, dtype=np.float32) for _, e in candidates])
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        return self.backend.get(candidates[best][0], now)
+
+    def put(
+        self,
+        result: LLMResult,
+        *,
+        provider: str,
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> None:
+        """Store a completion returned by ``provider``."""
+        now = time.time()
+        scope = self._scope(provider, model, system_prompt, temperature, max_tokens)
+        canon = canonical_prompt(prompt)
+        entry = CacheEntry(
+            key=_sha256(scope, canon),
+            scope=scope,
+            payload=_result_to_payload(result),
+            embedding=self._embed(canon) if self._embed is not None else None,
+            expires_at=now + self.ttl_seconds,
+        )
+        evicted = self.backend.put(entry, now)
+        self._bump("stores")
+        if evicted:
+            self._bump("evictions", evicted)
+
+    @property
+    def hit_rate(self) -> float:
+        with self._lock:
+            hits = self.stats["hits"] + self.stats["semantic_hits"]
+            total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["entries"] = len(self.backend)
+        stats["hit_rate"] = self.hit_rate
+        return stats
+
+
+_UNSET = object()
+_cache: "CompletionCache | None | object" = _UNSET
+_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache | None:
+    """Process-wide router cache, built from env on first use.
+
+    A misconfigured cache is logged once and left disabled so calls go
+    straight to the provider.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is _UNSET:
+            try:
+                _cache = CompletionCache.from_env()
+            except Exception:
+                logger.exception("LLM completion cache disabled: construction failed")
+                _cache = None
+        return _cache  # type: ignore[return-value]
+
+
+def set_completion_cache(cache: CompletionCache | None) -> None:
+    """Install a cache (e.g. with an embedding function) or disable caching."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -4,10 +4,15 @@ import json
 import os
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.llm.providers.base import LLMResult, LLMUsage
-from src.runtime_config import RuntimeConfig
+from src.llm.providers.http_pool import (
+    ProviderPool,
+    get_pool,
+    runtime_config,
+    safe_int,
+)
 
 
 @dataclass(frozen=True)
@@ -41,6 +46,7 @@ class AnthropicProvider:
     """
 
     name: str = "anthropic"
+    pool: ProviderPool | None = field(default=None, compare=False, repr=False)
 
     def generate_text(
         self,
@@ -102,38 +108,17 @@ class AnthropicProvider:
         Unlike the OpenAI API, Anthropic returns content as an array of blocks. This
         method filters for blocks with ``type="text"`` and concatenates their text content.
         """
-        cfg = RuntimeConfig.from_env_and_optional_yaml(None)
-        if cfg.no_network or cfg.mock_only:
-            raise RuntimeError(
-                "NO_NETWORK=1 or MOCK_ONLY=1 blocks Anthropic calls (fail-closed)."
-            )
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise RuntimeError("ANTHROPIC_API_KEY not set.")
-
-        url = os.getenv(
-            "ANTHROPIC_MESSAGES_URL", "https://api.anthropic.com/v1/messages"
+        url, headers, body = self._build_request(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
-
-        body: dict = {
-            "model": model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": [{"role": "user", "content": prompt}],
-        }
-        if system_prompt:
-            body["system"] = system_prompt
-
         req = urllib.request.Request(
             url,
             data=json.dumps(body).encode("utf-8"),
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": os.getenv("ANTHROPIC_VERSION", "2023-06-01"),
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
+            headers=headers,
             method="POST",
         )
         try:
@@ -158,6 +143,79 @@ class AnthropicProvider:
         except Exception as e:
             raise RuntimeError(f"Unexpected error calling Anthropic API: {e}") from e
 
+        return self._parse_response(payload, model)
+
+    async def agenerate_text(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> LLMResult:
+        """
+        Async variant of :meth:`generate_text` over the shared connection pool.
+
+        The request is sent through :class:`ProviderPool`, which reuses keep-alive
+        connections to the Anthropic endpoint, limits in-flight requests per provider
+        and retries 429/5xx responses with jittered backoff. Gating, request body
+        and result parsing are the same as the sync path.
+        """
+        url, headers, body = self._build_request(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        pool = self.pool or get_pool()
+        payload = await pool.post_json(self.name, "Anthropic", url, headers, body)
+        return self._parse_response(payload, model)
+
+    def _build_request(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict]:
+        """Apply network gating and build (url, headers, body) for the Messages API."""
+        cfg = runtime_config()
+        if cfg.no_network or cfg.mock_only:
+            raise RuntimeError(
+                "NO_NETWORK=1 or MOCK_ONLY=1 blocks Anthropic calls (fail-closed)."
+            )
+
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise RuntimeError("ANTHROPIC_API_KEY not set.")
+
+        url = os.getenv(
+            "ANTHROPIC_MESSAGES_URL", "https://api.anthropic.com/v1/messages"
+        )
+
+        body: dict = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system_prompt:
+            body["system"] = system_prompt
+
+        headers = {
+            "x-api-key": api_key,
+            "anthropic-version": os.getenv("ANTHROPIC_VERSION", "2023-06-01"),
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        return url, headers, body
+
+    def _parse_response(self, payload: dict, model: str) -> LLMResult:
+        """Convert an Anthropic response payload to an LLMResult, raising on API errors."""
         # Check for API error response (e.g., invalid key, rate limit, model not found)
         if "error" in payload:
             error_info = payload["error"]
@@ -175,15 +233,6 @@ class AnthropicProvider:
 
         usage_p = payload.get("usage") or {}
 
-        # Safer conversion for token counts with fallback
-        def safe_int(value) -> int | None:
-            if value is None:
-                return None
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-
         usage = LLMUsage(
             input_tokens=safe_int(usage_p.get("input_tokens")),
             output_tokens=safe_int(usage_p.get("output_tokens")),
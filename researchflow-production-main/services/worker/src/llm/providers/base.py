@@ -32,3 +32,13 @@ class LLMProvider(Protocol):
         temperature: float = 0.2,
         max_tokens: int = 800,
     ) -> LLMResult: ...
+
+    async def agenerate_text(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> LLMResult: ...
@@ -0,0 +1,264 @@
+"""
+Shared async HTTP transport for LLM providers.
+
+Every provider's ``agenerate_text`` goes through one :class:`ProviderPool`,
+which keeps a keep-alive ``httpx.AsyncClient`` per provider (HTTP/2 when the
+optional ``h2`` package is installed), caps in-flight requests per provider
+with a semaphore, and retries 429/5xx responses and transport errors with
+jittered exponential backoff.
+
+Clients and semaphores are bound to an event loop, so the pool keeps one set
+per running loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import random
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+import httpx
+
+from src.runtime_config import RuntimeConfig
+
+logger = logging.getLogger("llm.http_pool")
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+DEFAULT_MAX_CONCURRENCY = 16
+
+_RUNTIME_ENV_KEYS = (
+    "ROS_MODE",
+    "NO_NETWORK",
+    "MOCK_ONLY",
+    "ALLOW_UPLOADS",
+    "STRICT_PHI_ON_UPLOAD",
+    "MAX_UPLOAD_MB",
+    "LLM_PROVIDER",
+    "LITERATURE_PROVIDER",
+)
+_runtime_cache: tuple[tuple[str | None, ...], RuntimeConfig] | None = None
+
+
+def runtime_config() -> RuntimeConfig:
+    """
+    Return the env-derived RuntimeConfig, rebuilt only when its env vars change.
+
+    Providers consult the config on every call for network gating; this keeps
+    that check to a tuple comparison instead of re-parsing the environment.
+    """
+    global _runtime_cache
+    snapshot = tuple(os.environ.get(k) for k in _RUNTIME_ENV_KEYS)
+    cached = _runtime_cache
+    if cached is not None and cached[0] == snapshot:
+        return cached[1]
+    cfg = RuntimeConfig.from_env_and_optional_yaml(None)
+    _runtime_cache = (snapshot, cfg)
+    return cfg
+
+
+def safe_int(value) -> int | None:
+    """Safely convert a value to int, returning None if conversion fails."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def max_concurrency(provider: str) -> int:
+    """
+    Per-provider in-flight request limit.
+
+    Read from ``LLM_MAX_CONCURRENCY_<PROVIDER>`` (e.g. ``LLM_MAX_CONCURRENCY_OPENAI``),
+    then ``LLM_MAX_CONCURRENCY``, defaulting to 16.
+    """
+    for key in (f"LLM_MAX_CONCURRENCY_{provider.upper()}", "LLM_MAX_CONCURRENCY"):
+        value = safe_int(os.getenv(key))
+        if value is not None and value > 0:
+            return value
+    return DEFAULT_MAX_CONCURRENCY
+
+
+def api_error_message(status_code: int, body: str) -> str:
+    """Extract ``error.message`` from an API error body, falling back to raw text."""
+    try:
+        data = json.loads(body) if body else {}
+        error = data.get("error", {}) if isinstance(data, dict) else {}
+        if isinstance(error, dict) and error.get("message"):
+            return error["message"]
+        if isinstance(error, str) and error:
+            return error
+    except json.JSONDecodeError:
+        pass
+    return f"HTTP Error {status_code}: {body[:200]}"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for retryable provider responses."""
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_delay)
+            except ValueError:
+                pass
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+@dataclass
+class _LoopState:
+    clients: dict[str, httpx.AsyncClient] = field(default_factory=dict)
+    semaphores: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+class ProviderPool:
+    """
+    Keep-alive client pools with per-provider concurrency limits and retries.
+
+    Args:
+        retry: Backoff policy for 429/5xx responses and transport errors
+        timeout: Per-request timeout in seconds
+        max_connections: Connection pool size per provider client
+        transport: Optional httpx transport (used by tests to stub the network)
+    """
+
+    def __init__(
+        self,
+        retry: RetryPolicy | None = None,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.transport = transport
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = _LoopState()
+            self._loops[loop] = state
+        return state
+
+    def client(self, provider: str) -> httpx.AsyncClient:
+        """Shared client for ``provider`` on the running event loop."""
+        state = self._state()
+        client = state.clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+            state.clients[provider] = client
+        return client
+
+    def semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Concurrency gate for ``provider`` on the running event loop."""
+        state = self._state()
+        sem = state.semaphores.get(provider)
+        if sem is None:
+            sem = asyncio.Semaphore(max_concurrency(provider))
+            state.semaphores[provider] = sem
+        return sem
+
+    async def post_json(
+        self,
+        provider: str,
+        label: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        """
+        POST a JSON body and return the decoded JSON response.
+
+        Retries 429/5xx responses (honouring ``Retry-After``) and transport
+        errors up to ``retry.max_retries`` times.
+
+        Raises:
+            RuntimeError: With the same messages as the sync providers, for
+                HTTP errors, network errors, and undecodable responses.
+        """
+        client = self.client(provider)
+        async with self.semaphore(provider):
+            attempt = 0
+            while True:
+                try:
+                    resp = await client.post(url, json=body, headers=dict(headers))
+                except httpx.TransportError as e:
+                    if attempt < self.retry.max_retries:
+                        delay = self.retry.delay(attempt)
+                        logger.warning(
+                            "%s request failed (%s); retry %d in %.2fs",
+                            label, e, attempt + 1, delay,
+                        )
+                        attempt += 1
+                        await asyncio.sleep(delay)
+                        continue
+                    raise RuntimeError(f"Network error accessing {label} API: {e}") from e
+
+                if resp.status_code in RETRYABLE_STATUS and attempt < self.retry.max_retries:
+                    delay = self.retry.delay(attempt, resp.headers.get("retry-after"))
+                    logger.warning(
+                        "%s API returned HTTP %d; retry %d in %.2fs",
+                        label, resp.status_code, attempt + 1, delay,
+                    )
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+
+                if resp.status_code >= 400:
+                    error_msg = api_error_message(resp.status_code, resp.text)
+                    raise RuntimeError(
+                        f"{label} API error (HTTP {resp.status_code}): {error_msg}"
+                    )
+
+                try:
+                    return resp.json()
+                except ValueError as e:
+                    raise RuntimeError(f"Unexpected error calling {label} API: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close the clients opened on the running event loop."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        for client in state.clients.values():
+            await client.aclose()
+
+
+_default_pool = ProviderPool()
+
+
+def get_pool() -> ProviderPool:
+    """Process-wide pool shared by all providers."""
+    return _default_pool
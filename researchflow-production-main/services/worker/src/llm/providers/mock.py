@@ -47,3 +47,20 @@ class MockProvider:
             request_id=None,
             raw_meta={"deterministic": True},
         )
+
+    async def agenerate_text(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str = "mock-1",
+        temperature: float = 0.0,
+        max_tokens: int = 800,
+    ) -> LLMResult:
+        return self.generate_text(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
@@ -4,10 +4,10 @@ import json
 import os
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.llm.providers.base import LLMResult, LLMUsage
-from src.runtime_config import RuntimeConfig
+from src.llm.providers.http_pool import ProviderPool, get_pool, runtime_config
 
 
 def _safe_int(value) -> int | None:
@@ -50,6 +50,7 @@ class XAIProvider:
     """
 
     name: str = "xai"
+    pool: ProviderPool | None = field(default=None, compare=False, repr=False)
 
     def generate_text(
         self,
@@ -107,7 +108,79 @@ class XAIProvider:
         POST request to the xAI ``/chat/completions`` endpoint using the configured
         base URL; otherwise, it raises a ``RuntimeError`` without making any network call.
         """
-        cfg = RuntimeConfig.from_env_and_optional_yaml(None)
+        url, headers, body = self._build_request(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        req = urllib.request.Request(
+            url,
+            data=json.dumps(body).encode("utf-8"),
+            headers=headers,
+            method="POST",
+        )
+
+        try:
+            with urllib.request.urlopen(req, timeout=60) as resp:
+                raw = resp.read().decode("utf-8")
+                payload = json.loads(raw)
+        except urllib.error.HTTPError as e:
+            # Read error response body if available
+            error_body = e.read().decode("utf-8") if e.fp else ""
+            try:
+                error_data = json.loads(error_body) if error_body else {}
+                error_msg = error_data.get("error", {}).get("message", str(e))
+            except json.JSONDecodeError:
+                error_msg = f"{e}: {error_body[:200]}"
+            raise RuntimeError(f"xAI API error (HTTP {e.code}): {error_msg}") from e
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"Network error accessing xAI API: {e.reason}") from e
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error calling xAI API: {e}") from e
+
+        return self._parse_response(payload, model)
+
+    async def agenerate_text(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> LLMResult:
+        """
+        Async variant of :meth:`generate_text` over the shared connection pool.
+
+        The request is sent through :class:`ProviderPool`, which reuses keep-alive
+        connections to the xAI endpoint, limits in-flight requests per provider
+        and retries 429/5xx responses with jittered backoff. Gating, request body
+        and result parsing are the same as the sync path.
+        """
+        url, headers, body = self._build_request(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        pool = self.pool or get_pool()
+        payload = await pool.post_json(self.name, "xAI", url, headers, body)
+        return self._parse_response(payload, model)
+
+    def _build_request(
+        self,
+        *,
+        prompt: str,
+        system_prompt: str | None,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict]:
+        """Apply network gating and build (url, headers, body) for the chat-completions API."""
+        cfg = runtime_config()
         if cfg.no_network or cfg.mock_only:
             raise RuntimeError(
                 "NO_NETWORK=1 or MOCK_ONLY=1 blocks xAI calls (fail-closed)."
@@ -134,35 +207,15 @@ class XAIProvider:
             "max_tokens": int(max_tokens),
         }
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(body).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            method="POST",
-        )
-
-        try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                raw = resp.read().decode("utf-8")
-                payload = json.loads(raw)
-        except urllib.error.HTTPError as e:
-            # Read error response body if available
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            try:
-                error_data = json.loads(error_body) if error_body else {}
-                error_msg = error_data.get("error", {}).get("message", str(e))
-            except json.JSONDecodeError:
-                error_msg = f"{e}: {error_body[:200]}"
-            raise RuntimeError(f"xAI API error (HTTP {e.code}): {error_msg}") from e
-        except urllib.error.URLError as e:
-            raise RuntimeError(f"Network error accessing xAI API: {e.reason}") from e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error calling xAI API: {e}") from e
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        return url, headers, body
 
+    def _parse_response(self, payload: dict, model: str) -> LLMResult:
+        """Convert an xAI response payload to an LLMResult, raising on API errors."""
         # Check for API error response (e.g., invalid key, rate limit, model not found)
         if "error" in payload:
             error_info = payload["error"]
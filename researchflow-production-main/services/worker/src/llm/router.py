@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 
+from src.llm.cache import get_completion_cache
 from src.llm.providers.anthropic_provider import AnthropicProvider
 from src.llm.providers.base import LLMResult
+from src.llm.providers.http_pool import runtime_config
 from src.llm.providers.mercury_provider import MercuryProvider
 from src.llm.providers.mock import MockProvider
 from src.llm.providers.openai_provider import OpenAIProvider
 from src.llm.providers.xai_provider import XAIProvider
-from src.runtime_config import RuntimeConfig
+from src.llm.shadow import get_shadow_runner
 
 logger = logging.getLogger("llm.router")
 
@@ -32,6 +35,28 @@ def _get_bridge_provider_mode() -> str:
     return os.getenv("AI_BRIDGE_PROVIDER_MODE", "mock").strip().lower()
 
 
+def _real_provider():
+    cfg = runtime_config()
+    provider_name = cfg.llm_provider or os.getenv("LLM_PROVIDER") or "mock"
+    return _select_provider(provider_name)
+
+
+def _cache_get(cache, provider_name: str, kwargs: dict) -> LLMResult | None:
+    # The cache is an optimization; a broken backend must not fail the call
+    try:
+        return cache.get(provider=provider_name, **kwargs)
+    except Exception:
+        logger.exception("completion cache lookup failed; calling provider")
+        return None
+
+
+def _cache_put(cache, result: LLMResult, provider_name: str, kwargs: dict) -> None:
+    try:
+        cache.put(result, provider=provider_name, **kwargs)
+    except Exception:
+        logger.exception("completion cache store failed; returning provider result")
+
+
 def generate_text(
     *,
     task_name: str,
@@ -46,14 +71,20 @@ def generate_text(
 
     Provider selection respects AI_BRIDGE_PROVIDER_MODE:
       mock   -> always MockProvider (default, zero cost)
-      shadow -> MockProvider result returned, real provider called
-                in background and logged for comparison
+      shadow -> MockProvider result returned immediately; the real provider
+                is called on a bounded, sampled background runner and a
+                comparison record is written (see src.llm.shadow)
       real   -> real provider selected via LLM_PROVIDER env
 
     Within 'real' mode the provider is selected via:
       1) RuntimeConfig.llm_provider (env LLM_PROVIDER)
       2) fallback to env LLM_PROVIDER
       3) fallback to mock
+
+    Real-mode calls at or below LLM_CACHE_MAX_TEMPERATURE are served from the
+    completion cache when LLM_CACHE_BACKEND is enabled (see src.llm.cache).
+
+    Blocking; async callers should use :func:`agenerate_text`.
     """
     bridge_mode = _get_bridge_provider_mode()
     logger.info("generate_text mode=%s task=%s model=%s", bridge_mode, task_name, model)
@@ -67,12 +98,10 @@ def generate_text(
             max_tokens=max_tokens,
         )
 
-    cfg = RuntimeConfig.from_env_and_optional_yaml(None)
-    provider_name = cfg.llm_provider or os.getenv("LLM_PROVIDER") or "mock"
-    real_provider = _select_provider(provider_name)
+    real_provider = _real_provider()
 
     if bridge_mode == "shadow":
-        # Return mock, but also fire real call for comparison logging
+        # Return mock; the real call runs in the background for comparison
         mock_result = MockProvider().generate_text(
             prompt=prompt,
             system_prompt=system_prompt,
@@ -80,29 +109,87 @@ def generate_text(
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        try:
-            real_result = real_provider.generate_text(
+        get_shadow_runner().submit(
+            lambda: real_provider.generate_text(
                 prompt=prompt,
                 system_prompt=system_prompt,
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
-            )
-            logger.info(
-                "shadow-mode real response provider=%s tokens_in=%d tokens_out=%d",
-                real_result.provider,
-                real_result.usage.input_tokens,
-                real_result.usage.output_tokens,
-            )
-        except Exception:
-            logger.warning("shadow-mode real call failed", exc_info=True)
+            ),
+            task_name=task_name,
+            model=model,
+            mock_result=mock_result,
+        )
         return mock_result
 
     # mode == 'real'
-    return real_provider.generate_text(
+    kwargs = dict(
+        prompt=prompt,
+        system_prompt=system_prompt,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    cache = get_completion_cache()
+    if cache is not None and cache.cacheable(temperature):
+        cached = _cache_get(cache, real_provider.name, kwargs)
+        if cached is not None:
+            return cached
+        result = real_provider.generate_text(**kwargs)
+        _cache_put(cache, result, real_provider.name, kwargs)
+        return result
+    return real_provider.generate_text(**kwargs)
+
+
+async def agenerate_text(
+    *,
+    task_name: str,
+    prompt: str,
+    system_prompt: str | None,
+    model: str,
+    temperature: float = 0.2,
+    max_tokens: int = 800,
+) -> LLMResult:
+    """
+    Async entry point with the same mode handling as :func:`generate_text`.
+
+    Real providers are awaited over the shared keep-alive connection pool
+    (see ``src.llm.providers.http_pool``) instead of blocking a thread per call.
+    """
+    bridge_mode = _get_bridge_provider_mode()
+    logger.info("agenerate_text mode=%s task=%s model=%s", bridge_mode, task_name, model)
+
+    kwargs = dict(
         prompt=prompt,
         system_prompt=system_prompt,
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
     )
+
+    if bridge_mode == "mock":
+        return await MockProvider().agenerate_text(**kwargs)
+
+    real_provider = _real_provider()
+
+    if bridge_mode == "shadow":
+        mock_result = await MockProvider().agenerate_text(**kwargs)
+        get_shadow_runner().submit_async(
+            lambda: real_provider.agenerate_text(**kwargs),
+            task_name=task_name,
+            model=model,
+            mock_result=mock_result,
+        )
+        return mock_result
+
+    # mode == 'real'; cache I/O (SQLite) runs off the event loop
+    cache = get_completion_cache()
+    if cache is not None and cache.cacheable(temperature):
+        cached = await asyncio.to_thread(_cache_get, cache, real_provider.name, kwargs)
+        if cached is not None:
+            return cached
+        result = await real_provider.agenerate_text(**kwargs)
+        await asyncio.to_thread(_cache_put, cache, result, real_provider.name, kwargs)
+        return result
+    return await real_provider.agenerate_text(**kwargs)
@@ -0,0 +1,276 @@
+"""
+Background execution of shadow-mode provider calls.
+
+In ``AI_BRIDGE_PROVIDER_MODE=shadow`` the router returns the mock result and
+hands the real provider call to a :class:`ShadowRunner`, so the caller never
+waits on the real provider. The runner:
+
+- samples requests (``AI_BRIDGE_SHADOW_SAMPLE_RATE``, 0.0-1.0, default 1.0)
+- bounds outstanding work (``AI_BRIDGE_SHADOW_MAX_PENDING``, default 32) and
+  drops new shadow calls instead of queueing when that bound is reached
+- runs sync calls on a small thread pool (``AI_BRIDGE_SHADOW_WORKERS``,
+  default 4) and async calls as tasks on the caller's event loop
+- writes one comparison record per call, off the request path, as a JSON
+  line to ``AI_BRIDGE_SHADOW_LOG`` when set, otherwise to the logger
+
+Comparison records hold sizes, token counts and latency only - never prompt
+or response text.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from src.llm.providers.base import LLMResult
+
+logger = logging.getLogger("llm.shadow")
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.getenv(key, default))
+    except ValueError:
+        return default
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key, default))
+    except ValueError:
+        return default
+
+
+def comparison_record(
+    *,
+    task_name: str,
+    model: str,
+    mock_result: LLMResult,
+    real_result: LLMResult | None,
+    latency_ms: float,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build a PHI-free comparison record for one shadow call."""
+    return {
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "task_name": task_name,
+        "model": model,
+        "provider": real_result.provider if real_result else None,
+        "latency_ms": round(latency_ms, 1),
+        "mock_chars": len(mock_result.text),
+        "real_chars": len(real_result.text) if real_result else None,
+        "mock_tokens_out": mock_result.usage.output_tokens,
+        "real_tokens_in": real_result.usage.input_tokens if real_result else None,
+        "real_tokens_out": real_result.usage.output_tokens if real_result else None,
+        "error": error,
+    }
+
+
+class ShadowRunner:
+    """
+    Bounded, sampled, drop-on-overload executor for shadow provider calls.
+
+    Args:
+        sample_rate: Fraction of shadow-eligible requests to actually run
+        max_pending: Max submitted-but-unfinished calls; beyond it calls are dropped
+        max_workers: Thread pool size for sync calls and record writes
+        log_path: JSONL file for comparison records (None = log only)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        max_pending: int = 32,
+        max_workers: int = 4,
+        log_path: str | None = None,
+    ):
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.max_pending = max(max_pending, 0)
+        self.log_path = log_path
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix="llm-shadow"
+        )
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending = 0
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = {"submitted": 0, "sampled_out": 0, "dropped": 0, "completed": 0, "failed": 0}
+
+    @classmethod
+    def from_env(cls) -> "ShadowRunner":
+        return cls(
+            sample_rate=_env_float("AI_BRIDGE_SHADOW_SAMPLE_RATE", 1.0),
+            max_pending=_env_int("AI_BRIDGE_SHADOW_MAX_PENDING", 32),
+            max_workers=_env_int("AI_BRIDGE_SHADOW_WORKERS", 4),
+            log_path=os.getenv("AI_BRIDGE_SHADOW_LOG") or None,
+        )
+
+    def _admit(self) -> bool:
+        """Apply sampling and the pending bound; reserve a slot if admitted."""
+        with self._lock:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                self.stats["sampled_out"] += 1
+                return False
+            if self._pending >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            self._pending += 1
+            self.stats["submitted"] += 1
+            return True
+
+    def _release(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.stats["failed" if record["error"] else "completed"] += 1
+
+    def _finish(self, record: dict[str, Any]) -> None:
+        self._release(record)
+        self._write(record)
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self.log_path:
+            try:
+                line = json.dumps(record)
+                with self._write_lock, open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError:
+                logger.warning("failed to write shadow record", exc_info=True)
+        else:
+            logger.info("shadow-mode comparison %s", json.dumps(record))
+
+    def submit(
+        self,
+        call: Callable[[], LLMResult],
+        *,
+        task_name: str,
+        model: str,
+        mock_result: LLMResult,
+    ) -> bool:
+        """
+        Run a blocking real-provider call in the background.
+
+        Returns:
+            True if the call was scheduled, False if sampled out or dropped.
+        """
+        if not self._admit():
+            return False
+
+        def run() -> None:
+            started = time.perf_counter()
+            real_result, error = None, None
+            try:
+                real_result = call()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            self._finish(comparison_record(
+                task_name=task_name,
+                model=model,
+                mock_result=mock_result,
+                real_result=real_result,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                error=error,
+            ))
+
+        try:
+            self._executor.submit(run)
+        except RuntimeError:
+            # Executor shut down (interpreter exit); release the slot
+            with self._lock:
+                self._pending -= 1
+                self.stats["submitted"] -= 1
+                self.stats["dropped"] += 1
+            return False
+        return True
+
+    def submit_async(
+        self,
+        call: Callable[[], Awaitable[LLMResult]],
+        *,
+        task_name: str,
+        model: str,
+        mock_result: LLMResult,
+    ) -> bool:
+        """
+        Run an async real-provider call as a background task on the running loop.
+
+        The comparison record is written from the thread pool so file I/O
+        never runs on the event loop.
+
+        Returns:
+            True if the call was scheduled, False if sampled out or dropped.
+        """
+        if not self._admit():
+            return False
+
+        async def run() -> None:
+            started = time.perf_counter()
+            real_result, error, cancelled = None, None, False
+            try:
+                real_result = await call()
+            except asyncio.CancelledError:
+                # e.g. asyncio.run cancelling pending tasks at teardown
+                error, cancelled = "CancelledError: shadow call cancelled", True
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            record = comparison_record(
+                task_name=task_name,
+                model=model,
+                mock_result=mock_result,
+                real_result=real_result,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                error=error,
+            )
+            # Release the slot on the loop so a cancellation can never leak it
+            self._release(record)
+            if cancelled:
+                self._write(record)
+                raise asyncio.CancelledError
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._write, record
+                )
+            except RuntimeError:
+                self._write(record)
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; optionally wait for running sync calls."""
+        self._executor.shutdown(wait=wait)
+
+
+_runner: ShadowRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_shadow_runner() -> ShadowRunner:
+    """Process-wide runner, configured from env on first use."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = ShadowRunner.from_env()
+        return _runner
+
+
+def reset_shadow_runner(wait: bool = True) -> None:
+    """Shut down the current runner; the next call re-reads the env."""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        runner.shutdown(wait=wait)
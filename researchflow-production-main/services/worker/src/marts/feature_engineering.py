@@ -26,7 +26,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 import warnings
 
 warnings.filterwarnings("ignore")
@@ -220,113 +220,135 @@ class FeatureEngineer:
         - Anti-Tg antibody: mean, median, min, max, std, first, last, trend
         - Test frequency: number of tests, time span
 
+        Each wide lab table is melted into one long (patient, slot, value,
+        date) frame and all statistics are computed with a single groupby.
+
         Returns:
             DataFrame with aggregated lab features per patient
         """
         print("\nAggregating laboratory values...")
 
-        lab_features = []
+        anti_tg = None
+        tg = None
 
         # Process Anti-Tg antibody
         if self.datasets["anti_tg"] is not None:
-            anti_tg_df = self.datasets["anti_tg"].copy()
+            anti_tg_df = self.datasets["anti_tg"]
             id_col = self._find_id_column(anti_tg_df)
 
             if id_col:
-                for rid in anti_tg_df[id_col].unique():
-                    patient_labs = anti_tg_df[anti_tg_df[id_col] == rid].iloc[0]
-
-                    # Extract lab results (lab1_result through labN_result)
-                    result_cols = [
-                        c
-                        for c in anti_tg_df.columns
-                        if c.startswith("lab") and c.endswith("_result")
-                    ]
-                    date_cols = [
-                        c
-                        for c in anti_tg_df.columns
-                        if c.startswith("lab") and c.endswith("_specimen_collect_dt")
-                    ]
-
-                    results = []
-                    dates = []
-
-                    for res_col, date_col in zip(result_cols, date_cols):
-                        if pd.notna(patient_labs.get(res_col)):
-                            # Parse numeric value (handle <, >, inequalities)
-                            val = self._parse_lab_value(str(patient_labs[res_col]))
-                            if val is not None:
-                                results.append(val)
-                                if pd.notna(patient_labs.get(date_col)):
-                                    dates.append(patient_labs[date_col])
-
-                    if results:
-                        features = self._compute_lab_stats(
-                            self._normalize_id(rid), results, dates, "anti_tg"
-                        )
-                        lab_features.append(features)
-
-                print(
-                    f"  ✓ Aggregated anti-Tg antibody for {len(lab_features):,} patients"
-                )
+                anti_tg = self._aggregate_wide_labs(anti_tg_df, id_col, "anti_tg")
+                print(f"  ✓ Aggregated anti-Tg antibody for {len(anti_tg):,} patients")
 
         # Process Thyroglobulin
         if self.datasets["thyroglobulin"] is not None:
-            tg_df = self.datasets["thyroglobulin"].copy()
+            tg_df = self.datasets["thyroglobulin"]
             id_col = self._find_id_column(tg_df)
 
             if id_col:
-                tg_count = 0
-                for rid in tg_df[id_col].unique():
-                    patient_labs = tg_df[tg_df[id_col] == rid].iloc[0]
+                tg = self._aggregate_wide_labs(tg_df, id_col, "thyroglobulin")
+                print(f"  ✓ Aggregated thyroglobulin for {len(tg):,} patients")
 
-                    result_cols = [
-                        c
-                        for c in tg_df.columns
-                        if c.startswith("lab") and c.endswith("_result")
-                    ]
-                    date_cols = [
-                        c
-                        for c in tg_df.columns
-                        if c.startswith("lab") and c.endswith("_specimen_collect_dt")
-                    ]
+        labs_df = self._combine_lab_features(anti_tg, tg)
 
-                    results = []
-                    dates = []
-
-                    for res_col, date_col in zip(result_cols, date_cols):
-                        if pd.notna(patient_labs.get(res_col)):
-                            val = self._parse_lab_value(str(patient_labs[res_col]))
-                            if val is not None:
-                                results.append(val)
-                                if pd.notna(patient_labs.get(date_col)):
-                                    dates.append(patient_labs[date_col])
-
-                    if results:
-                        norm_id = self._normalize_id(rid)
-                        features = self._compute_lab_stats(
-                            norm_id, results, dates, "thyroglobulin"
-                        )
+        if len(labs_df) > 0:
+            print(f"\n  Total patients with lab features: {len(labs_df):,}")
 
-                        # Merge with existing record or create new
-                        existing = next(
-                            (f for f in lab_features if f["research_id"] == norm_id),
-                            None,
-                        )
-                        if existing:
-                            existing.update(features)
-                        else:
-                            lab_features.append(features)
-                        tg_count += 1
+        return labs_df
 
-                print(f"  ✓ Aggregated thyroglobulin for {tg_count:,} patients")
+    def _aggregate_wide_labs(
+        self, df: pd.DataFrame, id_col: str, lab_type: str
+    ) -> pd.DataFrame:
+        """
+        Summarize one wide lab table (labN_result / labN_specimen_collect_dt).
 
-        labs_df = pd.DataFrame(lab_features)
+        Uses the first row of each patient, pairs result and date columns in
+        column order, and keeps patients with at least one numeric result, in
+        order of first appearance.
+        """
+        result_cols = [
+            c for c in df.columns if c.startswith("lab") and c.endswith("_result")
+        ]
+        date_cols = [
+            c
+            for c in df.columns
+            if c.startswith("lab") and c.endswith("_specimen_collect_dt")
+        ]
+        pairs = list(zip(result_cols, date_cols))
+
+        patients = df[df[id_col].notna()].drop_duplicates(id_col)
+        if not pairs or patients.empty:
+            return pd.DataFrame(columns=["research_id"])
+
+        # Melt to long format, slot-major: row k * n_patients + p is slot k of patient p
+        n_patients = len(patients)
+        long = pd.DataFrame(
+            {
+                "patient": np.tile(np.arange(n_patients), len(pairs)),
+                "value": pd.concat(
+                    [patients[res_col] for res_col, _ in pairs], ignore_index=True
+                ),
+                "date": pd.concat(
+                    [patients[date_col] for _, date_col in pairs], ignore_index=True
+                ),
+            }
+        )
+        long["value"] = self._parse_lab_values(long["value"])
+        long = long[long["value"].notna()]
+        long = long.sort_values("patient", kind="mergesort")
 
-        if len(labs_df) > 0:
-            print(f"\n  Total patients with lab features: {len(labs_df):,}")
+        stats = self._compute_lab_stats(long, lab_type)
+        research_ids = patients[id_col].iloc[stats.index].map(self._normalize_id)
+        stats.insert(0, "research_id", research_ids.to_numpy())
+        return stats.reset_index(drop=True)
 
-        return labs_df
+    def _combine_lab_features(
+        self, anti_tg: Optional[pd.DataFrame], tg: Optional[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Merge per-lab features into one row per patient.
+
+        Thyroglobulin features attach to the first anti-Tg row with the same
+        normalized ID; the remaining thyroglobulin patients are appended.
+        """
+        if tg is not None and len(tg) > 0:
+            # Later records for the same normalized ID overwrite earlier values
+            tg = tg.groupby("research_id", sort=False).last()
+        else:
+            tg = None
+        if anti_tg is None or len(anti_tg) == 0:
+            if tg is None:
+                return pd.DataFrame()
+            labs = tg.reset_index()
+        elif tg is None:
+            labs = anti_tg
+        else:
+            first_rows = ~anti_tg["research_id"].duplicated()
+            merged = (
+                anti_tg.assign(_tg_key=anti_tg["research_id"].where(first_rows))
+                .join(tg, on="_tg_key")
+                .drop(columns="_tg_key")
+            )
+            tg_only = tg[~tg.index.isin(anti_tg["research_id"])].reset_index()
+            labs = pd.concat([merged, tg_only], ignore_index=True)
+
+        return labs[self._lab_column_order(labs)]
+
+    @staticmethod
+    def _lab_column_order(labs: pd.DataFrame) -> List[str]:
+        """
+        Order lab feature columns by first appearance across patients.
+
+        Matches building the frame from per-patient dicts, where trend and
+        time-span keys only exist for patients with enough measurements.
+        """
+        present = labs.notna()
+        order = ["research_id"]
+        for _, row in present.drop_duplicates().iterrows():
+            for col in labs.columns:
+                if row[col] and col not in order:
+                    order.append(col)
+        return order + [c for c in labs.columns if c not in order]
 
     def extract_imaging_features(self) -> pd.DataFrame:
         """
@@ -731,57 +753,50 @@ class FeatureEngineer:
 
         return rid_str
 
-    def _parse_lab_value(self, value_str: str) -> Optional[float]:
-        """Parse lab result value (handles <, >, inequalities)."""
-        if pd.isna(value_str) or value_str == "":
-            return None
-
-        # Remove inequality symbols
-        value_str = str(value_str).strip()
-        value_str = (
-            value_str.replace("<", "")
-            .replace(">", "")
-            .replace("≤", "")
-            .replace("≥", "")
+    def _parse_lab_values(self, values: pd.Series) -> pd.Series:
+        """Parse lab result values (handles <, >, inequalities); unparseable → NaN."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(float)
+        text = values[values.notna()].astype(str).str.replace(
+            r"[<>≤≥]", "", regex=True
         )
+        return pd.to_numeric(text.str.strip(), errors="coerce").reindex(values.index)
 
-        try:
-            return float(value_str)
-        except ValueError:
-            return None
+    def _compute_lab_stats(self, long: pd.DataFrame, lab_type: str) -> pd.DataFrame:
+        """
+        Compute summary statistics for longitudinal lab values.
 
-    def _compute_lab_stats(
-        self, research_id: str, results: List[float], dates: List, lab_type: str
-    ) -> Dict:
-        """Compute summary statistics for longitudinal lab values."""
-        features = {
-            "research_id": research_id,
-            f"{lab_type}_mean": np.mean(results),
-            f"{lab_type}_median": np.median(results),
-            f"{lab_type}_min": np.min(results),
-            f"{lab_type}_max": np.max(results),
-            f"{lab_type}_std": np.std(results),
-            f"{lab_type}_count": len(results),
-            f"{lab_type}_first": results[0],
-            f"{lab_type}_last": results[-1],
-        }
+        Args:
+            long: Parsed results with columns patient, value, date, sorted by
+                patient and then measurement order
+
+        Returns:
+            DataFrame indexed by patient position
+        """
+        grouped = long.groupby("patient", sort=True)["value"]
+        stats = grouped.agg(["mean", "median", "min", "max", "count", "first", "last"])
+        stats["std"] = grouped.std(ddof=0)
+
+        features = pd.DataFrame(index=stats.index)
+        for stat in ("mean", "median", "min", "max", "std", "count", "first", "last"):
+            features[f"{lab_type}_{stat}"] = stats[stat]
 
         # Compute trend (if multiple values)
-        if len(results) >= 2:
-            features[f"{lab_type}_trend"] = results[-1] - results[0]
-            features[f"{lab_type}_trend_pct"] = (
-                ((results[-1] - results[0]) / results[0] * 100)
-                if results[0] != 0
-                else 0
-            )
+        multiple = stats["count"] >= 2
+        trend = stats["last"] - stats["first"]
+        trend_pct = (trend / stats["first"] * 100).where(stats["first"] != 0, 0)
+        features[f"{lab_type}_trend"] = trend.where(multiple)
+        features[f"{lab_type}_trend_pct"] = trend_pct.where(multiple)
 
         # Time span (if dates available)
-        if len(dates) >= 2:
-            dates_sorted = sorted([pd.to_datetime(d) for d in dates])
-            time_span = (dates_sorted[-1] - dates_sorted[0]).days
-            features[f"{lab_type}_timespan_days"] = time_span
+        dates = pd.to_datetime(long["date"], errors="coerce")
+        dated = long.assign(date=dates)[dates.notna()].groupby("patient")["date"]
+        span = dated.agg(["min", "max", "count"]).reindex(stats.index)
+        features[f"{lab_type}_timespan_days"] = (
+            (span["max"] - span["min"]).dt.days.where(span["count"] >= 2)
+        )
 
-        return features
+        return features.dropna(axis=1, how="all")
 
 
 def main():
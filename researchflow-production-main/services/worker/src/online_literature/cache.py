@@ -1,13 +1,64 @@
-"""Cache helpers for online literature runs."""
+"""Cache helpers for online literature runs.
+
+Entries live in a sharded layout (``<root>/ab/cd/<key>.<ext>``) so no single
+directory grows past a few thousand files. A small SQLite index next to the
+shards tracks size, creation and last access per key, which gives TTL expiry
+and LRU eviction under a byte budget without listing the directory tree.
+The index uses SQLite's default rollback journal because WAL does not work
+on network filesystems; ONLINE_LITERATURE_CACHE_JOURNAL_MODE overrides it
+for local disks.
+
+Payloads are msgpack (or compact JSON when msgpack is missing), compressed
+with zstd when ``zstandard`` is installed and zlib otherwise.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - msgpack is a pinned requirement
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# Evict down to this fraction of the budget so writes near the limit do not
+# trigger an eviction pass every time.
+EVICT_TARGET_RATIO = 0.9
+DEFAULT_JOURNAL_MODE = "DELETE"
+JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "WAL"})
+
+_DECODE_ERRORS: tuple = (OSError, ValueError, zlib.error)
+if ZSTD_AVAILABLE:
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+if MSGPACK_AVAILABLE:
+    _DECODE_ERRORS += (msgpack.UnpackException,)
+
 
 def compute_cache_key(provider: str, query: str, params: Mapping[str, Any]) -> str:
     payload = {
@@ -19,33 +70,266 @@ def compute_cache_key(provider: str, query: str, params: Mapping[str, Any]) -> s
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-def load_cache(cache_root: Path, cache_key: str) -> dict[str, Any] | None:
-    cache_path = cache_root / f"{cache_key}.json"
-    if not cache_path.exists():
-        return None
-    if not cache_path.is_file():
-        return None
+def _default_suffix() -> str:
+    fmt = "msgpack" if MSGPACK_AVAILABLE else "json"
+    return f".{fmt}.{'zst' if ZSTD_AVAILABLE else 'z'}"
 
-    try:
-        return json.loads(cache_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return None
 
+def _encode(payload: dict[str, Any], suffix: str) -> bytes:
+    if suffix.startswith(".msgpack"):
+        raw = msgpack.packb(payload, use_bin_type=True)
+    else:
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    if suffix.endswith(".zst"):
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    return zlib.compress(raw, 6)
 
-def write_cache(cache_root: Path, cache_key: str, payload: dict[str, Any]) -> Path:
-    cache_root.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_root / f"{cache_key}.json"
 
-    payload = dict(payload)
-    payload["cached_at"] = datetime.now(timezone.utc).isoformat()
+def _decode(data: bytes, suffix: str) -> dict[str, Any]:
+    # Entries may have been written by a worker with other optional packages
+    if suffix.endswith(".zst") and not ZSTD_AVAILABLE:
+        raise ValueError("zstandard is not installed")
+    if suffix.startswith(".msgpack") and not MSGPACK_AVAILABLE:
+        raise ValueError("msgpack is not installed")
+    if suffix.endswith(".zst"):
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raw = zlib.decompress(data)
+    if suffix.startswith(".msgpack"):
+        return msgpack.unpackb(raw, raw=False)
+    return json.loads(raw)
+
+
+class LiteratureCacheStore:
+    """Sharded, size-bounded on-disk cache with TTL and LRU eviction.
+
+    Args:
+        root: Cache directory
+        max_bytes: Byte budget for stored payloads; least recently used
+            entries are evicted when a write exceeds it
+        ttl_seconds: Entries older than this are treated as misses and removed
+        journal_mode: SQLite journal mode for the index; keep the default
+            rollback journal on shared/network volumes
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        journal_mode: str = DEFAULT_JOURNAL_MODE,
+    ) -> None:
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(
+                f"journal_mode must be one of {sorted(JOURNAL_MODES)}, got {journal_mode!r}"
+            )
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.suffix = _default_suffix()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / INDEX_FILENAME), timeout=30, check_same_thread=False
+        )
+        self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)"
+        )
+        self._conn.commit()
+
+    def shard_path(self, cache_key: str, suffix: str | None = None) -> Path:
+        return self.root / cache_key[:2] / cache_key[2:4] / f"{cache_key}{suffix or self.suffix}"
+
+    def get(self, cache_key: str) -> dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, created_at FROM entries WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                legacy = self._load_legacy(cache_key)
+                self.stats["hits" if legacy is not None else "misses"] += 1
+                return legacy
+
+            rel_path, created_at = row
+            path = self.root / rel_path
+            if now - created_at > self.ttl_seconds:
+                self._delete(cache_key, path)
+                self._conn.commit()
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            try:
+                payload = _decode(path.read_bytes(), "".join(path.suffixes))
+            except _DECODE_ERRORS as exc:
+                logger.warning("Dropping unreadable cache entry %s: %s", rel_path, exc)
+                self._delete(cache_key, path)
+                self._conn.commit()
+                self.stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (now, cache_key)
+            )
+            self._conn.commit()
+            self.stats["hits"] += 1
+            return payload
 
-    _atomic_write_json(cache_path, payload)
-    return cache_path
+    def put(self, cache_key: str, payload: dict[str, Any]) -> Path:
+        now = time.time()
+        path = self.shard_path(cache_key)
+        data = _encode(payload, self.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
 
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, path, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (cache_key, path.relative_to(self.root).as_posix(), len(data), now, now),
+            )
+            self.stats["writes"] += 1
+            self._evict(now)
+            self._conn.commit()
+        return path
+
+    def _evict(self, now: float) -> None:
+        expired = self._conn.execute(
+            "SELECT key, path FROM entries WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        ).fetchall()
+        for key, rel_path in expired:
+            self._delete(key, self.root / rel_path)
+        self.stats["expired"] += len(expired)
+
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        for key, rel_path, size in self._conn.execute(
+            "SELECT key, path, size FROM entries ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            self._delete(key, self.root / rel_path)
+            total -= size
+            self.stats["evictions"] += 1
+
+    def _delete(self, cache_key: str, path: Path) -> None:
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (cache_key,))
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load_legacy(self, cache_key: str) -> dict[str, Any] | None:
+        """Read a pre-sharding flat ``<key>.json`` entry and migrate it.
+
+        The file's mtime becomes ``created_at`` so migration does not extend
+        its TTL.
+        """
+        legacy_path = self.root / f"{cache_key}.json"
+        if not legacy_path.is_file():
+            return None
+        try:
+            created_at = legacy_path.stat().st_mtime
+            if time.time() - created_at > self.ttl_seconds:
+                legacy_path.unlink(missing_ok=True)
+                self.stats["expired"] += 1
+                return None
+            payload = json.loads(legacy_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        path = self.shard_path(cache_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = _encode(payload, self.suffix)
+        path.write_bytes(data)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, path, size, created_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (cache_key, path.relative_to(self.root).as_posix(), len(data), created_at,
+             time.time()),
+        )
+        self._conn.commit()
+        legacy_path.unlink(missing_ok=True)
+        return payload
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            **self.stats,
+            "hit_ratio": self.hit_ratio,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: dict[Path, LiteratureCacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_cache_store(cache_root: Path) -> LiteratureCacheStore:
+    """Shared store per cache directory, configured from the environment.
+
+    ONLINE_LITERATURE_CACHE_MAX_BYTES, ONLINE_LITERATURE_CACHE_TTL_SECONDS and
+    ONLINE_LITERATURE_CACHE_JOURNAL_MODE override the defaults.
+    """
+    root = Path(cache_root).resolve()
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = LiteratureCacheStore(
+                root,
+                max_bytes=int(
+                    os.getenv("ONLINE_LITERATURE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+                ),
+                ttl_seconds=float(
+                    os.getenv("ONLINE_LITERATURE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+                ),
+                journal_mode=os.getenv(
+                    "ONLINE_LITERATURE_CACHE_JOURNAL_MODE", DEFAULT_JOURNAL_MODE
+                ),
+            )
+            _stores[root] = store
+        return store
+
+
+def load_cache(cache_root: Path, cache_key: str) -> dict[str, Any] | None:
+    return get_cache_store(cache_root).get(cache_key)
+
+
+def write_cache(cache_root: Path, cache_key: str, payload: dict[str, Any]) -> Path:
+    payload = dict(payload)
+    payload["cached_at"] = datetime.now(timezone.utc).isoformat()
 
-def _atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
-    tmp_path.replace(path)
+    return get_cache_store(cache_root).put(cache_key, payload)
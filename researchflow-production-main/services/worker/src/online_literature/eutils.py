@@ -0,0 +1,235 @@
+"""NCBI E-utilities transport for the PubMed provider.
+
+One rate-limited, keep-alive HTTP session is shared per API key so that all
+PubMed searches in a process stay within NCBI's request limits (3 requests/s
+without a key, 10 requests/s with one).
+
+Searches use the history server: ``esearch`` runs once with ``usehistory=y``
+and returns a WebEnv/query_key, and ``efetch`` then pages through the stored
+result set in batches. efetch responses are streamed and parsed incrementally,
+so memory use is bounded by one article rather than one response.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+TOOL_NAME = "ros_online_literature"
+USER_AGENT = "ROS-OnlineLiterature/1.0"
+DEFAULT_BATCH_SIZE = 500
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+@dataclass(frozen=True)
+class SearchHistory:
+    """Result set stored on the E-utilities history server."""
+
+    count: int
+    webenv: str
+    query_key: str
+
+
+class EUtilsClient:
+    """Pooled, rate-limited E-utilities client.
+
+    Args:
+        api_key: NCBI API key (raises the limit from 3 to 10 requests/s)
+        timeout: Per-request timeout in seconds
+        max_retries: Retries for 429/5xx responses and transport errors
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+    ) -> None:
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(10.0 if api_key else 3.0)
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    def _session(self) -> Any:
+        # Network library imported lazily (defense-in-depth: no network imports
+        # at module level for offline runtimes).
+        with self._client_lock:
+            if self._client is None:
+                import httpx
+
+                self._client = httpx.Client(
+                    base_url=EUTILS_BASE_URL,
+                    timeout=self.timeout,
+                    headers={"User-Agent": USER_AGENT},
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+                )
+            return self._client
+
+    def _params(self, **params: str) -> dict[str, str]:
+        params["tool"] = TOOL_NAME
+        email = os.getenv("NCBI_EMAIL")
+        if email:
+            params["email"] = email
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    def _request(self, endpoint: str, params: dict[str, str]) -> Any:
+        """Open a streamed response, retrying 429/5xx with backoff."""
+        import httpx
+
+        session = self._session()
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                request = session.build_request("GET", endpoint, params=params)
+                response = session.send(request, stream=True)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                time.sleep(min(2 ** attempt * 0.5, 8.0))
+                continue
+
+            if response.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                response.close()
+                retry_after = response.headers.get("retry-after")
+                try:
+                    delay = float(retry_after) if retry_after else 2 ** attempt * 0.5
+                except ValueError:
+                    delay = 2 ** attempt * 0.5
+                attempt += 1
+                time.sleep(min(delay, 8.0))
+                continue
+
+            if response.status_code >= 400:
+                response.close()
+                response.raise_for_status()
+            return response
+
+    def esearch(self, term: str, *, sort: str = "relevance") -> SearchHistory:
+        """Run ``esearch`` with ``usehistory=y`` and return the stored result set."""
+        response = self._request(
+            "esearch.fcgi",
+            self._params(
+                db="pubmed",
+                term=term,
+                retmax="0",
+                usehistory="y",
+                retmode="xml",
+                sort=sort,
+            ),
+        )
+        try:
+            root = ET.fromstring(response.read())
+        finally:
+            response.close()
+
+        error = root.findtext("ERROR")
+        if error:
+            raise RuntimeError(f"PubMed esearch error: {error}")
+        webenv = root.findtext("WebEnv")
+        query_key = root.findtext("QueryKey")
+        count = int(root.findtext("Count") or 0)
+        if count and not (webenv and query_key):
+            raise RuntimeError("PubMed esearch returned no history (WebEnv/QueryKey)")
+        return SearchHistory(count=count, webenv=webenv or "", query_key=query_key or "")
+
+    def iter_articles(
+        self,
+        history: SearchHistory,
+        *,
+        max_results: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[ET.Element]:
+        """Yield ``PubmedArticle`` elements from the history server, batch by batch.
+
+        Each element is only valid until the next one is requested; it is
+        cleared afterwards to keep memory flat.
+        """
+        total = min(history.count, max_results)
+        for retstart in range(0, total, batch_size):
+            retmax = min(batch_size, total - retstart)
+            response = self._request(
+                "efetch.fcgi",
+                self._params(
+                    db="pubmed",
+                    WebEnv=history.webenv,
+                    query_key=history.query_key,
+                    retstart=str(retstart),
+                    retmax=str(retmax),
+                    retmode="xml",
+                ),
+            )
+            try:
+                yield from _stream_articles(response.iter_bytes())
+            finally:
+                response.close()
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+def _stream_articles(chunks: Any) -> Iterator[ET.Element]:
+    """Incrementally parse an efetch byte stream into ``PubmedArticle`` elements."""
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            if elem.tag == "PubmedArticle":
+                yield elem
+                # Drop parsed articles so the tree never holds a whole batch
+                if root is not None:
+                    root.clear()
+    parser.close()
+
+
+_clients: dict[str | None, EUtilsClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_eutils_client(api_key: str | None = None, *, timeout: float = 30.0) -> EUtilsClient:
+    """Process-wide client per API key, so all callers share one rate limit.
+
+    ``timeout`` only applies when the client is first created.
+    """
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = EUtilsClient(api_key=api_key, timeout=timeout)
+            _clients[api_key] = client
+        return client
@@ -5,10 +5,11 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
 from web_frontend.phi_scan import scan_text_high_confidence
 
+from .eutils import DEFAULT_BATCH_SIZE, get_eutils_client
 from .network_gates import (
     NetworkBlockedError,
     OnlineLiteratureError,
@@ -72,93 +73,46 @@ class OnlineLiteratureProvider(Protocol):
 
 
 class PubMedProvider:
-    """PubMed E-utilities provider (metadata-only)."""
+    """PubMed E-utilities provider (metadata-only).
+
+    Searches go through the history server and are fetched in batches of
+    ``batch_size`` over a shared, rate-limited session (see ``eutils``), so
+    large result sets cost ``1 + ceil(n / batch_size)`` requests.
+    """
 
     name = "pubmed"
 
-    def __init__(self, *, api_key: str | None = None, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        timeout: int = 10,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
         self._api_key = api_key or os.getenv("NCBI_API_KEY")
         self._timeout = timeout
+        self._batch_size = max(1, batch_size)
 
     def search(self, topic: str, max_results: int = 20) -> list[PaperMetadata]:
+        return list(self.iter_search(topic, max_results=max_results))
+
+    def iter_search(self, topic: str, max_results: int = 20) -> Iterator[PaperMetadata]:
+        """Stream results batch by batch; use for large systematic-review pulls."""
         # Defense-in-depth: provider gate stays even with runtime gate since providers
         # may be called directly outside the runtime entry point.
         ensure_network_allowed()
         ensure_topic_safe(topic)
 
         if max_results < 1:
-            return []
+            return
 
         try:
-            import urllib.parse
-            import urllib.request
-            import xml.etree.ElementTree as ET
-
-            search_params = {
-                "db": "pubmed",
-                "term": topic,
-                "retmax": str(max_results),
-                "retmode": "xml",
-                "sort": "relevance",
-                "tool": "ros_online_literature",
-            }
-            if self._api_key:
-                search_params["api_key"] = self._api_key
-
-            search_url = (
-                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?"
-                + urllib.parse.urlencode(search_params)
-            )
-
-            request = urllib.request.Request(
-                search_url,
-                headers={"User-Agent": "ROS-OnlineLiterature/1.0"},
-            )
-
-            with urllib.request.urlopen(request, timeout=self._timeout) as response:
-                search_xml = response.read()
-
-            root = ET.fromstring(search_xml)
-            id_list = [
-                elem.text
-                for elem in root.findall(".//IdList/Id")
-                if elem is not None and elem.text
-            ]
-
-            if not id_list:
-                return []
-
-            fetch_params = {
-                "db": "pubmed",
-                "id": ",".join(id_list),
-                "retmode": "xml",
-                "tool": "ros_online_literature",
-            }
-            if self._api_key:
-                fetch_params["api_key"] = self._api_key
-
-            fetch_url = (
-                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?"
-                + urllib.parse.urlencode(fetch_params)
-            )
-
-            fetch_request = urllib.request.Request(
-                fetch_url,
-                headers={"User-Agent": "ROS-OnlineLiterature/1.0"},
-            )
-
-            with urllib.request.urlopen(
-                fetch_request, timeout=self._timeout
-            ) as response:
-                fetch_xml = response.read()
-
-            fetch_root = ET.fromstring(fetch_xml)
-
-            results: list[PaperMetadata] = []
-            for article in fetch_root.findall(".//PubmedArticle"):
-                results.append(_parse_pubmed_article(article))
-
-            return results
+            client = get_eutils_client(self._api_key, timeout=self._timeout)
+            history = client.esearch(topic, sort="relevance")
+            for article in client.iter_articles(
+                history, max_results=max_results, batch_size=self._batch_size
+            ):
+                yield _parse_pubmed_article(article)
         except PhiViolationError:
             raise
         except Exception as exc:
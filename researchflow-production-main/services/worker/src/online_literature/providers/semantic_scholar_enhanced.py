@@ -19,8 +19,8 @@ import aiohttp
 import networkx as nx
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Set, Tuple
-from dataclasses import dataclass, field
-from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict, defaultdict
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -32,10 +32,20 @@ from src.runtime_config import RuntimeConfig
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Maximum IDs per Semantic Scholar paper/batch request
+PAPER_BATCH_SIZE = 500
+
+# Unresolved citation links kept by CitationGraphBuilder before the oldest
+# external IDs are dropped
+MAX_PENDING_LINKS = 200_000
+
+@dataclass(frozen=True)
 class EnhancedPaperMetadata(PaperMetadata):
     """Enhanced paper metadata with additional Semantic Scholar data."""
     
+    # Semantic Scholar paper ID (references/citations are expressed in these)
+    paper_id: Optional[str] = None
+    
     # Citation metrics
     citation_count: int = 0
     influential_citation_count: int = 0
@@ -133,6 +143,88 @@ class KnowledgeGap:
     suggested_research_directions: List[str] = field(default_factory=list)
     relevant_funding_opportunities: List[str] = field(default_factory=list)
 
+class CitationGraphBuilder:
+    """
+    Incrementally maintained citation graph.
+    
+    Nodes are keyed by DOI (falling back to title). References and citations
+    carry Semantic Scholar paper IDs, so every paper is indexed under both its
+    paper ID and DOI; each link is then resolved with one dict lookup.
+    Links to papers not yet in the graph are kept and connected when that
+    paper is added, so a graph can be extended without rebuilding it.
+    Most referenced papers never join the graph, so at most ``max_pending``
+    unresolved links are kept; the oldest external IDs are dropped first.
+    """
+    
+    def __init__(self,
+                 graph: Optional[nx.DiGraph] = None,
+                 max_pending: int = MAX_PENDING_LINKS):
+        self.graph = graph if graph is not None else nx.DiGraph()
+        self.max_pending = max_pending
+        self._node_by_ref: Dict[str, str] = {}
+        # Unresolved links: external ID -> {(node_id, node_cites_external)},
+        # oldest external ID first
+        self._pending: "OrderedDict[str, Set[Tuple[str, bool]]]" = OrderedDict()
+        self._pending_links = 0
+    
+    @property
+    def pending_links(self) -> int:
+        return self._pending_links
+    
+    @staticmethod
+    def node_id(paper: EnhancedPaperMetadata) -> str:
+        return paper.doi or paper.title
+    
+    def add_papers(self, papers: List[EnhancedPaperMetadata]) -> nx.DiGraph:
+        """Add papers and their citation links; returns the (shared) graph."""
+        added = []
+        for paper in papers:
+            node = self.node_id(paper)
+            self.graph.add_node(node,
+                                title=paper.title,
+                                year=paper.year,
+                                citation_count=paper.citation_count,
+                                fields=paper.fields_of_study)
+            for alias in (paper.paper_id, paper.doi):
+                if alias:
+                    self._node_by_ref[alias] = node
+                    links = self._pending.pop(alias, ())
+                    self._pending_links -= len(links)
+                    for other, other_cites in links:
+                        self._add_edge(other, node, other_cites)
+            added.append((node, paper))
+        
+        for node, paper in added:
+            for ref_id in paper.references:
+                self._link(node, ref_id, cites=True)
+            for cit_id in paper.citations:
+                self._link(node, cit_id, cites=False)
+        return self.graph
+    
+    def _link(self, node: str, external_id: str, cites: bool) -> None:
+        target = self._node_by_ref.get(external_id)
+        if target is None:
+            links = self._pending.setdefault(external_id, set())
+            if (node, cites) not in links:
+                links.add((node, cites))
+                self._pending_links += 1
+                self._prune_pending()
+        else:
+            self._add_edge(node, target, cites)
+    
+    def _prune_pending(self) -> None:
+        while self._pending_links > self.max_pending and self._pending:
+            _, dropped = self._pending.popitem(last=False)
+            self._pending_links -= len(dropped)
+    
+    def _add_edge(self, node: str, other: str, cites: bool) -> None:
+        if node == other:
+            return
+        if cites:
+            self.graph.add_edge(node, other, relation="cites")
+        else:
+            self.graph.add_edge(other, node, relation="cites")
+
 class EnhancedSemanticScholarProvider:
     """
     Enhanced Semantic Scholar provider with advanced analytics capabilities.
@@ -155,8 +247,14 @@ class EnhancedSemanticScholarProvider:
         self.base_url = base_url
         self.rate_limit = rate_limit_per_second
         
+        # Shared HTTP session (created lazily on the running loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._throttle_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
+        
         # Analytics components
         self.citation_graph = nx.DiGraph()
+        self.citation_builder = CitationGraphBuilder(self.citation_graph)
         self.author_network = nx.Graph()
         self.paper_cache: Dict[str, EnhancedPaperMetadata] = {}
         self.author_cache: Dict[str, AuthorProfile] = {}
@@ -199,6 +297,11 @@ class EnhancedSemanticScholarProvider:
             # Build citation network if requested
             citation_network = None
             if include_citations or include_references:
+                papers = await self._fetch_citation_links(
+                    papers,
+                    include_citations=include_citations,
+                    include_references=include_references,
+                )
                 citation_network = await self._build_citation_network(papers)
             
             # Analyze research trends
@@ -234,48 +337,118 @@ class EnhancedSemanticScholarProvider:
             logger.error(f"Enhanced search failed: {e}")
             raise
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            headers = {"Accept": "application/json"}
+            if self.api_key:
+                headers["x-api-key"] = self.api_key
+            self._session = aiohttp.ClientSession(
+                headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _throttle(self) -> None:
+        """Space requests to stay within ``rate_limit`` requests per second."""
+        if self._throttle_lock is None:
+            self._throttle_lock = asyncio.Lock()
+        async with self._throttle_lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_request_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = loop.time() + 1.0 / max(self.rate_limit, 1)
+    
     async def _search_papers_advanced(self, topic: str, max_results: int) -> List[EnhancedPaperMetadata]:
         """Search papers with enhanced metadata."""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Extended field list for comprehensive data
-                fields = [
-                    "title", "year", "authors", "doi", "url", "abstract",
-                    "citationCount", "influentialCitationCount", "isOpenAccess",
-                    "fieldsOfStudy", "s2FieldsOfStudy", "publicationDate",
-                    "venue", "references", "citations", "embedding"
-                ]
-                
-                headers = {"Accept": "application/json"}
-                if self.api_key:
-                    headers["x-api-key"] = self.api_key
-                
-                url = f"{self.base_url}/paper/search"
-                params = {
-                    "query": topic,
-                    "limit": max_results,
-                    "fields": ",".join(fields)
-                }
-                
-                async with session.get(url, headers=headers, params=params) as response:
-                    data = await response.json()
-                
-                papers = []
-                for item in data.get("data", []):
-                    paper = self._parse_enhanced_paper(item)
-                    papers.append(paper)
-                    
-                    # Cache for later use
-                    if paper.doi:
-                        self.paper_cache[paper.doi] = paper
-                
-                logger.info(f"Retrieved {len(papers)} papers for topic: {topic}")
-                return papers
+            session = await self._get_session()
+            # Extended field list for comprehensive data; reference and
+            # citation IDs are fetched separately via paper/batch
+            fields = [
+                "paperId", "title", "year", "authors", "doi", "url", "abstract",
+                "citationCount", "influentialCitationCount", "isOpenAccess",
+                "fieldsOfStudy", "s2FieldsOfStudy", "publicationDate",
+                "venue", "embedding"
+            ]
+            
+            url = f"{self.base_url}/paper/search"
+            params = {
+                "query": topic,
+                "limit": max_results,
+                "fields": ",".join(fields)
+            }
+            
+            await self._throttle()
+            async with session.get(url, params=params) as response:
+                data = await response.json()
+            
+            papers = []
+            for item in data.get("data", []):
+                paper = self._parse_enhanced_paper(item)
+                papers.append(paper)
                 
+                # Cache for later use
+                if paper.doi:
+                    self.paper_cache[paper.doi] = paper
+            
+            logger.info(f"Retrieved {len(papers)} papers for topic: {topic}")
+            return papers
+            
         except Exception as e:
             logger.error(f"Advanced paper search failed: {e}")
             raise
     
+    async def _fetch_citation_links(self,
+                                    papers: List[EnhancedPaperMetadata],
+                                    include_citations: bool = True,
+                                    include_references: bool = True) -> List[EnhancedPaperMetadata]:
+        """Fill reference/citation IDs using batched ``paper/batch`` lookups."""
+        fields = []
+        if include_references:
+            fields.append("references.paperId")
+        if include_citations:
+            fields.append("citations.paperId")
+        ids = list(dict.fromkeys(p.paper_id for p in papers if p.paper_id))
+        if not fields or not ids:
+            return papers
+        
+        session = await self._get_session()
+        url = f"{self.base_url}/paper/batch"
+        links: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), PAPER_BATCH_SIZE):
+            chunk = ids[start:start + PAPER_BATCH_SIZE]
+            await self._throttle()
+            async with session.post(url, params={"fields": ",".join(fields)},
+                                    json={"ids": chunk}) as response:
+                response.raise_for_status()
+                data = await response.json()
+            # Results align with the requested IDs; unknown IDs come back as null
+            for paper_id, item in zip(chunk, data):
+                if item:
+                    links[paper_id] = item
+        
+        enriched = []
+        for paper in papers:
+            item = links.get(paper.paper_id) if paper.paper_id else None
+            if item is None:
+                enriched.append(paper)
+                continue
+            enriched.append(replace(
+                paper,
+                references=[r["paperId"] for r in item.get("references") or [] if r.get("paperId")],
+                citations=[c["paperId"] for c in item.get("citations") or [] if c.get("paperId")],
+            ))
+        logger.info(f"Fetched citation links for {len(links)} papers in "
+                    f"{-(-len(ids) // PAPER_BATCH_SIZE)} batch request(s)")
+        return enriched
+    
     def _parse_enhanced_paper(self, data: Dict[str, Any]) -> EnhancedPaperMetadata:
         """Parse API response into enhanced paper metadata."""
         try:
@@ -353,6 +526,7 @@ class EnhancedSemanticScholarProvider:
                 embedding=embedding,
                 references=references,
                 citations=citations,
+                paper_id=data.get("paperId"),
                 citation_velocity=citation_velocity,
                 venue_type=venue_type
             )
@@ -369,33 +543,13 @@ class EnhancedSemanticScholarProvider:
                 abstract=data.get("abstract")
             )
     
-    async def _build_citation_network(self, papers: List[EnhancedPaperMetadata]) -> nx.DiGraph:
-        """Build citation network graph from papers."""
+    async def _build_citation_network(self,
+                                      papers: List[EnhancedPaperMetadata],
+                                      builder: Optional[CitationGraphBuilder] = None) -> nx.DiGraph:
+        """Build citation network graph from papers (or extend ``builder``'s graph)."""
         try:
-            G = nx.DiGraph()
-            
-            # Add nodes (papers)
-            for paper in papers:
-                paper_id = paper.doi or paper.title
-                G.add_node(paper_id, 
-                          title=paper.title,
-                          year=paper.year,
-                          citation_count=paper.citation_count,
-                          fields=paper.fields_of_study)
-            
-            # Add edges (citations)
-            for paper in papers:
-                paper_id = paper.doi or paper.title
-                
-                # References (this paper cites others)
-                for ref_id in paper.references:
-                    if ref_id in [p.doi for p in papers if p.doi]:
-                        G.add_edge(paper_id, ref_id, relation="cites")
-                
-                # Citations (other papers cite this one)
-                for cit_id in paper.citations:
-                    if cit_id in [p.doi for p in papers if p.doi]:
-                        G.add_edge(cit_id, paper_id, relation="cites")
+            builder = builder or CitationGraphBuilder()
+            G = builder.add_papers(papers)
             
             logger.info(f"Built citation network with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
             return G
@@ -404,6 +558,10 @@ class EnhancedSemanticScholarProvider:
             logger.error(f"Error building citation network: {e}")
             return nx.DiGraph()
     
+    async def extend_citation_network(self, papers: List[EnhancedPaperMetadata]) -> nx.DiGraph:
+        """Add papers to the provider-wide ``citation_graph`` without rebuilding it."""
+        return await self._build_citation_network(papers, builder=self.citation_builder)
+    
     async def _analyze_research_trends(self, topic: str, papers: List[EnhancedPaperMetadata]) -> ResearchTrend:
         """Analyze research trends for the given topic."""
         try:
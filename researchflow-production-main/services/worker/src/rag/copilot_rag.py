@@ -10,7 +10,13 @@ import logging
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
-from .hybrid_retriever import HybridRetriever, HybridConfig, RetrievalResult
+from .hybrid_retriever import (
+    SNAPSHOT_MANIFEST,
+    HybridConfig,
+    HybridRetriever,
+    RetrievalResult,
+    content_hash,
+)
 from .document_processor import DocumentProcessor, ChunkConfig
 
 logger = logging.getLogger(__name__)
@@ -33,6 +39,10 @@ class CopilotRAG:
     - Document chunking and embedding
     - Hybrid retrieval (semantic + keyword)
     - Context augmentation for LLM
+    
+    When an index path is configured (argument or COPILOT_RAG_INDEX_PATH),
+    the retriever is loaded from the snapshot there on startup and every
+    newly indexed paper is appended to it.
     """
     
     def __init__(
@@ -41,15 +51,25 @@ class CopilotRAG:
         llm_provider: Optional[Any] = None,
         hybrid_config: Optional[HybridConfig] = None,
         chunk_config: Optional[ChunkConfig] = None,
+        index_path: Optional[str] = None,
     ):
-        self.retriever = HybridRetriever(hybrid_config)
         self.processor = DocumentProcessor(chunk_config)
         self.embedding_provider = embedding_provider
         self.llm_provider = llm_provider
+        self.index_path = index_path or os.getenv("COPILOT_RAG_INDEX_PATH") or None
         
         self._indexed_papers: Dict[str, bool] = {}
         
-        logger.info("CopilotRAG initialized")
+        if self.index_path and os.path.exists(os.path.join(self.index_path, SNAPSHOT_MANIFEST)):
+            self.retriever = HybridRetriever.load(self.index_path, hybrid_config)
+            for paper_id in self.retriever.metadata_values('paper_id'):
+                self._indexed_papers[paper_id] = True
+        else:
+            self.retriever = HybridRetriever(hybrid_config)
+        
+        logger.info(
+            f"CopilotRAG initialized with {len(self._indexed_papers)} indexed papers"
+        )
     
     async def index_paper(
         self,
@@ -78,13 +98,32 @@ class CopilotRAG:
         # Chunk the document
         chunks = self.processor.chunk_document(paper_id, content, metadata)
         
-        # Generate embeddings
-        if self.embedding_provider:
-            chunk_texts = [c.content for c in chunks]
-            embeddings = await self._generate_embeddings(chunk_texts)
-        else:
-            # Fallback: use dummy embeddings for testing
-            embeddings = [[0.0] * 1536 for _ in chunks]
+        # Generate embeddings, reusing those of chunks with identical content
+        digests = [content_hash(c.content) for c in chunks]
+        embeddings_by_hash: Dict[str, List[float]] = {}
+        pending: Dict[str, str] = {}
+        for chunk, digest in zip(chunks, digests):
+            if digest in embeddings_by_hash or digest in pending:
+                continue
+            existing = self.retriever.find_by_content_hash(digest)
+            if existing is not None:
+                embeddings_by_hash[digest] = self.retriever.get_embedding(existing)
+            else:
+                pending[digest] = chunk.content
+        
+        if pending:
+            if self.embedding_provider:
+                new_embeddings = await self._generate_embeddings(list(pending.values()))
+            else:
+                # Fallback: use dummy embeddings for testing
+                new_embeddings = [[0.0] * 1536 for _ in pending]
+            embeddings_by_hash.update(zip(pending.keys(), new_embeddings))
+        
+        embeddings = [embeddings_by_hash[digest] for digest in digests]
+        if len(pending) < len(chunks):
+            logger.info(
+                f"Reused embeddings for {len(chunks) - len(pending)} of {len(chunks)} chunks"
+            )
         
         # Index chunks
         for chunk, embedding in zip(chunks, embeddings):
@@ -98,6 +137,9 @@ class CopilotRAG:
         self._indexed_papers[paper_id] = True
         logger.info(f"Indexed paper {paper_id} with {len(chunks)} chunks")
         
+        if self.index_path:
+            self.save_index()
+        
         return len(chunks)
     
     async def query(
@@ -170,6 +212,12 @@ class CopilotRAG:
             retrieval_results=results,
         )
     
+    def save_index(self) -> None:
+        """Persist the retriever to index_path, appending new chunks only."""
+        if not self.index_path:
+            raise ValueError("CopilotRAG has no index_path configured")
+        self.retriever.save(self.index_path)
+    
     def _build_context(self, results: List[RetrievalResult]) -> str:
         """Build context string from retrieval results."""
         context_parts = []
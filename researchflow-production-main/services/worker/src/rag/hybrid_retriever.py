@@ -4,18 +4,47 @@ Combines semantic vector search with BM25 keyword matching.
 
 Architecture:
     Query -> [Semantic Search] + [BM25 Keyword] -> Reciprocal Rank Fusion -> Results
+
+Embeddings are held in a contiguous NumPy matrix so semantic scores for all
+documents come from a single matrix-vector product, BM25 scores are
+accumulated from a postings-list inverted index, and metadata filters are
+resolved to cached boolean row masks.
+
+The index can be snapshotted to a directory and reloaded with the embedding
+matrix memory-mapped, so restarts do not need to re-embed documents.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
 import math
 import logging
+import os
+from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
-from collections import defaultdict
+from typing import List, Dict, Optional, Any, Iterator, Set, Tuple
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MANIFEST = "manifest.json"
+SNAPSHOT_EMBEDDINGS = "embeddings.f64"
+SNAPSHOT_DOCUMENTS = "documents.jsonl"
+
+# Embeddings are stored as raw little-endian float64 rows
+_EMBEDDING_DTYPE = np.dtype("<f8")
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest used to detect duplicate chunk content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
 
 @dataclass
 class RetrievalResult:
@@ -47,7 +76,7 @@ class HybridConfig:
 
 
 class BM25Scorer:
-    """BM25 keyword scoring implementation."""
+    """BM25 keyword scoring backed by a postings-list inverted index."""
     
     def __init__(self, k1: float = 1.5, b: float = 0.75):
         self.k1 = k1
@@ -56,30 +85,54 @@ class BM25Scorer:
         self.avg_doc_length: float = 0.0
         self.doc_freqs: Dict[str, int] = defaultdict(int)
         self.term_freqs: Dict[str, Dict[str, int]] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
         self.total_docs: int = 0
+        self._total_length: int = 0
         
     def index_document(self, doc_id: str, content: str) -> None:
-        """Index a document for BM25 scoring."""
-        terms = self._tokenize(content)
-        self.doc_lengths[doc_id] = len(terms)
-        self.total_docs += 1
+        """Index a document for BM25 scoring, replacing any previous version."""
+        self.index_term_counts(doc_id, Counter(self._tokenize(content)))
+    
+    def index_term_counts(self, doc_id: str, term_counts: Mapping[str, int]) -> None:
+        """Index already tokenized term counts, e.g. when restoring a snapshot."""
+        if doc_id in self.term_freqs:
+            self.remove_document(doc_id)
         
-        # Update average document length
-        total_length = sum(self.doc_lengths.values())
-        self.avg_doc_length = total_length / self.total_docs
+        length = sum(term_counts.values())
+        self.doc_lengths[doc_id] = length
+        self.total_docs += 1
         
-        # Track term frequencies
-        term_counts: Dict[str, int] = defaultdict(int)
-        seen_terms = set()
+        # Running total keeps the average O(1) per insert
+        self._total_length += length
+        self.avg_doc_length = self._total_length / self.total_docs
         
-        for term in terms:
-            term_counts[term] += 1
-            if term not in seen_terms:
-                self.doc_freqs[term] += 1
-                seen_terms.add(term)
+        for term, tf in term_counts.items():
+            self.doc_freqs[term] += 1
+            self.postings.setdefault(term, {})[doc_id] = tf
         
         self.term_freqs[doc_id] = dict(term_counts)
     
+    def remove_document(self, doc_id: str) -> None:
+        """Remove a document from the index (no-op if not indexed)."""
+        term_counts = self.term_freqs.pop(doc_id, None)
+        if term_counts is None:
+            return
+        
+        self.total_docs -= 1
+        self._total_length -= self.doc_lengths.pop(doc_id, 0)
+        self.avg_doc_length = (
+            self._total_length / self.total_docs if self.total_docs else 0.0
+        )
+        
+        for term in term_counts:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if postings:
+                self.doc_freqs[term] -= 1
+            else:
+                del self.postings[term]
+                del self.doc_freqs[term]
+    
     def score(self, query: str, doc_id: str, content: str) -> float:
         """Calculate BM25 score for a document."""
         if doc_id not in self.term_freqs:
@@ -93,27 +146,85 @@ class BM25Scorer:
         for term in query_terms:
             if term not in term_freqs:
                 continue
-                
-            tf = term_freqs[term]
-            df = self.doc_freqs.get(term, 1)
-            
-            # IDF calculation
-            idf = math.log((self.total_docs - df + 0.5) / (df + 0.5) + 1)
-            
-            # TF normalization
-            tf_norm = (tf * (self.k1 + 1)) / (
-                tf + self.k1 * (1 - self.b + self.b * (doc_length / max(self.avg_doc_length, 1)))
+            score += self._idf(self.doc_freqs.get(term, 1)) * self._tf_norm(
+                term_freqs[term], doc_length
             )
-            
-            score += idf * tf_norm
         
         return score
     
+    def score_query(self, query: str) -> Dict[str, float]:
+        """
+        Score every document that contains at least one query term.
+        
+        Only the postings of the query terms are visited, so the cost is
+        proportional to the number of matching postings rather than the
+        corpus size. Documents without any query term are omitted.
+        
+        Returns:
+            Mapping of doc_id to BM25 score
+        """
+        scores: Dict[str, float] = defaultdict(float)
+        
+        for term, query_tf in Counter(self._tokenize(query)).items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            
+            weight = query_tf * self._idf(len(postings))
+            for doc_id, tf in postings.items():
+                scores[doc_id] += weight * self._tf_norm(tf, self.doc_lengths[doc_id])
+        
+        return dict(scores)
+    
+    def _idf(self, df: int) -> float:
+        """Inverse document frequency for a term seen in df documents."""
+        return math.log((self.total_docs - df + 0.5) / (df + 0.5) + 1)
+    
+    def _tf_norm(self, tf: int, doc_length: int) -> float:
+        """Length-normalized term frequency."""
+        return (tf * (self.k1 + 1)) / (
+            tf + self.k1 * (1 - self.b + self.b * (doc_length / max(self.avg_doc_length, 1)))
+        )
+    
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization - lowercase and split."""
         return text.lower().split()
 
 
+class _EmbeddingView(Mapping):
+    """Read-only doc_id -> embedding view over the retriever's matrix."""
+    
+    def __init__(self, retriever: "HybridRetriever"):
+        self._retriever = retriever
+    
+    def __getitem__(self, doc_id: str) -> List[float]:
+        row = self._retriever._row_of[doc_id]
+        return self._retriever._matrix[row].tolist()
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._retriever._doc_ids)
+    
+    def __len__(self) -> int:
+        return len(self._retriever._doc_ids)
+
+
+def _top_indices(scores: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of scores in descending order, truncated to limit.
+    
+    Uses argpartition so only the selected top entries are fully sorted.
+    Ties keep ascending index order.
+    """
+    if limit is not None and limit < len(scores):
+        if limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-scores, limit - 1)[:limit]
+        # Restore index order first so the stable sort breaks ties by index
+        candidates.sort()
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+    return np.argsort(-scores, kind="stable")
+
+
 class HybridRetriever:
     """
     Hybrid retrieval combining semantic and keyword search.
@@ -126,7 +237,26 @@ class HybridRetriever:
         self.config = config or HybridConfig()
         self.bm25 = BM25Scorer(k1=self.config.bm25_k1, b=self.config.bm25_b)
         self._documents: Dict[str, Dict[str, Any]] = {}
-        self._embeddings: Dict[str, List[float]] = {}
+        
+        # Row-aligned embedding storage; capacity grows by doubling
+        self._doc_ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._norms: np.ndarray = np.zeros(0)
+        self._embeddings = _EmbeddingView(self)
+        
+        # metadata key -> value -> rows, plus masks built from it per filter
+        self._metadata_index: Dict[str, Dict[Any, Set[int]]] = defaultdict(dict)
+        self._mask_cache: Dict[Tuple[str, Any], np.ndarray] = {}
+        
+        # content hash -> first doc_id with that content
+        self._content_hashes: Dict[str, str] = {}
+        self._hash_to_doc: Dict[str, str] = {}
+        
+        # Snapshot bookkeeping for incremental saves
+        self._snapshot_path: Optional[Path] = None
+        self._persisted_rows: int = 0
+        self._dirty_rows: Set[int] = set()
         
         logger.info(f"HybridRetriever initialized with config: {self.config}")
     
@@ -137,16 +267,187 @@ class HybridRetriever:
         embedding: List[float],
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Add a document to the retriever index."""
-        self._documents[doc_id] = {
-            'content': content,
-            'metadata': metadata or {},
-        }
-        self._embeddings[doc_id] = embedding
+        """
+        Add a document to the retriever index.
+        
+        Re-adding an existing doc_id replaces its content, embedding and
+        metadata in place.
+        
+        Raises:
+            ValueError: If the embedding dimension differs from the index
+        """
+        vector = np.asarray(embedding, dtype=np.float64)
+        if vector.ndim != 1:
+            raise ValueError(f"Embedding for {doc_id} must be one-dimensional")
+        
+        row = self._row_of.get(doc_id)
+        if row is None:
+            self._reserve(len(self._doc_ids) + 1, vector.shape[0])
+            row = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._row_of[doc_id] = row
+        else:
+            self._check_dimension(vector.shape[0])
+            self._forget_document(doc_id, row)
+            if row < self._persisted_rows:
+                self._dirty_rows.add(row)
+        
+        self._store_document(
+            row, doc_id, content, metadata or {}, content_hash(content)
+        )
+        self._matrix[row] = vector
+        self._norms[row] = np.linalg.norm(vector)
         self.bm25.index_document(doc_id, content)
         
         logger.debug(f"Added document {doc_id} to index")
     
+    def find_by_content_hash(self, digest: str) -> Optional[str]:
+        """Return the doc_id of an indexed document whose content_hash() is digest."""
+        return self._hash_to_doc.get(digest)
+    
+    def metadata_values(self, key: str) -> Set[Any]:
+        """Distinct hashable values of a metadata key across indexed documents."""
+        return {
+            value for value, rows in self._metadata_index.get(key, {}).items() if rows
+        }
+    
+    def get_embedding(self, doc_id: str) -> List[float]:
+        """Return the stored embedding for doc_id."""
+        return self._embeddings[doc_id]
+    
+    def save(self, path: str | Path) -> None:
+        """
+        Snapshot the index to a directory.
+        
+        Layout:
+            manifest.json    - row count, dimension and committed byte sizes
+            embeddings.f64   - raw little-endian float64 embedding rows
+            documents.jsonl  - one record per row (content, metadata,
+                               content hash, norm and BM25 term counts)
+        
+        Saving again to the directory this index was loaded from or last
+        saved to only appends rows added since, and rewrites re-added rows
+        in place. The manifest is replaced atomically last, so a crash
+        while appending leaves the previous snapshot readable. Only a
+        single writer per directory is supported.
+        
+        Metadata values that are not JSON serializable are stored as str.
+        
+        Args:
+            path: Snapshot directory (created if missing)
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        manifest_path = path / SNAPSHOT_MANIFEST
+        
+        count = len(self._doc_ids)
+        dimension = self._matrix.shape[1] if self._matrix is not None else None
+        
+        start, documents_bytes, dirty = 0, 0, []
+        if self._snapshot_path == path.resolve() and manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text())
+            if manifest.get("count") == self._persisted_rows:
+                start = self._persisted_rows
+                documents_bytes = manifest["documents_bytes"]
+                dirty = sorted(self._dirty_rows)
+            else:
+                logger.warning(
+                    f"Snapshot at {path} changed since it was loaded; rewriting it"
+                )
+        
+        row_bytes = (dimension or 0) * _EMBEDDING_DTYPE.itemsize
+        with _snapshot_file(path / SNAPSHOT_EMBEDDINGS, append=bool(start)) as f:
+            f.truncate(start * row_bytes)
+            for row in dirty:
+                f.seek(row * row_bytes)
+                f.write(self._matrix[row].astype(_EMBEDDING_DTYPE).tobytes())
+            if count > start:
+                f.seek(start * row_bytes)
+                f.write(self._matrix[start:count].astype(_EMBEDDING_DTYPE).tobytes())
+        
+        # Later records for the same row supersede earlier ones on load
+        with _snapshot_file(path / SNAPSHOT_DOCUMENTS, append=bool(start)) as f:
+            f.truncate(documents_bytes)
+            f.seek(documents_bytes)
+            for row in [*dirty, *range(start, count)]:
+                f.write(self._snapshot_record(row).encode("utf-8"))
+            documents_bytes = f.tell()
+        
+        _write_json_atomic(
+            {
+                "format_version": SNAPSHOT_FORMAT_VERSION,
+                "count": count,
+                "dimension": dimension,
+                "documents_bytes": documents_bytes,
+            },
+            manifest_path,
+        )
+        
+        self._snapshot_path = path.resolve()
+        self._persisted_rows = count
+        self._dirty_rows.clear()
+        
+        logger.info(
+            f"Saved retriever snapshot to {path}: {count} documents "
+            f"({count - start} appended, {len(dirty)} rewritten)"
+        )
+    
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        config: Optional[HybridConfig] = None
+    ) -> "HybridRetriever":
+        """
+        Load an index snapshot written by save().
+        
+        The embedding matrix is memory-mapped copy-on-write, so loading does
+        not read it; pages are faulted in by the first searches. Adding new
+        documents afterwards copies the matrix into memory once it needs
+        to grow.
+        
+        Args:
+            path: Snapshot directory
+            config: Retriever configuration (BM25 parameters apply at query time)
+            
+        Raises:
+            FileNotFoundError: If the directory has no snapshot manifest
+            ValueError: If the snapshot format version is unsupported
+        """
+        path = Path(path)
+        manifest = json.loads((path / SNAPSHOT_MANIFEST).read_text())
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported retriever snapshot version: {manifest.get('format_version')}"
+            )
+        
+        retriever = cls(config)
+        count = manifest["count"]
+        if count:
+            retriever._matrix = np.memmap(
+                path / SNAPSHOT_EMBEDDINGS,
+                dtype=_EMBEDDING_DTYPE,
+                mode="c",
+                shape=(count, manifest["dimension"]),
+            )
+            retriever._norms = np.zeros(count)
+            retriever._doc_ids = [None] * count
+        
+        with open(path / SNAPSHOT_DOCUMENTS, "rb") as f:
+            data = f.read(manifest["documents_bytes"])
+        for line in data.splitlines():
+            record = json.loads(line)
+            retriever._restore_record(record)
+        
+        if any(doc_id is None for doc_id in retriever._doc_ids):
+            raise ValueError(f"Retriever snapshot at {path} is missing document records")
+        
+        retriever._snapshot_path = path.resolve()
+        retriever._persisted_rows = count
+        
+        logger.info(f"Loaded retriever snapshot from {path}: {count} documents")
+        return retriever
+    
     def search(
         self,
         query: str,
@@ -157,6 +458,11 @@ class HybridRetriever:
         """
         Perform hybrid search combining semantic and keyword retrieval.
         
+        Every document passing the filter is ranked semantically; documents
+        containing at least one query term are also ranked by BM25. Fusion
+        scores are computed as arrays and only the top_k results are
+        materialized.
+        
         Args:
             query: Search query text
             query_embedding: Pre-computed query embedding
@@ -168,87 +474,299 @@ class HybridRetriever:
         """
         top_k = top_k or self.config.top_k
         
-        # Get semantic search results
-        semantic_results = self._semantic_search(query_embedding, filter_metadata)
+        rows = self._candidate_rows(filter_metadata)
+        if rows.size == 0:
+            return []
         
-        # Get BM25 keyword results  
-        keyword_results = self._keyword_search(query, filter_metadata)
+        k = self.config.rrf_k
+        semantic_weight = self.config.semantic_weight
+        keyword_weight = 1.0 - semantic_weight
+        
+        # Semantic ranks over all candidates
+        semantic_scores = self._semantic_scores(query_embedding)[rows]
+        semantic_ranks = np.empty(rows.size, dtype=np.int64)
+        semantic_ranks[_top_indices(semantic_scores)] = np.arange(1, rows.size + 1)
+        fused = semantic_weight / (k + semantic_ranks)
+        
+        # Keyword ranks over candidates that match the query
+        keyword_scores = np.zeros(rows.size)
+        keyword_ranks = np.zeros(rows.size, dtype=np.int64)
+        hit_rows, hit_scores = self._keyword_scores(query, rows)
+        if hit_rows.size:
+            positions = np.searchsorted(rows, hit_rows)
+            order = _top_indices(hit_scores)
+            keyword_ranks[positions[order]] = np.arange(1, hit_rows.size + 1)
+            keyword_scores[positions] = hit_scores
+            fused[positions] += keyword_weight / (k + keyword_ranks[positions])
+        
+        eligible = np.flatnonzero(fused >= self.config.min_score)
+        best = eligible[_top_indices(fused[eligible], top_k)]
         
-        # Combine using Reciprocal Rank Fusion
-        combined = self._reciprocal_rank_fusion(semantic_results, keyword_results)
+        results = []
+        for i in best:
+            doc_id = self._doc_ids[rows[i]]
+            doc_data = self._documents[doc_id]
+            has_keyword = keyword_ranks[i] > 0
+            results.append(RetrievalResult(
+                doc_id=doc_id,
+                chunk_id=doc_id,
+                content=doc_data['content'],
+                score=float(fused[i]),
+                metadata=doc_data['metadata'],
+                semantic_score=float(semantic_scores[i]),
+                keyword_score=float(keyword_scores[i]) if has_keyword else None,
+                semantic_rank=int(semantic_ranks[i]),
+                keyword_rank=int(keyword_ranks[i]) if has_keyword else None,
+            ))
         
-        # Filter and return top_k
-        results = [r for r in combined if r.score >= self.config.min_score]
-        return results[:top_k]
+        return results
     
     def _semantic_search(
         self,
         query_embedding: List[float],
-        filter_metadata: Optional[Dict[str, Any]] = None
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None
     ) -> List[RetrievalResult]:
         """Perform semantic search using cosine similarity."""
-        results = []
+        rows = self._candidate_rows(filter_metadata)
+        if rows.size == 0:
+            return []
         
-        for doc_id, embedding in self._embeddings.items():
-            doc_data = self._documents.get(doc_id, {})
-            
-            # Apply metadata filter
-            if filter_metadata and not self._matches_filter(doc_data.get('metadata', {}), filter_metadata):
-                continue
-            
-            score = self._cosine_similarity(query_embedding, embedding)
-            
+        scores = self._semantic_scores(query_embedding)[rows]
+        
+        results = []
+        for rank, i in enumerate(_top_indices(scores, top_k), start=1):
+            doc_id = self._doc_ids[rows[i]]
+            doc_data = self._documents[doc_id]
+            score = float(scores[i])
             results.append(RetrievalResult(
                 doc_id=doc_id,
                 chunk_id=doc_id,
-                content=doc_data.get('content', ''),
+                content=doc_data['content'],
                 score=score,
-                metadata=doc_data.get('metadata', {}),
+                metadata=doc_data['metadata'],
                 semantic_score=score,
+                semantic_rank=rank,
             ))
         
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        # Assign ranks
-        for i, result in enumerate(results):
-            result.semantic_rank = i + 1
-        
         return results
     
     def _keyword_search(
         self,
         query: str,
-        filter_metadata: Optional[Dict[str, Any]] = None
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None
     ) -> List[RetrievalResult]:
-        """Perform BM25 keyword search."""
-        results = []
+        """
+        Perform BM25 keyword search.
         
-        for doc_id, doc_data in self._documents.items():
-            # Apply metadata filter
-            if filter_metadata and not self._matches_filter(doc_data.get('metadata', {}), filter_metadata):
-                continue
-            
-            content = doc_data.get('content', '')
-            score = self.bm25.score(query, doc_id, content)
-            
+        Only documents containing at least one query term are returned.
+        """
+        rows = self._candidate_rows(filter_metadata)
+        hit_rows, hit_scores = self._keyword_scores(query, rows)
+        
+        results = []
+        for rank, i in enumerate(_top_indices(hit_scores, top_k), start=1):
+            doc_id = self._doc_ids[hit_rows[i]]
+            doc_data = self._documents[doc_id]
+            score = float(hit_scores[i])
             results.append(RetrievalResult(
                 doc_id=doc_id,
                 chunk_id=doc_id,
-                content=content,
+                content=doc_data['content'],
                 score=score,
-                metadata=doc_data.get('metadata', {}),
+                metadata=doc_data['metadata'],
                 keyword_score=score,
+                keyword_rank=rank,
             ))
         
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
+        return results
+    
+    def _semantic_scores(self, query_embedding: List[float]) -> np.ndarray:
+        """Cosine similarity of the query against every indexed row."""
+        count = len(self._doc_ids)
+        if count == 0:
+            return np.zeros(0)
+        
+        query = np.asarray(query_embedding, dtype=np.float64)
+        if query.shape != (self._matrix.shape[1],):
+            raise ValueError(
+                f"Query embedding has shape {query.shape}, "
+                f"index expects ({self._matrix.shape[1]},)"
+            )
         
-        # Assign ranks
-        for i, result in enumerate(results):
-            result.keyword_rank = i + 1
+        denominators = self._norms[:count] * np.linalg.norm(query)
+        dots = self._matrix[:count] @ query
+        scores = np.zeros(count)
+        np.divide(dots, denominators, out=scores, where=denominators != 0)
+        return scores
+    
+    def _keyword_scores(
+        self,
+        query: str,
+        rows: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        BM25 scores for matching documents restricted to the given rows.
         
-        return results
+        Returns:
+            (rows, scores) arrays in ascending row order
+        """
+        scores = self.bm25.score_query(query)
+        if not scores:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        
+        hit_rows = np.fromiter(
+            (self._row_of[doc_id] for doc_id in scores), dtype=np.int64, count=len(scores)
+        )
+        hit_scores = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        
+        keep = np.isin(hit_rows, rows, assume_unique=True)
+        order = np.argsort(hit_rows[keep])
+        return hit_rows[keep][order], hit_scores[keep][order]
+    
+    def _candidate_rows(
+        self,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> np.ndarray:
+        """Ascending row indices of documents matching the metadata filter."""
+        count = len(self._doc_ids)
+        if not filter_metadata:
+            return np.arange(count)
+        
+        mask = np.ones(count, dtype=bool)
+        for key, value in filter_metadata.items():
+            mask &= self._filter_mask(key, value)
+        return np.flatnonzero(mask)
+    
+    def _filter_mask(self, key: str, value: Any) -> np.ndarray:
+        """Boolean row mask for metadata[key] == value, cached until the next add."""
+        try:
+            cache_key = (key, value)
+            mask = self._mask_cache.get(cache_key)
+        except TypeError:
+            # Unhashable filter values cannot use the index
+            return np.fromiter(
+                (
+                    self._matches_filter(self._documents[doc_id]['metadata'], {key: value})
+                    for doc_id in self._doc_ids
+                ),
+                dtype=bool,
+                count=len(self._doc_ids),
+            )
+        
+        if mask is None:
+            mask = np.zeros(len(self._doc_ids), dtype=bool)
+            matching_rows = self._metadata_index.get(key, {}).get(value)
+            if matching_rows:
+                mask[list(matching_rows)] = True
+            self._mask_cache[cache_key] = mask
+        return mask
+    
+    def _store_document(
+        self,
+        row: int,
+        doc_id: str,
+        content: str,
+        metadata: Dict[str, Any],
+        digest: str
+    ) -> None:
+        """Record content, metadata and content hash for a row."""
+        self._documents[doc_id] = {
+            'content': content,
+            'metadata': metadata,
+        }
+        self._content_hashes[doc_id] = digest
+        self._hash_to_doc.setdefault(digest, doc_id)
+        self._index_metadata(row, metadata)
+        self._mask_cache.clear()
+    
+    def _forget_document(self, doc_id: str, row: int) -> None:
+        """Drop the index entries of a document that is about to be replaced."""
+        self._unindex_metadata(row, self._documents[doc_id]['metadata'])
+        digest = self._content_hashes.pop(doc_id)
+        if self._hash_to_doc.get(digest) == doc_id:
+            del self._hash_to_doc[digest]
+    
+    def _snapshot_record(self, row: int) -> str:
+        """Serialize one row as a documents.jsonl line."""
+        doc_id = self._doc_ids[row]
+        doc_data = self._documents[doc_id]
+        record = {
+            "row": row,
+            "doc_id": doc_id,
+            "content": doc_data['content'],
+            "metadata": doc_data['metadata'],
+            "content_hash": self._content_hashes[doc_id],
+            "norm": float(self._norms[row]),
+            "terms": self.bm25.term_freqs[doc_id],
+        }
+        return json.dumps(record, default=str) + "\n"
+    
+    def _restore_record(self, record: Dict[str, Any]) -> None:
+        """Apply one documents.jsonl record while loading a snapshot."""
+        row = record["row"]
+        doc_id = record["doc_id"]
+        
+        previous = self._doc_ids[row]
+        if previous is not None:
+            self._forget_document(previous, row)
+            del self._documents[previous]
+            del self._row_of[previous]
+            self.bm25.remove_document(previous)
+        
+        self._doc_ids[row] = doc_id
+        self._row_of[doc_id] = row
+        self._norms[row] = record["norm"]
+        self._store_document(
+            row, doc_id, record["content"], record["metadata"], record["content_hash"]
+        )
+        self.bm25.index_term_counts(doc_id, record["terms"])
+    
+    def _index_metadata(self, row: int, metadata: Dict[str, Any]) -> None:
+        """Record row under each hashable metadata value."""
+        for key, value in metadata.items():
+            try:
+                self._metadata_index[key].setdefault(value, set()).add(row)
+            except TypeError:
+                continue
+    
+    def _unindex_metadata(self, row: int, metadata: Dict[str, Any]) -> None:
+        """Drop row from the metadata index entries of its old metadata."""
+        for key, value in metadata.items():
+            try:
+                self._metadata_index[key].get(value, set()).discard(row)
+            except TypeError:
+                continue
+    
+    def _reserve(self, rows: int, dimension: int) -> None:
+        """Ensure the embedding matrix can hold at least rows entries."""
+        if self._matrix is None:
+            capacity = max(rows, 64)
+            self._matrix = np.zeros((capacity, dimension))
+            self._norms = np.zeros(capacity)
+            return
+        
+        self._check_dimension(dimension)
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        
+        while capacity < rows:
+            capacity *= 2
+        matrix = np.zeros((capacity, dimension))
+        matrix[:len(self._doc_ids)] = self._matrix[:len(self._doc_ids)]
+        norms = np.zeros(capacity)
+        norms[:len(self._doc_ids)] = self._norms[:len(self._doc_ids)]
+        self._matrix, self._norms = matrix, norms
+    
+    def _check_dimension(self, dimension: int) -> None:
+        """Reject embeddings whose size differs from the indexed ones."""
+        if self._matrix is not None and dimension != self._matrix.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {dimension} does not match "
+                f"index dimension {self._matrix.shape[1]}"
+            )
     
     def _reciprocal_rank_fusion(
         self,
@@ -332,3 +850,49 @@ class HybridRetriever:
     def document_count(self) -> int:
         """Number of indexed documents."""
         return len(self._documents)
+
+
+@contextlib.contextmanager
+def _snapshot_file(output_file: Path, append: bool):
+    """
+    Open a snapshot data file for writing and fsync it on success.
+    
+    Appends modify the file in place. Full rewrites go to a temp file that
+    replaces the original, so a memory-mapped copy of the old file stays
+    valid while it is being rewritten.
+    """
+    if append:
+        with open(output_file, "r+b") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        return
+    
+    tmp_file = output_file.parent / (output_file.name + ".tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_file.unlink()
+        raise
+
+
+def _write_json_atomic(data: Dict[str, Any], output_file: Path) -> None:
+    """Write JSON atomically via a temp file then rename."""
+    tmp_file = output_file.parent / (output_file.name + ".tmp")
+    
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(tmp_file, output_file)
+    except Exception:
+        with contextlib.suppress(FileNotFoundError):
+            tmp_file.unlink()
+        raise
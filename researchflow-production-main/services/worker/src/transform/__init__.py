@@ -12,12 +12,14 @@ GOVERNANCE NOTICE:
 
 from src.transform.wide_to_long import (
     wide_labs_to_long,
+    iter_wide_labs_to_long,
     detect_wide_lab_blocks,
     PHI_OUTPUT_DENYLIST,
 )
 
 __all__ = [
     "wide_labs_to_long",
+    "iter_wide_labs_to_long",
     "detect_wide_lab_blocks",
     "PHI_OUTPUT_DENYLIST",
 ]
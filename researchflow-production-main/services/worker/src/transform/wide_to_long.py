@@ -19,7 +19,7 @@ Example Long Format:
 
 import re
 import warnings
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 import numpy as np
@@ -231,6 +231,214 @@ def detect_wide_lab_blocks(
 # -----------------------------------------------------------------------------
 
 
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "linkage_key": "research_id",
+    "value_fields": ["value", "result", "level", "concentration", "measurement"],
+    "unit_fields": ["unit", "units", "uom"],
+    "keep_raw_value": True,
+    "drop_all_null_rows": True,
+    "chunk_rows": None,
+}
+
+
+def _long_columns(linkage_key: str) -> List[str]:
+    return [
+        linkage_key,
+        "analyte",
+        "measurement_index",
+        "value",
+        "unit",
+        "source_block",
+    ]
+
+
+def _resolve_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    cfg = dict(_DEFAULT_CONFIG)
+    if config:
+        cfg.update(config)
+    return cfg
+
+
+def _resolve_blocks(
+    df: pd.DataFrame, analyte: str, cfg: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+    """
+    Detect lab blocks and pick each block's value and unit column.
+
+    Returns a list of (block, value_col, unit_col) in block index order.
+    """
+    blocks = detect_wide_lab_blocks(df.columns.tolist(), analyte_prefix=analyte)
+    if not blocks:
+        # Try without prefix filter (maybe columns don't have analyte prefix)
+        blocks = detect_wide_lab_blocks(df.columns.tolist())
+
+    plan = []
+    for block in blocks:
+        block_cols = block["columns"]
+
+        value_col = next(
+            (block_cols[vf] for vf in cfg["value_fields"] if vf in block_cols), None
+        )
+        # If no explicit value field, check if there's a single field
+        if value_col is None and len(block_cols) == 1:
+            value_col = list(block_cols.values())[0]
+
+        unit_col = next(
+            (block_cols[uf] for uf in cfg["unit_fields"] if uf in block_cols), None
+        )
+        plan.append((block, value_col, unit_col))
+    return plan
+
+
+def _coerce_numeric(values: pd.Series) -> np.ndarray:
+    """Coerce a column to float64, with NaN where a value cannot be parsed."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def _chunk_to_long(
+    chunk: pd.DataFrame,
+    plan: List[Tuple[Dict[str, Any], Optional[str], Optional[str]]],
+    analyte: str,
+    cfg: Dict[str, Any],
+) -> pd.DataFrame:
+    """Stack the blocks of one row chunk into long format."""
+    linkage_key = cfg["linkage_key"]
+    n_rows = len(chunk)
+    drop_nulls = cfg["drop_all_null_rows"]
+    keep_raw = cfg["keep_raw_value"]
+
+    row_parts: List[np.ndarray] = []
+    block_parts: List[np.ndarray] = []
+    value_parts: List[np.ndarray] = []
+    unit_parts: List[np.ndarray] = []
+    raw_parts: List[np.ndarray] = []
+    any_raw = False
+
+    for block_pos, (_, value_col, unit_col) in enumerate(plan):
+        if value_col is not None:
+            raw = chunk[value_col]
+            numeric = _coerce_numeric(raw)
+            failed = (np.isnan(numeric) & raw.notna().to_numpy()) if keep_raw else None
+        else:
+            numeric = np.full(n_rows, np.nan)
+            failed = None
+
+        if drop_nulls:
+            keep = ~np.isnan(numeric)
+            if failed is not None:
+                keep |= failed
+            rows = np.flatnonzero(keep)
+        else:
+            rows = np.arange(n_rows)
+
+        raw_values = np.full(len(rows), np.nan, dtype=object)
+        if failed is not None and failed.any():
+            # Keep raw value if coercion failed
+            failed_rows = failed[rows]
+            raw_values[failed_rows] = (
+                raw.iloc[rows[failed_rows]].astype(str).to_numpy(dtype=object)
+            )
+            any_raw = True
+
+        units = np.full(len(rows), None, dtype=object)
+        if unit_col is not None:
+            unit_values = chunk[unit_col].to_numpy(dtype=object)[rows]
+            present = pd.notna(unit_values)
+            units[present] = unit_values[present]
+
+        row_parts.append(rows)
+        block_parts.append(np.full(len(rows), block_pos))
+        value_parts.append(numeric[rows])
+        unit_parts.append(units)
+        raw_parts.append(raw_values)
+
+    rows = np.concatenate(row_parts)
+    # Blocks were appended in order, so a stable sort on row gives patient-major order
+    order = np.argsort(rows, kind="stable")
+    rows = rows[order]
+    block_pos = np.concatenate(block_parts)[order]
+
+    block_index = np.array([block["index"] for block, _, _ in plan], dtype=np.int64)
+    block_id = np.array([block["block_id"] for block, _, _ in plan], dtype=object)
+
+    result = pd.DataFrame(
+        {
+            linkage_key: chunk[linkage_key].take(rows).infer_objects().to_numpy(),
+            "analyte": analyte,
+            "measurement_index": block_index[block_pos],
+            "value": np.concatenate(value_parts)[order],
+            "unit": np.concatenate(unit_parts)[order],
+            "source_block": block_id[block_pos],
+        }
+    )
+    if any_raw:
+        result["raw_value"] = np.concatenate(raw_parts)[order]
+    return result
+
+
+def _plan_transform(
+    df: pd.DataFrame, analyte: str, cfg: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+    """Validate the linkage key and resolve blocks, warning if there are none."""
+    linkage_key = cfg["linkage_key"]
+
+    # Validate linkage key exists
+    if linkage_key not in df.columns:
+        raise ValueError(
+            f"Required linkage key '{linkage_key}' not found in DataFrame. "
+            f"Available columns: {df.columns.tolist()}"
+        )
+
+    plan = _resolve_blocks(df, analyte, cfg)
+    if not plan:
+        warnings.warn(
+            f"No wide-format lab blocks detected for analyte '{analyte}'. "
+            f"Returning empty long-format DataFrame."
+        )
+    return plan
+
+
+def _iter_long_chunks(
+    df: pd.DataFrame,
+    plan: List[Tuple[Dict[str, Any], Optional[str], Optional[str]]],
+    analyte: str,
+    cfg: Dict[str, Any],
+) -> Iterator[pd.DataFrame]:
+    if not plan:
+        return
+    chunk_rows = cfg["chunk_rows"] or max(len(df), 1)
+    for start in range(0, len(df), chunk_rows):
+        yield _chunk_to_long(df.iloc[start : start + chunk_rows], plan, analyte, cfg)
+
+
+def iter_wide_labs_to_long(
+    df: pd.DataFrame,
+    analyte: str,
+    config: Optional[Dict[str, Any]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Transform wide-format lab data to long format one row chunk at a time.
+
+    Takes the same arguments as wide_labs_to_long and yields its output in
+    pieces of config["chunk_rows"] input rows (all rows if unset), so very
+    wide sheets never materialize every (row, block) cell at once. Each
+    chunk is checked against the PHI denylist before it is yielded.
+
+    Raises
+    ------
+    ValueError
+        If research_id column is missing
+        If output contains PHI columns (safety check)
+    """
+    cfg = _resolve_config(config)
+    plan = _plan_transform(df, analyte, cfg)
+    for chunk in _iter_long_chunks(df, plan, analyte, cfg):
+        _check_output_for_phi(chunk)
+        yield chunk
+
+
 def wide_labs_to_long(
     df: pd.DataFrame,
     analyte: str,
@@ -242,6 +450,9 @@ def wide_labs_to_long(
     Converts columns like tg_lab1_value, tg_lab1_unit, tg_lab2_value, ...
     into rows with: research_id, analyte, measurement_index, value, unit, source_block
 
+    Each block's value and unit columns are stacked column-wise and values
+    are coerced to numeric in bulk; rows are ordered by patient, then block.
+
     PHI SAFETY:
     - Dates are converted to measurement indices (relative ordering)
     - Raw dates are NOT included in output
@@ -263,6 +474,8 @@ def wide_labs_to_long(
           (default ["unit", "units"])
         - keep_raw_value: bool (default True) - keep original value if coercion fails
         - drop_all_null_rows: bool (default True) - drop rows where value is null
+        - chunk_rows: int (default None) - transform this many input rows at a
+          time (see iter_wide_labs_to_long)
 
     Returns
     -------
@@ -295,135 +508,25 @@ def wide_labs_to_long(
     >>> long_df.columns.tolist()
     ['research_id', 'analyte', 'measurement_index', 'value', 'unit', 'source_block']
     """
-    # Default configuration
-    cfg = {
-        "linkage_key": "research_id",
-        "value_fields": ["value", "result", "level", "concentration", "measurement"],
-        "unit_fields": ["unit", "units", "uom"],
-        "keep_raw_value": True,
-        "drop_all_null_rows": True,
-    }
-    if config:
-        cfg.update(config)
-
-    linkage_key = cfg["linkage_key"]
-
-    # Validate linkage key exists
-    if linkage_key not in df.columns:
-        raise ValueError(
-            f"Required linkage key '{linkage_key}' not found in DataFrame. "
-            f"Available columns: {df.columns.tolist()}"
-        )
+    cfg = _resolve_config(config)
+    required_cols = _long_columns(cfg["linkage_key"])
 
-    # Detect lab blocks for this analyte
-    blocks = detect_wide_lab_blocks(df.columns.tolist(), analyte_prefix=analyte)
+    plan = _plan_transform(df, analyte, cfg)
+    if not plan:
+        return pd.DataFrame(columns=required_cols)
 
-    if not blocks:
-        # Try without prefix filter (maybe columns don't have analyte prefix)
-        blocks = detect_wide_lab_blocks(df.columns.tolist())
-        if not blocks:
-            warnings.warn(
-                f"No wide-format lab blocks detected for analyte '{analyte}'. "
-                f"Returning empty long-format DataFrame."
-            )
-            return pd.DataFrame(
-                columns=[
-                    linkage_key,
-                    "analyte",
-                    "measurement_index",
-                    "value",
-                    "unit",
-                    "source_block",
-                ]
-            )
-
-    # Build long-format rows
-    long_rows: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        patient_id = row[linkage_key]
-
-        for block in blocks:
-            block_cols = block["columns"]
-            measurement_idx = block["index"]
-            source_block = block["block_id"]
-
-            # Find value column
-            value_col = None
-            raw_value = None
-            numeric_value = None
-
-            for vf in cfg["value_fields"]:
-                if vf in block_cols:
-                    value_col = block_cols[vf]
-                    break
-
-            # If no explicit value field, check if there's a single field
-            if value_col is None and len(block_cols) == 1:
-                value_col = list(block_cols.values())[0]
-
-            if value_col:
-                raw_value = row.get(value_col)
-                # Try numeric coercion
-                try:
-                    if pd.notna(raw_value):
-                        numeric_value = float(raw_value)
-                    else:
-                        numeric_value = np.nan
-                except (ValueError, TypeError):
-                    numeric_value = np.nan
-
-            # Find unit column
-            unit_val = None
-            for uf in cfg["unit_fields"]:
-                if uf in block_cols:
-                    unit_col = block_cols[uf]
-                    unit_val = row.get(unit_col)
-                    break
-
-            # Build row
-            long_row = {
-                linkage_key: patient_id,
-                "analyte": analyte,
-                "measurement_index": measurement_idx,
-                "value": numeric_value,
-                "unit": unit_val if pd.notna(unit_val) else None,
-                "source_block": source_block,
-            }
-
-            # Keep raw value if coercion failed
-            if cfg["keep_raw_value"] and pd.isna(numeric_value) and pd.notna(raw_value):
-                long_row["raw_value"] = str(raw_value)
-
-            long_rows.append(long_row)
-
-    # Create DataFrame
-    result = pd.DataFrame(long_rows)
-
-    # Drop rows where value is null (if configured)
-    if cfg["drop_all_null_rows"] and "value" in result.columns:
-        # Keep rows that have either numeric value or raw_value
-        if "raw_value" in result.columns:
-            mask = result["value"].notna() | result["raw_value"].notna()
-        else:
-            mask = result["value"].notna()
-        result = result[mask].reset_index(drop=True)
-
-    # Ensure required columns exist
-    required_cols = [
-        linkage_key,
-        "analyte",
-        "measurement_index",
-        "value",
-        "unit",
-        "source_block",
+    chunks = [
+        chunk
+        for chunk in _iter_long_chunks(df, plan, analyte, cfg)
+        if len(chunk) > 0
     ]
-    for col in required_cols:
-        if col not in result.columns:
-            result[col] = None
+    if not chunks:
+        chunks = [pd.DataFrame(columns=required_cols)]
+
+    result = pd.concat(chunks, ignore_index=True)
 
     # Reorder columns
-    col_order = [c for c in required_cols if c in result.columns]
+    col_order = list(required_cols)
     if "raw_value" in result.columns:
         col_order.append("raw_value")
     result = result[col_order]
@@ -47,12 +47,16 @@ Usage:
 import re
 import logging
 import hashlib
+import warnings
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Tuple, Optional, Any, Union
 from enum import Enum
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from .phi_patterns import combine_patterns
+
 logger = logging.getLogger(__name__)
 
 
@@ -148,6 +152,9 @@ class PHIDetector:
         if custom_patterns:
             self.patterns.extend(custom_patterns)
 
+        self._combined_key: Optional[Tuple[int, ...]] = None
+        self._combined_pattern: Optional[re.Pattern] = None
+
         logger.info(f"PHI Detector initialized with {len(self.patterns)} patterns")
 
     def _load_default_patterns(self) -> List[PHIPattern]:
@@ -276,12 +283,33 @@ class PHIDetector:
 
         return detections
 
+    @property
+    def combined_pattern(self) -> Optional[re.Pattern]:
+        """Single alternation of all patterns, rebuilt if patterns change."""
+        key = tuple(id(p.pattern) for p in self.patterns)
+        if key != self._combined_key:
+            self._combined_pattern = combine_patterns(p.pattern for p in self.patterns)
+            self._combined_key = key
+        return self._combined_pattern
+
+    @property
+    def severity_map(self) -> Dict[PHIType, str]:
+        """Severity per PHI type (first pattern of each type wins)."""
+        severities: Dict[PHIType, str] = {}
+        for p in self.patterns:
+            severities.setdefault(p.phi_type, p.severity)
+        return severities
+
     def scan_series(
         self, series: pd.Series, column_name: str
     ) -> Dict[int, List[Tuple[PHIType, str]]]:
         """
         Scan a pandas Series for PHI.
 
+        The column is scanned at once: identical values are scanned only
+        once, and the combined pattern rules out clean values in a single
+        vectorized pass before the individual patterns run.
+
         Args:
             series: Pandas Series to scan
             column_name: Name of the column (for logging)
@@ -291,10 +319,19 @@ class PHIDetector:
         """
         flagged_rows = {}
 
-        for idx, value in series.items():
-            detections = self.scan_value(value)
+        positions, codes, texts = candidate_phi_cells(series, self.combined_pattern)
+        detections_by_code: Dict[int, List[Tuple[PHIType, str]]] = {}
+        for code in np.unique(codes).tolist():
+            detections = self.scan_value(texts[code])
             if detections:
-                flagged_rows[idx] = detections
+                detections_by_code[code] = detections
+
+        if detections_by_code:
+            labels = series.index
+            for pos, code in zip(positions.tolist(), codes.tolist()):
+                detections = detections_by_code.get(code)
+                if detections:
+                    flagged_rows[labels[pos]] = list(detections)
 
         if flagged_rows:
             logger.warning(
@@ -304,6 +341,52 @@ class PHIDetector:
         return flagged_rows
 
 
+def candidate_phi_cells(
+    series: pd.Series, prefilter: Optional[re.Pattern]
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Find the non-null cells of a column whose text may contain PHI.
+
+    Values are converted with ``str()`` exactly as per-cell scanning would,
+    factorized so each distinct text is tested once, and tested against the
+    combined ``prefilter`` pattern with a vectorized ``.str.contains``.
+
+    Args:
+        series: Column to scan
+        prefilter: Combined pattern (see combine_patterns); None keeps all cells
+
+    Returns:
+        (positions, codes, texts) where positions are ascending positional row
+        indices of candidate cells and ``texts[codes[i]]`` is the text of the
+        cell at ``positions[i]``.
+    """
+    empty = np.array([], dtype=np.intp)
+    present = series.notna().to_numpy(dtype=bool)
+    if not present.any():
+        return empty, empty, []
+
+    positions = np.flatnonzero(present)
+    values = series[present]
+    if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+        codes, uniques = pd.factorize(values.astype(str))
+        texts = list(uniques)
+    else:
+        # Factorize on the typed values so str() matches per-cell conversion
+        # (e.g. Timestamps keep their time component)
+        codes, uniques = pd.factorize(values)
+        texts = [str(v) for v in uniques]
+
+    if prefilter is not None:
+        with warnings.catch_warnings():
+            # Capture groups in the combined pattern are irrelevant for contains()
+            warnings.filterwarnings("ignore", "This pattern is interpreted", UserWarning)
+            hits = pd.Series(texts, dtype=object).str.contains(prefilter).to_numpy(dtype=bool)
+        mask = hits[codes]
+        positions, codes = positions[mask], codes[mask]
+
+    return positions, codes, texts
+
+
 def scan_dataframe(
     df: pd.DataFrame,
     detector: Optional[PHIDetector] = None,
@@ -337,6 +420,7 @@ def scan_dataframe(
     flagged_row_indices = set()
     detection_details = {}
     severity_counts = {"high": 0, "medium": 0, "low": 0}
+    severity_map = detector.severity_map
 
     for col in cols:
         col_flagged_rows = detector.scan_series(df[col], col)
@@ -351,10 +435,7 @@ def scan_dataframe(
 
                 # Count severity
                 for phi_type, _ in detections:
-                    pattern = next(
-                        p for p in detector.patterns if p.phi_type == phi_type
-                    )
-                    severity_counts[pattern.severity] += 1
+                    severity_counts[severity_map[phi_type]] += 1
 
     result = PHIScanResult(
         phi_detected=len(flagged_columns) > 0,
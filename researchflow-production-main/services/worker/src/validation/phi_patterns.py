@@ -38,6 +38,9 @@ Used by (non-exhaustive)
 Last Updated: 2026-01-20
 """
 
+import re
+from typing import Iterable, Optional
+
 # Re-export from generated file - single source of truth
 from .phi_patterns_generated import (
     PHI_PATTERNS,
@@ -51,4 +54,32 @@ __all__ = [
     "PHI_PATTERNS_HIGH_CONFIDENCE",
     "PHI_PATTERNS_EXTENDED",
     "PHI_PATTERNS_OUTPUT_GUARD",
+    "combine_patterns",
 ]
+
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def combine_patterns(patterns: Iterable[re.Pattern]) -> Optional[re.Pattern]:
+    """Combine compiled patterns into a single alternation.
+
+    The result matches a string if and only if at least one of the input
+    patterns matches it, so it can be used as a one-pass prefilter before
+    running the individual patterns. Per-pattern flags are preserved with
+    scoped inline flags (``(?i:...)``).
+
+    Returns None if the patterns cannot be combined (e.g. duplicate named
+    groups); callers should then fall back to the individual patterns.
+    """
+    parts = []
+    for pattern in patterns:
+        flags = "".join(char for flag, char in _SCOPED_FLAGS if pattern.flags & flag)
+        parts.append(f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})")
+
+    if not parts:
+        return None
+
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
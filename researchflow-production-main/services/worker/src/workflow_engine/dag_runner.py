@@ -4,6 +4,10 @@ DAG Runner
 Executes a compiled workflow by running stages in topological order.
 Handles conditions, gates, and checkpointing.
 
+With enable_parallel=True, independent nodes are scheduled concurrently:
+every node whose dependencies have finished is started as soon as a
+concurrency slot is free, and merge nodes act as barriers for their branches.
+
 Usage:
     from workflow_engine.dag_runner import DAGRunner
     from workflow_engine.dag_compiler import compile_workflow
@@ -37,6 +41,7 @@ class RunState:
     workflow_id: str
     workflow_version: int
     current_node_id: Optional[str] = None
+    running_nodes: List[str] = field(default_factory=list)
     completed_nodes: List[str] = field(default_factory=list)
     skipped_nodes: List[str] = field(default_factory=list)
     node_outputs: Dict[str, StageResult] = field(default_factory=dict)
@@ -52,6 +57,7 @@ class RunState:
             "workflow_id": self.workflow_id,
             "workflow_version": self.workflow_version,
             "current_node_id": self.current_node_id,
+            "running_nodes": self.running_nodes,
             "completed_nodes": self.completed_nodes,
             "skipped_nodes": self.skipped_nodes,
             "node_outputs": {
@@ -76,6 +82,7 @@ class DAGRunner:
 
     Features:
     - Sequential execution (v1)
+    - Concurrent ready-node scheduling with a concurrency limit (v2, feature-flagged)
     - Condition evaluation (on_success, on_failure)
     - Gate handling (auto-pass in DEMO, approval required in LIVE)
     - Checkpointing for resume
@@ -96,6 +103,7 @@ class DAGRunner:
         governance_mode: str = "DEMO",
         enable_parallel: bool = False,
         checkpoint_callback: Optional[callable] = None,
+        max_concurrency: int = 4,
     ):
         """
         Initialize the runner.
@@ -104,10 +112,16 @@ class DAGRunner:
             governance_mode: DEMO, LIVE, or STANDBY
             enable_parallel: Enable parallel execution (feature-flagged, v2)
             checkpoint_callback: Optional callback for checkpoint persistence
+            max_concurrency: Maximum number of nodes executing at once when
+                enable_parallel is set
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
         self.governance_mode = governance_mode
         self.enable_parallel = enable_parallel
         self.checkpoint_callback = checkpoint_callback
+        self.max_concurrency = max_concurrency
 
     async def run(
         self,
@@ -143,52 +157,10 @@ class DAGRunner:
             logger.info(f"Starting new run {state.run_id}")
 
         try:
-            for step in compiled.steps:
-                # Skip already completed nodes (resume case)
-                if step.node_id in state.completed_nodes:
-                    logger.debug(f"Skipping completed node {step.node_id}")
-                    continue
-                
-                # Skip already skipped nodes
-                if step.node_id in state.skipped_nodes:
-                    logger.debug(f"Skipping previously skipped node {step.node_id}")
-                    continue
-
-                state.current_node_id = step.node_id
-
-                # Check dependencies are satisfied
-                if not self._dependencies_satisfied(step, state):
-                    logger.warning(
-                        f"Dependencies not satisfied for {step.node_id}, skipping"
-                    )
-                    state.skipped_nodes.append(step.node_id)
-                    continue
-
-                # Evaluate condition
-                if not self._evaluate_condition(step, state):
-                    logger.info(f"Condition not met for {step.node_id}, skipping")
-                    state.skipped_nodes.append(step.node_id)
-                    continue
-
-                # Execute the step
-                logger.info(f"Executing step {step.node_id} ({step.node_type})")
-                result = await self._execute_step(step, context, state)
-
-                # Store result
-                state.node_outputs[step.node_id] = result
-                state.completed_nodes.append(step.node_id)
-
-                # Checkpoint if callback provided
-                if self.checkpoint_callback:
-                    try:
-                        await self.checkpoint_callback(state)
-                    except Exception as e:
-                        logger.warning(f"Checkpoint callback failed: {e}")
-
-                # Check for failure - continue but track it
-                if result.status == "failed":
-                    logger.error(f"Step {step.node_id} failed: {result.errors}")
-                    # Don't abort - let condition edges handle failure paths
+            if self.enable_parallel and self.max_concurrency > 1:
+                await self._run_parallel(compiled, context, state)
+            else:
+                await self._run_sequential(compiled, context, state)
 
             state.status = "completed"
             state.current_node_id = None
@@ -208,6 +180,158 @@ class DAGRunner:
 
         return state
 
+    async def _run_sequential(
+        self,
+        compiled: CompiledWorkflow,
+        context: StageContext,
+        state: RunState,
+    ) -> None:
+        """Execute steps one at a time in topological order."""
+        for step in compiled.steps:
+            # Skip already completed nodes (resume case)
+            if step.node_id in state.completed_nodes:
+                logger.debug(f"Skipping completed node {step.node_id}")
+                continue
+
+            # Skip already skipped nodes
+            if step.node_id in state.skipped_nodes:
+                logger.debug(f"Skipping previously skipped node {step.node_id}")
+                continue
+
+            state.current_node_id = step.node_id
+
+            # Check dependencies are satisfied
+            if not self._dependencies_satisfied(step, state):
+                logger.warning(
+                    f"Dependencies not satisfied for {step.node_id}, skipping"
+                )
+                state.skipped_nodes.append(step.node_id)
+                continue
+
+            # Evaluate condition
+            if not self._evaluate_condition(step, state):
+                logger.info(f"Condition not met for {step.node_id}, skipping")
+                state.skipped_nodes.append(step.node_id)
+                continue
+
+            # Execute the step
+            logger.info(f"Executing step {step.node_id} ({step.node_type})")
+            result = await self._execute_step(step, context, state)
+            await self._record_result(step, result, state)
+
+    async def _run_parallel(
+        self,
+        compiled: CompiledWorkflow,
+        context: StageContext,
+        state: RunState,
+    ) -> None:
+        """
+        Execute steps concurrently as their dependencies finish.
+
+        A node becomes ready once every predecessor is completed or skipped,
+        so merge nodes naturally wait for all of their incoming branches.
+        Ready nodes are started in topological order (deterministic) while
+        fewer than max_concurrency nodes are in flight. State mutation and
+        checkpointing only happen in this coroutine, never inside the tasks.
+        """
+        pending: List[CompiledStep] = [
+            step for step in compiled.steps
+            if step.node_id not in state.completed_nodes
+            and step.node_id not in state.skipped_nodes
+        ]
+        order = {step.node_id: i for i, step in enumerate(compiled.steps)}
+        # Nodes that were in flight when a checkpoint was taken are re-run
+        state.running_nodes = []
+        running: Dict[asyncio.Task, CompiledStep] = {}
+
+        try:
+            while pending or running:
+                # Resolve skips first; a skip can unblock further nodes
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for step in list(pending):
+                        if not self._dependencies_satisfied(step, state):
+                            continue
+                        if not self._evaluate_condition(step, state):
+                            logger.info(
+                                f"Condition not met for {step.node_id}, skipping"
+                            )
+                            pending.remove(step)
+                            state.skipped_nodes.append(step.node_id)
+                            progressed = True
+
+                # Start ready nodes up to the concurrency limit
+                for step in list(pending):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    if not self._dependencies_satisfied(step, state):
+                        continue
+
+                    pending.remove(step)
+                    state.current_node_id = step.node_id
+                    state.running_nodes.append(step.node_id)
+                    logger.info(
+                        f"Executing step {step.node_id} ({step.node_type})"
+                        + (
+                            f" in parallel group {step.parallel_group}"
+                            if step.parallel_group else ""
+                        )
+                    )
+                    task = asyncio.create_task(
+                        self._execute_step(step, context, state)
+                    )
+                    running[task] = step
+
+                if not running:
+                    # Nothing in flight and nothing can start: the remaining
+                    # nodes depend on something that will never finish.
+                    for step in pending:
+                        logger.warning(
+                            f"Dependencies not satisfied for {step.node_id}, skipping"
+                        )
+                        state.skipped_nodes.append(step.node_id)
+                    pending = []
+                    break
+
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                # Record in topological order for deterministic state
+                for task in sorted(done, key=lambda t: order[running[t].node_id]):
+                    step = running.pop(task)
+                    state.running_nodes.remove(step.node_id)
+                    await self._record_result(step, task.result(), state)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+            state.running_nodes = []
+
+    async def _record_result(
+        self,
+        step: CompiledStep,
+        result: StageResult,
+        state: RunState,
+    ) -> None:
+        """Store a step result and persist a checkpoint."""
+        state.node_outputs[step.node_id] = result
+        state.completed_nodes.append(step.node_id)
+
+        # Checkpoint if callback provided
+        if self.checkpoint_callback:
+            try:
+                await self.checkpoint_callback(state)
+            except Exception as e:
+                logger.warning(f"Checkpoint callback failed: {e}")
+
+        # Check for failure - continue but track it
+        if result.status == "failed":
+            logger.error(f"Step {step.node_id} failed: {result.errors}")
+            # Don't abort - let condition edges handle failure paths
+
     def _dependencies_satisfied(self, step: CompiledStep, state: RunState) -> bool:
         """Check if all dependencies have been executed (completed or skipped)."""
         for dep_id in step.depends_on:
@@ -478,6 +602,8 @@ async def run_workflow(
     compiled: CompiledWorkflow,
     context: StageContext,
     governance_mode: str = "DEMO",
+    enable_parallel: bool = False,
+    max_concurrency: int = 4,
 ) -> RunState:
     """
     Convenience function to run a compiled workflow.
@@ -486,9 +612,15 @@ async def run_workflow(
         compiled: The compiled workflow
         context: Execution context
         governance_mode: DEMO, LIVE, or STANDBY
+        enable_parallel: Run independent nodes concurrently
+        max_concurrency: Concurrency limit when enable_parallel is set
         
     Returns:
         RunState with execution results
     """
-    runner = DAGRunner(governance_mode=governance_mode)
+    runner = DAGRunner(
+        governance_mode=governance_mode,
+        enable_parallel=enable_parallel,
+        max_concurrency=max_concurrency,
+    )
     return await runner.run(compiled, context)
@@ -6,11 +6,14 @@ Uses runner.run_stages and the stage registry; no duplication of execution logic
 Phase 3: structured logging, metrics, and error recovery.
 """
 
+import os
 import time
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from .types import StageContext
 from .runner import run_stages
+from .stage_cache import STAGE_CACHE_DIRNAME, StageCache
 from .stages import STAGE_REGISTRY
 
 from src.utils.logging import get_logger
@@ -35,6 +38,10 @@ async def run_pipeline(
     stage_ids: Optional[List[int]] = None,
     stop_on_failure: bool = True,
     governance_mode: str = "DEMO",
+    spill_outputs: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    use_stage_cache: bool = False,
+    stage_cache: Optional[StageCache] = None,
     **context_kwargs: Any,
 ) -> Dict[str, Any]:
     """Run the workflow pipeline for the given job.
@@ -49,6 +56,13 @@ async def run_pipeline(
         stage_ids: Stage IDs to run (1-20). If None, uses get_default_stage_ids().
         stop_on_failure: If True, stop on first failed stage.
         governance_mode: DEMO, STAGING, or PRODUCTION.
+        spill_outputs: Keep stage outputs on disk under artifact_path instead of
+            in memory (see runner.run_stages).
+        on_result: Optional callback receiving each stage result as it completes.
+        use_stage_cache: Restore unchanged stages from the content-addressed stage
+            cache instead of re-running them. The cache lives in STAGE_CACHE_DIR,
+            or <artifact_path>/stage_cache when unset.
+        stage_cache: Explicit StageCache to use (implies use_stage_cache).
         **context_kwargs: Additional arguments for StageContext (e.g. dataset_pointer,
             previous_results, metadata).
 
@@ -58,6 +72,11 @@ async def run_pipeline(
     if stage_ids is None:
         stage_ids = get_default_stage_ids()
 
+    if stage_cache is None and use_stage_cache:
+        stage_cache = StageCache(
+            os.getenv("STAGE_CACHE_DIR") or Path(artifact_path) / STAGE_CACHE_DIRNAME
+        )
+
     context = StageContext(
         job_id=job_id,
         config=config,
@@ -78,6 +97,9 @@ async def run_pipeline(
         stage_ids=stage_ids,
         context=context,
         stop_on_failure=stop_on_failure,
+        spill_outputs=spill_outputs,
+        on_result=on_result,
+        stage_cache=stage_cache,
     )
 
     elapsed = time.perf_counter() - start
@@ -88,6 +110,7 @@ async def run_pipeline(
         stages_failed=result.get("stages_failed", []),
         success=result.get("success", False),
         duration_seconds=round(elapsed, 3),
+        stage_cache=stage_cache.stats if stage_cache is not None else None,
     )
 
     # Push failed stages to DLQ (metrics are recorded per-stage in runner)
@@ -0,0 +1,120 @@
+"""
+Spilled Stage Results
+
+This module provides a read-only mapping of stage results whose outputs
+live on disk instead of in memory. run_stages uses it when spill_outputs
+is enabled: each completed stage output is written to the job's artifact
+directory and later stages see lazy StageResult objects that load the
+output only when it is accessed.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from .types import StageResult
+
+StageKey = Union[int, str]
+
+SPILL_DIRNAME = "stage_outputs"
+
+
+class LazyStageResult(StageResult):
+    """StageResult whose output is read from a spill file on access.
+
+    All other fields are held in memory. Assigning to output replaces the
+    spilled value for this object only.
+    """
+
+    def __init__(self, summary: StageResult, store: "SpilledStageResults"):
+        # StageResult.__init__ assigns the default output through the setter
+        super().__init__(
+            **{
+                f.name: getattr(summary, f.name)
+                for f in fields(StageResult)
+                if f.name != "output"
+            }
+        )
+        self._store = store
+        self._output_override: Optional[Dict[str, Any]] = None
+
+    @property
+    def output(self) -> Dict[str, Any]:
+        if self._output_override is not None:
+            return self._output_override
+        return self._store.load_output(self.stage_id)
+
+    @output.setter
+    def output(self, value: Dict[str, Any]) -> None:
+        self._output_override = value
+
+
+class SpilledStageResults(Mapping):
+    """Mapping of stage_id -> LazyStageResult backed by JSON spill files.
+
+    Args:
+        root: Directory for spill files (created on first spill)
+        max_loaded: Number of decoded outputs kept in memory
+    """
+
+    def __init__(self, root: Union[str, Path], max_loaded: int = 2):
+        self.root = Path(root)
+        self.max_loaded = max_loaded
+        self._results: Dict[StageKey, LazyStageResult] = {}
+        self._loaded: "OrderedDict[StageKey, Dict[str, Any]]" = OrderedDict()
+
+    def __getitem__(self, stage_id: StageKey) -> LazyStageResult:
+        return self._results[stage_id]
+
+    def __iter__(self) -> Iterator[StageKey]:
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def output_path(self, stage_id: StageKey) -> Path:
+        """Path of the spill file for a stage."""
+        return self.root / f"stage_{stage_id}.json"
+
+    def spill(self, result: StageResult) -> LazyStageResult:
+        """Write result.output to disk and keep only a lazy handle.
+
+        Outputs are JSON encoded; values JSON cannot represent are stored
+        as their str().
+
+        Args:
+            result: Completed stage result
+
+        Returns:
+            The LazyStageResult now stored for result.stage_id
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.output_path(result.stage_id)
+        tmp_path = path.parent / (path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result.output, f, default=str)
+        os.replace(tmp_path, path)
+
+        self._loaded.pop(result.stage_id, None)
+        lazy = LazyStageResult(result, self)
+        self._results[result.stage_id] = lazy
+        return lazy
+
+    def load_output(self, stage_id: StageKey) -> Dict[str, Any]:
+        """Return a stage's output, reading the spill file if not cached."""
+        if stage_id in self._loaded:
+            self._loaded.move_to_end(stage_id)
+            return self._loaded[stage_id]
+
+        with open(self.output_path(stage_id), "r", encoding="utf-8") as f:
+            output = json.load(f)
+
+        if self.max_loaded > 0:
+            self._loaded[stage_id] = output
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return output
@@ -6,11 +6,15 @@ of registered stages with proper error handling and PHI-safe sanitization.
 Phase 3: per-stage structlog and Prometheus metrics.
 """
 
+import inspect
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from .types import StageContext, StageResult
 from .registry import get_stage
+from .result_store import SPILL_DIRNAME, SpilledStageResults
+from .stage_cache import StageCache, result_hash
 
 from src.utils.logging import get_logger, log_stage_start, log_stage_end
 from src.utils.metrics import record_stage
@@ -92,16 +96,33 @@ async def run_stages(
     stage_ids: List[int],
     context: StageContext,
     stop_on_failure: bool = True,
+    spill_outputs: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    stage_cache: Optional[StageCache] = None,
 ) -> Dict[str, Any]:
     """Execute a sequence of workflow stages.
 
     This function runs the specified stages in order, tracking results
     and handling errors with PHI-safe sanitization.
 
+    With spill_outputs, each stage output is written under
+    <artifact_path>/stage_outputs/<job_id>/ as soon as the stage finishes
+    and later stages see lazy results in context.previous_results that
+    read the output from disk when accessed. The returned results then
+    carry an output_ref path instead of the output itself.
+
+    With a stage_cache, each stage is first looked up by a key over its
+    version, config, dataset and upstream results; hits restore the cached
+    result and artifacts instead of executing the stage.
+
     Args:
         stage_ids: List of stage IDs to execute (1-19)
         context: StageContext with job configuration
         stop_on_failure: If True, stop execution on first failure
+        spill_outputs: If True, keep stage outputs on disk instead of in memory
+        on_result: Optional callback (sync or async) called with each
+            serialized stage result as soon as the stage finishes
+        stage_cache: Optional StageCache used to skip unchanged stages
 
     Returns:
         Dict containing:
@@ -111,10 +132,20 @@ async def run_stages(
         - results: Dict mapping stage_id to StageResult
         - success: Boolean indicating all stages completed
     """
-    results: Dict[int, StageResult] = {}
+    results: Dict[int, StageResult]
+    if spill_outputs:
+        results = SpilledStageResults(
+            Path(context.artifact_path) / SPILL_DIRNAME / context.job_id
+        )
+        # Read-only view; later spills show up without copying
+        context.previous_results = results
+    else:
+        results = {}
     stages_completed: List[int] = []
     stages_failed: List[int] = []
     stages_skipped: List[int] = []
+    # Upstream inputs for stage cache keys
+    result_hashes: Dict[int, str] = {}
 
     logger.info(
         "run_stages_start",
@@ -148,13 +179,30 @@ async def run_stages(
 
         try:
             # Update context with previous results
-            context.previous_results = dict(results)
-
-            # Execute the stage
-            result = await stage.execute(context)
+            if not spill_outputs:
+                context.previous_results = dict(results)
+
+            cache_key = None
+            cached = None
+            if stage_cache is not None and stage_cache.is_cacheable(stage):
+                cache_key = stage_cache.compute_key(
+                    stage, stage_id, context, result_hashes
+                )
+                cached = stage_cache.load(cache_key, context)
 
-            # Store result
-            results[stage_id] = result
+            if cached is not None:
+                result, result_hashes[stage_id] = cached
+                logger.info("stage_cache_hit", stage_id=stage_id, key=cache_key)
+            else:
+                # Execute the stage
+                result = await stage.execute(context)
+                if cache_key is not None:
+                    result_hashes[stage_id] = stage_cache.store(
+                        cache_key, result, context
+                    )
+                elif stage_cache is not None:
+                    # Non-cacheable stages still feed downstream cache keys
+                    result_hashes[stage_id] = result_hash(result)
 
             record_stage(
                 stage_id,
@@ -199,7 +247,8 @@ async def run_stages(
                 error=e,
                 started_at=started_at,
             )
-            results[stage_id] = result
+            if stage_cache is not None:
+                result_hashes[stage_id] = result_hash(result)
             stages_failed.append(stage_id)
             record_stage(stage_id, "failed", result.duration_ms / 1000.0)
             log_stage_end(
@@ -212,6 +261,14 @@ async def run_stages(
                 project_id=context.metadata.get("project_id") if context.metadata else None,
             )
 
+        await _emit_result(on_result, result, context.job_id)
+
+        # Store result
+        if spill_outputs:
+            results.spill(result)
+        else:
+            results[stage_id] = result
+
     success = len(stages_failed) == 0 and len(stages_completed) == len(stage_ids)
 
     logger.info(
@@ -227,11 +284,55 @@ async def run_stages(
         "stages_completed": stages_completed,
         "stages_failed": stages_failed,
         "stages_skipped": stages_skipped,
-        "results": {k: _result_to_dict(v) for k, v in results.items()},
+        "results": (
+            {k: _spilled_result_to_dict(results, v) for k, v in results.items()}
+            if spill_outputs
+            else {k: _result_to_dict(v) for k, v in results.items()}
+        ),
         "success": success,
     }
 
 
+async def _emit_result(
+    on_result: Optional[Callable[[Dict[str, Any]], Any]],
+    result: StageResult,
+    job_id: str,
+) -> None:
+    """Hand a finished stage result to the caller's callback.
+
+    Callback errors are logged and never fail the run.
+    """
+    if on_result is None:
+        return
+    try:
+        emitted = on_result(_result_to_dict(result))
+        if inspect.isawaitable(emitted):
+            await emitted
+    except Exception as e:
+        logger.warning(
+            "stage_result_callback_failed",
+            job_id=job_id,
+            stage_id=result.stage_id,
+            error=sanitize_phi(str(e)),
+        )
+
+
+def _spilled_result_to_dict(
+    store: SpilledStageResults, result: StageResult
+) -> Dict[str, Any]:
+    """Serialize a spilled result without loading its output."""
+    data = {
+        f: getattr(result, f)
+        for f in (
+            "stage_id", "stage_name", "status", "started_at", "completed_at",
+            "duration_ms", "artifacts", "errors", "warnings", "metadata",
+        )
+    }
+    data["output"] = None
+    data["output_ref"] = str(store.output_path(result.stage_id))
+    return data
+
+
 def _result_to_dict(result: StageResult) -> Dict[str, Any]:
     """Convert StageResult to dictionary for serialization."""
     return {
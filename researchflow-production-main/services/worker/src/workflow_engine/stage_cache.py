@@ -0,0 +1,330 @@
+"""
+Content-Addressed Stage Cache
+
+This module lets run_stages skip stages whose inputs have not changed since
+a previous run. A stage's cache key is a SHA-256 over:
+
+- stage id, the stage's ``stage_version`` attribute and a hash of the
+  module source that defines it
+- the governance mode and a canonical JSON encoding of the stage's
+  relevant config (``cache_config_keys`` on the stage, else the whole config)
+- a fingerprint of the dataset pointer (file contents for local paths)
+- the result hashes of every upstream stage in the run, plus any
+  orchestrator-provided prior outputs and cumulative data
+
+Only completed results are stored, JSON encoded like the spill files in
+result_store, so restored outputs carry JSON types. Artifact files are
+copied into a blob store keyed by their content hash and put back on a hit.
+Artifacts under the storing job's ``<artifact_path>/<job_id>`` (or
+``<artifact_path>``) are restored under the loading job's directories, so a
+hit from another job never points into that job's tree. Stages can opt out
+by setting ``cacheable = False``.
+
+Layout under the cache root::
+
+    entries/<key>.json   serialized StageResult, result hash, artifact list
+    blobs/<sha256>       artifact file contents
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from .types import StageContext, StageResult
+
+from src.utils.logging import get_logger
+
+logger = get_logger("workflow_engine.stage_cache")
+
+STAGE_CACHE_DIRNAME = "stage_cache"
+
+# Bump to invalidate every entry written by an older key scheme
+CACHE_FORMAT_VERSION = 2
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+# (path, size, mtime_ns) -> sha256, so unchanged files are read once per process
+_file_hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+StageKey = Union[int, str]
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministic JSON encoding used for hashing.
+
+    Keys are sorted and values JSON cannot represent are encoded as str().
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents, memoized on (path, size, mtime)."""
+    stat = os.stat(path)
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    cached = _file_hash_memo.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+    _file_hash_memo[memo_key] = value
+    return value
+
+
+def dataset_fingerprint(dataset_pointer: Optional[str]) -> Optional[str]:
+    """Fingerprint a dataset pointer.
+
+    Local files hash their contents and local directories hash the sorted
+    (relative path, content hash) pairs of their files. Anything else (URIs,
+    missing paths) is fingerprinted by the pointer string itself.
+    """
+    if not dataset_pointer:
+        return None
+
+    path = Path(dataset_pointer)
+    if path.is_file():
+        return "file:" + file_sha256(path)
+    if path.is_dir():
+        entries = [
+            (str(p.relative_to(path)), file_sha256(p))
+            for p in sorted(path.rglob("*"))
+            if p.is_file()
+        ]
+        return "dir:" + _sha256_text(canonical_json(entries))
+    return "uri:" + _sha256_text(dataset_pointer)
+
+
+def result_hash(result: StageResult) -> str:
+    """Hash of a result's status and output, used as an upstream input."""
+    return _sha256_text(
+        canonical_json({"status": result.status, "output": result.output})
+    )
+
+
+def _stage_source_hash(stage: Any) -> Optional[str]:
+    """Hash of the source file defining the stage class, if available."""
+    try:
+        source_file = inspect.getsourcefile(type(stage))
+    except TypeError:
+        return None
+    if not source_file or not os.path.isfile(source_file):
+        return None
+    return file_sha256(source_file)
+
+
+def _result_fields(result: StageResult) -> Dict[str, Any]:
+    return {
+        "stage_id": result.stage_id,
+        "stage_name": result.stage_name,
+        "status": result.status,
+        "started_at": result.started_at,
+        "completed_at": result.completed_at,
+        "duration_ms": result.duration_ms,
+        "output": result.output,
+        "artifacts": list(result.artifacts),
+        "errors": list(result.errors),
+        "warnings": list(result.warnings),
+        "metadata": dict(result.metadata),
+    }
+
+
+def _artifact_files(artifacts: List[str]) -> List[Path]:
+    """Expand artifact paths to the files they contain."""
+    files: List[Path] = []
+    for artifact in artifacts:
+        path = Path(artifact)
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            files.extend(p for p in sorted(path.rglob("*")) if p.is_file())
+    return files
+
+
+def _artifact_roots(context: Optional[StageContext]) -> List[str]:
+    """Directories a job's artifacts are rebased from/to, most specific first."""
+    if context is None:
+        return []
+    base = Path(context.artifact_path)
+    return [str(base / context.job_id), str(base)]
+
+
+def _rebase(path: str, old_roots: List[str], new_roots: List[str]) -> str:
+    """Move path from one job's artifact roots to another's, if it lies under one."""
+    for old_root, new_root in zip(old_roots, new_roots):
+        try:
+            relative = Path(path).relative_to(old_root)
+        except ValueError:
+            continue
+        return str(Path(new_root) / relative)
+    return path
+
+
+class StageCache:
+    """File-backed, content-addressed cache of completed stage results.
+
+    Args:
+        root: Cache directory; shared across jobs for cross-run hits
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.entries_dir = self.root / "entries"
+        self.blobs_dir = self.root / "blobs"
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def is_cacheable(stage: Any) -> bool:
+        """Whether a stage allows its results to be cached."""
+        return getattr(stage, "cacheable", True)
+
+    def compute_key(
+        self,
+        stage: Any,
+        stage_id: StageKey,
+        context: StageContext,
+        upstream_hashes: Mapping[StageKey, str],
+    ) -> str:
+        """Cache key for running stage with context after the given upstream results."""
+        config_keys = getattr(stage, "cache_config_keys", None)
+        if config_keys is None:
+            config = context.config
+        else:
+            config = {k: context.config[k] for k in config_keys if k in context.config}
+
+        payload = {
+            "format": CACHE_FORMAT_VERSION,
+            "stage_id": str(stage_id),
+            "stage_class": f"{type(stage).__module__}.{type(stage).__qualname__}",
+            "stage_version": str(getattr(stage, "stage_version", "")),
+            "stage_source": _stage_source_hash(stage),
+            "governance_mode": context.governance_mode,
+            "config": config,
+            "dataset": dataset_fingerprint(context.dataset_pointer),
+            "upstream": sorted((str(k), v) for k, v in upstream_hashes.items()),
+            "prior_stage_outputs": context.prior_stage_outputs,
+            "cumulative_data": context.cumulative_data,
+        }
+        return _sha256_text(canonical_json(payload))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest
+
+    def load(
+        self, key: str, context: Optional[StageContext] = None
+    ) -> Optional[Tuple[StageResult, str]]:
+        """Restore a cached result and its artifacts.
+
+        With a context, artifact files and ``result.artifacts`` are rebased
+        from the storing job's artifact directories onto this job's.
+
+        Returns:
+            (StageResult, result_hash), or None on a miss or if the entry
+            or any of its artifact blobs can no longer be read
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            old_roots = entry.get("artifact_roots") or []
+            new_roots = _artifact_roots(context) if old_roots else []
+            if new_roots:
+                Path(new_roots[0]).mkdir(parents=True, exist_ok=True)
+            self._restore_files(entry.get("files", []), old_roots, new_roots)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("stage_cache_load_failed", key=key, error=str(e))
+            self.stats["misses"] += 1
+            return None
+
+        result = StageResult(**entry["result"])
+        result.artifacts = [_rebase(a, old_roots, new_roots) for a in result.artifacts]
+        result.metadata["stage_cache"] = {"hit": True, "key": key}
+        self.stats["hits"] += 1
+        return result, entry["result_hash"]
+
+    def _restore_files(
+        self,
+        files: List[Dict[str, Any]],
+        old_roots: List[str],
+        new_roots: List[str],
+    ) -> None:
+        # Check every blob first so a partial entry never half-restores
+        for item in files:
+            if not self._blob_path(item["sha256"]).is_file():
+                raise FileNotFoundError(f"missing blob {item['sha256']}")
+        for item in files:
+            target = Path(_rebase(item["path"], old_roots, new_roots))
+            if target.is_file() and file_sha256(target) == item["sha256"]:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.parent / (target.name + ".tmp")
+            shutil.copyfile(self._blob_path(item["sha256"]), tmp_path)
+            os.replace(tmp_path, target)
+
+    def store(
+        self, key: str, result: StageResult, context: Optional[StageContext] = None
+    ) -> str:
+        """Store a completed result and its artifact files under key.
+
+        The context records which artifact directories belong to this job so
+        a later hit from another job can rebase them.
+
+        Failures are logged and never raised; the run proceeds uncached.
+
+        Returns:
+            The result hash, for use as an upstream input of later stages
+        """
+        digest = result_hash(result)
+        if result.status != "completed":
+            return digest
+
+        try:
+            files = []
+            for path in _artifact_files(result.artifacts):
+                sha = file_sha256(path)
+                blob = self._blob_path(sha)
+                if not blob.exists():
+                    self.blobs_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_blob = self.blobs_dir / (sha + ".tmp")
+                    shutil.copyfile(path, tmp_blob)
+                    os.replace(tmp_blob, blob)
+                files.append({"path": str(path), "sha256": sha})
+
+            entry = {
+                "key": key,
+                "result": _result_fields(result),
+                "result_hash": digest,
+                "files": files,
+                "artifact_roots": _artifact_roots(context),
+            }
+            self.entries_dir.mkdir(parents=True, exist_ok=True)
+            entry_path = self._entry_path(key)
+            tmp_path = self.entries_dir / (entry_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, entry_path)
+            self.stats["stores"] += 1
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(
+                "stage_cache_store_failed",
+                key=key,
+                stage_id=result.stage_id,
+                error=str(e),
+            )
+        return digest
@@ -21,11 +21,14 @@ with Node services.
 """
 
 import hashlib
+import itertools
 import json
 import logging
 import os
 import re
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -66,6 +69,7 @@ from src.validation.phi_patterns_generated import (
     PHI_PATTERNS_HIGH_CONFIDENCE,
     PHI_PATTERNS_OUTPUT_GUARD,
 )
+from src.validation.phi_patterns import combine_patterns
 
 # Import ingestion module for large-data support (Phase 5)
 try:
@@ -88,7 +92,9 @@ except ImportError:
 
 # Import pandas for DataFrame handling
 try:
+    import numpy as np
     import pandas as pd
+    from src.validation.phi_detector import candidate_phi_cells
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
@@ -147,6 +153,13 @@ PHI_COLUMN_NAME_PATTERNS = {
 # Audit log storage (in-memory for now, can be extended to persist)
 _audit_log_entries: List[Dict[str, Any]] = []
 
+# One combined alternation per tier, used to rule out clean cells in a
+# single vectorized pass before the per-category patterns run
+_TIER_PREFILTERS = {
+    "HIGH_CONFIDENCE": combine_patterns(p for _, p in PHI_PATTERNS_HIGH_CONFIDENCE),
+    "OUTPUT_GUARD": combine_patterns(p for _, p in PHI_PATTERNS_OUTPUT_GUARD),
+}
+
 
 def hash_match(text: str) -> str:
     """Compute SHA256 hash of matched text (first 12 chars).
@@ -310,6 +323,9 @@ def scan_dataframe_for_phi(
     """Scan a pandas DataFrame for PHI patterns with risk assessment.
     
     Scans all string columns for PHI and optionally assesses column-level risk.
+    Each column is scanned at once: the tier's combined pattern rules out clean
+    cells with a vectorized ``.str.contains`` and each distinct remaining text
+    is scanned once, producing the same hash-only findings as per-cell scanning.
     
     Args:
         df: DataFrame to scan
@@ -322,6 +338,7 @@ def scan_dataframe_for_phi(
     """
     findings: List[Dict[str, Any]] = []
     column_risks: Dict[str, Dict[str, Any]] = {}
+    prefilter = _TIER_PREFILTERS.get(tier, _TIER_PREFILTERS["OUTPUT_GUARD"])
     
     # Identify string columns
     string_cols = df.select_dtypes(include=['object', 'string']).columns
@@ -329,14 +346,17 @@ def scan_dataframe_for_phi(
     for col in string_cols:
         col_findings: List[Dict[str, Any]] = []
         
-        for row_idx, value in enumerate(df[col]):
-            if pd.isna(value):
-                continue
-            
-            content = str(value)
-            cell_findings = scan_text_for_phi(content, tier=tier)
-            
-            for finding in cell_findings:
+        # Column-at-a-time: each distinct candidate text is scanned once
+        positions, codes, texts = candidate_phi_cells(df[col], prefilter)
+        text_findings: Dict[int, List[Dict[str, Any]]] = {}
+        for code in np.unique(codes).tolist():
+            cell_findings = scan_text_for_phi(texts[code], tier=tier)
+            if cell_findings:
+                text_findings[code] = cell_findings
+        
+        for row_idx, code in zip(positions.tolist(), codes.tolist()):
+            for template in text_findings.get(code, ()):
+                finding = {**template, "position": dict(template["position"])}
                 finding["column"] = col
                 finding["row"] = row_idx
                 if chunk_index is not None:
@@ -351,19 +371,140 @@ def scan_dataframe_for_phi(
     return findings, column_risks
 
 
+def _scan_chunk_worker(
+    payload: Tuple[int, "pd.DataFrame", str],
+) -> Tuple[int, int, List[str], List[Dict[str, Any]]]:
+    """Scan one chunk (runs in a worker process for parallel scans).
+
+    Returns:
+        Tuple of (chunk_index, row_count, string_columns, findings)
+    """
+    chunk_index, chunk_df, tier = payload
+    string_cols = chunk_df.select_dtypes(include=['object', 'string']).columns.tolist()
+    findings, _ = scan_dataframe_for_phi(
+        chunk_df, tier=tier, chunk_index=chunk_index, assess_risk=False
+    )
+    return chunk_index, len(chunk_df), string_cols, findings
+
+
+def _scan_chunks_for_phi(
+    chunks: Any,  # Iterable[pd.DataFrame]
+    tier: str,
+    assess_risk: bool,
+    max_workers: int = 1,
+    max_chunks: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Scan a stream of DataFrame chunks, optionally across worker processes.
+
+    Chunks are pulled lazily and at most ``2 * max_workers`` are in flight,
+    so memory stays bounded. Results are merged in chunk order, and column
+    risks are assessed once over the findings from every chunk, so the
+    output is identical regardless of worker count or completion order.
+
+    A chunk of None marks a chunk that could not be loaded; it is counted
+    as failed.
+
+    Returns:
+        Tuple of (findings, scan_metadata, column_risk_assessments)
+    """
+    started = time.perf_counter()
+    results: Dict[int, Tuple[int, List[str], List[Dict[str, Any]]]] = {}
+    failed_chunks: List[int] = []
+    # Every column seen (name -> dtype), including numeric quasi-identifiers
+    all_columns: Dict[str, Any] = {}
+    chunk_iter = iter(chunks)
+    if max_chunks is not None:
+        chunk_iter = itertools.islice(chunk_iter, max_chunks)
+
+    def _collect(chunk_index: int, outcome: Any) -> None:
+        try:
+            _, rows, cols, chunk_findings = outcome()
+            results[chunk_index] = (rows, cols, chunk_findings)
+        except Exception as e:
+            failed_chunks.append(chunk_index)
+            logger.warning(f"Error scanning chunk {chunk_index}: {e}")
+
+    if max_workers <= 1:
+        for i, chunk_df in enumerate(chunk_iter):
+            if chunk_df is None:
+                failed_chunks.append(i)
+                continue
+            all_columns.update(chunk_df.dtypes.to_dict())
+            _collect(i, lambda: _scan_chunk_worker((i, chunk_df, tier)))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            pending: Dict[Any, int] = {}
+            for i, chunk_df in enumerate(chunk_iter):
+                if chunk_df is None:
+                    failed_chunks.append(i)
+                    continue
+                all_columns.update(chunk_df.dtypes.to_dict())
+                pending[pool.submit(_scan_chunk_worker, (i, chunk_df, tier))] = i
+                if len(pending) >= 2 * max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _collect(pending.pop(future), future.result)
+            for future in list(pending):
+                _collect(pending.pop(future), future.result)
+
+    # Deterministic merge in chunk order
+    all_findings: List[Dict[str, Any]] = []
+    string_cols: Dict[str, None] = {}
+    total_rows = 0
+    for chunk_index in sorted(results):
+        rows, cols, chunk_findings = results[chunk_index]
+        total_rows += rows
+        string_cols.update(dict.fromkeys(cols))
+        all_findings.extend(chunk_findings)
+
+    all_column_risks: Dict[str, Dict[str, Any]] = {}
+    if assess_risk and string_cols:
+        findings_by_column: Dict[str, List[Dict[str, Any]]] = {col: [] for col in string_cols}
+        for finding in all_findings:
+            findings_by_column[finding["column"]].append(finding)
+        # Quasi-identifier checks need every column (numeric ZIP/age included),
+        # not just the scanned string ones; a 0-row frame keeps their dtypes
+        columns_df = pd.DataFrame(
+            {col: pd.Series(dtype=dtype) for col, dtype in all_columns.items()}
+        )
+        for col, col_findings in findings_by_column.items():
+            all_column_risks[col] = assess_column_risk(col, col_findings, columns_df)
+
+    elapsed = time.perf_counter() - started
+    metadata = {
+        "chunks_scanned": len(results),
+        "chunks_failed": len(failed_chunks),
+        "rows_scanned": total_rows,
+        "workers": max(max_workers, 1),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(total_rows / elapsed, 1) if elapsed > 0 else None,
+    }
+    logger.info(
+        f"PHI scan of {len(results)} chunks ({total_rows} rows) with "
+        f"{metadata['workers']} worker(s): {metadata['rows_per_second']} rows/s"
+    )
+
+    return all_findings, metadata, all_column_risks
+
+
 def scan_dask_dataframe_for_phi(
     ddf: Any,  # dask.dataframe.DataFrame
     tier: str = "HIGH_CONFIDENCE",
-    max_partitions: int = 100,
+    max_partitions: Optional[int] = None,
     assess_risk: bool = True,
+    max_workers: int = 1,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Dict[str, Any]]]:
-    """Scan a Dask DataFrame for PHI using map_partitions.
+    """Scan a Dask DataFrame for PHI, one partition at a time.
+    
+    Partitions are computed in the calling thread and, with max_workers > 1,
+    scanned in a process pool (regex scanning is GIL-bound).
     
     Args:
         ddf: Dask DataFrame to scan
         tier: Pattern tier to use
-        max_partitions: Maximum partitions to scan (for safety)
+        max_partitions: Optional cap on partitions to scan (None scans all)
         assess_risk: Whether to perform column-level risk assessment
+        max_workers: Worker processes for scanning (1 = in-process)
         
     Returns:
         Tuple of (findings, scan_metadata, column_risk_assessments)
@@ -371,44 +512,30 @@ def scan_dask_dataframe_for_phi(
     if not DASK_AVAILABLE:
         return [], {"error": "Dask not available"}, {}
     
-    all_findings: List[Dict[str, Any]] = []
-    partitions_scanned = 0
-    total_rows = 0
-    all_column_risks: Dict[str, Dict[str, Any]] = {}
-    
-    num_partitions = min(ddf.npartitions, max_partitions)
+    num_partitions = ddf.npartitions
+    if max_partitions is not None:
+        num_partitions = min(num_partitions, max_partitions)
     
-    # Sample first partition for risk assessment
-    sample_df = None
-    if assess_risk and num_partitions > 0:
-        try:
-            sample_df = ddf.get_partition(0).compute()
-        except Exception as e:
-            logger.warning(f"Could not sample partition for risk assessment: {e}")
+    def _computed_partitions():
+        for i in range(num_partitions):
+            try:
+                yield ddf.get_partition(i).compute()
+            except Exception as e:
+                logger.warning(f"Error computing partition {i}: {e}")
+                yield None
     
-    for i in range(num_partitions):
-        try:
-            partition_df = ddf.get_partition(i).compute()
-            partition_findings, partition_risks = scan_dataframe_for_phi(
-                partition_df, 
-                tier=tier, 
-                chunk_index=i,
-                assess_risk=(i == 0) if assess_risk else False,  # Only assess first partition
-            )
-            all_findings.extend(partition_findings)
-            total_rows += len(partition_df)
-            partitions_scanned += 1
-            
-            # Merge column risks (from first partition)
-            if i == 0:
-                all_column_risks.update(partition_risks)
-        except Exception as e:
-            logger.warning(f"Error scanning partition {i}: {e}")
+    all_findings, chunk_metadata, all_column_risks = _scan_chunks_for_phi(
+        _computed_partitions(),
+        tier=tier,
+        assess_risk=assess_risk,
+        max_workers=max_workers,
+    )
     
     metadata = {
-        "partitions_scanned": partitions_scanned,
+        "partitions_scanned": chunk_metadata.pop("chunks_scanned"),
+        "partitions_failed": chunk_metadata.pop("chunks_failed"),
         "total_partitions": ddf.npartitions,
-        "rows_scanned": total_rows,
+        **chunk_metadata,
         "scan_mode": "dask_partitioned",
     }
     
@@ -418,51 +545,36 @@ def scan_dask_dataframe_for_phi(
 def scan_chunked_iterator_for_phi(
     reader: Any,  # TextFileReader
     tier: str = "HIGH_CONFIDENCE",
-    max_chunks: int = 100,
+    max_chunks: Optional[int] = None,
     assess_risk: bool = True,
+    max_workers: int = 1,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Dict[str, Any]]]:
     """Scan a chunked iterator (TextFileReader) for PHI.
     
-    Note: This consumes the iterator.
+    Note: This consumes the iterator. With max_workers > 1, chunks are
+    streamed to a process pool as they are read.
     
     Args:
         reader: Chunked file reader
         tier: Pattern tier to use
-        max_chunks: Maximum chunks to scan (for safety)
+        max_chunks: Optional cap on chunks to scan (None scans all)
         assess_risk: Whether to perform column-level risk assessment
+        max_workers: Worker processes for scanning (1 = in-process)
         
     Returns:
         Tuple of (findings, scan_metadata, column_risk_assessments)
     """
-    all_findings: List[Dict[str, Any]] = []
-    chunks_scanned = 0
-    total_rows = 0
-    all_column_risks: Dict[str, Dict[str, Any]] = {}
-    
-    for i, chunk_df in enumerate(reader):
-        if i >= max_chunks:
-            logger.warning(f"Reached max_chunks limit ({max_chunks})")
-            break
-        
-        chunk_findings, chunk_risks = scan_dataframe_for_phi(
-            chunk_df,
-            tier=tier,
-            chunk_index=i,
-            assess_risk=(i == 0) if assess_risk else False,  # Only assess first chunk
-        )
-        all_findings.extend(chunk_findings)
-        total_rows += len(chunk_df)
-        chunks_scanned += 1
-        
-        # Merge column risks (from first chunk)
-        if i == 0:
-            all_column_risks.update(chunk_risks)
+    all_findings, metadata, all_column_risks = _scan_chunks_for_phi(
+        reader,
+        tier=tier,
+        assess_risk=assess_risk,
+        max_workers=max_workers,
+        max_chunks=max_chunks,
+    )
+    if max_chunks is not None and metadata["chunks_scanned"] + metadata["chunks_failed"] >= max_chunks:
+        logger.warning(f"Reached max_chunks limit ({max_chunks})")
     
-    metadata = {
-        "chunks_scanned": chunks_scanned,
-        "rows_scanned": total_rows,
-        "scan_mode": "chunked",
-    }
+    metadata["scan_mode"] = "chunked"
     
     return all_findings, metadata, all_column_risks
 
@@ -829,6 +941,7 @@ class PHIGuardAgent(BaseStageAgent):
         redaction_style = phi_config.get("redaction_style", "marker")
         validate_compliance = phi_config.get("validate_compliance", True)
         assess_column_risk = phi_config.get("assess_column_risk", True)
+        scan_workers = phi_config.get("scan_workers")
 
         tier = (
             "OUTPUT_GUARD"
@@ -864,6 +977,9 @@ class PHIGuardAgent(BaseStageAgent):
                     # Use large-file PHI scanning
                     logger.info(f"Using large-file PHI scanning for {file_path}")
                     
+                    if scan_workers is None:
+                        scan_workers = config.phi_scan_workers
+                    
                     file_format = "tsv" if file_path.endswith('.tsv') else "csv"
                     data, ingestion_meta = ingest_file_large(
                         file_path,
@@ -873,11 +989,17 @@ class PHIGuardAgent(BaseStageAgent):
                     
                     if ingestion_meta.is_dask:
                         all_findings, scan_metadata, column_risk_assessments = scan_dask_dataframe_for_phi(
-                            data, tier=tier, assess_risk=assess_column_risk
+                            data,
+                            tier=tier,
+                            assess_risk=assess_column_risk,
+                            max_workers=scan_workers,
                         )
                     elif ingestion_meta.is_chunked:
                         all_findings, scan_metadata, column_risk_assessments = scan_chunked_iterator_for_phi(
-                            data, tier=tier, assess_risk=assess_column_risk
+                            data,
+                            tier=tier,
+                            assess_risk=assess_column_risk,
+                            max_workers=scan_workers,
                         )
                     else:
                         # Standard pandas DataFrame
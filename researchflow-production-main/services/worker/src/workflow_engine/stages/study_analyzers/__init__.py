@@ -18,7 +18,7 @@ Components:
 # Core study analyzers
 from .ml_study_optimizer import MLStudyDesignOptimizer, StudyDesignRecommendation
 from .statistical_power_engine import (
-    StatisticalPowerEngine, PowerAnalysisResult, SampleSizeCalculation,
+    StatisticalPowerEngine, PowerAnalysisResult, SampleSizeCalculation, PowerGridResult,
     AdaptiveAnalysisResult, BayesianPowerResult, StatisticalTestType,
     AdaptiveDesignType, BayesianMethod
 )
@@ -74,6 +74,7 @@ __all__ = [
     "StudyDesignRecommendation",
     "PowerAnalysisResult",
     "SampleSizeCalculation",
+    "PowerGridResult",
     "AdaptiveAnalysisResult",
     "BayesianPowerResult",
     "StatisticalTestType",
@@ -17,7 +17,7 @@ Author: Stage 6 Enhancement Team
 import logging
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, Union, Callable
+from typing import Dict, List, Optional, Tuple, Any, Union
 from enum import Enum
 import numpy as np
 from scipy import stats
@@ -160,6 +160,47 @@ class SampleSizeCalculation:
         }
 
 
+@dataclass
+class PowerGridResult:
+    """
+    Power surface over a grid of alphas x effect sizes x sample sizes.
+    """
+    test_type: StatisticalTestType
+    sample_sizes: List[int]
+    effect_sizes: List[float]
+    alphas: List[float]
+    power: np.ndarray  # shape (len(alphas), len(effect_sizes), len(sample_sizes))
+    
+    # Minimum total n reaching target_power for each (alpha, effect size)
+    target_power: Optional[float] = None
+    required_sample_sizes: Optional[np.ndarray] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "test_type": self.test_type.value,
+            "sample_sizes": self.sample_sizes,
+            "effect_sizes": self.effect_sizes,
+            "alphas": self.alphas,
+            "power": self.power.tolist(),
+            "target_power": self.target_power,
+            "required_sample_sizes": (
+                self.required_sample_sizes.tolist()
+                if self.required_sample_sizes is not None else None
+            )
+        }
+
+
+# Tests whose total sample size is split evenly over two groups
+TWO_GROUP_TESTS = (
+    StatisticalTestType.TWO_SAMPLE_T_TEST,
+    StatisticalTestType.PROPORTION_TWO_SAMPLE,
+    StatisticalTestType.MANN_WHITNEY,
+    StatisticalTestType.SURVIVAL_LOGRANK,
+    StatisticalTestType.FISHER_EXACT,
+)
+
+
 class PowerCalculator:
     """
     Core calculator for statistical power and sample size calculations.
@@ -219,7 +260,9 @@ class PowerCalculator:
             
             # Power calculation using non-central t-distribution
             if alternative == "two-sided":
-                power = 1 - stats.nct.cdf(t_crit, df, ncp) + stats.nct.cdf(-t_crit, df, ncp)
+                # Far lower tail underflows to nan in scipy's nct; it is ~0
+                power = (1 - stats.nct.cdf(t_crit, df, ncp)
+                         + np.nan_to_num(stats.nct.cdf(-t_crit, df, ncp)))
             else:
                 power = 1 - stats.nct.cdf(t_crit, df, ncp)
             
@@ -617,6 +660,192 @@ class PowerCalculator:
             logger.error(f"Error calculating Fisher exact power: {str(e)}")
             return 0.0
 
+    def power_array(self,
+                    test_type: StatisticalTestType,
+                    n: Union[int, np.ndarray, List[int]],
+                    effect_size: Union[float, np.ndarray, List[float]],
+                    alpha: Union[float, np.ndarray, List[float]] = 0.05,
+                    alternative: str = "two-sided",
+                    **kwargs) -> np.ndarray:
+        """
+        Vectorized power for arrays of total sample sizes, effect sizes and alphas.
+        
+        Inputs broadcast against each other (pass e.g. ``n[None, :]`` and
+        ``effect_size[:, None]`` for a surface). ``n`` is the total sample size,
+        split evenly across groups the same way ``StatisticalPowerEngine``
+        splits an integer sample size. Infeasible points (e.g. no degrees of
+        freedom left) have power 0.
+        
+        Args:
+            test_type: Type of statistical test
+            n: Total sample size(s)
+            effect_size: Effect size(s) in the test's native measure
+            alpha: Significance level(s)
+            alternative: Direction of test
+            **kwargs: Test-specific parameters (p1, p2, num_groups, df,
+                num_predictors, event_rate) as accepted by ``calculate_power``
+            
+        Returns:
+            Array of powers (0-1) with the broadcast shape of the inputs
+        """
+        n = np.asarray(n, dtype=float)
+        es = np.asarray(effect_size, dtype=float)
+        alpha = np.asarray(alpha, dtype=float)
+        two_sided = alternative == "two-sided"
+        tail = alpha / 2 if two_sided else alpha
+        half = np.floor(n / 2)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if test_type in (StatisticalTestType.ONE_SAMPLE_T_TEST,
+                             StatisticalTestType.TWO_SAMPLE_T_TEST,
+                             StatisticalTestType.PAIRED_T_TEST):
+                if test_type == StatisticalTestType.TWO_SAMPLE_T_TEST:
+                    df = 2 * half - 2
+                    ncp = es / np.sqrt(2 / half)
+                else:
+                    df = n - 1
+                    ncp = es * np.sqrt(n)
+                t_crit = stats.t.ppf(1 - tail, df)
+                power = stats.nct.sf(t_crit, df, ncp)
+                if two_sided:
+                    # Far lower tail underflows to nan in scipy's nct; it is ~0
+                    power = power + np.nan_to_num(stats.nct.cdf(-t_crit, df, ncp))
+                
+            elif test_type == StatisticalTestType.PROPORTION_ONE_SAMPLE:
+                p0 = kwargs.get('p1', 0.5)
+                p_alt = np.asarray(kwargs.get('p2', 0.5 + es), dtype=float)
+                se_null = np.sqrt(p0 * (1 - p0) / n)
+                se_alt = np.sqrt(p_alt * (1 - p_alt) / n)
+                diff = np.abs(p_alt - p0) if two_sided else p_alt - p0
+                power = stats.norm.cdf((diff - stats.norm.isf(tail) * se_null) / se_alt)
+                
+            elif test_type in (StatisticalTestType.PROPORTION_TWO_SAMPLE,
+                               StatisticalTestType.FISHER_EXACT):
+                p1 = kwargs.get('p1', 0.5)
+                p2 = np.asarray(kwargs.get('p2', 0.5 + es), dtype=float)
+                if test_type == StatisticalTestType.FISHER_EXACT:
+                    tail = alpha / 2  # always two-sided
+                p_pooled = (p1 + p2) / 2
+                se_null = np.sqrt(2 * p_pooled * (1 - p_pooled) / half)
+                se_alt = np.sqrt((p1 * (1 - p1) + p2 * (1 - p2)) / half)
+                power = stats.norm.cdf(
+                    (np.abs(p2 - p1) - stats.norm.isf(tail) * se_null) / se_alt
+                )
+                
+            elif test_type == StatisticalTestType.ONE_WAY_ANOVA:
+                k = kwargs.get('num_groups', 3)
+                n_total = np.floor(n / k) * k
+                df_within = n_total - k
+                f_crit = stats.f.isf(alpha, k - 1, df_within)
+                power = stats.ncf.sf(f_crit, k - 1, df_within, es**2 * n_total)
+                
+            elif test_type in (StatisticalTestType.CHI_SQUARE_INDEPENDENCE,
+                               StatisticalTestType.CHI_SQUARE_GOODNESS):
+                df = kwargs.get('df', 1)
+                power = stats.ncx2.sf(stats.chi2.isf(alpha, df), df, es**2 * n)
+                
+            elif test_type == StatisticalTestType.CORRELATION:
+                z_r = np.arctanh(es)
+                power = stats.norm.cdf(np.abs(z_r) * np.sqrt(n - 3) - stats.norm.isf(tail))
+                
+            elif test_type == StatisticalTestType.REGRESSION:
+                u = kwargs.get('num_predictors', 1)
+                df_within = n - u - 1
+                f_crit = stats.f.isf(alpha, u, df_within)
+                power = stats.ncf.sf(f_crit, u, df_within, es * n)
+                
+            elif test_type == StatisticalTestType.SURVIVAL_LOGRANK:
+                events = 2 * half * kwargs.get('event_rate', 0.5)
+                z = np.abs(np.log(es)) * np.sqrt(events) / 2
+                power = stats.norm.cdf(z - stats.norm.isf(tail))
+                
+            elif test_type == StatisticalTestType.MANN_WHITNEY:
+                sigma_u = np.sqrt(half * half * (2 * half + 1) / 12)
+                z = np.abs(es - 0.5) * half * half / sigma_u
+                power = stats.norm.sf(stats.norm.isf(alpha / 2) - z)
+                
+            elif test_type == StatisticalTestType.WILCOXON_SIGNED_RANK:
+                sigma_w = np.sqrt(n * (n + 1) * (2 * n + 1) / 24)
+                z = np.abs(es - 0.5) * n * (n + 1) / 2 / sigma_w
+                power = stats.norm.sf(stats.norm.isf(alpha / 2) - z)
+                
+            else:
+                raise ValueError(f"Unsupported test type: {test_type}")
+        
+        return np.clip(np.nan_to_num(power, nan=0.0), 0.0, 1.0)
+    
+    def approximate_sample_size(self,
+                                test_type: StatisticalTestType,
+                                target_power: float,
+                                effect_size: float,
+                                alpha: float = 0.05,
+                                alternative: str = "two-sided",
+                                **kwargs) -> Optional[float]:
+        """
+        Closed-form (or noncentral-inverse) total sample size for target power.
+        
+        Normal-theory inverses are used for z-based tests and t-tests (with
+        Guenther's correction); F and chi-square tests invert the noncentral
+        chi-square power function for the noncentrality parameter. The result
+        is a starting point that ``StatisticalPowerEngine`` refines against
+        ``power_array``. Returns None when no closed form applies.
+        """
+        tail = alpha / 2 if alternative == "two-sided" else alpha
+        z_a = stats.norm.isf(tail)
+        z_b = stats.norm.ppf(target_power)
+        
+        try:
+            if test_type in (StatisticalTestType.ONE_SAMPLE_T_TEST,
+                             StatisticalTestType.PAIRED_T_TEST):
+                return ((z_a + z_b) / effect_size)**2 + z_a**2 / 2
+            
+            if test_type == StatisticalTestType.TWO_SAMPLE_T_TEST:
+                return 2 * (2 * ((z_a + z_b) / effect_size)**2 + z_a**2 / 4)
+            
+            if test_type == StatisticalTestType.PROPORTION_ONE_SAMPLE:
+                p0 = kwargs.get('p1', 0.5)
+                p_alt = kwargs.get('p2', 0.5 + effect_size)
+                root_n = (z_a * np.sqrt(p0 * (1 - p0)) + z_b * np.sqrt(p_alt * (1 - p_alt))) / abs(p_alt - p0)
+                return root_n**2
+            
+            if test_type in (StatisticalTestType.PROPORTION_TWO_SAMPLE,
+                             StatisticalTestType.FISHER_EXACT):
+                if test_type == StatisticalTestType.FISHER_EXACT:
+                    z_a = stats.norm.isf(alpha / 2)
+                p1 = kwargs.get('p1', 0.5)
+                p2 = kwargs.get('p2', 0.5 + effect_size)
+                p_pooled = (p1 + p2) / 2
+                root_m = (z_a * np.sqrt(2 * p_pooled * (1 - p_pooled))
+                          + z_b * np.sqrt(p1 * (1 - p1) + p2 * (1 - p2))) / abs(p2 - p1)
+                return 2 * root_m**2
+            
+            if test_type == StatisticalTestType.CORRELATION:
+                return ((z_a + z_b) / abs(np.arctanh(effect_size)))**2 + 3
+            
+            if test_type == StatisticalTestType.SURVIVAL_LOGRANK:
+                event_rate = kwargs.get('event_rate', 0.5)
+                return 4 * (z_a + z_b)**2 / (np.log(effect_size)**2 * event_rate)
+            
+            if test_type in (StatisticalTestType.ONE_WAY_ANOVA,
+                             StatisticalTestType.REGRESSION,
+                             StatisticalTestType.CHI_SQUARE_INDEPENDENCE,
+                             StatisticalTestType.CHI_SQUARE_GOODNESS):
+                if test_type == StatisticalTestType.ONE_WAY_ANOVA:
+                    df, scale = kwargs.get('num_groups', 3) - 1, effect_size**2
+                elif test_type == StatisticalTestType.REGRESSION:
+                    df, scale = kwargs.get('num_predictors', 1), effect_size
+                else:
+                    df, scale = kwargs.get('df', 1), effect_size**2
+                # Noncentrality giving target power under the chi-square limit
+                crit = stats.chi2.isf(alpha, df)
+                ncp = brentq(lambda lam: stats.ncx2.sf(crit, df, lam) - target_power,
+                             1e-9, 1e4)
+                return ncp / scale
+        except (ValueError, ZeroDivisionError, FloatingPointError):
+            return None
+        
+        return None
+
 
 class StatisticalPowerEngine:
     """
@@ -798,20 +1027,9 @@ class StatisticalPowerEngine:
                 
             logger.info(f"Calculating sample size for {test_type.value}, target power: {target_power}")
             
-            # Define power function for optimization
-            async def power_function(n: int) -> float:
-                if isinstance(n, (list, np.ndarray)):
-                    n = int(n[0]) if len(n) > 0 else 100
-                n = max(1, int(n))
-                
-                result = await self.calculate_power(
-                    test_type, n, effect_size, alpha, **kwargs
-                )
-                return result.power
-            
-            # Binary search for required sample size
-            required_n = await self._optimize_sample_size(
-                power_function, target_power, max_n
+            # Closed-form / noncentral inverse, refined by one vectorized evaluation
+            required_n, method = self._solve_sample_size(
+                test_type, target_power, effect_size, alpha, max_n, **kwargs
             )
             
             # Calculate achieved power with required sample size
@@ -820,11 +1038,7 @@ class StatisticalPowerEngine:
             )
             
             # Determine sample size per group
-            if test_type in [StatisticalTestType.TWO_SAMPLE_T_TEST,
-                           StatisticalTestType.PROPORTION_TWO_SAMPLE,
-                           StatisticalTestType.MANN_WHITNEY,
-                           StatisticalTestType.SURVIVAL_LOGRANK,
-                           StatisticalTestType.FISHER_EXACT]:
+            if test_type in TWO_GROUP_TESTS:
                 n_per_group = [required_n // 2, required_n // 2]
                 total_groups = 2
                 allocation_ratio = [1.0, 1.0]
@@ -841,15 +1055,15 @@ class StatisticalPowerEngine:
                 alpha=alpha,
                 effect_size=effect_size,
                 test_type=test_type,
-                calculation_method="binary_search",
-                convergence_achieved=True,
+                calculation_method=method,
+                convergence_achieved=final_result.power >= target_power,
                 sample_size_per_group=n_per_group,
                 total_groups=total_groups,
                 allocation_ratio=allocation_ratio
             )
             
             # Generate power curve for sensitivity analysis
-            await self._generate_power_curve(result, power_function)
+            await self._generate_power_curve(result, test_type, alpha, **kwargs)
             
             return result
             
@@ -875,7 +1089,10 @@ class StatisticalPowerEngine:
         if isinstance(sample_size, list):
             n1, n2 = sample_size[0], sample_size[1] if len(sample_size) > 1 else None
         else:
-            n1, n2 = sample_size, sample_size // 2 if test_type == StatisticalTestType.TWO_SAMPLE_T_TEST else None
+            n1, n2 = sample_size, None
+            if test_type == StatisticalTestType.TWO_SAMPLE_T_TEST:
+                # Total sample size split evenly, as reported by calculate_sample_size
+                n1 = n2 = sample_size // 2
             
         return self.calculator.calculate_t_test_power(
             n1, n2, effect_size, alpha, test_type, 
@@ -931,58 +1148,135 @@ class StatisticalPowerEngine:
         df = kwargs.get('df', 1)
         return self.calculator.calculate_chi_square_power(n, effect_size, df, alpha)
     
-    async def _optimize_sample_size(self,
-                                  power_function: Callable,
-                                  target_power: float,
-                                  max_n: int) -> int:
-        """Optimize sample size using binary search."""
-        try:
-            # Binary search for required sample size
-            low, high = 1, max_n
-            best_n = max_n
-            
-            for _ in range(50):  # Max iterations
-                mid = (low + high) // 2
-                power = await power_function(mid)
-                
-                if power >= target_power:
-                    best_n = mid
-                    high = mid - 1
-                else:
-                    low = mid + 1
-                    
-                if low > high:
-                    break
-            
-            return best_n
-            
-        except Exception as e:
-            logger.error(f"Error in sample size optimization: {str(e)}")
-            return max_n // 2
+    def _solve_sample_size(self,
+                           test_type: StatisticalTestType,
+                           target_power: float,
+                           effect_size: float,
+                           alpha: float,
+                           max_n: int,
+                           **kwargs) -> Tuple[int, str]:
+        """
+        Smallest total n in [1, max_n] reaching target power.
+        
+        The closed-form estimate is checked against the exact power function
+        on a window around it in one vectorized call; if the window does not
+        bracket the crossing (or no closed form exists) all n up to max_n are
+        evaluated at once instead.
+        """
+        alternative = kwargs.pop('alternative', 'two-sided')
+        
+        def reaches(candidates: np.ndarray) -> np.ndarray:
+            return self.calculator.power_array(
+                test_type, candidates, effect_size, alpha, alternative, **kwargs
+            ) >= target_power
+        
+        estimate = self.calculator.approximate_sample_size(
+            test_type, target_power, effect_size, alpha, alternative, **kwargs
+        )
+        if estimate is not None and np.isfinite(estimate) and estimate < max_n:
+            window = max(8, int(0.1 * estimate))
+            candidates = np.arange(max(1, int(estimate) - window),
+                                   min(max_n, int(np.ceil(estimate)) + window) + 1)
+            hit = reaches(candidates)
+            if hit.any() and not hit[0]:
+                return int(candidates[np.argmax(hit)]), "closed_form"
+        
+        candidates = np.arange(1, max_n + 1)
+        hit = reaches(candidates)
+        if hit.any():
+            return int(candidates[np.argmax(hit)]), "vectorized_grid"
+        return max_n, "vectorized_grid"
     
     async def _generate_power_curve(self,
                                   result: SampleSizeCalculation,
-                                  power_function: Callable):
+                                  test_type: StatisticalTestType,
+                                  alpha: float,
+                                  **kwargs):
         """Generate power curve points for sensitivity analysis."""
         try:
-            curve_points = []
             base_n = result.required_sample_size
             
             # Generate points around the required sample size
-            test_sizes = [
+            test_sizes = np.array([
                 int(base_n * 0.5), int(base_n * 0.75), base_n,
                 int(base_n * 1.25), int(base_n * 1.5)
+            ])
+            test_sizes = test_sizes[test_sizes > 0]
+            
+            alternative = kwargs.pop('alternative', 'two-sided')
+            powers = self.calculator.power_array(
+                test_type, test_sizes, result.effect_size, alpha, alternative, **kwargs
+            )
+            result.power_curve_points = [
+                (int(n), float(power)) for n, power in zip(test_sizes, powers)
             ]
             
-            for n in test_sizes:
-                if n > 0:
-                    power = await power_function(n)
-                    curve_points.append((n, power))
+        except Exception as e:
+            logger.error(f"Error generating power curve: {str(e)}")
+    
+    async def calculate_power_grid(self,
+                                 test_type: StatisticalTestType,
+                                 sample_sizes: List[int],
+                                 effect_sizes: List[float],
+                                 alphas: Optional[List[float]] = None,
+                                 target_power: Optional[float] = None,
+                                 max_n: int = 10000,
+                                 **kwargs) -> PowerGridResult:
+        """
+        Evaluate power for every (alpha, effect size, sample size) scenario.
+        
+        The whole surface is computed in one vectorized call, so exploring
+        hundreds of protocol scenarios costs about as much as a single power
+        calculation.
+        
+        Args:
+            test_type: Type of statistical test
+            sample_sizes: Total sample sizes to evaluate
+            effect_sizes: Effect sizes to evaluate
+            alphas: Significance levels (defaults to the engine's alpha)
+            target_power: If given, also solve the required sample size for
+                each (alpha, effect size) pair
+            max_n: Maximum sample size to consider when solving
+            **kwargs: Additional test-specific parameters
+            
+        Returns:
+            PowerGridResult with a (alphas, effect_sizes, sample_sizes) surface
+        """
+        try:
+            if alphas is None:
+                alphas = [self.default_alpha]
+            n = np.asarray(sample_sizes, dtype=int)
+            es = np.asarray(effect_sizes, dtype=float)
+            a = np.asarray(alphas, dtype=float)
+            
+            params = dict(kwargs)
+            alternative = params.pop('alternative', 'two-sided')
+            power = self.calculator.power_array(
+                test_type, n[None, None, :], es[None, :, None], a[:, None, None],
+                alternative, **params
+            )
             
-            result.power_curve_points = curve_points
+            required = None
+            if target_power is not None:
+                required = np.array([
+                    [self._solve_sample_size(test_type, target_power, e, alpha, max_n, **kwargs)[0]
+                     for e in es]
+                    for alpha in a
+                ])
+            
+            return PowerGridResult(
+                test_type=test_type,
+                sample_sizes=n.tolist(),
+                effect_sizes=es.tolist(),
+                alphas=a.tolist(),
+                power=power,
+                target_power=target_power,
+                required_sample_sizes=required
+            )
             
         except Exception as e:
-            logger.error(f"Error generating power curve: {str(e)}")
+            logger.error(f"Error calculating power grid: {str(e)}")
+            raise
     
     async def _add_power_recommendations(self, result: PowerAnalysisResult):
         """Add recommendations based on power analysis results."""
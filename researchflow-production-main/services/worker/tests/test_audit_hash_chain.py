@@ -14,11 +14,14 @@ Tests cover:
 import pytest
 import tempfile
 import os
+import threading
 from datetime import datetime, timedelta
 import json
 
 from services.worker.src.audit.hash_chain import (
     HashChainAuditLogger,
+    AuditChainTail,
+    AuditCheckpoint,
     AuditEntry,
     get_audit_logger,
 )
@@ -339,6 +342,231 @@ class TestHashChainAuditLogger:
         assert result_future["total_entries"] == 0
 
 
+class TestVerificationCheckpoints:
+    """Tests for streaming verification with signed checkpoints."""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create temporary database for testing."""
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        yield f"sqlite:///{path}"
+        if os.path.exists(path):
+            os.remove(path)
+
+    @pytest.fixture
+    def logger(self, temp_db):
+        """Create audit logger that signs checkpoints."""
+        return HashChainAuditLogger(database_url=temp_db, checkpoint_key="test-key")
+
+    def _append(self, logger, count, start=0):
+        return [
+            logger.append_entry(
+                action="ACTION",
+                actor="user",
+                resource_type="resource",
+                data={"index": i},
+            )
+            for i in range(start, start + count)
+        ]
+
+    def test_small_batches_match_full_walk(self, logger):
+        """Batch size should not affect the verification result."""
+        self._append(logger, 7)
+        result = logger.verify_chain(batch_size=2, save_checkpoint=False)
+        assert result["valid"] is True
+        assert result["total_entries"] == 7
+
+    def test_resume_walks_only_new_entries(self, logger):
+        """Later verifications should start from the saved checkpoint."""
+        self._append(logger, 5)
+        first = logger.verify_chain()
+        assert first["checkpoint_saved"] is True
+        assert first["checkpoint"] is None
+
+        self._append(logger, 3, start=5)
+        second = logger.verify_chain()
+        assert second["valid"] is True
+        assert second["total_entries"] == 3
+        assert second["checkpoint"]["position"] == 5
+
+        third = logger.verify_chain(use_checkpoints=False)
+        assert third["total_entries"] == 8
+
+    def test_tampering_after_checkpoint_detected(self, logger):
+        """Modified entries after the checkpoint should still be reported."""
+        self._append(logger, 3)
+        logger.verify_chain()
+        new_ids = self._append(logger, 2, start=3)
+
+        with logger._get_session() as session:
+            entry = session.query(AuditEntry).filter_by(entry_id=new_ids[1]).one()
+            entry.action = "TAMPERED"
+
+        result = logger.verify_chain()
+        assert result["valid"] is False
+        assert result["invalid_entries"] == [new_ids[1]]
+        assert result["checkpoint_saved"] is False
+
+    def test_forged_checkpoint_ignored(self, logger):
+        """Checkpoints with a bad signature should not be trusted."""
+        self._append(logger, 4)
+        logger.verify_chain()
+
+        with logger._get_session() as session:
+            checkpoint = session.query(AuditCheckpoint).one()
+            checkpoint.position = 100
+
+        result = logger.verify_chain(save_checkpoint=False)
+        assert result["checkpoint"] is None
+        assert result["total_entries"] == 4
+
+    def test_range_starts_from_nearest_checkpoint(self, logger):
+        """Range verification should link to the chain before the range."""
+        self._append(logger, 3)
+        logger.verify_chain()
+        later_ids = self._append(logger, 3, start=3)
+
+        start = datetime.fromisoformat(logger.get_entry(later_ids[0])["timestamp"])
+        result = logger.verify_chain(start_timestamp=start, save_checkpoint=False)
+        assert result["valid"] is True
+        assert result["total_entries"] == 3
+        assert result["checkpoint"]["position"] == 3
+
+    def test_rollback_discards_later_checkpoints(self, logger):
+        """Verification after a rollback should not resume from a removed entry."""
+        ids = self._append(logger, 3)
+        logger.verify_chain()
+        self._append(logger, 2, start=3)
+        logger.verify_chain()
+
+        target_hash = logger.get_entry(ids[1])["entry_hash"]
+        logger.rollback_to_hash(target_hash)
+
+        with logger._get_session() as session:
+            assert session.query(AuditCheckpoint).count() == 0
+
+        resumed = logger.verify_chain(save_checkpoint=False)
+        assert resumed["valid"] is True
+        assert resumed["total_entries"] == 2
+        assert logger.verify_chain(use_checkpoints=False)["valid"] is True
+
+    def test_range_without_checkpoints_is_valid(self, temp_db):
+        """Range verification should not report a break at the range start."""
+        logger = HashChainAuditLogger(database_url=temp_db)
+        entry_ids = self._append(logger, 4)
+
+        start = datetime.fromisoformat(logger.get_entry(entry_ids[2])["timestamp"])
+        result = logger.verify_chain(start_timestamp=start)
+        assert result["valid"] is True
+        assert result["total_entries"] == 2
+        assert result["checkpoint_saved"] is False
+
+
+class TestGroupCommit:
+    """Tests for group-committed appends."""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create temporary database for testing."""
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        yield f"sqlite:///{path}"
+        if os.path.exists(path):
+            os.remove(path)
+
+    @pytest.fixture
+    def logger(self, temp_db):
+        """Create audit logger with small batches."""
+        return HashChainAuditLogger(database_url=temp_db, max_batch_size=16)
+
+    def test_append_entries_preserves_order(self, logger):
+        """Batch appends should chain entries in the order given."""
+        entry_ids = logger.append_entries(
+            [
+                {"action": f"ACTION_{i}", "actor": "user", "resource_type": "stage"}
+                for i in range(40)
+            ]
+        )
+
+        exported = json.loads(logger.export_chain())
+        assert [e["entry_id"] for e in exported] == entry_ids
+        assert logger.verify_chain()["valid"] is True
+
+    def test_concurrent_appends_form_single_chain(self, logger):
+        """Appends from many threads should produce one valid chain."""
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    logger.append_entry(
+                        action="STAGE_EVENT",
+                        actor=f"worker_{n}",
+                        resource_type="stage",
+                        data={"i": i},
+                    )
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        result = logger.verify_chain()
+        assert result["valid"] is True
+        assert result["total_entries"] == 160
+
+    def test_invalid_entry_rejects_batch(self, logger):
+        """Validation should fail before anything is written."""
+        with pytest.raises(ValueError):
+            logger.append_entries(
+                [
+                    {"action": "OK", "actor": "user", "resource_type": "stage"},
+                    {"action": "", "actor": "user", "resource_type": "stage"},
+                ]
+            )
+        assert logger.verify_chain()["total_entries"] == 0
+
+    def test_failed_flush_raises_to_caller(self, logger):
+        """Database errors should propagate and leave the chain intact."""
+        logger.append_entry(action="A", actor="user", resource_type="stage")
+        with pytest.raises(Exception):
+            logger.append_entry(action="B", actor="user", resource_type=None)
+
+        logger.append_entry(action="C", actor="user", resource_type="stage")
+        result = logger.verify_chain()
+        assert result["valid"] is True
+        assert result["total_entries"] == 2
+
+    def test_rollback_moves_tail(self, logger):
+        """Appends after a rollback should chain from the target entry."""
+        entry_ids = logger.append_entries(
+            [{"action": "A", "actor": "user", "resource_type": "stage"}] * 3
+        )
+        target_hash = logger.get_entry(entry_ids[0])["entry_hash"]
+        logger.rollback_to_hash(target_hash)
+
+        logger.append_entry(action="B", actor="user", resource_type="stage")
+        result = logger.verify_chain()
+        assert result["valid"] is True
+        assert result["total_entries"] == 2
+
+    def test_tail_seeded_from_existing_entries(self, logger):
+        """A missing tail row should be rebuilt from the newest entry."""
+        logger.append_entries(
+            [{"action": "A", "actor": "user", "resource_type": "stage"}] * 2
+        )
+        with logger._get_session() as session:
+            session.query(AuditChainTail).delete()
+
+        logger.append_entry(action="B", actor="user", resource_type="stage")
+        assert logger.verify_chain()["valid"] is True
+
+
 class TestModuleSingleton:
     """Tests for module-level singleton."""
 
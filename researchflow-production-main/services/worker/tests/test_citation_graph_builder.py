@@ -0,0 +1,129 @@
+"""
+Tests for the incremental citation graph builder
+
+Tests CitationGraphBuilder:
+- Links resolve by Semantic Scholar paper ID or DOI with one lookup each
+- Links to papers added later are connected when they arrive
+- Repeated papers and links do not duplicate edges or pending entries
+- Unresolved links are capped at max_pending, oldest first
+"""
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("networkx", exc_type=ImportError)
+pytest.importorskip("sklearn", exc_type=ImportError)
+pytest.importorskip("aiohttp", exc_type=ImportError)
+
+# The online_literature package pulls in web_frontend (not installed in the
+# worker image) and src.ros_irb.gate (whose package imports the top-level
+# ros_irb name); neither is used by the builder, so register stubs first.
+_phi_scan = types.ModuleType("web_frontend.phi_scan")
+_phi_scan.scan_text_high_confidence = lambda text: []
+sys.modules.setdefault("web_frontend", types.ModuleType("web_frontend"))
+sys.modules.setdefault("web_frontend.phi_scan", _phi_scan)
+_irb_gate = types.ModuleType("src.ros_irb.gate")
+_irb_gate.require_irb_submission = lambda *args, **kwargs: None
+sys.modules.setdefault("src.ros_irb.gate", _irb_gate)
+
+from src.online_literature.providers.semantic_scholar_enhanced import (  # noqa: E402
+    CitationGraphBuilder,
+    EnhancedPaperMetadata,
+)
+
+
+def _paper(n, references=(), citations=()):
+    return EnhancedPaperMetadata(
+        title=f"Paper {n}",
+        authors=[],
+        year=2020,
+        venue=None,
+        doi=f"10.1000/{n}",
+        url=None,
+        abstract=None,
+        paper_id=f"S2-{n}",
+        references=list(references),
+        citations=list(citations),
+    )
+
+
+class CountingDict(dict):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+
+class TestCitationGraphBuilder:
+    def test_resolves_links_by_paper_id_and_doi(self):
+        builder = CitationGraphBuilder()
+        graph = builder.add_papers([
+            _paper(1),
+            _paper(2, references=["S2-1"]),
+            _paper(3, references=["10.1000/2"], citations=["S2-1"]),
+        ])
+
+        assert set(graph.edges) == {
+            ("10.1000/2", "10.1000/1"),
+            ("10.1000/3", "10.1000/2"),
+            ("10.1000/1", "10.1000/3"),
+        }
+        assert builder.pending_links == 0
+
+    def test_one_lookup_per_link(self):
+        builder = CitationGraphBuilder()
+        builder._node_by_ref = CountingDict()
+        n = 500
+        papers = [
+            _paper(i, references=[f"S2-{j}" for j in range(max(0, i - 3), i)])
+            for i in range(n)
+        ]
+
+        graph = builder.add_papers(papers)
+
+        links = sum(len(p.references) for p in papers)
+        assert builder._node_by_ref.lookups == links
+        assert graph.number_of_edges() == links
+
+    def test_links_resolve_when_target_added_later(self):
+        builder = CitationGraphBuilder()
+        builder.add_papers([_paper(2, references=["S2-1"], citations=["10.1000/3"])])
+        assert builder.pending_links == 2
+
+        graph = builder.add_papers([_paper(1), _paper(3)])
+
+        assert set(graph.edges) == {
+            ("10.1000/2", "10.1000/1"),
+            ("10.1000/3", "10.1000/2"),
+        }
+        assert builder.pending_links == 0
+
+    def test_repeated_papers_are_deduplicated(self):
+        builder = CitationGraphBuilder()
+        paper = _paper(2, references=["S2-1", "S2-1", "S2-9"])
+
+        builder.add_papers([paper])
+        builder.add_papers([paper])
+        graph = builder.add_papers([_paper(1)])
+
+        assert graph.number_of_nodes() == 2
+        assert list(graph.edges) == [("10.1000/2", "10.1000/1")]
+        assert builder.pending_links == 1
+
+    def test_pending_links_are_capped(self):
+        builder = CitationGraphBuilder(max_pending=3)
+
+        builder.add_papers([_paper(0, references=[f"S2-ext-{i}" for i in range(5)])])
+
+        assert builder.pending_links == 3
+        # Oldest unresolved IDs are dropped first
+        graph = builder.add_papers([
+            _paper("ext-0"),
+            _paper("ext-4"),
+        ])
+        assert list(graph.edges) == [("10.1000/0", "10.1000/ext-4")]
+        assert builder.pending_links == 2
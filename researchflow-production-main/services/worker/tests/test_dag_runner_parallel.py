@@ -0,0 +1,203 @@
+"""
+Tests for DAG Runner parallel scheduling
+
+Tests the concurrent scheduler enabled with enable_parallel:
+- Independent branches overlap
+- Concurrency limit is respected
+- Merge nodes wait for every branch
+- Checkpoint/resume skips completed nodes
+"""
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.workflow_engine.dag_compiler import CompiledStep, CompiledWorkflow
+from src.workflow_engine.dag_runner import DAGRunner, RunState
+from src.workflow_engine.types import StageContext, StageResult
+
+
+class _Tracker:
+    """Records stage start/finish order and peak concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.events = []
+
+
+def _make_stage_class(tracker: _Tracker, delay: float = 0.05):
+    class _SleepStage:
+        stage_id = 0
+        stage_name = "sleep"
+
+        async def execute(self, context: StageContext) -> StageResult:
+            node_id = context.metadata["node_id"]
+            tracker.active += 1
+            tracker.peak = max(tracker.peak, tracker.active)
+            tracker.events.append(("start", node_id))
+            await asyncio.sleep(delay)
+            tracker.events.append(("end", node_id))
+            tracker.active -= 1
+            now = datetime.utcnow().isoformat()
+            return StageResult(
+                stage_id=context.config.get("stage_id", 0),
+                stage_name=node_id,
+                status="completed",
+                started_at=now,
+                completed_at=now,
+                duration_ms=int(delay * 1000),
+            )
+
+    return _SleepStage
+
+
+@pytest.fixture
+def fan_out_workflow() -> CompiledWorkflow:
+    """split -> (a, b, c) -> join -> final"""
+    branches = ["a", "b", "c"]
+    steps = [CompiledStep(node_id="split", node_type="parallel", label="Split")]
+    for i, node_id in enumerate(branches, start=1):
+        steps.append(
+            CompiledStep(
+                node_id=node_id,
+                node_type="stage",
+                label=node_id,
+                stage_id=i,
+                depends_on=["split"],
+                parallel_group="split",
+            )
+        )
+    steps.append(
+        CompiledStep(node_id="join", node_type="merge", label="Join", depends_on=branches)
+    )
+    steps.append(
+        CompiledStep(
+            node_id="final", node_type="stage", label="final", stage_id=9, depends_on=["join"]
+        )
+    )
+    return CompiledWorkflow(
+        workflow_id="wf_parallel", version=1, steps=steps, entry_node_id="split"
+    )
+
+
+@pytest.fixture
+def context() -> StageContext:
+    return StageContext(job_id="job_parallel", config={})
+
+
+class TestParallelScheduling:
+    """Test concurrent execution of independent nodes."""
+
+    @pytest.mark.asyncio
+    async def test_branches_overlap(self, fan_out_workflow, context):
+        tracker = _Tracker()
+        runner = DAGRunner(enable_parallel=True, max_concurrency=4)
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker),
+        ):
+            state = await runner.run(fan_out_workflow, context)
+
+        assert state.status == "completed"
+        assert tracker.peak == 3
+        assert set(state.completed_nodes) == {"split", "a", "b", "c", "join", "final"}
+        assert state.running_nodes == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self, fan_out_workflow, context):
+        tracker = _Tracker()
+        runner = DAGRunner(enable_parallel=True, max_concurrency=2)
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker),
+        ):
+            state = await runner.run(fan_out_workflow, context)
+
+        assert state.status == "completed"
+        assert tracker.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_merge_waits_for_all_branches(self, fan_out_workflow, context):
+        tracker = _Tracker()
+        runner = DAGRunner(enable_parallel=True, max_concurrency=4)
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker),
+        ):
+            state = await runner.run(fan_out_workflow, context)
+
+        join_index = state.completed_nodes.index("join")
+        for branch in ("a", "b", "c"):
+            assert state.completed_nodes.index(branch) < join_index
+        assert ("start", "final") == tracker.events[-2]
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_disabled(self, fan_out_workflow, context):
+        tracker = _Tracker()
+        runner = DAGRunner(enable_parallel=False)
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker, delay=0.01),
+        ):
+            state = await runner.run(fan_out_workflow, context)
+
+        assert state.status == "completed"
+        assert tracker.peak == 1
+
+    def test_invalid_concurrency_rejected(self):
+        with pytest.raises(ValueError):
+            DAGRunner(enable_parallel=True, max_concurrency=0)
+
+
+class TestParallelCheckpointing:
+    """Test checkpoint and resume semantics under parallel execution."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_called_per_node(self, fan_out_workflow, context):
+        snapshots = []
+
+        async def checkpoint(state: RunState):
+            snapshots.append(list(state.completed_nodes))
+
+        tracker = _Tracker()
+        runner = DAGRunner(
+            enable_parallel=True, max_concurrency=4, checkpoint_callback=checkpoint
+        )
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker),
+        ):
+            await runner.run(fan_out_workflow, context)
+
+        assert len(snapshots) == 6
+        assert snapshots[-1][-1] == "final"
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed(self, fan_out_workflow, context):
+        checkpoint = RunState(
+            run_id="job_parallel",
+            workflow_id="wf_parallel",
+            workflow_version=1,
+            completed_nodes=["split", "a"],
+            running_nodes=["b"],
+        )
+        tracker = _Tracker()
+        runner = DAGRunner(enable_parallel=True, max_concurrency=4)
+
+        with patch(
+            "src.workflow_engine.dag_runner.get_stage",
+            return_value=_make_stage_class(tracker),
+        ):
+            state = await runner.run(fan_out_workflow, context, checkpoint=checkpoint)
+
+        started = [node_id for kind, node_id in tracker.events if kind == "start"]
+        assert "a" not in started
+        assert sorted(started) == ["b", "c", "final"]
+        assert state.status == "completed"
@@ -0,0 +1,96 @@
+"""
+Tests for vectorized longitudinal lab aggregation in FeatureEngineer.
+
+Uses small synthetic wide lab tables (no real PHI) and checks the per-patient
+statistics, the merge of thyroglobulin onto anti-Tg rows, and that the
+feature schema matches the per-patient dict layout.
+"""
+
+import pandas as pd
+import pytest
+
+from src.marts.feature_engineering import FeatureEngineer
+
+
+def _wide(ids, results, dates):
+    """Wide lab table; results and dates hold one per-patient list per labN slot."""
+    data = {"research_id_number": ids}
+    for slot, (slot_results, slot_dates) in enumerate(zip(results, dates), start=1):
+        data[f"lab{slot}_result"] = slot_results
+        data[f"lab{slot}_specimen_collect_dt"] = pd.to_datetime(slot_dates)
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def engineer(tmp_path):
+    fe = FeatureEngineer(interim_dir=tmp_path, output_dir=tmp_path / "marts")
+    fe.datasets = {"anti_tg": None, "thyroglobulin": None}
+    return fe
+
+
+class TestAggregateLabs:
+    def test_statistics_per_patient(self, engineer):
+        engineer.datasets["anti_tg"] = _wide(
+            ["001", "002", "003"],
+            results=[["<2", "4", "x"], ["abc", None, None], ["4", None, "y"]],
+            dates=[
+                ["2020-01-01", "2020-03-01", None],
+                ["2020-02-01", None, None],
+                ["2020-03-01", None, None],
+            ],
+        )
+
+        labs = engineer.aggregate_labs()
+
+        # Patient 3 has no parseable results; patient 1 has two values
+        assert labs["research_id"].tolist() == ["1", "2"]
+        row = labs.iloc[0]
+        assert row["anti_tg_count"] == 2
+        assert row["anti_tg_first"] == 2.0 and row["anti_tg_last"] == 4.0
+        assert row["anti_tg_mean"] == pytest.approx(3.0)
+        assert row["anti_tg_std"] == pytest.approx(1.0)
+        assert row["anti_tg_trend"] == 2.0
+        assert row["anti_tg_trend_pct"] == pytest.approx(100.0)
+        assert row["anti_tg_timespan_days"] == 60
+        # Patient 2 has a single value and a single date
+        assert labs.iloc[1]["anti_tg_count"] == 1
+        assert pd.isna(labs.iloc[1]["anti_tg_trend"])
+        assert pd.isna(labs.iloc[1]["anti_tg_timespan_days"])
+
+    def test_thyroglobulin_merged_by_normalized_id(self, engineer):
+        engineer.datasets["anti_tg"] = _wide(
+            ["7", "8"], results=[["1", "2"]], dates=[[None, None]],
+        )
+        engineer.datasets["thyroglobulin"] = _wide(
+            ["007", "9"], results=[["0", "5"], ["3", "6"]], dates=[[None, None], [None, None]],
+        )
+
+        labs = engineer.aggregate_labs()
+
+        assert labs["research_id"].tolist() == ["7", "8", "9"]
+        assert labs.loc[0, "thyroglobulin_last"] == 3.0
+        # A zero baseline reports a 0% trend instead of dividing by zero
+        assert labs.loc[0, "thyroglobulin_trend_pct"] == 0
+        assert pd.isna(labs.loc[1, "thyroglobulin_mean"])
+        assert pd.isna(labs.loc[2, "anti_tg_mean"])
+        assert labs.loc[2, "thyroglobulin_mean"] == pytest.approx(5.5)
+
+    def test_schema_follows_first_appearance(self, engineer):
+        engineer.datasets["anti_tg"] = _wide(
+            ["1"], results=[["5"]], dates=[[None]],
+        )
+        engineer.datasets["thyroglobulin"] = _wide(
+            ["1"], results=[["5"], ["6"]], dates=[[None], [None]],
+        )
+
+        labs = engineer.aggregate_labs()
+
+        stats = ["mean", "median", "min", "max", "std", "count", "first", "last"]
+        assert list(labs.columns) == (
+            ["research_id"]
+            + [f"anti_tg_{s}" for s in stats]
+            + [f"thyroglobulin_{s}" for s in stats + ["trend", "trend_pct"]]
+        )
+
+    def test_no_lab_tables(self, engineer):
+        assert engineer.aggregate_labs().empty
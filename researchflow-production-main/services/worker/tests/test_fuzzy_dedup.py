@@ -0,0 +1,157 @@
+"""
+Tests for blocked fuzzy deduplication
+
+Verifies that cdist-based scoring reproduces the pairwise greedy grouping,
+that exact-match columns partition records, and that the phonetic, n-gram
+and sorted-neighbourhood blocking strategies only compare candidates.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from rapidfuzz import fuzz
+
+import src.dedup.fuzzy_dedup as fuzzy_dedup
+from src.dedup.fuzzy_dedup import DedupConfig, FuzzyDeduplicator, soundex
+
+
+def _pairwise_groups(records, config):
+    """Reference: the original all-pairs greedy grouping."""
+    sim = getattr(fuzz, config.algorithm)
+    ids = [r["id"] for r in records]
+    strings = {
+        r["id"]: " ".join(str(r[c]).lower() for c in config.match_columns if r.get(c))
+        for r in records
+    }
+    by_id = {r["id"]: r for r in records}
+    processed = set()
+    groups = []
+    for i, id1 in enumerate(ids):
+        if id1 in processed:
+            continue
+        members = []
+        for id2 in ids[i + 1:]:
+            if id2 in processed:
+                continue
+            if config.exact_match_columns and any(
+                by_id[id1].get(c) != by_id[id2].get(c) for c in config.exact_match_columns
+            ):
+                continue
+            if sim(strings[id1], strings[id2]) / 100.0 >= config.threshold:
+                members.append(id2)
+                processed.add(id2)
+        if members:
+            groups.append((id1, members))
+        processed.add(id1)
+    return groups
+
+
+@pytest.fixture
+def registry_records():
+    """Synthetic registry rows with typo'd duplicates - no real PHI."""
+    rng = random.Random(7)
+    names = ["john smith", "jane doe", "robert brown", "maria garcia", "li wei"]
+
+    def typo(text):
+        chars = list(text)
+        for _ in range(rng.randint(0, 2)):
+            chars[rng.randrange(len(chars))] = rng.choice("abcdefgh")
+        return "".join(chars)
+
+    return [
+        {"id": f"r{i}", "name": typo(rng.choice(names)), "site": rng.choice([1, 2, 3])}
+        for i in range(300)
+    ]
+
+
+def _groups(result):
+    return [(g.master_id, g.duplicate_ids) for g in result.duplicate_groups]
+
+
+class TestBlockedDedup:
+    @pytest.mark.parametrize("exact", [None, ["site"]])
+    def test_matches_pairwise_reference(self, registry_records, exact):
+        config = DedupConfig(match_columns=["name"], exact_match_columns=exact)
+        result = FuzzyDeduplicator(config).deduplicate(registry_records, save_artifact=False)
+
+        assert _groups(result) == _pairwise_groups(registry_records, config)
+
+    def test_tiling_does_not_change_result(self, registry_records, monkeypatch):
+        config = DedupConfig(match_columns=["name"])
+        expected = FuzzyDeduplicator(config).deduplicate(registry_records, save_artifact=False)
+
+        monkeypatch.setattr(fuzzy_dedup, "_TILE_CELLS", 1000)
+        tiled = FuzzyDeduplicator(config).deduplicate(registry_records, save_artifact=False)
+
+        assert _groups(tiled) == _groups(expected)
+
+    def test_exact_columns_partition(self):
+        records = [
+            {"id": "a", "name": "john smith", "site": 1},
+            {"id": "b", "name": "john smith", "site": 2},
+            {"id": "c", "name": "jon smith", "site": 1},
+        ]
+        config = DedupConfig(match_columns=["name"], exact_match_columns=["site"])
+        result = FuzzyDeduplicator(config).deduplicate(records, save_artifact=False)
+
+        assert _groups(result) == [("a", ["c"])]
+
+    @pytest.mark.parametrize("blocking", ["phonetic", "ngram"])
+    def test_key_blocking_only_compares_within_block(self, blocking):
+        records = [
+            {"id": "a", "name": "smith john"},
+            {"id": "b", "name": "smyth john"},
+            {"id": "c", "name": "jones john"},
+        ]
+        config = DedupConfig(match_columns=["name"], threshold=0.5, blocking=blocking)
+        result = FuzzyDeduplicator(config).deduplicate(records, save_artifact=False)
+
+        if blocking == "phonetic":
+            # smith/smyth share S530; jones is never compared
+            assert _groups(result) == [("a", ["b"])]
+        else:
+            # "smi" != "smy", so nothing shares a block
+            assert _groups(result) == []
+
+    def test_sorted_neighborhood_window(self):
+        records = [{"id": f"r{i}", "name": f"patient {i:03d}"} for i in range(50)]
+        records.append({"id": "dup", "name": "patient 010"})
+        config = DedupConfig(
+            match_columns=["name"],
+            threshold=0.99,
+            blocking="sorted_neighborhood",
+            window_size=2,
+        )
+        result = FuzzyDeduplicator(config).deduplicate(records, save_artifact=False)
+
+        # The duplicate sorts next to its twin even though it is last in input
+        assert _groups(result) == [("r10", ["dup"])]
+        assert result.unique_count == 50
+
+    def test_unknown_blocking_is_an_error(self):
+        config = DedupConfig(match_columns=["name"], blocking="lsh")
+        result = FuzzyDeduplicator(config).deduplicate([{"id": "a", "name": "x"}])
+
+        assert not result.success
+        assert "Unknown blocking strategy" in result.errors[0]
+
+
+class TestSoundex:
+    @pytest.mark.parametrize(
+        "name, code",
+        [
+            ("Robert", "R163"),
+            ("Rupert", "R163"),
+            ("Ashcraft", "A261"),
+            ("Tymczak", "T522"),
+            ("Pfister", "P236"),
+            ("Lee", "L000"),
+            ("O'Brien", "O165"),
+            ("Smith-Jones", "S532"),
+            ("", ""),
+        ],
+    )
+    def test_codes(self, name, code):
+        assert soundex(name) == code
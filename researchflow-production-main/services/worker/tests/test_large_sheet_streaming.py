@@ -0,0 +1,168 @@
+"""
+Tests for the streaming LargeSheetPipeline.
+
+Covers the producer/consumer extraction loop: concurrency stays saturated
+around slow calls, the task queue bounds how far detection runs ahead, and
+results are checkpointed per chunk with the chunk's real row range.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from data_extraction.checkpoints import CheckpointReader, read_jsonl
+from data_extraction.config import LargeSheetConfig
+from data_extraction.large_sheet_pipeline import LargeSheetPipeline
+from data_extraction.text_dedup import ExtractionResultStore
+
+
+NOTE_TEMPLATE = """HPI: Patient {i} presents for follow-up of hypertension.
+ROS: Denies chest pain, reports mild fatigue over the past week.
+Assessment and Plan: Continue current medications, recheck labs in 3 months."""
+
+
+@pytest.fixture
+def notes_csv(tmp_path) -> Path:
+    """50 rows, each with a distinct block-text note."""
+    rows = 50
+    df = pd.DataFrame({
+        "age": list(range(rows)),
+        "clinical_notes": [NOTE_TEMPLATE.format(i=i) for i in range(rows)],
+    })
+    path = tmp_path / "notes.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _config(**overrides) -> LargeSheetConfig:
+    values = {"chunk_rows": 10, "llm_concurrency": 4, "output_format": "jsonl"}
+    values.update(overrides)
+    return LargeSheetConfig(**values)
+
+
+async def _ok(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    await asyncio.sleep(0)
+    return {"extraction": {"row": metadata["row_idx"]}, "success": True}
+
+
+class TestStreamingPipeline:
+    @pytest.mark.asyncio
+    async def test_slow_call_does_not_stall_others(self, notes_csv, tmp_path):
+        in_flight = 0
+        peak = 0
+        done_during_slow = 0
+        slow_running = False
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal in_flight, peak, done_during_slow, slow_running
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if metadata["row_idx"] == 0:
+                slow_running = True
+                await asyncio.sleep(0.2)
+                slow_running = False
+            else:
+                await asyncio.sleep(0.005)
+                if slow_running:
+                    done_during_slow += 1
+            in_flight -= 1
+            return {"extraction": {}, "success": True}
+
+        pipeline = LargeSheetPipeline("job_slow", tmp_path / "out", config=_config())
+        result = await pipeline.run(notes_csv, extract)
+
+        assert result.success
+        assert result.completed_tasks == 50
+        assert peak == 4
+        # The other three slots kept working through the rest of the sheet
+        assert done_during_slow > 20
+
+    @pytest.mark.asyncio
+    async def test_queue_bounds_detection_lookahead(self, notes_csv, tmp_path):
+        release = asyncio.Event()
+        pipeline = LargeSheetPipeline(
+            "job_bounded",
+            tmp_path / "out",
+            config=_config(llm_concurrency=1, llm_queue_size=2),
+        )
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            await release.wait()
+            return {"extraction": {}, "success": True}
+
+        run = asyncio.create_task(pipeline.run(notes_csv, extract))
+        await asyncio.sleep(0.2)
+        # Only the first chunk has been detected while the worker is blocked
+        assert pipeline._total_task_count == 10
+
+        release.set()
+        result = await run
+        assert result.total_tasks == 50
+
+    @pytest.mark.asyncio
+    async def test_row_accurate_result_checkpoints(self, notes_csv, tmp_path):
+        out = tmp_path / "out"
+        pipeline = LargeSheetPipeline("job_rows", out, config=_config())
+        await pipeline.run(notes_csv, _ok)
+
+        result_files = sorted((out / "results").glob("results_*.jsonl"))
+        assert len(result_files) == 5
+        for chunk_index, path in enumerate(result_files):
+            items = list(read_jsonl(path))
+            meta = items[0]["_metadata"]
+            assert meta["chunk_index"] == chunk_index
+            assert (meta["row_start"], meta["row_end"]) == (
+                chunk_index * 10, chunk_index * 10 + 9,
+            )
+            rows = [r["row_idx"] for r in items[1:]]
+            assert rows == list(range(meta["row_start"], meta["row_end"] + 1))
+
+        manifest = json.loads((out / "manifest.json").read_text())
+        assert manifest["total_results"] == 50
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_checkpointed_chunks(self, notes_csv, tmp_path):
+        out = tmp_path / "out"
+        await LargeSheetPipeline(
+            "job_resume", out, config=_config(),
+            result_store=ExtractionResultStore(tmp_path / "first.sqlite"),
+        ).run(notes_csv, _ok)
+
+        # Simulate a crash after the first two chunks were checkpointed
+        (out / "manifest.json").unlink()
+        for path in (out / "results").glob("results_*.jsonl"):
+            if int(path.stem.split("_")[1]) >= 2:
+                path.unlink()
+
+        seen_rows = []
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            seen_rows.append(metadata["row_idx"])
+            return {"extraction": {}, "success": True}
+
+        # Fresh result store so only checkpoints can explain skipped rows
+        result = await LargeSheetPipeline(
+            "job_resume", out, config=_config(),
+            result_store=ExtractionResultStore(tmp_path / "second.sqlite"),
+        ).run(notes_csv, extract)
+
+        assert result.success
+        assert sorted(seen_rows) == list(range(20, 50))
+        assert CheckpointReader(out).get_completed_partitions() == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_failure_stops_pipeline(self, notes_csv, tmp_path):
+        pipeline = LargeSheetPipeline("job_fail", tmp_path / "out", config=_config())
+
+        def broken_write(**kwargs):
+            raise OSError("disk full")
+
+        pipeline.checkpoint_writer.write_results = broken_write
+        result = await asyncio.wait_for(pipeline.run(notes_csv, _ok), timeout=5)
+
+        assert not result.success
+        assert "disk full" in result.errors[0]
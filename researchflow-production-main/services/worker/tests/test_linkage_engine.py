@@ -0,0 +1,132 @@
+"""
+Tests for the merge_asof linkage core.
+
+Checks the nearest-within-tolerance join against a per-patient cartesian
+reference, and that chunking by patient partition and vectorized linkage
+IDs do not change the result.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.linkage.linkage_engine import (
+    create_linkage_id,
+    create_linkage_ids,
+    link_ct_to_pathology,
+    link_fna_to_pathology,
+    link_nearest_events,
+)
+
+
+def _cartesian_reference(ct_df, pathology_df, tolerance_days):
+    """The original merge-then-filter linkage, with ties to the earlier surgery."""
+    merged = ct_df.merge(pathology_df, on="research_id")
+    merged["abs_days_gap"] = (merged["surgery_date"] - merged["ct_date"]).dt.days.abs()
+    merged = merged[merged["abs_days_gap"] <= tolerance_days]
+    merged = merged.sort_values(["ct_id", "abs_days_gap", "surgery_date"])
+    best = merged.groupby("ct_id").first()
+    return dict(zip(best.index, best["pathology_id"]))
+
+
+@pytest.fixture
+def imaging_history():
+    """Synthetic patients with many CTs and a few surgeries each - no real PHI."""
+    rng = np.random.default_rng(11)
+    base = pd.Timestamp("2015-01-01")
+    ct_patients = rng.integers(0, 60, size=2000)
+    path_patients = rng.integers(0, 60, size=150)
+    ct_df = pd.DataFrame({
+        "research_id": [f"P{p:03d}" for p in ct_patients],
+        "ct_id": [f"CT{i:05d}" for i in range(len(ct_patients))],
+        "ct_date": base + pd.to_timedelta(rng.integers(0, 3000, size=len(ct_patients)), unit="D"),
+    })
+    pathology_df = pd.DataFrame({
+        "research_id": [f"P{p:03d}" for p in path_patients],
+        "pathology_id": [f"PATH{i:04d}" for i in range(len(path_patients))],
+        "surgery_date": base + pd.to_timedelta(rng.integers(0, 3000, size=len(path_patients)), unit="D"),
+    })
+    return ct_df, pathology_df
+
+
+class TestNearestLinkage:
+    def test_matches_cartesian_reference(self, imaging_history):
+        ct_df, pathology_df = imaging_history
+
+        linkage = link_ct_to_pathology(ct_df, pathology_df, tolerance_days=90)
+
+        expected = _cartesian_reference(ct_df, pathology_df, 90)
+        assert dict(zip(linkage["ct_id"], linkage["pathology_id"])) == expected
+        assert linkage["ct_id"].is_monotonic_increasing
+        assert linkage["abs_days_gap"].max() <= 90
+        assert linkage["within_tolerance"].all()
+
+    @pytest.mark.parametrize("chunk_patients", [1, 7, 1000])
+    def test_patient_chunks_do_not_change_result(self, imaging_history, chunk_patients):
+        ct_df, pathology_df = imaging_history
+
+        whole = link_ct_to_pathology(ct_df, pathology_df)
+        chunked = link_ct_to_pathology(ct_df, pathology_df, chunk_patients=chunk_patients)
+
+        pd.testing.assert_frame_equal(chunked, whole)
+
+    def test_invalid_chunk_size(self, imaging_history):
+        ct_df, pathology_df = imaging_history
+
+        with pytest.raises(ValueError, match="chunk_patients"):
+            link_ct_to_pathology(ct_df, pathology_df, chunk_patients=0)
+
+    def test_schema_and_confidence(self):
+        fna_df = pd.DataFrame({
+            "research_id": ["P1", "P1", "P2", "P3"],
+            "fna_id": ["F1", "F2", "F3", "F4"],
+            "fna_date": pd.to_datetime(["2020-01-01", "2020-03-01", "2020-01-10", None]),
+        })
+        pathology_df = pd.DataFrame({
+            "research_id": ["P1", "P2", "P3"],
+            "pathology_id": ["S1", "S2", "S3"],
+            "surgery_date": pd.to_datetime(["2020-01-08", "2020-02-10", "2020-01-01"]),
+        })
+
+        linkage = link_fna_to_pathology(fna_df, pathology_df)
+
+        # F2 and F3 are outside ±14 days; F4 has no date
+        assert linkage["fna_id"].tolist() == ["F1"]
+        row = linkage.iloc[0]
+        assert row["days_gap"] == 7
+        assert row["link_confidence"] == pytest.approx(0.5)
+        assert row["linkage_id"] == create_linkage_id("F1", "S1", "fna_biopsy", "pathology")
+        assert list(linkage.columns) == [
+            "linkage_id", "fna_id", "pathology_id", "research_id", "fna_date",
+            "surgery_date", "days_gap", "abs_days_gap", "within_tolerance",
+            "link_confidence",
+        ]
+
+    def test_no_links_returns_empty_frame(self):
+        source = pd.DataFrame({
+            "research_id": [1], "event_id": ["E1"],
+            "event_date": pd.to_datetime(["2020-01-01"]),
+        })
+        target = pd.DataFrame({
+            "research_id": [2], "pathology_id": ["S1"],
+            "target_date": pd.to_datetime(["2020-01-01"]),
+        })
+
+        linkage = link_nearest_events(
+            source, target, "event_id", "pathology_id", "ultrasound", "pathology",
+        )
+
+        assert linkage.empty
+
+
+def test_vectorized_linkage_ids():
+    source_ids = pd.Series(["CT1", "CT2", 3], index=[10, 11, 12])
+    target_ids = pd.Series(["S1", "S2", 4], index=[0, 1, 2])
+
+    ids = create_linkage_ids(source_ids, target_ids, "ct_scan", "pathology")
+
+    assert list(ids.index) == [10, 11, 12]
+    assert ids.tolist() == [
+        create_linkage_id(s, t, "ct_scan", "pathology")
+        for s, t in zip(source_ids, target_ids)
+    ]
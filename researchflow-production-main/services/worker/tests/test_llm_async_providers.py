@@ -0,0 +1,186 @@
+"""
+Tests for the async, connection-pooled LLM provider path.
+
+The network is replaced with httpx.MockTransport; no API keys or real
+endpoints are used.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.llm.providers.anthropic_provider import AnthropicProvider
+from src.llm.providers.http_pool import ProviderPool, RetryPolicy, runtime_config
+from src.llm.providers.openai_provider import OpenAIProvider
+from src.llm.router import agenerate_text, generate_text
+
+
+def _completion(text="ok"):
+    return {
+        "id": "cmpl-1",
+        "choices": [{"message": {"content": text}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2},
+    }
+
+
+@pytest.fixture
+def online(monkeypatch):
+    monkeypatch.setenv("NO_NETWORK", "0")
+    monkeypatch.setenv("MOCK_ONLY", "0")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://llm.test/v1")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+
+def _pool(handler, **retry):
+    retry = {"base_delay": 0.0, **retry}
+    return ProviderPool(retry=RetryPolicy(**retry), transport=httpx.MockTransport(handler))
+
+
+class TestProviderPool:
+    async def test_openai_request_and_parse(self, online):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=_completion("hello"))
+
+        provider = OpenAIProvider(pool=_pool(handler))
+        result = await provider.agenerate_text(
+            prompt="hi", system_prompt="be brief", model="gpt-test", max_tokens=10
+        )
+
+        assert result.text == "hello"
+        assert result.usage.input_tokens == 5
+        assert result.raw_meta == {"finish_reason": "stop"}
+        assert str(seen[0].url) == "https://llm.test/v1/chat/completions"
+        assert seen[0].headers["authorization"] == "Bearer test-key"
+        body = json.loads(seen[0].content)
+        assert body["messages"][0] == {"role": "system", "content": "be brief"}
+        assert body["max_tokens"] == 10
+
+    async def test_client_shared_across_calls(self, online):
+        pool = _pool(lambda request: httpx.Response(200, json=_completion()))
+        provider = OpenAIProvider(pool=pool)
+
+        await provider.agenerate_text(prompt="a", model="m")
+        client = pool.client("openai")
+        await provider.agenerate_text(prompt="b", model="m")
+
+        assert pool.client("openai") is client
+        await pool.aclose()
+        assert client.is_closed
+
+    async def test_retries_429_then_succeeds(self, online):
+        statuses = iter([429, 503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            if status != 200:
+                return httpx.Response(status, headers={"retry-after": "0"})
+            return httpx.Response(200, json=_completion("third time"))
+
+        result = await OpenAIProvider(pool=_pool(handler)).agenerate_text(
+            prompt="x", model="m"
+        )
+
+        assert result.text == "third time"
+
+    async def test_gives_up_after_max_retries(self, online):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={"error": {"message": "overloaded"}})
+
+        provider = OpenAIProvider(pool=_pool(handler, max_retries=2))
+        with pytest.raises(RuntimeError, match=r"OpenAI API error \(HTTP 503\): overloaded"):
+            await provider.agenerate_text(prompt="x", model="m")
+
+        assert len(calls) == 3
+
+    async def test_client_errors_not_retried(self, online):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"error": {"message": "bad model"}})
+
+        with pytest.raises(RuntimeError, match="bad model"):
+            await OpenAIProvider(pool=_pool(handler)).agenerate_text(prompt="x", model="m")
+
+        assert len(calls) == 1
+
+    async def test_transport_errors_retried(self, online):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("reset", request=request)
+            return httpx.Response(200, json=_completion())
+
+        result = await OpenAIProvider(pool=_pool(handler)).agenerate_text(prompt="x", model="m")
+
+        assert result.text == "ok" and len(attempts) == 2
+
+    async def test_per_provider_concurrency_limit(self, online, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY_OPENAI", "2")
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=_completion())
+
+        provider = OpenAIProvider(pool=_pool(handler))
+        await asyncio.gather(*[provider.agenerate_text(prompt=str(i), model="m") for i in range(8)])
+
+        assert peak == 2
+
+    async def test_anthropic_blocks_joined(self, online):
+        def handler(request):
+            assert request.headers["x-api-key"] == "test-key"
+            return httpx.Response(200, json={
+                "id": "msg-1",
+                "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}],
+                "usage": {"input_tokens": 3, "output_tokens": 1},
+                "stop_reason": "end_turn",
+            })
+
+        result = await AnthropicProvider(pool=_pool(handler)).agenerate_text(
+            prompt="x", model="claude-test"
+        )
+
+        assert result.text == "ab"
+        assert result.raw_meta == {"stop_reason": "end_turn"}
+
+    async def test_network_gating_fails_closed(self, online, monkeypatch):
+        monkeypatch.setenv("NO_NETWORK", "1")
+
+        def handler(request):
+            raise AssertionError("request should not be sent")
+
+        with pytest.raises(RuntimeError, match="fail-closed"):
+            await OpenAIProvider(pool=_pool(handler)).agenerate_text(prompt="x", model="m")
+
+
+def test_runtime_config_tracks_env(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    first = runtime_config()
+    assert runtime_config() is first
+
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+    assert runtime_config().llm_provider == "anthropic"
+
+
+async def test_router_async_matches_sync_in_mock_mode(monkeypatch):
+    monkeypatch.setenv("AI_BRIDGE_PROVIDER_MODE", "mock")
+    kwargs = dict(task_name="t", prompt="summarize", system_prompt=None, model="m")
+
+    assert await agenerate_text(**kwargs) == generate_text(**kwargs)
@@ -0,0 +1,204 @@
+"""
+Tests for the LLM completion cache and its use in the router.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.llm import cache as cache_module
+from src.llm import router
+from src.llm.cache import (
+    CompletionCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    canonical_prompt,
+)
+from src.llm.providers.base import LLMResult, LLMUsage
+
+
+def _result(text="answer"):
+    return LLMResult(
+        text=text, provider="openai", model="gpt-test",
+        usage=LLMUsage(input_tokens=10, output_tokens=4),
+        request_id="req-1", raw_meta={"finish_reason": "stop"},
+    )
+
+
+def _call(**overrides):
+    kwargs = dict(
+        provider="openai", model="gpt-test", prompt="Summarize the guideline.",
+        system_prompt="You are concise.", temperature=0.0, max_tokens=400,
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(max_entries=3)
+    return SQLiteCacheBackend(tmp_path / "cache.db", max_entries=3)
+
+
+class TestCompletionCache:
+    def test_exact_hit_roundtrip(self, backend):
+        cache = CompletionCache(backend=backend)
+        assert cache.get(**_call()) is None
+
+        cache.put(_result(), **_call())
+        hit = cache.get(**_call(prompt="Summarize the guideline.  \r\n"))
+
+        assert hit.text == "answer"
+        assert hit.usage == LLMUsage(input_tokens=10, output_tokens=4)
+        assert hit.raw_meta == {"finish_reason": "stop", "cache": "exact"}
+        assert cache.get_stats()["hits"] == 1
+        assert cache.hit_rate == pytest.approx(0.5)
+
+    @pytest.mark.parametrize("change", [
+        {"provider": "anthropic"}, {"model": "gpt-other"}, {"max_tokens": 500},
+        {"temperature": 0.1}, {"system_prompt": "Be verbose."}, {"prompt": "Other."},
+    ])
+    def test_key_covers_parameters(self, backend, change):
+        cache = CompletionCache(backend=backend)
+        cache.put(_result(), **_call())
+
+        assert cache.get(**_call(**change)) is None
+
+    def test_ttl_expiry(self, backend):
+        cache = CompletionCache(backend=backend, ttl_seconds=-1)
+        cache.put(_result(), **_call())
+
+        assert cache.get(**_call()) is None
+
+    def test_lru_eviction(self, backend):
+        cache = CompletionCache(backend=backend)
+        for i in range(3):
+            cache.put(_result(str(i)), **_call(prompt=f"p{i}"))
+        cache.get(**_call(prompt="p0"))  # refresh p0
+
+        cache.put(_result("3"), **_call(prompt="p3"))
+
+        assert cache.get(**_call(prompt="p1")) is None
+        assert cache.get(**_call(prompt="p0")).text == "0"
+        assert cache.stats["evictions"] == 1
+        assert len(backend) == 3
+
+    def test_semantic_hit(self, backend):
+        vectors = {
+            "summarize the guideline": [1.0, 0.0, 0.1],
+            "please summarize the guideline": [0.99, 0.0, 0.12],
+            "list drug interactions": [0.0, 1.0, 0.0],
+        }
+        cache = CompletionCache(
+            backend=backend, embed_fn=lambda text: vectors[text], similarity_threshold=0.95,
+        )
+        cache.put(_result(), **_call(prompt="summarize the guideline"))
+
+        hit = cache.get(**_call(prompt="please summarize the guideline"))
+        miss = cache.get(**_call(prompt="list drug interactions"))
+
+        assert hit.raw_meta["cache"] == "semantic"
+        assert miss is None
+        assert cache.stats["semantic_hits"] == 1
+
+    def test_sqlite_persists_across_instances(self, tmp_path):
+        CompletionCache(backend=SQLiteCacheBackend(tmp_path / "c.db")).put(_result(), **_call())
+
+        reopened = CompletionCache(backend=SQLiteCacheBackend(tmp_path / "c.db"))
+
+        assert reopened.get(**_call()).text == "answer"
+
+
+def test_canonical_prompt():
+    assert canonical_prompt("a  \r\nb\r\n\n") == "a\nb"
+    assert canonical_prompt(None) == ""
+
+
+@dataclass
+class CountingProvider:
+    name: str = "openai"
+    calls: list = field(default_factory=list)
+
+    def generate_text(self, *, prompt, system_prompt=None, model, temperature=0.2, max_tokens=800):
+        self.calls.append(prompt)
+        return _result(f"live {len(self.calls)}")
+
+    async def agenerate_text(self, **kwargs):
+        return self.generate_text(**kwargs)
+
+
+class TestRouterCache:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        monkeypatch.setenv("AI_BRIDGE_PROVIDER_MODE", "real")
+        provider = CountingProvider()
+        monkeypatch.setattr(router, "_real_provider", lambda: provider)
+        monkeypatch.setattr(cache_module, "_cache", CompletionCache())
+        return provider
+
+    def _generate(self, **overrides):
+        kwargs = dict(task_name="t", prompt="p", system_prompt=None, model="m", temperature=0.0)
+        kwargs.update(overrides)
+        return router.generate_text(**kwargs)
+
+    def test_deterministic_calls_cached(self, provider):
+        first = self._generate()
+        second = self._generate()
+
+        assert len(provider.calls) == 1
+        assert second.text == first.text
+        assert second.raw_meta["cache"] == "exact"
+
+    def test_sampled_calls_bypass_cache(self, provider):
+        self._generate(temperature=0.7)
+        self._generate(temperature=0.7)
+
+        assert len(provider.calls) == 2
+
+    async def test_async_path_shares_cache(self, provider):
+        self._generate()
+
+        result = await router.agenerate_text(
+            task_name="t", prompt="p", system_prompt=None, model="m", temperature=0.0
+        )
+
+        assert len(provider.calls) == 1
+        assert result.raw_meta["cache"] == "exact"
+
+    @pytest.mark.parametrize("method", ["get", "put"])
+    async def test_cache_errors_fall_back_to_provider(self, provider, monkeypatch, method):
+        def broken(*args, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(cache_module._cache, method, broken)
+
+        result = self._generate()
+        async_result = await router.agenerate_text(
+            task_name="t", prompt="p", system_prompt=None, model="m", temperature=0.0
+        )
+
+        assert len(provider.calls) == 2
+        assert result.text == "live 1"
+        assert async_result.text == "live 2"
+
+    def test_misconfigured_cache_falls_back_to_provider(self, provider, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("LLM_CACHE_BACKEND", "sqlite")
+        monkeypatch.setenv("LLM_CACHE_PATH", str(blocker / "cache" / "completions.db"))
+        monkeypatch.setattr(cache_module, "_cache", cache_module._UNSET)
+        builds = []
+        from_env = CompletionCache.from_env.__func__
+        monkeypatch.setattr(
+            CompletionCache, "from_env",
+            classmethod(lambda cls: builds.append(1) or from_env(cls)),
+        )
+
+        first = self._generate()
+        second = self._generate()
+
+        assert len(builds) == 1
+        assert [first.text, second.text] == ["live 1", "live 2"]
+        assert cache_module.get_completion_cache() is None
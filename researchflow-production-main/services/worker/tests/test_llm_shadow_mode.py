@@ -0,0 +1,168 @@
+"""
+Tests for non-blocking shadow mode in the LLM router.
+
+A slow fake provider stands in for the real one; the router must return the
+mock result without waiting for it.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from src.llm import router
+from src.llm.providers.base import LLMResult, LLMUsage
+from src.llm.shadow import ShadowRunner
+
+
+@dataclass
+class SlowProvider:
+    delay: float = 0.3
+    release: threading.Event | None = None
+    fail: bool = False
+    name: str = "slow"
+
+    def _result(self, model):
+        if self.fail:
+            raise RuntimeError("provider down")
+        return LLMResult(
+            text="real answer", provider=self.name, model=model,
+            usage=LLMUsage(input_tokens=7, output_tokens=3),
+        )
+
+    def generate_text(self, *, prompt, system_prompt=None, model, temperature=0.2, max_tokens=800):
+        if self.release is not None:
+            self.release.wait(5)
+        else:
+            time.sleep(self.delay)
+        return self._result(model)
+
+    async def agenerate_text(self, *, prompt, system_prompt=None, model, temperature=0.2, max_tokens=800):
+        await asyncio.sleep(self.delay)
+        return self._result(model)
+
+
+@pytest.fixture
+def shadow(monkeypatch, tmp_path):
+    """Route shadow calls to a SlowProvider and a runner logging to a JSONL file."""
+    monkeypatch.setenv("AI_BRIDGE_PROVIDER_MODE", "shadow")
+    log_path = tmp_path / "shadow.jsonl"
+    provider = SlowProvider()
+    monkeypatch.setattr(router, "_real_provider", lambda: provider)
+
+    def install(**kwargs):
+        runner = ShadowRunner(log_path=str(log_path), **kwargs)
+        monkeypatch.setattr(router, "get_shadow_runner", lambda: runner)
+        return runner
+
+    return provider, install, log_path
+
+
+def _call(**overrides):
+    kwargs = dict(task_name="summary", prompt="abstract text", system_prompt=None, model="m")
+    kwargs.update(overrides)
+    return router.generate_text(**kwargs)
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestShadowMode:
+    def test_returns_mock_without_waiting(self, shadow):
+        provider, install, log_path = shadow
+        runner = install()
+
+        started = time.perf_counter()
+        result = _call()
+        elapsed = time.perf_counter() - started
+
+        assert result.provider == "mock"
+        assert elapsed < provider.delay
+        runner.shutdown(wait=True)
+        (record,) = _records(log_path)
+        assert record["provider"] == "slow"
+        assert record["real_tokens_out"] == 3
+        assert record["latency_ms"] >= provider.delay * 1000 * 0.9
+        # No prompt or response text is written
+        assert "abstract text" not in log_path.read_text()
+        assert "real answer" not in log_path.read_text()
+
+    def test_drops_when_pending_bound_reached(self, shadow):
+        provider, install, log_path = shadow
+        provider.release = threading.Event()
+        runner = install(max_pending=2, max_workers=1)
+
+        for _ in range(5):
+            _call()
+
+        assert runner.stats["submitted"] == 2
+        assert runner.stats["dropped"] == 3
+        provider.release.set()
+        runner.shutdown(wait=True)
+        assert runner.pending == 0
+        assert len(_records(log_path)) == 2
+
+    def test_sample_rate_zero_skips_real_calls(self, shadow):
+        _, install, log_path = shadow
+        runner = install(sample_rate=0.0)
+
+        for _ in range(3):
+            _call()
+
+        runner.shutdown(wait=True)
+        assert runner.stats["sampled_out"] == 3
+        assert not log_path.exists()
+
+    def test_failures_recorded(self, shadow):
+        provider, install, log_path = shadow
+        provider.fail = True
+        runner = install()
+
+        assert _call().provider == "mock"
+
+        runner.shutdown(wait=True)
+        assert runner.stats["failed"] == 1
+        assert _records(log_path)[0]["error"] == "RuntimeError: provider down"
+
+    async def test_async_shadow_runs_as_background_task(self, shadow):
+        provider, install, log_path = shadow
+        runner = install()
+
+        started = time.perf_counter()
+        result = await router.agenerate_text(
+            task_name="summary", prompt="p", system_prompt=None, model="m"
+        )
+
+        assert result.provider == "mock"
+        assert time.perf_counter() - started < provider.delay
+        while runner.pending:
+            await asyncio.sleep(0.05)
+        runner.shutdown(wait=True)
+        assert runner.stats["completed"] == 1
+        assert _records(log_path)[0]["real_chars"] == len("real answer")
+
+
+def test_cancelled_async_call_releases_slot(tmp_path):
+    log_path = tmp_path / "shadow.jsonl"
+    runner = ShadowRunner(log_path=str(log_path), max_pending=1)
+    mock_result = LLMResult(text="mock", provider="mock", model="m")
+
+    async def main():
+        assert runner.submit_async(
+            lambda: asyncio.sleep(10), task_name="t", model="m", mock_result=mock_result
+        )
+
+    # asyncio.run cancels the still-pending shadow task at teardown
+    asyncio.run(main())
+
+    assert runner.pending == 0
+    assert runner.stats["failed"] == 1
+    assert _records(log_path)[0]["error"].startswith("CancelledError")
+    assert runner.submit(
+        lambda: mock_result, task_name="t", model="m", mock_result=mock_result
+    )
+    runner.shutdown(wait=True)
@@ -0,0 +1,180 @@
+"""
+Tests for the out-of-core DuckDB merge backend of MultiFileIngestEngine.
+
+The DuckDB backend must produce the same table as the in-memory pandas merge
+(up to row order); it writes the result to Parquet instead of returning a
+DataFrame. Synthetic data only - no real PHI.
+"""
+
+import pandas as pd
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from ingest.merge_ingest import MergeManifest, MultiFileIngestEngine
+
+
+def _manifest(run_id):
+    return MergeManifest(run_id=run_id, started_at="2024-01-01T00:00:00")
+
+
+def _read_output(path):
+    """Read merged Parquet through DuckDB (pandas would need pyarrow)."""
+    return duckdb.sql(f"SELECT * FROM read_parquet('{path}')").df()
+
+
+def _sorted(df, id_column):
+    return df.sort_values([id_column, "_source"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    pd.DataFrame({
+        "patient_id": ["P1", "P2", "P3", "P3"],
+        "age": [40, 51, 62, 62],
+        "site": ["A", "B", "A", "A"],
+    }).to_csv(data / "demographics.csv", index=False)
+    pd.DataFrame({
+        "Patient_ID": ["P2", "P3", "P4"],
+        "age": [51, 63, 70],
+        "tsh": [1.2, 3.4, None],
+    }).to_csv(data / "labs.csv", index=False)
+    pd.DataFrame({
+        "patient_id": ["P1", "P4", "P5"],
+        "stage": ["I", "II", "III"],
+    }).to_csv(data / "staging.tsv", sep="\t", index=False)
+    return data
+
+
+def _engines(tmp_path, **kwargs):
+    pandas_engine = MultiFileIngestEngine(
+        artifacts_dir=str(tmp_path / "pandas"), use_dask=False, **kwargs
+    )
+    duckdb_engine = MultiFileIngestEngine(
+        artifacts_dir=str(tmp_path / "duckdb"), use_dask=False,
+        merge_backend="duckdb", duckdb_memory_limit="256MB", **kwargs
+    )
+    return pandas_engine, duckdb_engine
+
+
+class TestDuckDBMergeBackend:
+    @pytest.mark.parametrize("strategy", ["outer", "inner", "left", "right"])
+    def test_matches_pandas_merge(self, tmp_path, source_dir, strategy):
+        pandas_engine, duckdb_engine = _engines(tmp_path)
+        pattern = "*.csv,*.tsv"
+
+        expected = pandas_engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("p"), pattern, strategy
+        )
+        result = duckdb_engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("d"), pattern, strategy
+        )
+
+        assert result.success, result.manifest.errors
+        assert result.dataframe is None
+        merged = _read_output(result.output_path)
+        assert list(merged.columns) == list(expected.dataframe.columns)
+        assert result.manifest.columns_merged == list(expected.dataframe.columns)
+        assert result.manifest.rows_after_merge == len(expected.dataframe)
+        assert result.manifest.id_column_aliases == expected.manifest.id_column_aliases
+        pd.testing.assert_frame_equal(
+            _sorted(merged, "patient_id"),
+            _sorted(expected.dataframe, "patient_id"),
+            check_dtype=False,
+        )
+
+    def test_clashing_columns_renamed_like_pandas(self, tmp_path, source_dir):
+        _, engine = _engines(tmp_path)
+
+        result = engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("r"), "*.csv"
+        )
+
+        assert result.manifest.columns_merged == [
+            "patient_id", "age", "site", "_source",
+            "age_labs.csv", "tsh", "_source_labs.csv",
+        ]
+        assert result.to_dict()["row_count"] == 5
+        assert result.to_dict()["output_path"] == result.output_path
+
+    def test_parquet_sources_scanned_directly(self, tmp_path, source_dir):
+        duckdb.from_df(
+            pd.DataFrame({"patient_id": ["P2", "P9"], "visits": [3, 1]})
+        ).write_parquet(str(source_dir / "visits.parquet"))
+        _, engine = _engines(tmp_path)
+
+        result = engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("q"), "demographics.csv,*.parquet"
+        )
+
+        merged = _sorted(_read_output(result.output_path), "patient_id")
+        assert merged["patient_id"].tolist() == ["P1", "P2", "P3", "P3", "P9"]
+        assert merged["visits"].tolist()[1] == 3
+        assert merged["_source_visits.parquet"].notna().sum() == 2
+
+    def test_excel_sheets_exported_for_duckdb(self, tmp_path):
+        workbook = tmp_path / "cohort.xlsx"
+        with pd.ExcelWriter(workbook) as writer:
+            pd.DataFrame({"mrn_id": [1, 2], "dx": ["a", "b"]}).to_excel(
+                writer, sheet_name="dx", index=False)
+            pd.DataFrame({"mrn_id": [2, 3], "rx": ["x", "y"]}).to_excel(
+                writer, sheet_name="rx", index=False)
+        pandas_engine, duckdb_engine = _engines(tmp_path)
+
+        expected = pandas_engine.complete_merge(workbook, "mrn_id", "yes", _manifest("p"))
+        result = duckdb_engine.complete_merge(workbook, "mrn_id", "yes", _manifest("d"))
+
+        pd.testing.assert_frame_equal(
+            _sorted(_read_output(result.output_path), "mrn_id"),
+            _sorted(expected.dataframe, "mrn_id"),
+            check_dtype=False,
+        )
+        # The temporary Excel exports and spill directory are cleaned up
+        assert not list((tmp_path / "duckdb").glob("duckdb_*"))
+
+    def test_validation_warnings_from_sql(self, tmp_path, source_dir):
+        pytest.importorskip("pandera")
+        _, engine = _engines(tmp_path)
+
+        result = engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("v"), "demographics.csv"
+        )
+
+        assert "Found 1 duplicate ID values after merge" in result.manifest.warnings
+
+    def test_missing_id_column_fails(self, tmp_path, source_dir):
+        _, engine = _engines(tmp_path)
+
+        result = engine.complete_merge(
+            source_dir, "encounter_number", "yes", _manifest("m"), "*.csv"
+        )
+
+        assert not result.success
+        assert result.manifest.errors
+
+    def test_unknown_strategy_recorded_as_error(self, tmp_path, source_dir):
+        _, engine = _engines(tmp_path)
+
+        result = engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("s"), "*.csv", "cross"
+        )
+
+        assert not result.success
+        assert "Unsupported merge strategy" in result.manifest.errors[0]
+
+    def test_iter_merged_batches(self, tmp_path, source_dir):
+        pytest.importorskip("pyarrow", exc_type=ImportError)
+        _, engine = _engines(tmp_path)
+        result = engine.complete_merge(
+            source_dir, "patient_id", "yes", _manifest("b"), "*.csv,*.tsv"
+        )
+
+        batches = list(engine.iter_merged_batches(result, batch_size=2))
+
+        assert sum(b.num_rows for b in batches) == result.manifest.rows_after_merge
+
+    def test_invalid_backend(self, tmp_path):
+        with pytest.raises(ValueError, match="merge_backend"):
+            MultiFileIngestEngine(artifacts_dir=str(tmp_path), merge_backend="spark")
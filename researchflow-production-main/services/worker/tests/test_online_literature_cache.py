@@ -0,0 +1,145 @@
+"""
+Tests for the sharded online literature cache
+
+Tests LiteratureCacheStore:
+- Entries are written under two levels of key-prefix shards
+- TTL expiry and LRU eviction under the byte budget
+- Hit ratio accounting
+- Corrupt entries are dropped and reported as misses
+- Legacy flat entries migrate with their original age
+"""
+import os
+import sys
+import time
+import types
+
+import pytest
+
+# The online_literature package pulls in web_frontend (not installed in the
+# worker image) and src.ros_irb.gate (whose package imports the
+# top-level ros_irb name); neither is used by the cache, so register stubs first.
+_phi_scan = types.ModuleType("web_frontend.phi_scan")
+_phi_scan.scan_text_high_confidence = lambda text: []
+sys.modules.setdefault("web_frontend", types.ModuleType("web_frontend"))
+sys.modules.setdefault("web_frontend.phi_scan", _phi_scan)
+_irb_gate = types.ModuleType("src.ros_irb.gate")
+_irb_gate.require_irb_submission = lambda *args, **kwargs: None
+sys.modules.setdefault("src.ros_irb.gate", _irb_gate)
+
+from src.online_literature.cache import (  # noqa: E402
+    INDEX_FILENAME,
+    LiteratureCacheStore,
+    compute_cache_key,
+)
+
+
+def _key(n: int) -> str:
+    return compute_cache_key("pubmed", f"topic {n}", {"max_results": n})
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LiteratureCacheStore(tmp_path / "cache")
+    yield store
+    store.close()
+
+
+class TestLiteratureCacheStore:
+    def test_sharded_layout_and_roundtrip(self, store):
+        key = _key(1)
+        payload = {"papers": [{"title": "A"}], "provider": "pubmed"}
+
+        path = store.put(key, payload)
+
+        assert path.parent.parent.name == key[:2]
+        assert path.parent.name == key[2:4]
+        assert path.name.startswith(key)
+        assert store.get(key) == payload
+
+    def test_rollback_journal_by_default(self, store):
+        (mode,) = store._conn.execute("PRAGMA journal_mode").fetchone()
+        assert mode.upper() == "DELETE"
+        assert not (store.root / f"{INDEX_FILENAME}-wal").exists()
+
+    def test_invalid_journal_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            LiteratureCacheStore(tmp_path / "cache", journal_mode="bogus")
+
+    def test_ttl_expiry(self, tmp_path):
+        store = LiteratureCacheStore(tmp_path / "cache", ttl_seconds=60)
+        key = _key(1)
+        store.put(key, {"papers": []})
+        store._conn.execute("UPDATE entries SET created_at = ?", (time.time() - 120,))
+
+        assert store.get(key) is None
+        assert store.stats["expired"] == 1
+        assert not store.shard_path(key).exists()
+        store.close()
+
+    def test_lru_eviction_under_byte_budget(self, tmp_path):
+        # Random bytes so compression cannot shrink entries below the budget
+        store = LiteratureCacheStore(tmp_path / "cache", max_bytes=11_000)
+        keys = [_key(n) for n in range(4)]
+        for n, key in enumerate(keys[:3]):
+            store.put(key, {"blob": os.urandom(3000), "n": n})
+        # Touch the oldest entry so the second one becomes least recently used
+        assert store.get(keys[0]) is not None
+
+        store.put(keys[3], {"blob": os.urandom(3000), "n": 3})
+
+        assert store.stats["evictions"] >= 1
+        assert store.get(keys[1]) is None
+        assert store.get(keys[0]) is not None
+        assert store.get(keys[3]) is not None
+        assert store.get_stats()["bytes"] <= store.max_bytes
+
+    def test_hit_ratio(self, store):
+        store.put(_key(1), {"papers": []})
+
+        store.get(_key(1))
+        store.get(_key(1))
+        store.get(_key(2))
+
+        assert store.hit_ratio == pytest.approx(2 / 3)
+        assert store.get_stats()["hit_ratio"] == pytest.approx(2 / 3)
+
+    def test_corrupt_entry_is_a_miss(self, store):
+        key = _key(1)
+        path = store.put(key, {"papers": []})
+        path.write_bytes(b"not a compressed payload")
+
+        assert store.get(key) is None
+        assert store.stats["misses"] == 1
+        assert not path.exists()
+
+    def test_legacy_entry_migrates_with_original_age(self, tmp_path):
+        root = tmp_path / "cache"
+        root.mkdir()
+        key = _key(1)
+        legacy = root / f"{key}.json"
+        legacy.write_text('{"papers": []}')
+        written = time.time() - 30
+        os.utime(legacy, (written, written))
+
+        store = LiteratureCacheStore(root, ttl_seconds=60)
+        assert store.get(key) == {"papers": []}
+        assert not legacy.exists()
+        (created_at,) = store._conn.execute(
+            "SELECT created_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        assert created_at == pytest.approx(written, abs=1)
+        store.close()
+
+    def test_expired_legacy_entry_is_a_miss(self, tmp_path):
+        root = tmp_path / "cache"
+        root.mkdir()
+        key = _key(1)
+        legacy = root / f"{key}.json"
+        legacy.write_text('{"papers": []}')
+        written = time.time() - 120
+        os.utime(legacy, (written, written))
+
+        store = LiteratureCacheStore(root, ttl_seconds=60)
+        assert store.get(key) is None
+        assert not legacy.exists()
+        store.close()
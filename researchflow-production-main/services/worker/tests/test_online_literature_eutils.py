@@ -0,0 +1,182 @@
+"""
+Tests for the PubMed E-utilities transport
+
+Tests EUtilsClient and PubMedProvider against an httpx.MockTransport:
+- esearch stores the result set on the history server (usehistory=y)
+- efetch pages through the stored set in batches
+- 429 responses are retried after backoff
+- efetch responses are parsed article by article
+"""
+import sys
+import types
+
+import httpx
+import pytest
+
+# The online_literature package pulls in web_frontend (not installed in the
+# worker image) and src.ros_irb.gate (whose package imports the top-level
+# ros_irb name); neither is exercised here, so register stubs first.
+_phi_scan = types.ModuleType("web_frontend.phi_scan")
+_phi_scan.scan_text_high_confidence = lambda text: []
+sys.modules.setdefault("web_frontend", types.ModuleType("web_frontend"))
+sys.modules.setdefault("web_frontend.phi_scan", _phi_scan)
+_irb_gate = types.ModuleType("src.ros_irb.gate")
+_irb_gate.require_irb_submission = lambda *args, **kwargs: None
+sys.modules.setdefault("src.ros_irb.gate", _irb_gate)
+
+from src.online_literature import eutils  # noqa: E402
+from src.online_literature.eutils import (  # noqa: E402
+    EUTILS_BASE_URL,
+    EUtilsClient,
+    SearchHistory,
+    _stream_articles,
+)
+from src.online_literature.provider import PubMedProvider  # noqa: E402
+
+TOTAL = 7
+
+
+def _article(pmid: int) -> str:
+    return (
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID>{pmid}</PMID>"
+        "<Article>"
+        "<Journal><JournalIssue><PubDate><Year>2021</Year></PubDate></JournalIssue>"
+        "<Title>Journal of Tests</Title></Journal>"
+        f"<ArticleTitle>Paper {pmid}</ArticleTitle>"
+        "<AuthorList><Author><LastName>Doe</LastName><ForeName>Jane</ForeName></Author>"
+        "</AuthorList>"
+        "</Article></MedlineCitation>"
+        "<PubmedData><ArticleIdList>"
+        f'<ArticleId IdType="doi">10.1000/{pmid}</ArticleId>'
+        "</ArticleIdList></PubmedData>"
+        "</PubmedArticle>"
+    )
+
+
+class FakeEUtils:
+    """Minimal history-server backend for esearch/efetch."""
+
+    def __init__(self, throttle: int = 0):
+        self.throttle = throttle
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.throttle:
+            self.throttle -= 1
+            return httpx.Response(429, headers={"Retry-After": "1"})
+
+        params = request.url.params
+        if request.url.path.endswith("esearch.fcgi"):
+            assert params["usehistory"] == "y"
+            return httpx.Response(
+                200,
+                content=(
+                    f"<eSearchResult><Count>{TOTAL}</Count>"
+                    "<WebEnv>MCID_1</WebEnv><QueryKey>1</QueryKey></eSearchResult>"
+                ),
+            )
+
+        assert params["WebEnv"] == "MCID_1"
+        assert params["query_key"] == "1"
+        start = int(params["retstart"])
+        stop = min(start + int(params["retmax"]), TOTAL)
+        body = "".join(_article(pmid) for pmid in range(start + 1, stop + 1))
+        return httpx.Response(200, content=f"<PubmedArticleSet>{body}</PubmedArticleSet>")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(eutils.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _client(backend: FakeEUtils, **kwargs) -> EUtilsClient:
+    client = EUtilsClient(**kwargs)
+    client._client = httpx.Client(base_url=EUTILS_BASE_URL, transport=httpx.MockTransport(backend))
+    return client
+
+
+class TestEUtilsClient:
+    def test_esearch_uses_history_server(self, sleeps):
+        backend = FakeEUtils()
+        client = _client(backend)
+
+        history = client.esearch("asthma")
+
+        assert history == SearchHistory(count=TOTAL, webenv="MCID_1", query_key="1")
+        assert backend.requests[0].url.params["retmax"] == "0"
+
+    def test_efetch_pages_in_batches(self, sleeps):
+        backend = FakeEUtils()
+        client = _client(backend)
+        history = client.esearch("asthma")
+
+        pmids = [
+            article.findtext(".//PMID")
+            for article in client.iter_articles(history, max_results=TOTAL, batch_size=3)
+        ]
+
+        assert pmids == [str(n) for n in range(1, TOTAL + 1)]
+        efetches = [r.url.params for r in backend.requests[1:]]
+        assert [(p["retstart"], p["retmax"]) for p in efetches] == [
+            ("0", "3"),
+            ("3", "3"),
+            ("6", "1"),
+        ]
+
+    def test_max_results_limits_fetch(self, sleeps):
+        backend = FakeEUtils()
+        client = _client(backend)
+
+        articles = list(
+            client.iter_articles(client.esearch("asthma"), max_results=4, batch_size=3)
+        )
+
+        assert len(articles) == 4
+        assert len(backend.requests) == 3
+
+    def test_retries_429_with_backoff(self, sleeps):
+        backend = FakeEUtils(throttle=2)
+        client = _client(backend)
+
+        history = client.esearch("asthma")
+
+        assert history.count == TOTAL
+        assert len(backend.requests) == 3
+        assert [s for s in sleeps if s >= 1.0] == [1.0, 1.0]
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        client = _client(FakeEUtils(throttle=10), max_retries=2)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.esearch("asthma")
+
+
+def test_stream_articles_parses_across_chunks():
+    document = f"<PubmedArticleSet>{_article(1)}{_article(2)}</PubmedArticleSet>".encode()
+    chunks = [document[i : i + 16] for i in range(0, len(document), 16)]
+
+    titles = [article.findtext(".//ArticleTitle") for article in _stream_articles(chunks)]
+
+    assert titles == ["Paper 1", "Paper 2"]
+
+
+def test_pubmed_provider_search(monkeypatch, sleeps):
+    # Network gating is covered by its own tests; allow the mocked transport
+    monkeypatch.setattr("src.online_literature.provider.ensure_network_allowed", lambda: None)
+    backend = FakeEUtils()
+    client = _client(backend)
+    monkeypatch.setattr(
+        "src.online_literature.provider.get_eutils_client", lambda *args, **kwargs: client
+    )
+
+    papers = PubMedProvider(batch_size=2).search("asthma", max_results=3)
+
+    assert [p.title for p in papers] == ["Paper 1", "Paper 2", "Paper 3"]
+    assert papers[0].authors == ["Jane Doe"]
+    assert papers[0].year == 2021
+    assert papers[0].venue == "Journal of Tests"
+    assert papers[0].url == "https://doi.org/10.1000/1"
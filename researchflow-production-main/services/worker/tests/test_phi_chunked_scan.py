@@ -0,0 +1,78 @@
+"""
+Tests for chunked and multi-process Stage 5 PHI scanning
+
+Verifies that scanning chunks in a process pool yields the same findings
+and column risks as in-process scanning, and that the whole input is
+scanned unless a cap is requested.
+"""
+import pandas as pd
+
+from src.workflow_engine.stages.stage_05_phi import (
+    scan_chunked_iterator_for_phi,
+    scan_dataframe_for_phi,
+)
+
+
+def _chunks(count: int = 6, rows: int = 50):
+    """Synthetic values only - no real PHI."""
+    values = ["No evidence of disease", "call 555-123-4567", "a@example.com", None]
+    for c in range(count):
+        yield pd.DataFrame(
+            {
+                "notes": [values[(c + r) % len(values)] for r in range(rows)],
+                "zip_code": ["xxxxx"] * rows,
+                "age": list(range(rows)),
+            }
+        )
+
+
+class TestChunkedScan:
+    def test_process_pool_matches_in_process(self):
+        sequential = scan_chunked_iterator_for_phi(_chunks(), max_workers=1)
+        parallel = scan_chunked_iterator_for_phi(_chunks(), max_workers=2)
+
+        assert parallel[0] == sequential[0]
+        assert parallel[2] == sequential[2]
+        assert parallel[1]["rows_scanned"] == sequential[1]["rows_scanned"] == 300
+        assert parallel[1]["workers"] == 2
+
+    def test_findings_merged_in_chunk_order(self):
+        findings, _, _ = scan_chunked_iterator_for_phi(_chunks(), max_workers=2)
+        chunk_indices = [f["chunk_index"] for f in findings]
+        assert chunk_indices == sorted(chunk_indices)
+        assert set(chunk_indices) == set(range(6))
+
+    def test_scans_all_chunks_by_default(self):
+        _, metadata, _ = scan_chunked_iterator_for_phi(_chunks(count=150, rows=2))
+        assert metadata["chunks_scanned"] == 150
+        assert metadata["rows_per_second"] is None or metadata["rows_per_second"] > 0
+
+    def test_max_chunks_cap(self):
+        _, metadata, _ = scan_chunked_iterator_for_phi(_chunks(), max_chunks=2)
+        assert metadata["chunks_scanned"] == 2
+        assert metadata["rows_scanned"] == 100
+
+    def test_column_risk_uses_all_chunks(self):
+        _, _, risks = scan_chunked_iterator_for_phi(_chunks())
+        whole = pd.concat(list(_chunks()), ignore_index=True)
+        whole_findings, _ = scan_dataframe_for_phi(whole, assess_risk=False)
+
+        notes_findings = [f for f in whole_findings if f["column"] == "notes"]
+        assert risks["notes"]["findings_count"] == len(notes_findings)
+        assert risks["notes"]["risk_level"] == "critical"
+
+    def test_numeric_quasi_identifiers_flag_risk(self):
+        chunks = [
+            pd.DataFrame({
+                "visit_date": ["2020-01-01"] * 5,
+                "zip_code": [12345] * 5,
+                "age": [40] * 5,
+            })
+            for _ in range(2)
+        ]
+        _, whole_risks = scan_dataframe_for_phi(pd.concat(chunks, ignore_index=True))
+
+        _, _, risks = scan_chunked_iterator_for_phi(iter(chunks))
+
+        assert whole_risks["visit_date"]["quasi_identifier_risk"] is True
+        assert risks["visit_date"]["quasi_identifier_risk"] is True
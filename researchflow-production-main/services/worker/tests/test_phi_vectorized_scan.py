@@ -0,0 +1,130 @@
+"""
+Tests for the column-at-a-time PHI scanner
+
+Verifies the vectorized scan produces the same detections as scanning
+every cell individually with PHIDetector.scan_value.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validation.phi_detector import (
+    PHIDetector,
+    PHIPattern,
+    PHIType,
+    candidate_phi_cells,
+    scan_dataframe,
+)
+from src.validation.phi_patterns import PHI_PATTERNS_OUTPUT_GUARD, combine_patterns
+
+
+@pytest.fixture
+def detector():
+    return PHIDetector()
+
+
+@pytest.fixture
+def mixed_df():
+    """Synthetic values only - no real PHI."""
+    notes = [
+        "No evidence of disease",
+        "Contact: 555-123-4567",
+        "MRN123456 seen on 01/15/2024",
+        None,
+        "Email: patient@example.com",
+        "No evidence of disease",
+        np.nan,
+        "Contact: 555-123-4567",
+    ]
+    return pd.DataFrame(
+        {
+            "notes": notes,
+            "numbers": [123456789, 5, 42, 7, 987654321, 1, 2, 3],
+            "visit": pd.to_datetime(["2024-01-15"] * 8),
+        },
+        index=[10, 3, 7, 1, 99, 4, 5, 6],
+    )
+
+
+def _per_cell(detector, series):
+    flagged = {}
+    for idx, value in series.items():
+        detections = detector.scan_value(value)
+        if detections:
+            flagged[idx] = detections
+    return flagged
+
+
+class TestCombinePatterns:
+    def test_matches_iff_any_pattern_matches(self):
+        combined = combine_patterns(p for _, p in PHI_PATTERNS_OUTPUT_GUARD)
+        samples = [
+            "nothing here",
+            "call 555-123-4567",
+            "MRN: ABC123456",
+            "mrn: abc123456",
+            "Dr. Jane Smith",
+            "age: 95",
+            "plain 2024 text",
+        ]
+        for text in samples:
+            expected = any(p.search(text) for _, p in PHI_PATTERNS_OUTPUT_GUARD)
+            assert bool(combined.search(text)) == expected, text
+
+    def test_preserves_per_pattern_flags(self):
+        combined = combine_patterns([re.compile("abc", re.IGNORECASE), re.compile("XYZ")])
+        assert combined.search("ABC")
+        assert not combined.search("xyz")
+
+    def test_uncombinable_patterns_return_none(self):
+        patterns = [re.compile(r"(?P<x>a)"), re.compile(r"(?P<x>b)")]
+        assert combine_patterns(patterns) is None
+        assert combine_patterns([]) is None
+
+
+class TestScanSeries:
+    def test_matches_per_cell_scan(self, detector, mixed_df):
+        for col in mixed_df.columns:
+            assert detector.scan_series(mixed_df[col], col) == _per_cell(
+                detector, mixed_df[col]
+            )
+
+    def test_candidate_cells_skip_clean_values(self, detector, mixed_df):
+        positions, codes, texts = candidate_phi_cells(
+            mixed_df["notes"], detector.combined_pattern
+        )
+        assert positions.tolist() == [1, 2, 4, 7]
+        assert texts[codes[0]] == "Contact: 555-123-4567"
+        assert codes[0] == codes[3]
+
+    def test_custom_pattern_added_later_is_used(self, detector):
+        series = pd.Series(["study code ZZ-9999"])
+        assert detector.scan_series(series, "codes") == {}
+
+        detector.patterns.append(
+            PHIPattern(
+                phi_type=PHIType.OTHER_IDENTIFIER,
+                pattern=re.compile(r"ZZ-\d{4}"),
+                description="Site code",
+                severity="low",
+            )
+        )
+        assert detector.scan_series(series, "codes") == {
+            0: [(PHIType.OTHER_IDENTIFIER, "ZZ-9999")]
+        }
+
+
+class TestScanDataframe:
+    def test_severity_counts(self, detector, mixed_df):
+        result = scan_dataframe(mixed_df, detector)
+
+        expected = {"high": 0, "medium": 0, "low": 0}
+        for col in mixed_df.columns:
+            for detections in _per_cell(detector, mixed_df[col]).values():
+                for phi_type, _ in detections:
+                    expected[detector.severity_map[phi_type]] += 1
+
+        assert result.severity_counts == expected
+        assert result.flagged_rows == sorted([10, 3, 7, 1, 99, 4, 5, 6])
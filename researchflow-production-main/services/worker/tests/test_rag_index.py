@@ -0,0 +1,246 @@
+"""
+Tests for the HybridRetriever index structures
+
+Covers:
+- BM25 postings-list scoring against the per-document scorer
+- Re-indexing an existing document id
+- Matrix-backed semantic search and top-k selection
+- Metadata filter masks
+- Snapshot save/load, incremental append and content-hash dedup
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+worker_src = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(worker_src))
+
+from rag.copilot_rag import CopilotRAG
+from rag.hybrid_retriever import (
+    SNAPSHOT_DOCUMENTS,
+    SNAPSHOT_EMBEDDINGS,
+    BM25Scorer,
+    HybridConfig,
+    HybridRetriever,
+)
+
+
+DOCS = [
+    ("doc-1", "metformin lowers blood glucose in type 2 diabetes", [0.9, 0.1, 0.0], {"paper_id": "p1"}),
+    ("doc-2", "exercise and diet for diabetes management", [0.2, 0.9, 0.1], {"paper_id": "p1"}),
+    ("doc-3", "statins reduce cardiovascular events", [0.1, 0.2, 0.9], {"paper_id": "p2"}),
+    ("doc-4", "insulin therapy in type 1 diabetes diabetes", [0.8, 0.3, 0.1], {"paper_id": "p2"}),
+]
+
+
+@pytest.fixture
+def retriever():
+    retriever = HybridRetriever(HybridConfig(top_k=10))
+    for doc_id, content, embedding, metadata in DOCS:
+        retriever.add_document(doc_id, content, embedding, metadata)
+    return retriever
+
+
+class TestBM25Postings:
+    """Tests for the inverted index."""
+
+    def test_score_query_matches_per_document_score(self):
+        scorer = BM25Scorer()
+        for doc_id, content, _, _ in DOCS:
+            scorer.index_document(doc_id, content)
+
+        query = "type 2 diabetes diabetes"
+        scores = scorer.score_query(query)
+
+        for doc_id, content, _, _ in DOCS:
+            expected = scorer.score(query, doc_id, content)
+            assert scores.get(doc_id, 0.0) == pytest.approx(expected)
+        assert "doc-3" not in scores
+
+    def test_reindex_replaces_document(self):
+        scorer = BM25Scorer()
+        scorer.index_document("doc-1", "alpha beta")
+        scorer.index_document("doc-2", "beta gamma delta")
+        scorer.index_document("doc-1", "gamma")
+
+        assert scorer.total_docs == 2
+        assert scorer.avg_doc_length == pytest.approx(2.0)
+        assert "alpha" not in scorer.postings
+        assert scorer.doc_freqs["gamma"] == 2
+        assert scorer.score_query("beta").keys() == {"doc-2"}
+
+
+class TestMatrixSearch:
+    """Tests for matrix-backed semantic and fused search."""
+
+    def test_semantic_top_k_matches_full_ranking(self, retriever):
+        query = [1.0, 0.2, 0.0]
+        full = retriever._semantic_search(query)
+        top = retriever._semantic_search(query, top_k=2)
+
+        assert [r.doc_id for r in top] == [r.doc_id for r in full[:2]]
+        assert [r.semantic_rank for r in top] == [1, 2]
+        assert top[0].semantic_score == pytest.approx(
+            retriever._cosine_similarity(query, DOCS[0][2])
+        )
+
+    def test_zero_vectors_score_zero(self, retriever):
+        retriever.add_document("doc-0", "empty vector", [0.0, 0.0, 0.0])
+        scores = {r.doc_id: r.score for r in retriever._semantic_search([1.0, 0.0, 0.0])}
+        assert scores["doc-0"] == 0.0
+
+    def test_search_matches_reciprocal_rank_fusion(self, retriever):
+        query, query_embedding = "type 2 diabetes", [0.5, 0.5, 0.2]
+        expected = retriever._reciprocal_rank_fusion(
+            retriever._semantic_search(query_embedding),
+            retriever._keyword_search(query),
+        )
+        results = retriever.search(query, query_embedding, top_k=3)
+
+        assert [r.doc_id for r in results] == [r.doc_id for r in expected[:3]]
+        for got, want in zip(results, expected):
+            assert got.score == pytest.approx(want.score)
+            assert got.keyword_rank == want.keyword_rank
+
+    def test_dimension_mismatch_rejected(self, retriever):
+        with pytest.raises(ValueError):
+            retriever.add_document("doc-x", "bad", [1.0, 0.0])
+        with pytest.raises(ValueError):
+            retriever.search("diabetes", [1.0, 0.0])
+
+    def test_readd_updates_embedding_and_metadata(self, retriever):
+        retriever.add_document("doc-3", "statins", [0.0, 0.0, 1.0], {"paper_id": "p1"})
+
+        assert retriever.document_count == 4
+        assert retriever._embeddings["doc-3"] == [0.0, 0.0, 1.0]
+        p1 = retriever.search("statins", [0.0, 0.0, 1.0], filter_metadata={"paper_id": "p1"})
+        p2 = retriever.search("statins", [0.0, 0.0, 1.0], filter_metadata={"paper_id": "p2"})
+        assert "doc-3" in {r.doc_id for r in p1}
+        assert {r.doc_id for r in p2} == {"doc-4"}
+
+
+class TestFilterMasks:
+    """Tests for precomputed metadata filter masks."""
+
+    def test_filter_restricts_both_rankings(self, retriever):
+        results = retriever.search(
+            "diabetes", [0.1, 0.2, 0.9], filter_metadata={"paper_id": "p2"}
+        )
+        assert {r.doc_id for r in results} == {"doc-3", "doc-4"}
+        assert {r.semantic_rank for r in results} == {1, 2}
+        assert [r.keyword_rank for r in results if r.doc_id == "doc-4"] == [1]
+
+    def test_mask_refreshed_after_add(self, retriever):
+        retriever.search("diabetes", [1.0, 0.0, 0.0], filter_metadata={"paper_id": "p3"})
+        retriever.add_document("doc-5", "diabetes", [1.0, 0.0, 0.0], {"paper_id": "p3"})
+
+        results = retriever.search(
+            "diabetes", [1.0, 0.0, 0.0], filter_metadata={"paper_id": "p3"}
+        )
+        assert [r.doc_id for r in results] == ["doc-5"]
+
+    def test_unhashable_filter_value(self, retriever):
+        retriever.add_document("doc-5", "tagged", [1.0, 0.0, 0.0], {"tags": ["a", "b"]})
+        results = retriever._semantic_search([1.0, 0.0, 0.0], {"tags": ["a", "b"]})
+        assert [r.doc_id for r in results] == ["doc-5"]
+
+
+class _CountingEmbedder:
+    """Deterministic embedding provider that records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), float(t.count("e")), 1.0] for t in texts]
+
+
+class TestSnapshot:
+    """Tests for persisting and reloading the index."""
+
+    def _results(self, retriever, **kwargs):
+        return [
+            (r.doc_id, round(r.score, 12), r.keyword_rank, r.semantic_rank)
+            for r in retriever.search("type 2 diabetes", [0.7, 0.3, 0.1], **kwargs)
+        ]
+
+    def test_round_trip(self, retriever, tmp_path):
+        retriever.save(tmp_path)
+        loaded = HybridRetriever.load(tmp_path, HybridConfig(top_k=10))
+
+        assert loaded.document_count == retriever.document_count
+        assert loaded._embeddings["doc-2"] == retriever._embeddings["doc-2"]
+        assert loaded.bm25.postings == retriever.bm25.postings
+        assert self._results(loaded) == self._results(retriever)
+        assert self._results(loaded, filter_metadata={"paper_id": "p1"}) == self._results(
+            retriever, filter_metadata={"paper_id": "p1"}
+        )
+
+    def test_incremental_save_appends(self, retriever, tmp_path):
+        retriever.save(tmp_path)
+        embeddings_before = (tmp_path / SNAPSHOT_EMBEDDINGS).read_bytes()
+        documents_before = (tmp_path / SNAPSHOT_DOCUMENTS).read_bytes()
+
+        loaded = HybridRetriever.load(tmp_path)
+        loaded.add_document("doc-5", "glp-1 agonists", [0.3, 0.3, 0.3], {"paper_id": "p3"})
+        loaded.save(tmp_path)
+
+        assert (tmp_path / SNAPSHOT_EMBEDDINGS).read_bytes().startswith(embeddings_before)
+        assert (tmp_path / SNAPSHOT_DOCUMENTS).read_bytes().startswith(documents_before)
+        reloaded = HybridRetriever.load(tmp_path)
+        assert reloaded.document_count == 5
+        assert reloaded.metadata_values("paper_id") == {"p1", "p2", "p3"}
+
+    def test_readd_after_load_is_persisted(self, retriever, tmp_path):
+        retriever.save(tmp_path)
+        loaded = HybridRetriever.load(tmp_path)
+        loaded.add_document("doc-1", "replaced text", [0.0, 1.0, 0.0], {"paper_id": "p9"})
+        loaded.save(tmp_path)
+
+        reloaded = HybridRetriever.load(tmp_path)
+        assert reloaded.document_count == 4
+        assert reloaded._embeddings["doc-1"] == [0.0, 1.0, 0.0]
+        assert reloaded._documents["doc-1"]["content"] == "replaced text"
+        assert "metformin" not in reloaded.bm25.postings
+        assert "p9" in reloaded.metadata_values("paper_id")
+
+    def test_uncommitted_bytes_ignored(self, retriever, tmp_path):
+        retriever.save(tmp_path)
+        with open(tmp_path / SNAPSHOT_DOCUMENTS, "ab") as f:
+            f.write(b'{"row": 4, "doc_id": "torn')
+
+        loaded = HybridRetriever.load(tmp_path)
+        assert loaded.document_count == 4
+
+
+class TestCopilotPersistence:
+    """Tests for CopilotRAG startup from a snapshot."""
+
+    def test_restart_does_not_reembed(self, tmp_path):
+        paper = "Metformin is first-line therapy. " * 40
+        embedder = _CountingEmbedder()
+        rag = CopilotRAG(embedding_provider=embedder, index_path=str(tmp_path))
+        chunks = asyncio.run(rag.index_paper("paper-1", paper))
+        assert chunks > 0
+
+        restarted_embedder = _CountingEmbedder()
+        restarted = CopilotRAG(embedding_provider=restarted_embedder, index_path=str(tmp_path))
+        assert restarted.total_chunks == rag.total_chunks
+        assert asyncio.run(restarted.index_paper("paper-1", paper)) == 0
+        assert restarted_embedder.calls == []
+
+    def test_duplicate_chunks_reuse_embeddings(self, tmp_path):
+        paper = "Metformin is first-line therapy. " * 40
+        embedder = _CountingEmbedder()
+        rag = CopilotRAG(embedding_provider=embedder, index_path=str(tmp_path))
+        first = asyncio.run(rag.index_paper("paper-1", paper))
+        embedded = sum(len(call) for call in embedder.calls)
+
+        second = asyncio.run(rag.index_paper("paper-2", paper))
+        assert sum(len(call) for call in embedder.calls) == embedded
+        assert rag.total_chunks == first + second
+        assert rag.indexed_paper_count == 2
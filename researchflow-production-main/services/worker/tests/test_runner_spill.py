@@ -0,0 +1,160 @@
+"""
+Tests for spilled stage outputs in run_stages
+
+Tests the spill_outputs mode and the per-stage on_result callback:
+- Outputs are written to the artifact directory and loaded lazily
+- Later stages read earlier outputs through previous_results
+- Results are emitted as each stage finishes
+- Default mode keeps returning outputs inline
+"""
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.workflow_engine.result_store import (
+    LazyStageResult,
+    SPILL_DIRNAME,
+    SpilledStageResults,
+)
+from src.workflow_engine.runner import run_stages
+from src.workflow_engine.types import StageContext, StageResult
+
+
+def _make_stage_class(stage_id: int, seen: dict):
+    class _Stage:
+        stage_name = f"stage_{stage_id}"
+
+        async def execute(self, context: StageContext) -> StageResult:
+            seen[stage_id] = {
+                sid: context.previous_results[sid].output
+                for sid in context.previous_results
+            }
+            if context.config.get("fail_stage") == stage_id:
+                raise RuntimeError("boom")
+            now = datetime.utcnow().isoformat() + "Z"
+            return StageResult(
+                stage_id=stage_id,
+                stage_name=self.stage_name,
+                status="completed",
+                started_at=now,
+                completed_at=now,
+                duration_ms=1,
+                output={"stage": stage_id, "rows": list(range(stage_id))},
+            )
+
+    return _Stage
+
+
+@pytest.fixture
+def seen():
+    return {}
+
+
+@pytest.fixture
+def stages(seen):
+    registry = {sid: _make_stage_class(sid, seen) for sid in (1, 2, 3)}
+    with patch("src.workflow_engine.runner.get_stage", side_effect=registry.get):
+        yield
+
+
+def _context(tmp_path: Path, **config) -> StageContext:
+    return StageContext(job_id="job-1", config=config, artifact_path=str(tmp_path))
+
+
+class TestSpilledStageResults:
+    def test_spill_and_lazy_load(self, tmp_path):
+        store = SpilledStageResults(tmp_path, max_loaded=1)
+        now = datetime.utcnow().isoformat() + "Z"
+        for sid in (1, 2):
+            store.spill(
+                StageResult(
+                    stage_id=sid,
+                    stage_name="s",
+                    status="completed",
+                    started_at=now,
+                    completed_at=now,
+                    duration_ms=0,
+                    output={"value": sid},
+                )
+            )
+
+        assert list(store) == [1, 2]
+        assert isinstance(store[1], LazyStageResult)
+        assert store[1].output == {"value": 1}
+        assert store[2].output == {"value": 2}
+        assert list(store._loaded) == [2]
+        assert store.output_path(1).exists()
+
+    def test_output_assignment_overrides(self, tmp_path):
+        store = SpilledStageResults(tmp_path)
+        now = datetime.utcnow().isoformat() + "Z"
+        lazy = store.spill(
+            StageResult(
+                stage_id=1,
+                stage_name="s",
+                status="completed",
+                started_at=now,
+                completed_at=now,
+                duration_ms=0,
+                output={"value": 1},
+            )
+        )
+        lazy.output = {}
+        assert lazy.output == {}
+        assert store.load_output(1) == {"value": 1}
+
+
+class TestRunStagesSpill:
+    async def test_previous_results_load_from_disk(self, tmp_path, stages, seen):
+        result = await run_stages([1, 2, 3], _context(tmp_path), spill_outputs=True)
+
+        assert result["success"]
+        assert seen[3] == {1: {"stage": 1, "rows": [0]}, 2: {"stage": 2, "rows": [0, 1]}}
+
+        spill_dir = tmp_path / SPILL_DIRNAME / "job-1"
+        for sid in (1, 2, 3):
+            entry = result["results"][sid]
+            assert entry["output"] is None
+            assert entry["output_ref"] == str(spill_dir / f"stage_{sid}.json")
+            assert Path(entry["output_ref"]).exists()
+
+    async def test_on_result_called_per_stage(self, tmp_path, stages):
+        emitted = []
+
+        async def on_result(payload):
+            emitted.append((payload["stage_id"], payload["output"]["stage"]))
+
+        await run_stages([1, 2], _context(tmp_path), spill_outputs=True, on_result=on_result)
+
+        assert emitted == [(1, 1), (2, 2)]
+
+    async def test_failed_stage_is_emitted_and_spilled(self, tmp_path, stages):
+        emitted = []
+        result = await run_stages(
+            [1, 2, 3],
+            _context(tmp_path, fail_stage=2),
+            spill_outputs=True,
+            on_result=emitted.append,
+        )
+
+        assert result["stages_failed"] == [2]
+        assert result["stages_skipped"] == [3]
+        assert [p["status"] for p in emitted] == ["completed", "failed"]
+        assert result["results"][2]["errors"][0].startswith("RuntimeError")
+
+    async def test_callback_error_does_not_fail_run(self, tmp_path, stages):
+        def on_result(payload):
+            raise ValueError("sink down")
+
+        result = await run_stages([1, 2], _context(tmp_path), spill_outputs=True, on_result=on_result)
+        assert result["success"]
+
+    async def test_default_mode_returns_outputs_inline(self, tmp_path, stages, seen):
+        result = await run_stages([1, 2], _context(tmp_path))
+
+        assert result["results"][2]["output"] == {"stage": 2, "rows": [0, 1]}
+        assert "output_ref" not in result["results"][2]
+        assert seen[2] == {1: {"stage": 1, "rows": [0]}}
+        assert not (tmp_path / SPILL_DIRNAME).exists()
@@ -0,0 +1,220 @@
+"""
+Tests for the content-addressed stage cache
+
+Tests run_stages with a StageCache:
+- A second identical run restores every stage without executing it
+- Config, dataset and upstream changes invalidate the right stages
+- Artifacts are restored from the blob store, under the loading job's directory
+- Failed and non-cacheable stages always execute
+"""
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.workflow_engine.runner import run_stages
+from src.workflow_engine.stage_cache import StageCache, dataset_fingerprint
+from src.workflow_engine.types import StageContext, StageResult
+
+
+def _make_stage_class(stage_id: int, calls: list, cacheable: bool = True):
+    class _Stage:
+        stage_name = f"stage_{stage_id}"
+        cache_config_keys = ("shared", f"stage_{stage_id}")
+
+        async def execute(self, context: StageContext) -> StageResult:
+            calls.append(stage_id)
+            if context.config.get("fail_stage") == stage_id:
+                raise RuntimeError("boom")
+
+            upstream = [
+                context.previous_results[sid].output["value"]
+                for sid in sorted(context.previous_results)
+            ]
+            value = sum(upstream) + context.config.get(f"stage_{stage_id}", stage_id)
+
+            artifact = Path(context.artifact_path) / context.job_id / f"stage_{stage_id}.txt"
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            artifact.write_text(f"value={value}")
+
+            now = datetime.utcnow().isoformat() + "Z"
+            return StageResult(
+                stage_id=stage_id,
+                stage_name=self.stage_name,
+                status="completed",
+                started_at=now,
+                completed_at=now,
+                duration_ms=1,
+                output={"value": value},
+                artifacts=[str(artifact)],
+            )
+
+    _Stage.cacheable = cacheable
+    return _Stage
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def stages(calls):
+    registry = {sid: _make_stage_class(sid, calls) for sid in (1, 2, 3)}
+    with patch("src.workflow_engine.runner.get_stage", side_effect=registry.get):
+        yield registry
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StageCache(tmp_path / "cache")
+
+
+async def _run(
+    tmp_path, cache, dataset=None, job_id="job-1", artifacts="artifacts",
+    stop_on_failure=True, **config,
+):
+    context = StageContext(
+        job_id=job_id,
+        config=config,
+        artifact_path=str(tmp_path / artifacts),
+        dataset_pointer=dataset,
+    )
+    return await run_stages(
+        [1, 2, 3], context, stop_on_failure=stop_on_failure, stage_cache=cache
+    )
+
+
+class TestStageCache:
+    async def test_second_run_is_fully_cached(self, tmp_path, stages, calls, cache):
+        first = await _run(tmp_path, cache)
+        second = await _run(tmp_path, cache)
+
+        assert calls == [1, 2, 3]
+        assert second["success"]
+        for sid in (1, 2, 3):
+            assert second["results"][sid]["output"] == first["results"][sid]["output"]
+            assert second["results"][sid]["metadata"]["stage_cache"]["hit"] is True
+        assert cache.stats == {"hits": 3, "misses": 3, "stores": 3}
+
+    async def test_config_change_invalidates_stage_and_downstream(
+        self, tmp_path, stages, calls, cache
+    ):
+        await _run(tmp_path, cache)
+        calls.clear()
+
+        result = await _run(tmp_path, cache, stage_2=20)
+
+        assert calls == [2, 3]
+        assert result["results"][3]["output"]["value"] == 1 + 21 + 3
+
+    async def test_irrelevant_config_change_is_ignored(self, tmp_path, stages, calls, cache):
+        await _run(tmp_path, cache, other="a")
+        calls.clear()
+
+        await _run(tmp_path, cache, other="b")
+        assert calls == []
+
+    async def test_unchanged_output_keeps_downstream_cached(
+        self, tmp_path, stages, calls, cache
+    ):
+        await _run(tmp_path, cache)
+        calls.clear()
+
+        # Stage 1 re-runs for its new key but yields the same output
+        await _run(tmp_path, cache, stage_1=1)
+        assert calls == [1]
+
+    async def test_dataset_change_invalidates(self, tmp_path, stages, calls, cache):
+        dataset = tmp_path / "data.csv"
+        dataset.write_text("a,b\n1,2\n")
+        await _run(tmp_path, cache, dataset=str(dataset))
+        calls.clear()
+
+        dataset.write_text("a,b\n1,3\n")
+        await _run(tmp_path, cache, dataset=str(dataset))
+        assert calls == [1, 2, 3]
+
+    async def test_artifacts_restored_on_hit(self, tmp_path, stages, calls, cache):
+        first = await _run(tmp_path, cache)
+        artifact = Path(first["results"][2]["artifacts"][0])
+        artifact.unlink()
+
+        await _run(tmp_path, cache)
+        assert calls == [1, 2, 3]
+        assert artifact.read_text() == "value=3"
+
+    async def test_cross_job_hit_restores_into_current_job(
+        self, tmp_path, stages, calls, cache
+    ):
+        first = await _run(tmp_path, cache)
+        calls.clear()
+
+        second = await _run(tmp_path, cache, job_id="job-2", artifacts="other")
+
+        assert calls == []
+        expected = tmp_path / "other" / "job-2" / "stage_2.txt"
+        assert second["results"][2]["artifacts"] == [str(expected)]
+        assert expected.read_text() == "value=3"
+        assert Path(first["results"][2]["artifacts"][0]).parent.name == "job-1"
+
+    async def test_missing_blob_is_a_miss(self, tmp_path, stages, calls, cache):
+        await _run(tmp_path, cache)
+        for blob in cache.blobs_dir.iterdir():
+            blob.unlink()
+        calls.clear()
+
+        await _run(tmp_path, cache)
+        assert calls == [1, 2, 3]
+
+    async def test_failed_stage_not_cached(self, tmp_path, stages, calls, cache):
+        await _run(tmp_path, cache, fail_stage=2)
+        calls.clear()
+
+        await _run(tmp_path, cache, fail_stage=2)
+        assert calls == [2]
+
+    async def test_non_cacheable_stage_always_runs(self, tmp_path, stages, calls, cache):
+        stages[2] = _make_stage_class(2, calls, cacheable=False)
+        await _run(tmp_path, cache)
+        calls.clear()
+
+        await _run(tmp_path, cache)
+        assert calls == [2]
+
+    async def test_non_cacheable_output_change_invalidates_downstream(
+        self, tmp_path, stages, calls, cache
+    ):
+        stages[1] = _make_stage_class(1, calls, cacheable=False)
+        await _run(tmp_path, cache)
+        calls.clear()
+
+        result = await _run(tmp_path, cache, stage_1=2)
+
+        assert calls == [1, 2, 3]
+        assert result["results"][3]["output"]["value"] == 2 + 4 + 3
+
+    async def test_failed_stage_invalidates_downstream(self, tmp_path, stages, calls, cache):
+        stages[1] = _make_stage_class(1, calls, cacheable=False)
+        await _run(tmp_path, cache)
+        calls.clear()
+
+        # Stage 2 must not reuse a result built on stage 1's earlier output
+        result = await _run(tmp_path, cache, stop_on_failure=False, fail_stage=1)
+
+        assert calls[:2] == [1, 2]
+        assert 2 in result["stages_failed"]
+
+
+class TestDatasetFingerprint:
+    def test_file_content_hash(self, tmp_path):
+        a = tmp_path / "a.csv"
+        b = tmp_path / "b.csv"
+        a.write_text("x\n1\n")
+        b.write_text("x\n1\n")
+        assert dataset_fingerprint(str(a)) == dataset_fingerprint(str(b))
+
+    def test_uri_and_missing(self):
+        assert dataset_fingerprint(None) is None
+        assert dataset_fingerprint("s3://bucket/key").startswith("uri:")
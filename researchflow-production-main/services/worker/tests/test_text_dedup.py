@@ -0,0 +1,235 @@
+"""
+Tests for text dedup ahead of LLM extraction.
+
+Verifies that identical (normalized) cell texts are extracted once, that the
+result is fanned out to every matching cell, and that the persistent store
+lets later jobs skip the LLM entirely.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from data_extraction.checkpoints import CheckpointReader
+from data_extraction.config import LargeSheetConfig
+from data_extraction.large_sheet_pipeline import LargeSheetPipeline
+from data_extraction.text_dedup import (
+    ExtractionResultStore,
+    TextDeduplicator,
+    dedup_key,
+    normalize_text,
+    text_hash,
+)
+
+
+TEMPLATES = [
+    "HPI: Routine follow-up visit number {i}.\nROS: Denies fever.\nPlan: Continue therapy.",
+    "Assessment: No evidence of disease.\nPlan: Surveillance imaging in {i} months.\nLabs stable.",
+]
+
+
+@pytest.fixture
+def templated_csv(tmp_path) -> Path:
+    """40 rows drawn from 4 distinct notes, with whitespace/case variants."""
+    distinct = [t.format(i=i) for t in TEMPLATES for i in (3, 6)]
+    notes = []
+    for row in range(40):
+        text = distinct[row % 4]
+        if row % 3 == 0:
+            text = text.upper()
+        if row % 5 == 0:
+            text = text.replace("\n", "\r\n  ")
+        notes.append(text)
+    path = tmp_path / "templated.csv"
+    pd.DataFrame({"clinical_notes": notes}).to_csv(path, index=False)
+    return path
+
+
+def _config(**overrides) -> LargeSheetConfig:
+    values = {"chunk_rows": 10, "llm_concurrency": 4, "output_format": "jsonl"}
+    values.update(overrides)
+    return LargeSheetConfig(**values)
+
+
+class TestNormalization:
+    def test_whitespace_and_case_variants_share_hash(self):
+        base = "ROS: Denies fever.\nPlan: Continue therapy."
+        variants = [
+            base.upper(),
+            base.replace("\n", "\r\n"),
+            "  " + base.replace(" ", "\t") + "\n",
+        ]
+        for variant in variants:
+            assert text_hash(variant) == text_hash(base)
+        assert normalize_text(base) == "ros: denies fever. plan: continue therapy."
+
+    def test_key_includes_template_and_tier(self):
+        keys = {
+            dedup_key("text", "clinical_note_extract_v2", None),
+            dedup_key("text", "ros_extract_v1", None),
+            dedup_key("text", "clinical_note_extract_v2", "MINI"),
+        }
+        assert len(keys) == 3
+
+    def test_key_includes_extractor_and_prompt_version(self):
+        keys = {
+            dedup_key("text", "clinical_note_extract_v2", None),
+            dedup_key("text", "clinical_note_extract_v2", None, "model-a"),
+            dedup_key("text", "clinical_note_extract_v2", None, "model-b"),
+            dedup_key("text", "clinical_note_extract_v2", None, "model-a", "2"),
+        }
+        assert len(keys) == 4
+
+
+class TestTextDeduplicator:
+    def test_followers_released_and_success_stored(self, tmp_path):
+        store = ExtractionResultStore(tmp_path / "store.sqlite")
+        dedup = TextDeduplicator(store)
+
+        assert dedup.claim("k", "a")
+        assert not dedup.claim("k", "b")
+        assert not dedup.claim("k", "c")
+        followers = dedup.release("k", {"success": True, "extraction": {"x": 1}, "cost_usd": 2})
+
+        assert followers == ["b", "c"]
+        assert store.get("k") == {"success": True, "extraction": {"x": 1}}
+        assert dedup.lookup("k") is not None
+        assert dedup.stats.to_dict() == {
+            "llm_calls": 1, "store_hits": 1, "fanned_out": 2, "saved_calls": 3,
+        }
+
+    def test_failure_not_stored(self, tmp_path):
+        store = ExtractionResultStore(tmp_path / "store.sqlite")
+        dedup = TextDeduplicator(store)
+
+        dedup.claim("k", "a")
+        dedup.release("k", {"success": False, "error": "timeout"})
+
+        assert store.get("k") is None
+        assert dedup.claim("k", "b")
+
+    def test_failure_hands_followers_back(self, tmp_path):
+        dedup = TextDeduplicator(ExtractionResultStore(tmp_path / "store.sqlite"))
+
+        dedup.claim("k", "a")
+        dedup.claim("k", "b")
+        dedup.claim("k", "c")
+        followers = dedup.release("k", {"success": False, "error": "timeout"})
+
+        assert followers == ["b", "c"]
+        assert dedup.claim("k", "b")
+        assert not dedup.claim("k", "c")
+        assert dedup.release("k", {"success": True, "extraction": {}}) == ["c"]
+        assert dedup.stats.to_dict() == {
+            "llm_calls": 2, "store_hits": 0, "fanned_out": 1, "saved_calls": 1,
+        }
+
+
+class TestPipelineDedup:
+    @pytest.mark.asyncio
+    async def test_each_distinct_text_extracted_once(self, templated_csv, tmp_path):
+        calls = []
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(normalize_text(text))
+            await asyncio.sleep(0.01)
+            return {"extraction": {"note": normalize_text(text)[:20]}, "success": True}
+
+        out = tmp_path / "out"
+        result = await LargeSheetPipeline("job_dedup", out, config=_config()).run(
+            templated_csv, extract,
+        )
+
+        assert len(calls) == len(set(calls)) == 4
+        assert result.completed_tasks == 40
+        assert result.deduped_tasks == 36
+
+        results = list(CheckpointReader(out).read_results())
+        assert sorted(r["row_idx"] for r in results) == list(range(40))
+        by_row = {r["row_idx"]: r for r in results}
+        for row in range(4, 40):
+            assert by_row[row]["extraction"] == by_row[row % 4]["extraction"]
+        assert sum(1 for r in results if "dedup_source" not in r) == 4
+
+    @pytest.mark.asyncio
+    async def test_shared_store_reused_across_jobs(self, templated_csv, tmp_path):
+        store_path = tmp_path / "shared" / "extractions.sqlite"
+        calls = 0
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            return {"extraction": {}, "success": True}
+
+        for job in ("job_a", "job_b"):
+            await LargeSheetPipeline(
+                job, tmp_path / job, config=_config(dedup_store_path=str(store_path)),
+            ).run(templated_csv, extract)
+
+        assert calls == 4
+        second = list(CheckpointReader(tmp_path / "job_b").read_results())
+        assert len(second) == 40
+        assert all(r["dedup_source"] == "store" for r in second)
+
+    @pytest.mark.asyncio
+    async def test_shared_store_keyed_by_extractor_and_prompt_version(
+        self, templated_csv, tmp_path,
+    ):
+        store_path = tmp_path / "shared" / "extractions.sqlite"
+        calls = 0
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            return {"extraction": {}, "success": True}
+
+        runs = [("job_a", "model-a", ""), ("job_b", "model-b", ""), ("job_c", "model-a", "2")]
+        for job, extractor_id, prompt_version in runs:
+            await LargeSheetPipeline(
+                job, tmp_path / job, config=_config(
+                    dedup_store_path=str(store_path),
+                    extractor_id=extractor_id,
+                    prompt_version=prompt_version,
+                ),
+            ).run(templated_csv, extract)
+
+        assert calls == 12
+
+    @pytest.mark.asyncio
+    async def test_waiting_cells_retry_after_transient_failure(self, templated_csv, tmp_path):
+        calls = []
+
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            key = normalize_text(text)
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            if calls.count(key) == 1:
+                raise RuntimeError("rate limited")
+            return {"extraction": {"note": key[:20]}, "success": True}
+
+        # More consumers than distinct texts, so duplicates park on each leader
+        config = _config(llm_concurrency=12)
+        result = await LargeSheetPipeline("job_retry", tmp_path / "out", config=config).run(
+            templated_csv, extract,
+        )
+
+        # Each distinct text fails once, then one waiting cell retries it
+        assert len(calls) == 8
+        assert result.failed_tasks == 4
+        assert result.completed_tasks == 36
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_fails_every_cell(self, templated_csv, tmp_path):
+        async def extract(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("rate limited")
+
+        result = await LargeSheetPipeline("job_fail", tmp_path / "out", config=_config()).run(
+            templated_csv, extract,
+        )
+
+        assert result.failed_tasks == 40
+        assert not result.success
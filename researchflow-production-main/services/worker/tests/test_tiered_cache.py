@@ -0,0 +1,171 @@
+"""
+Tests for the in-process tier in front of RedisCache
+
+Covers:
+- Size-aware LRU eviction
+- Single-flight coalescing of concurrent misses
+- Stale-while-revalidate refreshes
+- Hit/miss counters and cached_extraction integration
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.cache.redis_cache import (
+    LocalLRUCache,
+    RedisCache,
+    RedisCacheConfig,
+    TieredCache,
+    cached_extraction,
+)
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the redis client used by RedisCache."""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+        self.fail = False
+
+    def get(self, key):
+        self.gets += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+@pytest.fixture
+def remote():
+    cache = RedisCache(RedisCacheConfig(url="redis://localhost:6379/0"))
+    cache.client = _FakeRedis()
+    return cache
+
+
+@pytest.fixture
+def tiered(remote):
+    return TieredCache(remote, max_entries=100, max_bytes=10_000, fresh_s=60, stale_s=300)
+
+
+class TestLocalLRU:
+    def test_evicts_least_recently_used_by_bytes(self):
+        lru = LocalLRUCache(max_entries=10, max_bytes=10)
+        lru.put("a", b"1234", 60, 60, now=0)
+        lru.put("b", b"1234", 60, 60, now=0)
+        assert lru.get("a", now=1) is not None  # a is now most recent
+        lru.put("c", b"1234", 60, 60, now=0)
+
+        assert lru.get("b", now=1) is None
+        assert lru.get("a", now=1) is not None
+        assert lru.nbytes == 8
+        assert lru.evictions == 1
+
+    def test_oversized_values_not_stored(self):
+        lru = LocalLRUCache(max_entries=10, max_bytes=4)
+        lru.put("a", b"12345", 60, 60, now=0)
+        assert len(lru) == 0
+
+    def test_expired_entries_dropped(self):
+        lru = LocalLRUCache(max_entries=10, max_bytes=100)
+        lru.put("a", b"1", 10, 30, now=0)
+        assert lru.get("a", now=29) is not None
+        assert lru.get("a", now=30) is None
+        assert lru.nbytes == 0
+
+
+class TestTieredCache:
+    def test_local_hit_skips_redis(self, tiered, remote):
+        tiered.set_json("k", {"v": 1})
+        remote.client.gets = 0
+
+        assert tiered.get_json("k") == {"v": 1}
+        assert remote.client.gets == 0
+        assert tiered.stats_snapshot()["local_hits"] == 1
+
+    def test_remote_hit_populates_local(self, tiered, remote):
+        remote.set_json("k", [1, 2])
+        assert tiered.get_json("k") == [1, 2]
+        assert tiered.get_json("k") == [1, 2]
+
+        stats = tiered.stats_snapshot()
+        assert stats["remote_hits"] == 1
+        assert stats["local_hits"] == 1
+        assert remote.client.gets == 1
+
+    def test_returned_values_are_independent(self, tiered):
+        tiered.set_json("k", {"items": [1]})
+        tiered.get_json("k")["items"].append(2)
+        assert tiered.get_json("k") == {"items": [1]}
+
+    def test_concurrent_misses_compute_once(self, tiered):
+        calls = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return {"answer": 42}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(tiered.get_or_compute("k", compute)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"answer": 42}] * 8
+        assert tiered.stats_snapshot()["coalesced"] >= 1
+
+    def test_compute_error_propagates_and_is_not_cached(self, tiered):
+        def boom():
+            raise RuntimeError("llm failed")
+
+        with pytest.raises(RuntimeError):
+            tiered.get_or_compute("k", boom)
+        assert tiered.get_or_compute("k", lambda: "ok") == "ok"
+
+    def test_stale_entry_served_then_revalidated(self, remote):
+        tiered = TieredCache(remote, fresh_s=0, stale_s=300)
+        tiered.set_json("k", "old")
+        remote.set_json("k", "new")
+
+        assert tiered.get_json("k") == "old"
+        deadline = time.time() + 2
+        while tiered.stats_snapshot()["refreshes"] < 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert tiered.get_json("k") == "new"
+        assert tiered.stats_snapshot()["stale_hits"] >= 1
+
+    def test_redis_errors_fall_back_to_compute(self, tiered, remote):
+        remote.client.fail = True
+        assert tiered.get_or_compute("k", lambda: 7) == 7
+        assert tiered.stats_snapshot()["errors"] >= 1
+
+    def test_cached_extraction_uses_local_tier(self, tiered, remote):
+        calls = []
+
+        def extract(text):
+            calls.append(text)
+            return {"len": len(text)}
+
+        first = cached_extraction(tiered, extract, "note text", "gpt-4")
+        remote.client.gets = 0
+        second = cached_extraction(tiered, extract, "note text", "gpt-4")
+
+        assert first == second == {"len": 9}
+        assert calls == ["note text"]
+        assert remote.client.gets == 0
@@ -0,0 +1,83 @@
+"""
+Tests for the columnar wide-to-long lab transform.
+
+Synthetic lab exports only - no real PHI.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transform.wide_to_long import iter_wide_labs_to_long, wide_labs_to_long
+
+
+@pytest.fixture
+def wide_tg():
+    return pd.DataFrame({
+        "research_id": [1001, 1002, 1003],
+        "tg_lab1_value": [0.5, 15.0, None],
+        "tg_lab1_unit": ["ng/mL", "ng/mL", None],
+        "tg_lab2_value": ["0.8", "<0.2", None],
+        "tg_lab2_unit": ["ng/mL", "ng/mL", "ng/mL"],
+        "tg_lab3_value": [None, "1e1", "2"],
+    })
+
+
+class TestWideLabsToLong:
+    def test_stacks_blocks_patient_major(self, wide_tg):
+        long_df = wide_labs_to_long(wide_tg, analyte="tg")
+
+        assert long_df.columns.tolist() == [
+            "research_id", "analyte", "measurement_index", "value", "unit",
+            "source_block", "raw_value",
+        ]
+        assert list(zip(long_df["research_id"], long_df["source_block"])) == [
+            (1001, "lab1"), (1001, "lab2"),
+            (1002, "lab1"), (1002, "lab2"), (1002, "lab3"),
+            (1003, "lab3"),
+        ]
+        np.testing.assert_array_equal(
+            long_df["value"].to_numpy(), [0.5, 0.8, 15.0, np.nan, 10.0, 2.0]
+        )
+        # Unparseable values keep their raw text; blocks without a unit get None
+        assert long_df.loc[3, "raw_value"] == "<0.2"
+        assert long_df["raw_value"].isna().sum() == 5
+        assert long_df["unit"].tolist() == ["ng/mL"] * 4 + [None, None]
+        assert long_df["research_id"].dtype == np.int64
+
+    def test_options(self, wide_tg):
+        no_raw = wide_labs_to_long(wide_tg, "tg", {"keep_raw_value": False})
+        keep_all = wide_labs_to_long(wide_tg, "tg", {"drop_all_null_rows": False})
+
+        assert "raw_value" not in no_raw.columns
+        assert len(no_raw) == 5
+        assert len(keep_all) == 9
+
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 100])
+    def test_chunked_matches_whole(self, wide_tg, chunk_rows):
+        whole = wide_labs_to_long(wide_tg, "tg")
+        chunked = wide_labs_to_long(wide_tg, "tg", {"chunk_rows": chunk_rows})
+
+        pd.testing.assert_frame_equal(chunked, whole)
+
+    def test_iter_yields_row_chunks(self, wide_tg):
+        chunks = list(iter_wide_labs_to_long(wide_tg, "tg", {"chunk_rows": 2}))
+
+        assert [c["research_id"].unique().tolist() for c in chunks] == [
+            [1001, 1002], [1003],
+        ]
+
+    def test_phi_linkage_key_rejected(self, wide_tg):
+        df = wide_tg.rename(columns={"research_id": "patient_mrn"})
+
+        with pytest.raises(ValueError, match="PHI SAFETY VIOLATION"):
+            wide_labs_to_long(df, "tg", {"linkage_key": "patient_mrn"})
+
+    def test_no_blocks_returns_empty(self):
+        df = pd.DataFrame({"research_id": [1], "age": [40]})
+
+        with pytest.warns(UserWarning, match="No wide-format lab blocks"):
+            long_df = wide_labs_to_long(df, "tg")
+
+        assert long_df.empty
+        assert "measurement_index" in long_df.columns